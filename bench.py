@@ -0,0 +1,283 @@
+#-----------------------------------------------------------------------------
+"""
+Benchmarks
+
+usage: python bench.py [-n REPEAT] <benchmark>
+"""
+#-----------------------------------------------------------------------------
+
+import os
+import sys
+import getopt
+import subprocess
+import threading
+import time
+
+#-----------------------------------------------------------------------------
+# startup
+
+# modules that must not be imported until a target is selected
+_startup_lazy = ('pygame', 'jace', 'tec1', 'spectrum', 'z80')
+
+def importtime(stmt):
+    """
+    run stmt in a fresh interpreter with -X importtime
+    return a list of (module, self_us, cumulative_us) tuples
+    """
+    cmd = (sys.executable, '-X', 'importtime', '-c', stmt)
+    p = subprocess.run(cmd, capture_output = True, text = True)
+    if p.returncode != 0:
+        raise RuntimeError(p.stderr)
+    modules = []
+    for line in p.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        modules.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return modules
+
+def bench_startup(n):
+    """interpreter start and main.py import"""
+    cumulative = []
+    wall = []
+    for i in range(n):
+        t = time.perf_counter()
+        modules = importtime('import main')
+        wall.append(time.perf_counter() - t)
+        cumulative.extend([x[2] for x in modules if x[0] == 'main'])
+    names = [x[0] for x in modules]
+    lazy = [name for name in _startup_lazy if name in names]
+    print('import main   : %.1f ms (best of %d)' % (min(cumulative) / 1000.0, n))
+    print('process total : %.1f ms (best of %d)' % (min(wall) * 1000.0, n))
+    print('lazy modules  : %s' % (('ok', 'imported early: %s' % ' '.join(lazy))[bool(lazy)]))
+
+#-----------------------------------------------------------------------------
+# cpu construction
+
+_create_cpus = 10000
+
+def bench_create(n):
+    """construct and discard cpus"""
+    import z80
+    import memory
+    mem = memory.ram(4)
+    best = None
+    for i in range(n):
+        t = time.perf_counter()
+        for j in range(_create_cpus):
+            z80.cpu(mem, None)
+        secs = time.perf_counter() - t
+        if best is None or secs < best:
+            best = secs
+    print('create %d cpus: %.1f ms  %.2f us/cpu (best of %d)' % (_create_cpus, best * 1000.0,
+        (best * 1e6) / _create_cpus, n))
+
+#-----------------------------------------------------------------------------
+# forth workload on each ram expansion
+
+# ACE key matrix: port -> keys for bits 0..4 (^ is shift/symbol shift)
+_ace_rows = (
+    (0xfefe, '^^ZXC'),
+    (0xfdfe, 'ASDFG'),
+    (0xfbfe, 'QWERT'),
+    (0xf7fe, '12345'),
+    (0xeffe, '09876'),
+    (0xdffe, 'POIUY'),
+    (0xbffe, '\nLKJH'),
+    (0x7ffe, ' MNBV'),
+)
+
+# symbol shifted characters
+_ace_symbols = ((':', 'Z'), (';', 'O'), ('!', '1'), ('@', '2'), ('+', 'K'), ('-', 'J'))
+
+def ace_keys():
+    """return a character to [(port, bits), ...] mapping for typing"""
+    keys = {}
+    for (port, row) in _ace_rows:
+        for (i, c) in enumerate(row):
+            if c != '^':
+                keys[c] = [(port, 1 << i)]
+    for (c, k) in _ace_symbols:
+        keys[c] = [(0xfefe, 1 << 1)] + keys[k]
+    return keys
+
+def type_text(m, keys, text, frames = 3):
+    """type text on a machine's keyboard, holding each key for frames"""
+    import jace
+    for c in text:
+        for (port, bits) in keys[c]:
+            m.keyboard.event(port, bits, True)
+        m.run(frames * jace._FRAME_CLKS)
+        for (port, bits) in keys[c]:
+            m.keyboard.event(port, bits, False)
+        m.run(frames * jace._FRAME_CLKS)
+
+def enter_line(m, keys, line):
+    """
+    Type a line of forth, press enter and run until the ACE responds with OK.
+    Return the (secs, T-states) taken to execute the line.
+    """
+    import jace
+    type_text(m, keys, line)
+    oks = bytes(m.mem.video.mem).count(b'OK')
+    clks = m.sched.clks
+    t = time.perf_counter()
+    type_text(m, keys, '\n')
+    while bytes(m.mem.video.mem).count(b'OK') == oks:
+        m.run(jace._FRAME_CLKS)
+    return (time.perf_counter() - t, m.sched.clks - clks)
+
+# fill a 512 byte buffer 5 times - in the base ram above the dictionary
+# for the baseline, in the ram expansion otherwise - the buffer is
+# addressed directly, so the dictionary is in the base ram in both
+_forth_base_buffer = 0x3d00
+_forth_expansion_buffer = 0x4200
+_forth_define = ': T 5 0 DO %d 512 + %d DO I DUP C! LOOP LOOP ;'
+_forth_run = 'T'
+_forth_boot_frames = 100
+
+def bench_expansion(n):
+    """memory heavy forth workload in the base ram, then each ram expansion"""
+    import jace
+    keys = ace_keys()
+    for size in jace._expansions:
+        if size == 0:
+            (buf, base) = (_forth_base_buffer, 0x3c00)
+        else:
+            (buf, base) = (_forth_expansion_buffer, jace._EXPANSION_ADR)
+        best = None
+        for i in range(n):
+            m = jace.machine(expansion = size)
+            m.run(_forth_boot_frames * jace._FRAME_CLKS)
+            enter_line(m, keys, _forth_define % (buf, buf))
+            (secs, clks) = enter_line(m, keys, _forth_run)
+            # the workload ran in the memory being measured
+            dev = (m.mem.ram, m.mem.expansion)[size != 0]
+            adr = buf - base
+            if bytes(dev.mem[adr:adr + 512]) != bytes(range(256)) * 2:
+                raise RuntimeError('the workload did not write the %s' % ('base ram', 'ram expansion')[size != 0])
+            if best is None or secs < best:
+                best = secs
+        name = ('base ram', 'expansion %2dK' % size)[size != 0]
+        print('%-13s: %6.3f s  %5.2f MHz (best of %d)' % (name, best, clks / (best * 1e6), n))
+
+#-----------------------------------------------------------------------------
+# one machine per thread
+
+_thread_frames = 10
+
+def machine_state(m):
+    """return a comparable snapshot of a machine"""
+    return (str(m.cpu), bytes(m.mem.ram.mem), bytes(m.mem.video.mem))
+
+def run_machines(nthreads, frames):
+    """run a jace machine on each of nthreads threads - return (secs, states)"""
+    import jace
+    machines = [jace.machine() for i in range(nthreads)]
+    barrier = threading.Barrier(nthreads + 1)
+    def work(m):
+        barrier.wait()
+        m.run(frames * jace._FRAME_CLKS)
+    threads = [threading.Thread(target = work, args = (m,)) for m in machines]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.join()
+    secs = time.perf_counter() - t0
+    return (secs, [machine_state(m) for m in machines])
+
+def bench_threads(n):
+    """jace machines on 1..cpu_count threads"""
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('gil enabled: %s' % gil)
+    (secs, ref) = run_machines(1, _thread_frames)
+    nthreads = 1
+    base = None
+    while nthreads <= (os.cpu_count() or 1):
+        best = None
+        for i in range(n):
+            (secs, states) = run_machines(nthreads, _thread_frames)
+            for state in states:
+                if state != ref[0]:
+                    raise RuntimeError('machine state differs from single thread run')
+            if best is None or secs < best:
+                best = secs
+        rate = nthreads / best
+        if base is None:
+            base = rate
+        print('threads %3d: %6.3f s  %6.2f machine-frames/s  scaling %5.2f (%3d%%)' % (nthreads, best,
+            rate * _thread_frames, rate / base, (100 * rate) / (base * nthreads)))
+        nthreads *= 2
+
+#-----------------------------------------------------------------------------
+# spectrum rom boot: ram test, clear and copyright message
+
+_spectrum_frames = 150
+
+def bench_spectrum(n):
+    """spectrum 48K rom boot, rendering every frame"""
+    import spectrum
+    if not os.path.exists(spectrum._ROM_FILE):
+        print('no spectrum rom: %s' % spectrum._ROM_FILE)
+        return
+    best = None
+    for i in range(n):
+        m = spectrum.machine()
+        (run, render) = (0.0, 0.0)
+        for j in range(_spectrum_frames):
+            t = time.perf_counter()
+            m.run(spectrum._FRAME_CLKS)
+            t1 = time.perf_counter()
+            spectrum.render_rgb(m.mem.screen(), m.flash())
+            render += time.perf_counter() - t1
+            run += t1 - t
+        if best is None or run < best[0]:
+            best = (run, render)
+    (run, render) = best
+    clks = _spectrum_frames * spectrum._FRAME_CLKS
+    print('boot %d frames: %6.3f s  %5.2f MHz  render %.2f ms/frame (best of %d)' % (_spectrum_frames,
+        run, clks / (run * 1e6), (render * 1000.0) / _spectrum_frames, n))
+
+#-----------------------------------------------------------------------------
+
+_benchmarks = (
+    ('startup', bench_startup),
+    ('create', bench_create),
+    ('expansion', bench_expansion),
+    ('threads', bench_threads),
+    ('spectrum', bench_spectrum),
+)
+
+def usage():
+    print('usage:')
+    print('%s [-n REPEAT] <benchmark>' % sys.argv[0])
+    print('benchmarks: %s' % ' '.join([x[0] for x in _benchmarks]))
+    sys.exit(2)
+
+def main():
+    n = 5
+    try:
+        optlist, arglist = getopt.gnu_getopt(sys.argv[1:], 'n:')
+    except getopt.GetoptError:
+        usage()
+    for opt in optlist:
+        if opt[0] == '-n':
+            n = int(opt[1])
+    if len(arglist) != 1:
+        usage()
+    for (name, func) in _benchmarks:
+        if name == arglist[0]:
+            func(n)
+            return
+    usage()
+
+#-----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    main()
+
+#-----------------------------------------------------------------------------
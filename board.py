@@ -0,0 +1,253 @@
+#-----------------------------------------------------------------------------
+"""
+Machine Descriptions
+
+A machine is described by a dictionary and compiled once, when it is
+built, into the page tables of a memory.bus and the port tables of an io
+decoder. Targets only supply the devices that have side effects.
+
+spec = {
+    'roms': {name: filename, ...},
+    'memory': (
+        # (name, address, size, device, bits, access)
+        # device is 'rom', 'ram' or 'wom', bits is log2 of the device size.
+        # A device smaller than size is mirrored. A name used again maps
+        # the same device. access is memory.RW/RO/WO, or memory.DEV to
+        # route the accesses through the device. The cpu writes RW/WO
+        # pages directly, so byte-level dirty tracking (poll_dirty) needs
+        # memory.DEV - RW pages are only marked by block writes.
+    ),
+    'banks': (
+        # (name, address, size, device, bits, access)
+        # a device larger than its window of size bytes at address. A
+        # write to the port of the same name selects the bank in the window.
+    ),
+    'ports': (
+        # (name, mask, match)
+        # the port is selected when (port & mask) == match
+    ),
+    'interrupts': (
+        # (name, period in T-states)
+    ),
+}
+"""
+#-----------------------------------------------------------------------------
+
+import memory
+
+#-----------------------------------------------------------------------------
+
+_devices = {
+    'rom': memory.rom,
+    'ram': memory.ram,
+    'wom': memory.wom,
+}
+
+def build_memory(bus, spec, files = None, bufs = None):
+    """
+    Create the memory devices of a spec and map them onto a bus.
+    Each device is also set as an attribute of the bus (Eg. bus.rom), a
+    banked device as its memory.banked window (Eg. bus.paged.dev).
+    files: rom filenames by device name - overrides spec['roms']
+    bufs: external backing buffers by device name (Eg. shared memory)
+    """
+    roms = dict(spec.get('roms', {}))
+    roms.update(files or {})
+    bufs = bufs or {}
+    devices = {}
+    for (name, adr, size, kind, bits, access) in spec['memory']:
+        dev = devices.get(name, None)
+        if dev is None:
+            if kind == 'rom':
+                image = memory.image(roms[name])
+                if len(image) != (1 << bits):
+                    raise ValueError('%s is %d bytes, expected %d' % (roms[name], len(image), 1 << bits))
+                dev = memory.rom(bits, image)
+            else:
+                dev = _devices[kind](bits, bufs.get(name, None))
+            devices[name] = dev
+            setattr(bus, name, dev)
+        if access == memory.DEV:
+            bus.handle(adr, size, dev)
+        else:
+            bus.map(adr, size, dev, access)
+    for (name, adr, size, kind, bits, access) in spec.get('banks', ()):
+        dev = _devices[kind](bits, bufs.get(name, None))
+        devices[name] = dev
+        setattr(bus, name, memory.banked(bus, adr, size, dev, access))
+    return devices
+
+def bank_ports(bus, spec):
+    """return the io handlers of the bank select ports of a spec, by name"""
+    return dict([(x[0], (None, getattr(bus, x[0]).wr)) for x in spec.get('banks', ())])
+
+#-----------------------------------------------------------------------------
+
+def _wr_open(adr, val):
+    """write to an undecoded port"""
+    pass
+
+def _wr_open_block(adr, data):
+    """block write to an undecoded port"""
+    pass
+
+def _static_block(val):
+    """return a block read handler for a static port value"""
+    def rd_block(adr, n):
+        return bytes((val,)) * n
+    return rd_block
+
+class io:
+    """
+    io port decoder
+    The port decodes are compiled into flat tables of handler indices.
+    The tables cover the low 8 address bits, or all 16 if a decode needs
+    them. A read handler may be a static value, returned with no call.
+
+    Handlers that can transfer a buffer for the block io instructions
+    (inir, otir, ...) also supply rd_block(adr, n) -> bytes and
+    wr_block(adr, data). Static ports get a rd_block automatically.
+    """
+
+    def __init__(self, ports, handlers, default = (0xff, _wr_open, None, _wr_open_block)):
+        """
+        ports: a tuple of (name, mask, match) port decodes
+        handlers: (rd, wr) or (rd, wr, rd_block, wr_block) by port name -
+        rd is a function or a static value, any may be None
+        default: the handlers for undecoded ports
+        """
+        wide = any([mask & 0xff00 for (name, mask, match) in ports])
+        size = (0x100, 0x10000)[wide]
+        self.mask = size - 1
+        # index 0 is the undecoded handler
+        self.rd_handlers = []
+        self.wr_handlers = []
+        self.rd_blocks = []
+        self.wr_blocks = []
+        self.add_handlers(default)
+        self.rd_index = bytearray(size)
+        self.wr_index = bytearray(size)
+        # earlier decodes take priority
+        for (name, mask, match) in reversed(ports):
+            (rd, wr) = handlers[name][:2]
+            (nrd, nwr) = self.add_handlers(handlers[name])
+            if rd is not None:
+                self.decode(self.rd_index, mask, match, nrd)
+            if wr is not None:
+                self.decode(self.wr_index, mask, match, nwr)
+
+    def add_handlers(self, handlers):
+        """add a set of handlers - return their (rd, wr) indices"""
+        (rd, wr, rd_block, wr_block) = (tuple(handlers) + (None, None))[:4]
+        if (rd_block is None) and (rd.__class__ is int):
+            rd_block = _static_block(rd)
+        self.rd_handlers.append(rd)
+        self.wr_handlers.append(wr)
+        self.rd_blocks.append(rd_block)
+        self.wr_blocks.append(wr_block)
+        return (len(self.rd_handlers) - 1, len(self.wr_handlers) - 1)
+
+    def decode(self, index, mask, match, n):
+        """set the index table entries selected by (port & mask) == match"""
+        mask &= self.mask
+        match &= mask
+        # iterate over the don't care bits only
+        free = self.mask & ~mask
+        adr = 0
+        while True:
+            index[adr | match] = n
+            if adr == free:
+                break
+            adr = ((adr | mask) + 1) & free
+
+    def rd(self, adr):
+        h = self.rd_handlers[self.rd_index[adr & self.mask]]
+        if h.__class__ is int:
+            return h
+        return h(adr)
+
+    def wr(self, adr, val):
+        self.wr_handlers[self.wr_index[adr & self.mask]](adr, val)
+
+    def bulk(self, index, blocks, ports):
+        """return the block handler shared by all the ports, or None"""
+        mask = self.mask
+        n = index[ports[0] & mask]
+        if mask > 0xff:
+            for adr in ports:
+                if index[adr & mask] != n:
+                    return None
+        return blocks[n]
+
+    def rd_bulk(self, ports):
+        """return a rd_block handler for a sequence of ports, or None"""
+        return self.bulk(self.rd_index, self.rd_blocks, ports)
+
+    def wr_bulk(self, ports):
+        """return a wr_block handler for a sequence of ports, or None"""
+        return self.bulk(self.wr_index, self.wr_blocks, ports)
+
+#-----------------------------------------------------------------------------
+
+def add_interrupts(sched, spec, handlers):
+    """add the interrupt sources of a spec to a scheduler as periodic events"""
+    return [sched.add(period, handlers[name]) for (name, period) in spec.get('interrupts', ())]
+
+#-----------------------------------------------------------------------------
+
+class keyboard:
+    """
+    A keyboard matrix of 8 half-rows of 5 keys (Eg. Jupiter ACE, ZX Spectrum).
+    Half-row n is read on D0-D4 when address line A(8 + n) is low.
+    """
+
+    def __init__(self):
+        self.reset()
+        # split mode: key events are forwarded to the worker process
+        # through a split.sender
+        self.sender = None
+
+    def reset(self):
+        """release all keys"""
+        # half-row n is selected by address line A(8 + n) low
+        self.rows = bytearray((0xff,) * 8)
+        self.update()
+
+    def update(self):
+        """
+        Recompute the port values for all 256 high address bytes. A port
+        read with several address lines low ANDs the selected half-rows.
+        """
+        table = bytearray(256)
+        rows = self.rows
+        for hi in range(256):
+            val = 0xff
+            for n in range(8):
+                if not (hi & (1 << n)):
+                    val &= rows[n]
+            table[hi] = val
+        self.table = table
+
+    def event(self, port, bits, down):
+        """a key has gone up or down"""
+        n = ((~port >> 8) & 0xff).bit_length() - 1
+        if down:
+            self.rows[n] &= ~bits
+        else:
+            self.rows[n] |= bits
+        self.update()
+        if self.sender is not None:
+            # a lost event could leave a key held down: the sender queues
+            # events the ring has no room for
+            self.sender.put((port >> 8, bits | (0, 0x80)[down]))
+
+    def events(self, data):
+        """apply key events received from the ring"""
+        for i in range(0, len(data) - 1, 2):
+            self.event((data[i] << 8) | 0xfe, data[i + 1] & 0x1f, bool(data[i + 1] & 0x80))
+
+    def rd(self, adr):
+        """return the current port value"""
+        return self.table[(adr >> 8) & 0xff]
+
+#-----------------------------------------------------------------------------
@@ -20,7 +20,6 @@ Function Help Format: (parm, descr)
 
 import sys
 import conio
-import time
 
 #-----------------------------------------------------------------------------
 
@@ -114,7 +113,6 @@ class cli:
         self.cl = command(app)
         self.running = True
         self.prompt = '> '
-        self.poll = None
         self.prompt_changed = False
 
     def set_root(self, root):
@@ -126,10 +124,6 @@ class cli:
         self.prompt = prompt
         self.prompt_changed = True
 
-    def set_poll(self, poll):
-        """set the external polling function"""
-        self.poll = poll
-
     def func_help(self, help):
         """print help for a leaf function"""
         self.app.io.put('\n\n')
@@ -196,54 +190,61 @@ class cli:
                 marker.append(' ' * l)
         return '\n'.join([msg, ' '.join(cmds), ' '.join(marker)])
 
-    def get_cmd(self):
+    def key(self, c):
+        """
+        process an input character
+        return True when the command line is complete
+        """
+        #print(f"\nDEBUG: Received char: {c}")  # Debugging print
+
+        if c == conio.CHAR_CR:  # Enter key
+            return True
+        elif c == conio.CHAR_BS:  # Backspace
+            self.cl.backspace()
+        elif c == conio.CHAR_DEL:  # Delete
+            self.cl.delete()
+        elif c == conio.CHAR_LEFT:  # Left arrow
+            self.cl.left()
+        elif c == conio.CHAR_RIGHT:  # Right arrow
+            self.cl.right()
+        elif c == conio.CHAR_HOME:  # Home
+            self.cl.home()
+        elif c == conio.CHAR_END:  # End
+            self.cl.end()
+        elif c == conio.CHAR_UP:  # Up arrow
+            self.cl.set(self.get_history_rev()) # Set the command line to the previous history entry
+        elif c == conio.CHAR_DOWN:  # Down arrow
+            self.cl.set(self.get_history_fwd()) # Set the command line to the next history entry
+        elif c >= 32 and c <= 126:  # Printable ASCII characters
+            self.cl.add(chr(c))
+        else:
+            print(f"Unhandled character: {c}")
+
+        self.cl.render()
+        return False
+
+    async def get_cmd(self):
         """
         accumulate input characters to the command line
-        return True when processing is needed
-        return False for on going input
-        get a command from the user
+        other tasks run while we wait for console input
+        return the command string
         """
         self.cl.clear()
         self.cl.render()
         while True:
             c = self.app.io.get()
             if c is None:
-                time.sleep(0.01)  # Add a small delay to prevent busy-waiting
+                await self.app.io.ready()
                 continue
-
-            #print(f"\nDEBUG: Received char: {c}")  # Debugging print
-
-            if c == conio.CHAR_CR:  # Enter key
+            if self.key(c):
                 break
-            elif c == conio.CHAR_BS:  # Backspace
-                self.cl.backspace()
-            elif c == conio.CHAR_DEL:  # Delete
-                self.cl.delete()
-            elif c == conio.CHAR_LEFT:  # Left arrow
-                self.cl.left()
-            elif c == conio.CHAR_RIGHT:  # Right arrow
-                self.cl.right()
-            elif c == conio.CHAR_HOME:  # Home
-                self.cl.home()
-            elif c == conio.CHAR_END:  # End
-                self.cl.end()
-            elif c == conio.CHAR_UP:  # Up arrow
-                self.cl.set(self.get_history_rev()) # Set the command line to the previous history entry
-            elif c == conio.CHAR_DOWN:  # Down arrow
-                self.cl.set(self.get_history_fwd()) # Set the command line to the next history entry
-            elif c >= 32 and c <= 126:  # Printable ASCII characters
-                self.cl.add(chr(c))
-            else:
-                print(f"Unhandled character: {c}")
-
-            self.cl.render()
 
         cmd = self.cl.get()
         return cmd
 
-    def execute_cmd(self):
+    async def execute_cmd(self):
         """execute the command"""
-        cmd = self.get_cmd()
+        cmd = await self.get_cmd()
         if cmd:
             self.add_history(cmd)
             self.app.put('\n')
@@ -387,12 +388,15 @@ class cli:
         self.cl.repeat()
         return True
 
-    def run(self):
-        """run the CLI"""
+    async def run(self):
+        """run the CLI as an event loop task"""
         while self.running:
-            if self.poll:
-                self.poll()
-            self.execute_cmd()
+            try:
+                await self.execute_cmd()
+            except EOFError:
+                # the console input has closed: nothing more to do
+                self.exit()
+                break
             if self.prompt_changed: # Check the flag
                 self.cl.render()  # Re-render the prompt
                 self.prompt_changed = False # Reset the flag
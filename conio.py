@@ -3,14 +3,22 @@
 Console IO
 
 Provides non-blocking, non-echoing access to the console interface.
+The console backend (Windows or POSIX) is selected by platform.
 """
 #-----------------------------------------------------------------------------
 
 import os
-import msvcrt
 import sys
-import ctypes
-from ctypes import wintypes
+import asyncio
+
+if sys.platform == 'win32':
+    import msvcrt
+    import ctypes
+    from ctypes import wintypes
+else:
+    import termios
+    import tty
+    import selectors
 
 #termiWin = ctypes.CDLL('C:/tmp/pyz80/termiWin.dll')
 
@@ -47,12 +55,14 @@ CHAR_DEL   = 0x7e
 #-----------------------------------------------------------------------------
 
 # Windows API constants
+WAIT_OBJECT_0 = 0x00000000
 ENABLE_ECHO_INPUT = 0x0004
 ENABLE_LINE_INPUT = 0x0002
 ENABLE_PROCESSED_INPUT = 0x0001
 
 # Windows API functions
-kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+if sys.platform == 'win32':
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
 
 def get_console_mode(handle):
     mode = wintypes.DWORD()
@@ -64,7 +74,7 @@ def set_console_mode(handle, mode):
     if not kernel32.SetConsoleMode(handle, mode):
         raise ctypes.WinError(ctypes.get_last_error())
 
-class console:
+class win_console:
     def __init__(self):
         """set the console to non-blocking, non-echoing"""
         self.handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
@@ -80,6 +90,24 @@ class console:
         """poll for any key - return True when pressed"""
         return msvcrt.kbhit()
 
+    def wait(self):
+        """block until there is console input or the poll timeout - return True for a key"""
+        if kernel32.WaitForSingleObject(self.handle, int(_poll_timeout * 1000)) != WAIT_OBJECT_0:
+            return False
+        if msvcrt.kbhit():
+            return True
+        # mouse, focus and key up events also signal the handle - discard
+        # them or the wait returns at once
+        kernel32.FlushConsoleInputBuffer(self.handle)
+        return False
+
+    async def ready(self):
+        """wait within the event loop until console input is ready"""
+        loop = asyncio.get_running_loop()
+        # the wait times out so the executor thread can end with the loop
+        while not await loop.run_in_executor(None, self.wait):
+            pass
+
     def get(self):
         """get console input - return ascii code or None if no input"""
         import conio # Importing conio here, inside the console class
@@ -114,3 +142,140 @@ class console:
         sys.stdout.flush()
 
 #-----------------------------------------------------------------------------
+# POSIX terminal escape sequences (the bytes following ESC)
+
+_escapes = (
+    (b'[A', CHAR_UP),
+    (b'[B', CHAR_DOWN),
+    (b'[C', CHAR_RIGHT),
+    (b'[D', CHAR_LEFT),
+    (b'[H', CHAR_HOME),
+    (b'[F', CHAR_END),
+    (b'[1~', CHAR_HOME),
+    (b'[3~', CHAR_DEL),
+    (b'[4~', CHAR_END),
+    (b'OA', CHAR_UP),
+    (b'OB', CHAR_DOWN),
+    (b'OC', CHAR_RIGHT),
+    (b'OD', CHAR_LEFT),
+    (b'OH', CHAR_HOME),
+    (b'OF', CHAR_END),
+)
+
+# time to wait for the remainder of an escape sequence
+_escape_timeout = 0.05 # secs
+
+def decode(buf, more):
+    """
+    Decode a key from the head of the input bytes.
+    more: True if further input may complete an escape sequence.
+    Return (code, number of bytes used), or None if more input is needed.
+    """
+    ch = buf[0]
+    if ch == 0x1b:
+        tail = bytes(buf[1:])
+        for (seq, code) in _escapes:
+            if tail.startswith(seq):
+                return (code, len(seq) + 1)
+            if more and seq.startswith(tail):
+                return None
+        return (CHAR_ESC, 1)
+    if ch in (0x0a, 0x0d):
+        return (CHAR_CR, 1)
+    if ch in (0x08, 0x7f):
+        return (CHAR_BS, 1)
+    return (ch, 1)
+
+#-----------------------------------------------------------------------------
+
+class posix_console:
+    def __init__(self, fd = None):
+        """
+        set the console to non-blocking, non-echoing
+        fd: the input file descriptor (default: stdin)
+        """
+        if fd is None:
+            fd = sys.stdin.fileno()
+        self.fd = fd
+        self.saved_mode = None
+        if os.isatty(self.fd):
+            self.saved_mode = termios.tcgetattr(self.fd)
+            # non-canonical, no echo, ctrl-c still raises KeyboardInterrupt
+            tty.setcbreak(self.fd)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ)
+        self.pending = bytearray()
+        # the input has closed
+        self.eof = False
+
+    def close(self):
+        """restore original console settings"""
+        self.selector.close()
+        if self.saved_mode is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.saved_mode)
+
+    def anykey(self):
+        """poll for any key - return True when pressed"""
+        if self.pending:
+            return True
+        return len(self.selector.select(0)) != 0
+
+    async def ready(self):
+        """wait within the event loop until console input is ready"""
+        if self.pending or self.eof:
+            return
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        def readable():
+            if not done.done():
+                done.set_result(None)
+        loop.add_reader(self.fd, readable)
+        try:
+            await done
+        finally:
+            loop.remove_reader(self.fd)
+
+    def read(self, timeout):
+        """read available input into the pending buffer - return False at eof"""
+        if self.selector.select(timeout):
+            data = os.read(self.fd, 64)
+            if not data:
+                self.eof = True
+                return False
+            self.pending.extend(data)
+        return True
+
+    def get(self):
+        """
+        get console input - return ascii code or None if no input
+        raise EOFError once the input has closed and been used up
+        """
+        if not self.pending:
+            if self.eof or not self.read(0):
+                raise EOFError('console input closed')
+        while self.pending:
+            key = decode(self.pending, True)
+            if key is None:
+                # partial escape sequence: give the rest a chance to arrive
+                n = len(self.pending)
+                if self.read(_escape_timeout) and len(self.pending) > n:
+                    continue
+                key = decode(self.pending, False)
+            (code, n) = key
+            del self.pending[:n]
+            return code
+        return None
+
+    def put(self, data):
+        """output a string to console"""
+        sys.stdout.write(data)
+        sys.stdout.flush()
+
+#-----------------------------------------------------------------------------
+
+if sys.platform == 'win32':
+    console = win_console
+else:
+    console = posix_console
+
+#-----------------------------------------------------------------------------
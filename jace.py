@@ -4,29 +4,97 @@ Jupiter ACE Emulator
 """
 #-----------------------------------------------------------------------------
 
+import asyncio
+import board
 import memory
 import z80da
 import z80
 import monitor
+import scheduler
+import sound
+import split
+import tape
 import util
-import pygame
-from pygame.locals import *
+
+try:
+    import pygame
+    from pygame.locals import *
+except ImportError:
+    # headless machines (Eg. on free-threaded builds) don't need pygame
+    pygame = None
+
+#-----------------------------------------------------------------------------
+# help for cli leaf functions
+
+_help_tape = (
+    ('[file] [fast]', '.tap file to load from - saves are added to the end'),
+    ( '', 'or a .wav recording, played into the tape input'),
+    ( '', 'fast: decode the .wav recording for the rom loader'),
+    ( '', 'insert the file again to rewind it'),
+    ( '', 'display the tape position if omitted'),
+)
+
+_help_split = (
+    ('<cr>', 'run the emulation in a worker process'),
+    ( '', 'a .tap tape goes with it, a .wav tape can\'t - insert a .tap'),
+    ( '', 'there is no sound while the worker runs'),
+)
+
+_help_ram = (
+    ('[size] [file]', 'expansion ram size (K) - 0, 16, 32 or 48'),
+    ( '', 'file to back the ram with - it persists across sessions'),
+    ( '', 'display the current size if omitted'),
+)
 
 #-----------------------------------------------------------------------------
 
+_CPU_CLOCK = 3250000 # Hz
+_FRAME_RATE = 50 # Hz
+_FRAME_CLKS = _CPU_CLOCK // _FRAME_RATE
+_FRAME_PERIOD = 1.0 / _FRAME_RATE # secs
+
 _CHAR_NUM = 256
 _CHAR_MASK = 0x7f
 _CHAR_ADR = 0x2800
+_VIDEO_ADR = 0x2000
 _COLS = 32
 _ROWS = 24
 _PIXELS_H = _COLS * 8
 _PIXELS_V = _ROWS * 8
 _VIDEO_SIZE = _COLS * _ROWS
 
+# ram expansion packs (K bytes) fitted at 0x4000
+_EXPANSION_ADR = 0x4000
+_expansions = (0, 16, 32, 48)
+
+# rom tape routines - trapped to copy blocks between memory and a .tap file
+_TAPE_SAVE = 0x1820 # hl = address, de = length, c = flag
+_TAPE_LOAD = 0x18a7 # as save, carry set = load, clear = verify
+_TAPE_TRAP_CLKS = 10 # charged for a trapped routine before the rom resumes
+# the traps resume the rom at the end of the routines, so the registers,
+# the BREAK check and the border/speaker output are the rom's own
+_TAPE_EXIT = 0x1892 # pop iy; check BREAK; ei; ret - af' is swapped around the check
+_TAPE_CHECK = 0x18f8 # load: ld a,h; cp 01; ret - carry set if the checksum is good
+_TAPE_BYTE = 0x190c # load: xor the byte read in l into the checksum in h
+_TAPE_FLAG = 0x18da # load: return here from reading the flag byte
+_TAPE_VERIFY = 0x18e7 # load: compare the byte read in l with (iy)
+
+# shared memory buffers for split mode
+_split_layout = (
+    ('video', 1 << 10),
+    ('char', 1 << 10),
+)
+
+# the cpu registers of a machine state
+_cpu_regs = ('a', 'f', 'b', 'c', 'd', 'e', 'h', 'l', 'alt_af', 'alt_bc', 'alt_de', 'alt_hl',
+    'sp', 'ix', 'iy', 'i', 'r', 'im', 'iff1', 'iff2', 'halt', 'pc')
+
 _bgnd = (0, 0, 0)
 _fgnd = (0xf9, 0xf9, 0xf9)
 _border = (0xf9, 0xf9, 0xf9)
 
+_keyboard_file = './graphics/keyboard.png'
+
 _border_x = 20
 _border_y = 20
 
@@ -48,6 +116,9 @@ class video:
         self.char_cache = [None] * _CHAR_NUM
         self.mem = None
         self.cmem = None
+        self.kb = None
+        self.shadow_video = None
+        self.shadow_char = None
 
     def adr2xy(self, adr):
         """given a video address return an (x,y) screen pixel position"""
@@ -79,7 +150,7 @@ class video:
         return bmp
 
     def update(self, screen):
-        """update the video display"""
+        """draw the dirty characters onto the screen surface - return True if any"""
         if self.dirty:
             #print len(self.dirty)
             for adr in self.dirty:
@@ -90,7 +161,8 @@ class video:
                     self.char_cache[char] = bmp
                 screen.blit(bmp, self.adr2xy(adr))
             self.dirty = []
-            pygame.display.flip()
+            return True
+        return False
 
     def refresh(self, screen):
         """refresh the whole display"""
@@ -98,23 +170,56 @@ class video:
         bg = bg.convert()
         bg.fill(_border)
         screen.blit(bg, (0, 0))
-        kb = pygame.image.load('./graphics/keyboard.png')
-        kb = kb.convert()
-        screen.blit(kb, (0, _keyboard_y))
+        if self.kb is None:
+            self.kb = pygame.image.load(_keyboard_file).convert()
+        screen.blit(self.kb, (0, _keyboard_y))
         pygame.display.flip()
 
-    def char_wr(self, adr):
-        """the cpu has written to character memory"""
-        # invalidate the character cache entries for this address
-        c = (adr >> 3) & _CHAR_MASK
-        self.char_cache[c] = None
-        self.char_cache[0x80 | c] = None
-
-    def video_wr(self, adr):
-        """the cpu has written to video memory"""
-        # add the address to the dirty list
-        if (adr & 0x3ff) < _VIDEO_SIZE:
-            self.dirty.append(adr)
+    def sync(self, vmem, cmem):
+        """
+        Update the dirty list and character cache by comparing video and
+        character memory (written by another process) with shadow copies.
+        """
+        chars = bytes(cmem)
+        changed = set()
+        if chars != self.shadow_char:
+            for c in range(_CHAR_NUM >> 1):
+                cadr = c << 3
+                if (self.shadow_char is None) or (chars[cadr:cadr + 8] != self.shadow_char[cadr:cadr + 8]):
+                    self.char_cache[c] = None
+                    self.char_cache[0x80 | c] = None
+                    changed.add(c)
+            self.shadow_char = chars
+        video = bytes(vmem[:_VIDEO_SIZE])
+        if (video != self.shadow_video) or changed:
+            for i in range(_VIDEO_SIZE):
+                c = video[i]
+                if (self.shadow_video is None) or (c != self.shadow_video[i]) or ((c & _CHAR_MASK) in changed):
+                    self.dirty.append(_VIDEO_ADR + i)
+            self.shadow_video = video
+
+    def poll(self, vdev, cdev):
+        """
+        Update the dirty list and character cache from the dirty line
+        bitmaps of the video and character memory devices.
+        """
+        changed = set()
+        for line in cdev.poll_dirty():
+            # invalidate the character cache entries for this line
+            for c in range(line << (memory._LINE_BITS - 3), (line + 1) << (memory._LINE_BITS - 3)):
+                c &= _CHAR_MASK
+                self.char_cache[c] = None
+                self.char_cache[0x80 | c] = None
+                changed.add(c)
+        for line in vdev.poll_dirty():
+            adr = line << memory._LINE_BITS
+            for i in range(adr, min(adr + memory._LINE_SIZE, _VIDEO_SIZE)):
+                self.dirty.append(_VIDEO_ADR + i)
+        if changed:
+            # redraw the characters whose shape has changed
+            for i in range(_VIDEO_SIZE):
+                if (vdev.mem[i] & _CHAR_MASK) in changed:
+                    self.dirty.append(_VIDEO_ADR + i)
 
 #-----------------------------------------------------------------------------
 #;                          LOGICAL VIEW OF KEYBOARD
@@ -133,159 +238,315 @@ class video:
 #; Start         +------------>--------------------->-------------+        End
 #;
 
-class keyboard:
-    """keyboard emulation"""
-
-    def __init__(self):
-        self.ports = {
-            0xfefe : 0xff,
-            0xfdfe : 0xff,
-            0xfbfe : 0xff,
-            0xf7fe : 0xff,
-            0xeffe : 0xff,
-            0xdffe : 0xff,
-            0xbffe : 0xff,
-            0x7ffe : 0xff,
-        }
-        self.keys = {
-            K_a : (0xfdfe, (1 << 0)),
-            K_b : (0x7ffe, (1 << 3)),
-            K_c : (0xfefe, (1 << 4)),
-            K_d : (0xfdfe, (1 << 2)),
-            K_e : (0xfbfe, (1 << 2)),
-            K_f : (0xfdfe, (1 << 3)),
-            K_g : (0xfdfe, (1 << 4)),
-            K_h : (0xbffe, (1 << 4)),
-            K_i : (0xdffe, (1 << 2)),
-            K_j : (0xbffe, (1 << 3)),
-            K_k : (0xbffe, (1 << 2)),
-            K_l : (0xbffe, (1 << 1)),
-            K_m : (0x7ffe, (1 << 1)),
-            K_n : (0x7ffe, (1 << 2)),
-            K_o : (0xdffe, (1 << 1)),
-            K_p : (0xdffe, (1 << 0)),
-            K_q : (0xfbfe, (1 << 0)),
-            K_r : (0xfbfe, (1 << 3)),
-            K_s : (0xfdfe, (1 << 1)),
-            K_t : (0xfbfe, (1 << 4)),
-            K_u : (0xdffe, (1 << 3)),
-            K_v : (0x7ffe, (1 << 4)),
-            K_w : (0xfbfe, (1 << 1)),
-            K_x : (0xfefe, (1 << 3)),
-            K_y : (0xdffe, (1 << 4)),
-            K_z : (0xfefe, (1 << 2)),
-            K_0 : (0xeffe, (1 << 0)),
-            K_1 : (0xf7fe, (1 << 0)),
-            K_2 : (0xf7fe, (1 << 1)),
-            K_3 : (0xf7fe, (1 << 2)),
-            K_4 : (0xf7fe, (1 << 3)),
-            K_5 : (0xf7fe, (1 << 4)),
-            K_6 : (0xeffe, (1 << 4)),
-            K_7 : (0xeffe, (1 << 3)),
-            K_8 : (0xeffe, (1 << 2)),
-            K_9 : (0xeffe, (1 << 1)),
-            K_LSHIFT : (0xfefe, (1 << 0)),
-            K_RSHIFT : (0xfefe, (1 << 1)),
-            K_SPACE : (0x7ffe, (1 << 0)),
-            K_RETURN : (0xbffe, (1 << 0)),
-        }
-
-    def get(self):
-        """process keyboard events"""
-        for event in pygame.event.get():
-            if event.type == KEYDOWN:
-                x = self.keys.get(event.key, None)
-                if x != None:
-                    (port, bits) = x
-                    self.ports[port] &= ~bits
-                    return True
-            elif event.type == KEYUP:
-                x = self.keys.get(event.key, None)
-                if x != None:
-                    (port, bits) = x
-                    self.ports[port] |= bits
-        return False
-
-    def rd(self, adr):
-        """return the current port value"""
-        return self.ports.get(adr, None)
+def host_keys():
+    """return the host key to (port, bits) mapping"""
+    return {
+        K_a : (0xfdfe, (1 << 0)),
+        K_b : (0x7ffe, (1 << 3)),
+        K_c : (0xfefe, (1 << 4)),
+        K_d : (0xfdfe, (1 << 2)),
+        K_e : (0xfbfe, (1 << 2)),
+        K_f : (0xfdfe, (1 << 3)),
+        K_g : (0xfdfe, (1 << 4)),
+        K_h : (0xbffe, (1 << 4)),
+        K_i : (0xdffe, (1 << 2)),
+        K_j : (0xbffe, (1 << 3)),
+        K_k : (0xbffe, (1 << 2)),
+        K_l : (0xbffe, (1 << 1)),
+        K_m : (0x7ffe, (1 << 1)),
+        K_n : (0x7ffe, (1 << 2)),
+        K_o : (0xdffe, (1 << 1)),
+        K_p : (0xdffe, (1 << 0)),
+        K_q : (0xfbfe, (1 << 0)),
+        K_r : (0xfbfe, (1 << 3)),
+        K_s : (0xfdfe, (1 << 1)),
+        K_t : (0xfbfe, (1 << 4)),
+        K_u : (0xdffe, (1 << 3)),
+        K_v : (0x7ffe, (1 << 4)),
+        K_w : (0xfbfe, (1 << 1)),
+        K_x : (0xfefe, (1 << 3)),
+        K_y : (0xdffe, (1 << 4)),
+        K_z : (0xfefe, (1 << 2)),
+        K_0 : (0xeffe, (1 << 0)),
+        K_1 : (0xf7fe, (1 << 0)),
+        K_2 : (0xf7fe, (1 << 1)),
+        K_3 : (0xf7fe, (1 << 2)),
+        K_4 : (0xf7fe, (1 << 3)),
+        K_5 : (0xf7fe, (1 << 4)),
+        K_6 : (0xeffe, (1 << 4)),
+        K_7 : (0xeffe, (1 << 3)),
+        K_8 : (0xeffe, (1 << 2)),
+        K_9 : (0xeffe, (1 << 1)),
+        K_LSHIFT : (0xfefe, (1 << 0)),
+        K_RSHIFT : (0xfefe, (1 << 1)),
+        K_SPACE : (0x7ffe, (1 << 0)),
+        K_RETURN : (0xbffe, (1 << 0)),
+    }
 
 #-----------------------------------------------------------------------------
 
-class memmap:
+# the machine description
+_spec = {
+    'roms': {'rom': './roms/ace.rom'},
+    'memory': (
+        ('rom', 0x0000, 0x2000, 'rom', 13, memory.RO),
+        # video and character writes go through the devices for dirty tracking
+        ('video', 0x2000, 0x0800, 'ram', 10, memory.DEV), # 1K repeats 2 times
+        ('char', 0x2800, 0x0800, 'wom', 10, memory.DEV),  # 1K repeats 2 times
+        ('ram', 0x3000, 0x1000, 'ram', 10, memory.RW),    # 1K repeats 4 times
+        # 0x4000 - 0xffff: optional ram expansion
+    ),
+    'ports': (
+        ('keyboard', 0x0001, 0x0000), # A0 low
+    ),
+    'interrupts': (
+        ('frame', _FRAME_CLKS),
+    ),
+}
+
+class memmap(memory.bus):
     """memory devices and address map"""
 
-    def __init__(self, romfile = './roms/ace.rom'):
-        self.rom = memory.rom(13)
-        self.rom.load_file(0, romfile)
-        self.video = memory.ram(10)
-        self.char = memory.wom(10)
-        self.ram = memory.ram(10)
-        self.empty = memory.null()
-
-    def select(self, adr):
-        """return the memory object selected by this address"""
-        # select with 2k granularity
-        memmap = (
-            self.rom,   # 0x0000 - 0x07ff
-            self.rom,   # 0x0800 - 0x0fff
-            self.rom,   # 0x1000 - 0x17ff
-            self.rom,   # 0x1800 - 0x1fff
-            self.video, # 0x2000 - 0x27ff - 1K repeats 2 times
-            self.char,  # 0x2800 - 0x2fff - 1K repeats 2 times
-            self.ram,   # 0x3000 - 0x37ff - 1K repeats 4 times
-            self.ram,   # 0x3800 - 0x3fff
-            self.empty, # 0x4000
-            self.empty, # 0x4800
-            self.empty, # 0x5000
-            self.empty, # 0x5800
-            self.empty, # 0x6000
-            self.empty, # 0x6800
-            self.empty, # 0x7000
-            self.empty, # 0x7800
-            self.empty, # 0x8000
-            self.empty, # 0x8800
-            self.empty, # 0x9000
-            self.empty, # 0x9800
-            self.empty, # 0xa000
-            self.empty, # 0xa800
-            self.empty, # 0xb000
-            self.empty, # 0xb800
-            self.empty, # 0xc000
-            self.empty, # 0xc800
-            self.empty, # 0xd000
-            self.empty, # 0xd800
-            self.empty, # 0xe000
-            self.empty, # 0xe800
-            self.empty, # 0xf000
-            self.empty, # 0xf800
-        )
-        return memmap[adr >> 11]
-
-    def __getitem__(self, adr):
-        adr &= 0xffff
-        return self.select(adr)[adr]
+    def __init__(self, romfile = './roms/ace.rom', video = None, char = None, expansion = 0):
+        """
+        video, char: optional external buffers for video and character memory
+        expansion: ram expansion size (K bytes)
+        """
+        memory.bus.__init__(self)
+        # the rom image is shared by all instances
+        board.build_memory(self, _spec, {'rom': romfile}, {'video': video, 'char': char})
+        self.expansion = None
+        self.expand(expansion)
+
+    def expand(self, size, filename = None):
+        """
+        Fit a size K byte ram expansion at 0x4000 - unmapped if 0.
+        filename: back the expansion with a host file so it persists
+        """
+        if size not in _expansions:
+            raise ValueError('bad ram expansion size %d' % size)
+        self.unmap(_EXPANSION_ADR, 0x10000 - _EXPANSION_ADR)
+        if isinstance(self.expansion, memory.mapped_ram):
+            # release the file mapping - unmapped from the bus above
+            self.expansion.close()
+        self.expansion = None
+        self.expansion_size = size
+        if size:
+            n = size << 10
+            bits = (n - 1).bit_length()
+            if filename is None:
+                self.expansion = memory.ram(bits)
+            else:
+                self.expansion = memory.mapped_ram(bits, filename)
+            self.map(_EXPANSION_ADR, n, self.expansion)
 
-    def __setitem__(self, adr, val):
-        adr &= 0xffff
-        self.select(adr)[adr] = val
+    def reset(self):
+        """zero the ram - a file backed expansion keeps its contents"""
+        self.video.clear()
+        self.char.clear()
+        self.ram.clear()
+        if (self.expansion is not None) and not isinstance(self.expansion, memory.mapped_ram):
+            self.expansion.clear()
 
 #-----------------------------------------------------------------------------
 
-class io:
-    """io handler"""
-
-    def __init__(self):
-        self.keyboard = None
-
-    def rd(self, adr):
-        val = self.keyboard(adr)
-        if val == None:
-            val = 0xff
-        return val
+class machine:
+    """
+    The headless machine: memory, io, keyboard matrix, cpu and scheduler.
+    All state is per instance, so machines can run on separate threads.
+    """
+
+    def __init__(self, romfile = './roms/ace.rom', video = None, char = None, expansion = 0):
+        self.keyboard = board.keyboard()
+        self.mem = memmap(romfile, video, char, expansion)
+        self.io = board.io(_spec['ports'], {
+            'keyboard': (self.port_rd, self.port_wr),
+        })
+        self.cpu = z80.cpu(self.mem, self.io)
+        self.beeper = sound.beeper(self.cpu, _CPU_CLOCK)
+        self.tape = tape.tap()
+        self.ear = None
+        self.cpu.trap(_TAPE_SAVE, self.tape_save)
+        self.cpu.trap(_TAPE_LOAD, self.tape_load)
+        self.sched = scheduler.scheduler(self.cpu)
+        board.add_interrupts(self.sched, _spec, {
+            'frame': self.frame,
+        })
+
+    def port_rd(self, adr):
+        """in from port 0xfe: read the keyboard and tape input, the speaker moves in"""
+        self.beeper.set(0)
+        if self.ear is not None:
+            return (self.keyboard.rd(adr) & 0xdf) | (self.ear.rd() << 5)
+        return self.keyboard.rd(adr)
+
+    def port_wr(self, adr, val):
+        """out to port 0xfe: the speaker moves out"""
+        self.beeper.set(1)
+
+    def eject(self):
+        """stop playing a WAV tape recording"""
+        if self.ear is not None:
+            self.sched.remove_device(self.ear)
+            self.ear = None
+
+    def insert(self, filename):
+        """insert a .tap file"""
+        self.eject()
+        self.tape = tape.tap(filename)
+
+    def play(self, filename, fast = False):
+        """
+        Play a WAV tape recording from now.
+        fast: decode the recording to blocks for the rom loader traps,
+        instead of playing it into the tape input
+        """
+        self.eject()
+        if fast:
+            self.tape = tape.wav_tap(filename)
+            return
+        # the rom loader reads the tape input
+        self.tape = tape.tap()
+        self.ear = tape.ear(self.cpu, filename, _CPU_CLOCK)
+        self.sched.add_device(self.ear)
+
+    def tape_exit(self):
+        """resume the rom at the exit of a tape routine - the caller's iy is on the stack"""
+        cpu = self.cpu
+        cpu._push(cpu.iy)
+        cpu._set_pc(_TAPE_EXIT)
+        return _TAPE_TRAP_CLKS
+
+    def tape_save(self):
+        """rom save trap: append the block to the tape"""
+        cpu = self.cpu
+        self.tape.write(self.mem.read_block(cpu._get_hl(), cpu._get_de()))
+        # registers as the rom's save loop leaves them
+        cpu._set_af(0xff6a)
+        cpu._set_bc(0x0008)
+        cpu._set_de(0xffff)
+        cpu._set_hl(0x0000)
+        return self.tape_exit()
+
+    def tape_load(self):
+        """
+        rom load/verify trap: copy the next block from the tape, then
+        resume the rom where it tests the result, with the registers its
+        byte loop leaves. Only r differs from a real load. A block shorter
+        than asked for fails at once, where the rom waits for the rest.
+        """
+        block = self.tape.read()
+        if block is None:
+            # the rom waits for a tape signal until break is pressed
+            return None
+        (flag, data, csum) = block
+        cpu = self.cpu
+        adr = cpu._get_hl()
+        n = cpu._get_de()
+        wanted = cpu.c
+        load = cpu.f & 1
+        # the rom keeps the load/verify carry in af', the edge timing in b
+        # and the edge polarity in c
+        cpu.alt_af = cpu._get_af()
+        cpu._set_bc(0x00ff)
+        cpu._push(cpu.iy)
+        cpu._push(_TAPE_EXIT)
+        if flag != wanted:
+            # the flag byte is xored into h: the rom returns nz
+            cpu.h = wanted
+            cpu.l = flag
+            cpu._push(_TAPE_FLAG)
+            cpu._set_pc(_TAPE_BYTE)
+            return _TAPE_TRAP_CLKS
+        if len(data) < n:
+            # a short block: fail with carry clear
+            cpu.f &= 0xfe
+            cpu._set_pc(cpu._pop())
+            return _TAPE_TRAP_CLKS
+        if not load:
+            old = self.mem.read_block(adr, n)
+            for i in range(n):
+                if old[i] != data[i]:
+                    # the rom returns nz from the compare
+                    cpu.iy = adr + i
+                    cpu._set_de(n - i)
+                    cpu._set_hl((tape.checksum(data[:i + 1]) << 8) | data[i])
+                    cpu._set_pc(_TAPE_VERIFY)
+                    return _TAPE_TRAP_CLKS
+        else:
+            self.mem.write_block(adr, data[:n])
+        # the byte after the block is taken as the checksum
+        last = (data[n:n + 1] or bytes((csum,)))[0]
+        cpu.iy = (adr + n) & 0xffff
+        cpu._set_de(0)
+        cpu._set_hl((tape.checksum(data[:n]) ^ last) << 8 | last)
+        cpu._set_pc(_TAPE_CHECK)
+        return _TAPE_TRAP_CLKS
+
+    def frame(self):
+        """frame event: emit the frame of sound, interrupt the cpu"""
+        self.beeper.frame()
+        return self.cpu.interrupt()
+
+    def state(self):
+        """
+        Return the machine state (Eg. to hand to a split mode worker): cpu,
+        ram, held keys and the .tap tape. A playing WAV tape and the sound
+        output are not part of the state.
+        """
+        mem = self.mem
+        expansion = None
+        if mem.expansion is not None:
+            expansion = mem.expansion.snapshot()
+        return {
+            'cpu': dict([(x, getattr(self.cpu, x)) for x in _cpu_regs]),
+            'video': mem.video.snapshot(),
+            'char': mem.char.snapshot(),
+            'ram': mem.ram.snapshot(),
+            'expansion': (mem.expansion_size, expansion),
+            'keys': bytes(self.keyboard.rows),
+            'tape': (None, self.tape)[isinstance(self.tape, tape.tap)],
+        }
 
-    def wr(self, adr, val):
-        pass
+    def restore(self, state):
+        """restore a machine state"""
+        mem = self.mem
+        (size, expansion) = state['expansion']
+        if isinstance(expansion, str):
+            # a file backed expansion: the file has the contents
+            if getattr(mem.expansion, 'filename', None) != expansion:
+                mem.expand(size, expansion)
+        else:
+            if (mem.expansion_size != size) or isinstance(mem.expansion, memory.mapped_ram):
+                mem.expand(size)
+            if expansion is not None:
+                mem.expansion.restore(expansion)
+        mem.video.restore(state['video'])
+        mem.char.restore(state['char'])
+        mem.ram.restore(state['ram'])
+        for (x, val) in state['cpu'].items():
+            setattr(self.cpu, x, val)
+        self.keyboard.rows[:] = state['keys']
+        self.keyboard.update()
+        if state['tape'] is not None:
+            self.eject()
+            self.tape = state['tape']
+
+    def reset(self, hard = True):
+        """
+        Reset the machine so it can be reused.
+        hard: also zero the ram, as at power on
+        """
+        self.cpu.reset()
+        self.keyboard.reset()
+        self.sched.reset()
+        self.beeper.reset()
+        if hard:
+            self.mem.reset()
+
+    def run(self, clks):
+        """run the machine for clks T-states"""
+        return self.sched.run(clks)
 
 #-----------------------------------------------------------------------------
 
@@ -294,10 +555,12 @@ class jace:
     def __init__(self, app):
         self.app = app
         self.video = video()
-        self.keyboard = keyboard()
-        self.mem = memmap()
-        self.io = io()
-        self.cpu = z80.cpu(self.mem, self.io)
+        self.machine = machine()
+        self.keyboard = self.machine.keyboard
+        self.mem = self.machine.mem
+        self.cpu = self.machine.cpu
+        self.sched = self.machine.sched
+        self.keys = host_keys()
         self.mon = monitor.monitor(self.cpu)
         self.menu_root = (
             ('..', 'return to main menu', util.cr, self.parent_menu, None),
@@ -306,70 +569,190 @@ class jace:
             ('exit', 'exit the application', util.cr, self.exit, None),
             ('help', 'display general help', util.cr, app.general_help, None),
             ('memory', 'memory functions', None, None, self.mon.menu_memory),
+            ('ram', 'set the ram expansion size', _help_ram, self.cli_ram, None),
             ('regs', 'display cpu registers', util.cr, self.mon.cli_registers, None),
             ('run', 'run the emulation', util.cr, self.cli_run, None),
+            ('split', 'run the emulation in a worker process', _help_split, self.cli_split, None),
             ('step', 'single step the emulation', util.cr, self.cli_step, None),
+            ('stop', 'stop the emulation', util.cr, self.cli_stop, None),
+            ('tape', 'insert a tape file', _help_tape, self.cli_tape, None),
         )
 
-        def filtered_char_wr(adr):
-            if 0 <= adr <= 255: # Check if it's a valid character code
-                self.video.char_wr(adr) 
-
-        def filtered_video_wr(adr):
-            if 0 <= adr <= 255: # Check if it's a valid character code
-                self.video.video_wr(adr)
-
-        # create the hooks between video and memory
-        self.mem.char.wr_notify = self.video.char_wr
-        self.mem.video.wr_notify = self.video.video_wr
+        # the video polls the memory dirty bitmaps when presenting
         self.video.mem = self.mem
         self.video.cmem = self.mem.char.rd
 
-        # create the hooks between io and keyboard
-        self.io.keyboard = self.keyboard.rd
-
-        # setup the video window
+        # setup the video window and sound - a small mixer buffer keeps the latency down
+        pygame.mixer.pre_init(sound._RATE, -16, 1, 512)
         pygame.init()
         self.screen = pygame.display.set_mode((_screen_x, _screen_y))
         pygame.display.set_caption('Jupiter ACE')
         self.video.refresh(self.screen)
+        if (sound.numpy is not None) and pygame.mixer.get_init():
+            self.machine.beeper.sink = sound.mixer_sink(pygame.mixer)
+
+        # video presentation and host input polling run while the target is selected
+        self.emulation = None
+        self.split = None
+        self.tasks = [
+            asyncio.create_task(scheduler.periodic(_FRAME_PERIOD, self.present)),
+            asyncio.create_task(scheduler.periodic(_FRAME_PERIOD, self.poll_input)),
+        ]
 
-        app.cli.set_poll(pygame.event.pump)
         app.cli.set_root(self.menu_root)
         self.app.cli.set_prompt('\njace> ')
 
     def cli_char(self, app, args):
         """display the character memory"""
         md = monitor.mem_display(app, _CHAR_ADR)
-        for i in range(0x400):
-            md.write(self.mem.char.rd(i))
+        for val in self.mem.char.dump(0, 0x400):
+            md.write(val)
+
+    def cli_ram(self, app, args):
+        """set the ram expansion size - this resets the machine"""
+        if util.wrong_argc(app, args, (0, 1, 2)):
+            return
+        if len(args) == 0:
+            app.put('\n\nram expansion: %dK\n' % self.mem.expansion_size)
+            return
+        size = util.int_arg(app, args[0], (0, 48), 10)
+        if size is None:
+            return
+        if size not in _expansions:
+            app.put(util.inv_arg)
+            return
+        if self.running():
+            app.put('\n\nstop the emulation first\n')
+            return
+        filename = (None, args[-1])[len(args) == 2]
+        self.mem.expand(size, filename)
+        self.machine.reset()
+        app.put('\n\nram expansion: %dK - machine reset\n' % size)
+
+    def cli_tape(self, app, args):
+        """insert a tape file"""
+        if util.wrong_argc(app, args, (0, 1, 2)):
+            return
+        if len(args) == 0:
+            if self.machine.ear is not None:
+                app.put('\n\ntape %s playing\n' % self.machine.ear.filename)
+            else:
+                app.put('\n\ntape %s\n' % self.machine.tape)
+            return
+        if not args[0].endswith('.wav'):
+            if len(args) == 2:
+                app.put(util.inv_arg)
+                return
+            self.machine.insert(args[0])
+            app.put('\n\ntape %s\n' % self.machine.tape)
+            return
+        if not util.file_arg(app, args[0]):
+            return
+        if tape.numpy is None:
+            app.put('\n\nwav tapes need numpy\n')
+            return
+        if (len(args) == 2) and (args[1] != 'fast'):
+            app.put(util.inv_arg)
+            return
+        self.machine.play(args[0], len(args) == 2)
+        app.put('\n\ntape %s playing\n' % args[0])
+
+    def poll_input(self):
+        """host input task: process keyboard events - the matrix is sampled by the cpu"""
+        try:
+            if self.keyboard.sender is not None:
+                # key events the worker had no room for
+                self.keyboard.sender.flush()
+            for event in pygame.event.get():
+                if event.type in (KEYDOWN, KEYUP):
+                    x = self.keys.get(event.key, None)
+                    if x != None:
+                        (port, bits) = x
+                        self.keyboard.event(port, bits, event.type == KEYDOWN)
+        except split.Error as e:
+            # the events stay queued
+            self.app.put('\n\nsplit mode: key events waiting - %s\n' % e)
+
+    def present(self):
+        """video presentation task"""
+        if self.split is not None:
+            (sm, worker, conn) = self.split
+            self.video.sync(sm.bufs['video'], sm.bufs['char'])
+        else:
+            self.video.poll(self.mem.video, self.mem.char)
+        if self.video.update(self.screen):
+            pygame.display.flip()
+
+    def running(self):
+        """return True if the emulation task or worker is running"""
+        if self.split is not None:
+            return True
+        return (self.emulation is not None) and not self.emulation.done()
+
+    async def emulate(self):
+        """cpu task: run frame sized slices in real time"""
+        try:
+            await self.sched.run_async(_FRAME_CLKS, _FRAME_PERIOD)
+        except z80.Error as e:
+            self.app.put('\n\nexception: %s\n' % e)
+            self.app.cli.cl.render()
 
     def cli_run(self, app, args):
         """run the emulation"""
-        app.put('\n\npress any key to halt\n')
-        cpu_clks = 0
-        video_clks = 0
-        irq = False
-        while True:
-            if app.io.anykey():
-                return
-            try:
-                pc = self.cpu._get_pc()
-                if (cpu_clks > 5000) or irq:
-                    cpu_clks = self.cpu.interrupt()
-                    irq = False
-                else:
-                    cpu_clks += self.cpu.execute()
-            except z80.Error as e:
-                self.cpu._set_pc(pc)
-                app.put('exception: %s\n' % e)
-                return
-            if video_clks == 500:
-                self.video.update(self.screen)
-                video_clks = 0
-            else:
-                video_clks += 1
-            irq = self.keyboard.get()
+        if self.running():
+            app.put('\n\nalready running\n')
+            return
+        self.emulation = asyncio.create_task(self.emulate())
+        app.put('\n\nrunning - use "stop" to halt\n')
+
+    def cli_split(self, app, args):
+        """run the emulation in a worker process"""
+        if self.running():
+            app.put('\n\nalready running\n')
+            return
+        if (self.machine.ear is not None) or not isinstance(self.machine.tape, tape.tap):
+            app.put('\n\na .wav tape can\'t go to the worker - insert a .tap tape first\n')
+            return
+        # the worker takes over the machine
+        self.split = split.start(split_worker, _split_layout, self.machine.state())
+        (sm, worker, conn) = self.split
+        # render from the shared buffers, forward key events to the worker
+        self.video.mem = memory.ram(10, sm.bufs['video'])
+        self.video.cmem = memory.wom(10, sm.bufs['char']).rd
+        self.keyboard.sender = split.sender(sm.ring)
+        app.put('\n\nrunning in process %d without sound - use "stop" to halt\n' % worker.pid)
+
+    def stop_split(self):
+        """stop the worker process, take back its machine state, render from local memory again"""
+        (sm, worker, conn) = self.split
+        frames = sm.ctl[split.CTL_FRAMES]
+        self.keyboard.sender = None
+        self.video.mem = self.mem
+        self.video.cmem = self.mem.char.rd
+        self.video.shadow_video = None
+        self.video.shadow_char = None
+        self.video.char_cache = [None] * _CHAR_NUM
+        state = split.stop(sm, worker, conn)
+        if state is not None:
+            # the host's key matrix has every event, sent or still queued
+            state['keys'] = bytes(self.keyboard.rows)
+            self.machine.restore(state)
+        # redraw from local memory
+        self.mem.video.touch()
+        self.mem.char.touch()
+        self.split = None
+        return frames
+
+    def cli_stop(self, app, args):
+        """stop the emulation"""
+        if self.split is not None:
+            frames = self.stop_split()
+            app.put('\n\nworker stopped after %d frames\n' % frames)
+            return
+        if self.running():
+            self.emulation.cancel()
+        self.emulation = None
+        app.put('\n\nstopped at %s\n' % self.current_instruction())
 
     def current_instruction(self):
         """return a string for the current instruction"""
@@ -379,9 +762,12 @@ class jace:
 
     def cli_step(self, app, args):
         """single step the cpu"""
+        if self.running():
+            app.put('\n\nstop the emulation first\n')
+            return
         done = 'done: %s' % self.current_instruction()
-        self.cpu.execute()
-        self.video.update(self.screen)
+        self.sched.step()
+        self.present()
         next = 'next: %s' % self.current_instruction()
         app.put('\n\n%s\n' % '\n'.join((done, next)))
 
@@ -389,9 +775,45 @@ class jace:
         """exit the application"""
         app.exit(app, [])
 
+    def close(self):
+        """cancel the target tasks"""
+        if self.split is not None:
+            self.stop_split()
+        if self.running():
+            self.emulation.cancel()
+        for task in self.tasks:
+            task.cancel()
+
     def parent_menu(self, app, args):
         """return to parent menu"""
+        self.close()
         app.put('\n')
         app.main_menu()
 
+#
+
+#-----------------------------------------------------------------------------
+
+def split_worker(name, conn, state):
+    """
+    Split mode worker process: take over the host's machine state, run the
+    cpu with video and character memory in shared memory, take key events
+    from the ring. Send the machine state back when stopped.
+    """
+    sm = split.shared(_split_layout, name)
+    m = machine(video = sm.bufs['video'], char = sm.bufs['char'])
+    m.restore(state)
+
+    def poll():
+        m.keyboard.events(sm.ring.get())
+        sm.ctl[split.CTL_FRAMES] += 1
+        if sm.ctl[split.CTL_STOP]:
+            m.sched.stop()
+
+    m.sched.add(_FRAME_CLKS, poll)
+    asyncio.run(m.sched.run_async(_FRAME_CLKS, _FRAME_PERIOD))
+    conn.send(m.state())
+    conn.close()
+    sm.close()
+
 #-----------------------------------------------------------------------------
@@ -4,13 +4,13 @@ PyZ80: Z80 platform Emulator
 """
 #-----------------------------------------------------------------------------
 
+import os
 import sys
+import asyncio
 import logging
 import conio
 import cli
 import util
-import jace
-import tec1
 
 #-----------------------------------------------------------------------------
 
@@ -23,6 +23,7 @@ class application:
     def __init__(self):
         self.menu_targets = (
             ('jace', 'Jupiter Ace', util.cr, self.target_jace, None),
+            ('spectrum', 'Sinclair ZX Spectrum 48K', util.cr, self.target_spectrum, None),
             ('tec1', 'Talking Electronics TEC-1', util.cr, self.target_tec1, None),
         )
         self.menu_root = (
@@ -51,7 +52,8 @@ class application:
         sys.stdout.flush()  # Ensure output is immediately displayed
 
     def run(self):
-        self.cli.run()
+        """run the cli (and any target tasks) in an asyncio event loop"""
+        asyncio.run(self.cli.run())
 
     def exit(self, app, args):
         app.cli.exit()
@@ -61,16 +63,32 @@ class application:
         app.put('\n\n%s\n' % _version_str)
 
     def target_jace(self, app, args):
+        # imported on selection: pulls in pygame and the cpu core
+        import jace
         app.put('\n\nemulating "Jupiter ACE"\n')
         self.current_target = jace.jace(app) # Store the target instance
         app.cli.set_prompt('\njace> ')
         #jace.jace(app)
 
     def target_tec1(self, app, args):
+        # imported on selection: pulls in pygame and the cpu core
+        import tec1
         app.put('\n\nemulating "Talking Electronics TEC 1"\n')
-        #self.current_target = tec1.tec1(app) # Store the target instance
-        #app.cli.set_prompt('\ntec1> ')
-        #tec1.tec1(app)
+        self.current_target = tec1.tec1(app) # Store the target instance
+        app.cli.set_prompt('\ntec1> ')
+
+    def target_spectrum(self, app, args):
+        # imported on selection: pulls in pygame, numpy and the cpu core
+        import spectrum
+        if spectrum.numpy is None:
+            app.put('\n\nthe spectrum target needs numpy\n')
+            return
+        if not os.path.exists(spectrum._ROM_FILE):
+            app.put('\n\nthe spectrum target needs the 48K rom: %s\n' % spectrum._ROM_FILE)
+            return
+        app.put('\n\nemulating "Sinclair ZX Spectrum 48K"\n')
+        self.current_target = spectrum.spectrum(app) # Store the target instance
+        app.cli.set_prompt('\nspectrum> ')
 
     def general_help(self, app, args):
         app.cli.func_help(util.general)
@@ -1,31 +1,92 @@
 #-----------------------------------------------------------------------------
 """
 Memory Devices
+
+A bus maps devices into the 64K address space in pages. Plain RAM/ROM
+pages are memoryview slices onto the device buffers, so the cpu reads
+and writes them with direct buffer indexing. Devices with side effects
+(Eg. dirty tracking for video) are called through their own
+__getitem__/__setitem__ for their pages only. Remapping (Eg. a bank
+switch) only touches the pages of the window being switched.
 """
 #-----------------------------------------------------------------------------
 
-import array
+import mmap
+import os
 
 #-----------------------------------------------------------------------------
 
 _empty = 0xff
 
+# writes are tracked in a dirty bitmap with one byte per line
+_LINE_BITS = 6
+_LINE_SIZE = 1 << _LINE_BITS
+
+#-----------------------------------------------------------------------------
+# ROM images
+
+_images = {}
+
+def image(filename):
+    """
+    Return the contents of a file as immutable bytes.
+    Each file is read once per process, so all machines share their ROM images.
+    """
+    data = _images.get(filename, None)
+    if data is None:
+        with open(filename, 'rb') as f:
+            data = f.read()
+        _images[filename] = data
+    return data
+
 #-----------------------------------------------------------------------------
 # Base Memory Device
 
 class memory:
     """Base Memory Device"""
-    def __init__(self, bits = 0):
-        """Create a memory device of size bytes."""
+    def __init__(self, bits = 0, buf = None):
+        """
+        Create a memory device of size bytes.
+        buf: an external backing buffer of size bytes (Eg. shared memory or
+        a shared ROM image)
+        """
         size = 1 << bits
         self.mask = size - 1
-        self.mem = array.array('B', (0,) * size)
-        self.wr_notify = self.null
-        self.rd_notify = self.null
+        if buf is None:
+            self.mem = bytearray(size)
+        else:
+            if len(buf) != size:
+                raise ValueError('buffer is %d bytes, the device is %d' % (len(buf), size))
+            self.mem = buf
+        self.dirty = bytearray(max(size >> _LINE_BITS, 1))
+        # optional synchronous write notification: wr_notify(adr)
+        self.wr_notify = None
 
-    def null(self, adr):
-        """do nothing read/write notification"""
-        pass
+    def touch(self, adr = 0, length = None):
+        """mark the lines covering length bytes at a given address as dirty"""
+        if length is None:
+            length = self.mask + 1
+        adr &= self.mask
+        first = adr >> _LINE_BITS
+        last = (min(adr + length, self.mask + 1) + _LINE_SIZE - 1) >> _LINE_BITS
+        self.dirty[first:last] = b'\x01' * (last - first)
+
+    def poll_dirty(self):
+        """
+        Return a list of the dirty line numbers and clear the bitmap.
+        Byte writes through a bus only mark lines on memory.DEV pages:
+        the cpu writes memory.RW/WO pages directly into the buffer, and
+        only block writes (bus.write_block, load, clear) mark those.
+        """
+        d = self.dirty
+        lines = []
+        i = d.find(1)
+        while i >= 0:
+            lines.append(i)
+            i = d.find(1, i + 1)
+        if lines:
+            d[:] = bytes(len(d))
+        return lines
 
     def __getitem__(self, adr):
         return _empty
@@ -33,15 +94,50 @@ class memory:
     def __setitem__(self, adr, val):
         pass
 
+    def clear(self):
+        """zero the memory contents"""
+        self.mem[:] = bytes(len(self.mem))
+        self.touch()
+
     def load(self, adr, data):
         """load bytes into memory starting at a given address"""
-        for i, val in enumerate(data):
-            self.mem[adr + i] = val
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+        adr &= self.mask
+        memoryview(self.mem)[adr:adr + len(data)] = data
+        self.touch(adr, len(data))
+
+    def load_file(self, adr, filename, offset = 0, length = None):
+        """
+        Load a file into memory starting at a given address.
+        offset, length: the part of the file to load (default: all of it)
+        The file is read directly into the backing buffer.
+        Return the number of bytes loaded.
+        """
+        adr &= self.mask
+        with open(filename, 'rb') as f:
+            if length is None:
+                length = os.fstat(f.fileno()).st_size - offset
+            f.seek(offset)
+            n = f.readinto(memoryview(self.mem)[adr:adr + length])
+        self.touch(adr, n)
+        return n
+
+    def dump(self, adr, length):
+        """return a memoryview of length bytes starting at a given address"""
+        adr &= self.mask
+        return memoryview(self.mem)[adr:adr + length]
+
+    def snapshot(self):
+        """return the memory contents for a snapshot"""
+        return bytes(self.mem)
 
-    def load_file(self, adr, filename):
-        """load file into memory starting at a given address"""
-        for i, val in enumerate(open(filename, "rb").read()):
-            self.mem[adr + i] = ord(val)
+    def restore(self, snap):
+        """restore the memory contents from a snapshot (bytes or a filename)"""
+        if isinstance(snap, str):
+            self.load_file(0, snap)
+        else:
+            self.load(0, snap)
 
 #-----------------------------------------------------------------------------
 # Specific Memory Devices
@@ -52,21 +148,66 @@ class ram(memory):
         return self.mem[adr & self.mask]
 
     def __setitem__(self, adr, val):
-        if val != self.mem[adr & self.mask]:
+        a = adr & self.mask
+        self.mem[a] = val
+        self.dirty[a >> _LINE_BITS] = 1
+        if self.wr_notify is not None:
             self.wr_notify(adr)
-        self.mem[adr & self.mask] = val
+
+class mapped_ram(ram):
+    """
+    Read/Write Memory backed by a memory mapped host file (Eg. battery backed
+    ram or a ram disk). The contents persist across sessions, the OS writes
+    them back to the file lazily.
+    """
+    def __init__(self, bits, filename):
+        size = 1 << bits
+        fd = os.open(filename, os.O_RDWR | os.O_CREAT)
+        try:
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            buf = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.filename = filename
+        ram.__init__(self, bits, buf)
+
+    def flush(self):
+        """write the contents back to the file now"""
+        self.mem.flush()
+
+    def close(self):
+        """unmap the file - the device must not be mapped on a bus"""
+        self.mem.close()
+
+    def snapshot(self):
+        """snapshots reference the file, not the contents"""
+        return self.filename
+
+    def restore(self, snap):
+        if snap != self.filename:
+            ram.restore(self, snap)
 
 class rom(memory):
     """Read Only Memory"""
     def __getitem__(self, adr):
         return self.mem[adr & self.mask]
 
+class mapped_rom(rom):
+    """Read Only Memory backed by a memory mapped file (Eg. a large ROM image)"""
+    def __init__(self, bits, filename):
+        with open(filename, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        rom.__init__(self, bits, buf)
+
 class wom(memory):
     """Write Only Memory"""
     def __setitem__(self, adr, val):
-        if val != self.mem[adr & self.mask]:
+        a = adr & self.mask
+        self.mem[a] = val
+        self.dirty[a >> _LINE_BITS] = 1
+        if self.wr_notify is not None:
             self.wr_notify(adr)
-        self.mem[adr & self.mask] = val
 
     def rd(self, adr):
         """backdoor read"""
@@ -77,3 +218,167 @@ class null(memory):
     pass
 
 #-----------------------------------------------------------------------------
+# Address Bus
+
+_PAGE_BITS = 10
+_PAGE_SIZE = 1 << _PAGE_BITS
+_PAGE_MASK = _PAGE_SIZE - 1
+_PAGES = 0x10000 >> _PAGE_BITS
+
+# page access
+RW = 'rw' # read/write
+RO = 'ro' # read only, writes are discarded
+WO = 'wo' # write only, reads return _empty
+DEV = 'dev' # accesses go through the device
+
+# unmapped pages read as _empty
+_empty_page = memoryview(bytes((_empty,)) * _PAGE_SIZE)
+
+class _handler:
+    """route the accesses for a page through a device"""
+    def __init__(self, dev, base):
+        self.dev = dev
+        self.base = base
+
+    def __getitem__(self, adr):
+        return self.dev[self.base + adr]
+
+    def __setitem__(self, adr, val):
+        self.dev[self.base + adr] = val
+
+class bus:
+    """64K address space of pages with per-page access"""
+    def __init__(self):
+        # writes to read only or unmapped pages land here
+        self.sink = memoryview(bytearray(_PAGE_SIZE))
+        self.rd_pages = [_empty_page] * _PAGES
+        self.wr_pages = [self.sink] * _PAGES
+        self.devices = [null()] * _PAGES
+        # device offset of each directly written page, for dirty tracking
+        self.wr_offsets = [None] * _PAGES
+        # optional remap notification: remap_notify(adr, size)
+        self.remap_notify = None
+
+    def remapped(self, adr, size):
+        """the pages for size bytes at a given address have been remapped"""
+        if self.remap_notify is not None:
+            self.remap_notify(adr, size)
+
+    def map(self, adr, size, dev, access = RW, offset = 0):
+        """
+        Map a device into size bytes at a given address, starting at a
+        given offset into the device buffer. The device buffer is mirrored
+        if it is smaller than size. The cost is proportional to the
+        number of pages mapped.
+        """
+        view = memoryview(dev.mem)
+        if len(view) != dev.mask + 1:
+            raise ValueError('device buffer is %d bytes, the device is %d' % (len(view), dev.mask + 1))
+        if len(view) < _PAGE_SIZE:
+            raise ValueError('device is smaller than a page: use handle()')
+        for n in range(adr >> _PAGE_BITS, (adr + size) >> _PAGE_BITS):
+            ofs = (offset + (n << _PAGE_BITS) - adr) & dev.mask
+            page = view[ofs:ofs + _PAGE_SIZE]
+            self.rd_pages[n] = (_empty_page, page)[access in (RW, RO)]
+            self.wr_pages[n] = (self.sink, page)[access in (RW, WO)]
+            self.wr_offsets[n] = (None, ofs)[access in (RW, WO)]
+            self.devices[n] = dev
+        self.remapped(adr, size)
+
+    def handle(self, adr, size, dev):
+        """route accesses to size bytes at a given address through the device"""
+        for n in range(adr >> _PAGE_BITS, (adr + size) >> _PAGE_BITS):
+            h = _handler(dev, (n << _PAGE_BITS))
+            self.rd_pages[n] = h
+            self.wr_pages[n] = h
+            self.wr_offsets[n] = None
+            self.devices[n] = dev
+        self.remapped(adr, size)
+
+    def unmap(self, adr, size):
+        """unmap size bytes at a given address"""
+        for n in range(adr >> _PAGE_BITS, (adr + size) >> _PAGE_BITS):
+            self.rd_pages[n] = _empty_page
+            self.wr_pages[n] = self.sink
+            self.wr_offsets[n] = None
+            self.devices[n] = null()
+        self.remapped(adr, size)
+
+    def select(self, adr):
+        """return the device mapped at this address"""
+        return self.devices[(adr & 0xffff) >> _PAGE_BITS]
+
+    def read_block(self, adr, n):
+        """return n bytes read from a given address"""
+        data = bytearray()
+        while n:
+            adr &= 0xffff
+            page = self.rd_pages[adr >> _PAGE_BITS]
+            ofs = adr & _PAGE_MASK
+            k = min(n, _PAGE_SIZE - ofs)
+            if page.__class__ is memoryview:
+                data += page[ofs:ofs + k]
+            else:
+                data += bytes([page[ofs + i] for i in range(k)])
+            adr += k
+            n -= k
+        return data
+
+    def write_block(self, adr, data):
+        """write bytes to a given address - the written device lines are marked dirty"""
+        i = 0
+        n = len(data)
+        while i < n:
+            adr &= 0xffff
+            page = self.wr_pages[adr >> _PAGE_BITS]
+            ofs = adr & _PAGE_MASK
+            k = min(n - i, _PAGE_SIZE - ofs)
+            if page.__class__ is memoryview:
+                page[ofs:ofs + k] = data[i:i + k]
+                base = self.wr_offsets[adr >> _PAGE_BITS]
+                if base is not None:
+                    self.devices[adr >> _PAGE_BITS].touch(base + ofs, k)
+            else:
+                for j in range(k):
+                    page[ofs + j] = data[i + j]
+            adr += k
+            i += k
+
+    def __getitem__(self, adr):
+        adr &= 0xffff
+        return self.rd_pages[adr >> _PAGE_BITS][adr & _PAGE_MASK]
+
+    def __setitem__(self, adr, val):
+        adr &= 0xffff
+        self.wr_pages[adr >> _PAGE_BITS][adr & _PAGE_MASK] = val
+
+#-----------------------------------------------------------------------------
+# Bank Switching
+
+class banked:
+    """
+    A device larger than its window on the bus, split into banks of the
+    window size. Selecting a bank remaps only the pages of the window.
+    """
+    def __init__(self, bus, adr, size, dev, access = RW):
+        self.bus = bus
+        self.adr = adr
+        self.size = size
+        self.dev = dev
+        self.access = access
+        self.nbanks = max((dev.mask + 1) // size, 1)
+        self.bank = None
+        self.select(0)
+
+    def select(self, n):
+        """map bank n into the window"""
+        n %= self.nbanks
+        if n != self.bank:
+            self.bus.map(self.adr, self.size, self.dev, self.access, n * self.size)
+            self.bank = n
+
+    def wr(self, adr, val):
+        """io port write handler: select the bank"""
+        self.select(val)
+
+#-----------------------------------------------------------------------------
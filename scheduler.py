@@ -0,0 +1,184 @@
+#-----------------------------------------------------------------------------
+"""
+Event Scheduler
+
+Runs the cpu in slices of T-states and dispatches timed events (Eg. frame
+interrupts) between the slices. Work is done once per event, not once per
+instruction.
+
+Within an asyncio event loop the cpu runs as a task that yields between
+frame sized slices, so the CLI, video and input tasks keep running.
+
+Devices with time dependent state are synchronised lazily: they catch up
+to the cpu's T-state count when the cpu touches them, or at the end of a
+slice, instead of being ticked after every instruction. The count is the
+start of the current instruction, so an access is timed to the start of
+its instruction, not its bus cycle, and a bulk INIR/INDR/OTIR/OTDR block
+is timed to the start of the block. Driving cpu.execute() directly does
+not advance the count - single step with scheduler.step().
+"""
+#-----------------------------------------------------------------------------
+
+import asyncio
+import z80
+
+#-----------------------------------------------------------------------------
+
+class event:
+    """a periodic event"""
+
+    def __init__(self, period, func, deadline):
+        self.period = period
+        self.func = func
+        self.deadline = deadline
+
+#-----------------------------------------------------------------------------
+
+class device:
+    """
+    A peripheral with time dependent state. Call sync() before any access
+    to the state; advance() brings the state from one T-state to another.
+    """
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.synced = 0
+
+    def sync(self):
+        """catch up to the cpu's current T-state"""
+        now = self.cpu.clks
+        if now > self.synced:
+            self.advance(self.synced, now)
+            self.synced = now
+
+    def advance(self, t0, t1):
+        """advance the device state from T-state t0 to t1"""
+        pass
+
+#-----------------------------------------------------------------------------
+
+class scheduler:
+    """T-state driven event scheduler"""
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.clks = 0
+        self.events = []
+        self.devices = []
+        self.running = False
+        # the end of the current slice - code that skips ahead (Eg. the
+        # high level emulation of an idle loop) must not go past it
+        self.deadline = 0
+
+    def add(self, period, func):
+        """
+        Add a periodic event, first called period T-states from now.
+        The event function returns the number of T-states it consumed
+        (Eg. for an interrupt acknowledge) or None.
+        """
+        e = event(period, func, self.clks + period)
+        self.events.append(e)
+        return e
+
+    def remove(self, e):
+        """remove an event"""
+        self.events.remove(e)
+
+    def add_device(self, dev):
+        """add a device to be synchronised at the end of every slice"""
+        self.devices.append(dev)
+
+    def remove_device(self, dev):
+        """remove a device"""
+        self.devices.remove(dev)
+
+    def reset(self):
+        """restart the T-state count and event deadlines from 0"""
+        self.clks = 0
+        self.cpu.clks = 0
+        for e in self.events:
+            e.deadline = e.period
+        for dev in self.devices:
+            dev.synced = 0
+
+    def stop(self):
+        """stop the run loop at the end of the current slice"""
+        self.running = False
+
+    def step(self):
+        """execute one instruction, advancing the T-state count, devices and events"""
+        self.run(1)
+
+    def run(self, clks = None):
+        """
+        Run the cpu until stopped, or for clks T-states.
+        The cpu runs uninterrupted up to the nearest event deadline.
+        Return False if the run was stopped.
+        """
+        cpu = self.cpu
+        execute = cpu.execute
+        limit = None
+        if clks is not None:
+            limit = self.clks + clks
+        self.running = True
+        while self.running:
+            deadlines = [e.deadline for e in self.events]
+            if limit is not None:
+                deadlines.append(limit)
+            deadline = min(deadlines)
+            self.deadline = deadline
+            now = self.clks
+            pc = cpu.pc
+            try:
+                while now < deadline:
+                    pc = cpu.pc
+                    # devices read the T-state at the start of the instruction
+                    cpu.clks = now
+                    now += execute()
+            except z80.Error:
+                cpu._set_pc(pc)
+                self.clks = now
+                cpu.clks = now
+                self.running = False
+                raise
+            self.clks = now
+            cpu.clks = now
+            for dev in self.devices:
+                dev.sync()
+            for e in self.events:
+                if e.deadline <= now:
+                    e.deadline += e.period
+                    n = e.func()
+                    if n:
+                        self.clks += n
+                        cpu.clks = self.clks
+            if self.running and (limit is not None) and (self.clks >= limit):
+                self.running = False
+                return True
+        return False
+
+    async def run_async(self, clks, period):
+        """
+        Run the cpu as an event loop task in slices of clks T-states,
+        yielding between slices. Slices are paced to one per period secs.
+        Return when the scheduler is stopped.
+        """
+        loop = asyncio.get_running_loop()
+        t = loop.time()
+        while self.run(clks):
+            t += period
+            delay = t - loop.time()
+            if delay < -period:
+                # the host can't keep up - don't try to catch up later
+                t = loop.time()
+            await asyncio.sleep(max(delay, 0))
+
+#-----------------------------------------------------------------------------
+
+async def periodic(period, func):
+    """event loop task: call func every period secs"""
+    while True:
+        func()
+        await asyncio.sleep(period)
+
+#-----------------------------------------------------------------------------
@@ -0,0 +1,140 @@
+#-----------------------------------------------------------------------------
+"""
+Beeper Sound
+
+The cpu only records speaker edges, stamped with the T-state at which
+they happen. Once per frame the edges are turned into a block of PCM
+samples with vectorized NumPy and passed to a sink: a pygame mixer
+channel, or a WAV file for headless machines (beeper.record). There is no per-sample
+work in the cpu loop.
+
+Each sample is the average speaker level over its sample period, so
+edges between sample points give fractional (band-limited) steps.
+"""
+#-----------------------------------------------------------------------------
+
+import wave
+
+try:
+    import numpy
+except ImportError:
+    # no sound without numpy - edges are discarded
+    numpy = None
+
+#-----------------------------------------------------------------------------
+
+_RATE = 44100 # Hz
+_AMPLITUDE = 8000
+
+#-----------------------------------------------------------------------------
+
+def synthesize(t0, t1, level, edges, clks_per_sample):
+    """
+    Return the 16 bit PCM samples for whole sample periods from T-state t0
+    (a sample boundary) up to t1.
+    level: the speaker level (0 or 1) at t0
+    edges: a list of (T-state, level) in time order, t0 <= T-state < t1
+    Return (samples, t) where t is the end of the last sample.
+    """
+    n = int((t1 - t0) / clks_per_sample)
+    bounds = t0 + (numpy.arange(n + 1) * clks_per_sample)
+    # start times and levels of each constant level segment
+    times = numpy.array([t0] + [t for (t, l) in edges], dtype = numpy.float64)
+    levels = numpy.array([level] + [l for (t, l) in edges], dtype = numpy.float64)
+    # integral of the level at the start of each segment
+    area = numpy.concatenate(((0.0,), numpy.cumsum(levels[:-1] * numpy.diff(times))))
+    # integral of the level at each sample boundary
+    k = numpy.searchsorted(times, bounds, side = 'right') - 1
+    integral = area[k] + (levels[k] * (bounds - times[k]))
+    average = numpy.diff(integral) / clks_per_sample
+    samples = (((2.0 * average) - 1.0) * _AMPLITUDE).astype(numpy.int16)
+    return (samples, bounds[-1])
+
+#-----------------------------------------------------------------------------
+
+class beeper:
+    """a speaker toggled by the cpu"""
+
+    def __init__(self, cpu, clock, rate = _RATE):
+        self.cpu = cpu
+        self.rate = rate
+        self.clks_per_sample = clock / rate
+        self.level = 0
+        self.edges = []
+        # the start of the next sample and the speaker level at that time
+        self.t0 = 0.0
+        self.level0 = 0
+        # sink(samples) takes a block of int16 samples, None to discard
+        self.sink = None
+
+    def set(self, level):
+        """set the speaker level at the current T-state"""
+        if level != self.level:
+            self.level = level
+            self.edges.append((self.cpu.clks, level))
+
+    def frame(self):
+        """end of frame: pass the samples up to now to the sink"""
+        t1 = self.cpu.clks
+        if (self.sink is None) or (numpy is None):
+            self.reset()
+            return
+        (samples, t) = synthesize(self.t0, t1, self.level0, self.edges, self.clks_per_sample)
+        self.sink(samples)
+        # keep the edges of the partial sample for the next frame
+        done = [e for e in self.edges if e[0] < t]
+        if done:
+            self.level0 = done[-1][1]
+        self.edges = self.edges[len(done):]
+        self.t0 = t
+
+    def record(self, filename):
+        """write the sound to a WAV file from now - None stops recording"""
+        if isinstance(self.sink, wav_sink):
+            self.sink.close()
+        self.sink = None
+        if filename is not None:
+            self.sink = wav_sink(filename, self.rate)
+        self.reset()
+
+    def reset(self):
+        """discard the edges, restart sampling from now"""
+        self.edges = []
+        self.t0 = float(self.cpu.clks)
+        self.level0 = self.level
+
+#-----------------------------------------------------------------------------
+
+class wav_sink:
+    """write samples to a mono 16 bit WAV file"""
+
+    def __init__(self, filename, rate = _RATE):
+        self.wav = wave.open(filename, 'wb')
+        self.wav.setnchannels(1)
+        self.wav.setsampwidth(2)
+        self.wav.setframerate(rate)
+
+    def __call__(self, samples):
+        self.wav.writeframes(samples.astype('<i2').tobytes())
+
+    def close(self):
+        self.wav.close()
+
+#-----------------------------------------------------------------------------
+
+class mixer_sink:
+    """queue samples to a pygame mixer channel"""
+
+    def __init__(self, mixer):
+        self.mixer = mixer
+        self.channel = mixer.Channel(0)
+
+    def __call__(self, samples):
+        sound = self.mixer.Sound(buffer = samples.tobytes())
+        if self.channel.get_busy():
+            # at most one frame queued behind the one playing
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+
+#-----------------------------------------------------------------------------
@@ -0,0 +1,555 @@
+#-----------------------------------------------------------------------------
+"""
+Sinclair ZX Spectrum 48K Emulator
+
+The ULA's memory contention and the floating bus are not emulated, so
+code timed to the raster (Eg. multicolour effects) runs early.
+"""
+#-----------------------------------------------------------------------------
+
+import asyncio
+import os
+import board
+import memory
+import monitor
+import scheduler
+import sound
+import util
+import z80
+
+try:
+    import numpy
+except ImportError:
+    # the screen renderer needs numpy
+    numpy = None
+
+try:
+    import pygame
+    from pygame.locals import *
+except ImportError:
+    # headless machines don't need pygame
+    pygame = None
+
+#-----------------------------------------------------------------------------
+
+_help_load = (
+    ('<filename>', 'snapshot file (.sna or .z80)'),
+)
+
+#-----------------------------------------------------------------------------
+
+_CPU_CLOCK = 3500000 # Hz
+_FRAME_CLKS = 69888 # T-states per frame - 50.08 Hz
+_FRAME_PERIOD = float(_FRAME_CLKS) / _CPU_CLOCK # secs
+
+_ROM_FILE = './roms/48.rom'
+
+_SCREEN_ADR = 0x4000
+_BITMAP_SIZE = 0x1800
+_ATTR_SIZE = 0x300
+_SCREEN_SIZE = _BITMAP_SIZE + _ATTR_SIZE
+_COLS = 32
+_PIXELS_H = _COLS * 8
+_PIXELS_V = 192
+_FLASH_FRAMES = 16 # flashing attributes swap ink and paper every 16 frames
+
+_border_x = 32
+_border_y = 24
+_scale = 2
+
+_screen_x = _scale * (_PIXELS_H + (2 * _border_x))
+_screen_y = _scale * (_PIXELS_V + (2 * _border_y))
+
+# grb colours 0..7, then 8..15 with bright set
+_palette = (
+    (0x00, 0x00, 0x00), (0x00, 0x00, 0xd7), (0xd7, 0x00, 0x00), (0xd7, 0x00, 0xd7),
+    (0x00, 0xd7, 0x00), (0x00, 0xd7, 0xd7), (0xd7, 0xd7, 0x00), (0xd7, 0xd7, 0xd7),
+    (0x00, 0x00, 0x00), (0x00, 0x00, 0xff), (0xff, 0x00, 0x00), (0xff, 0x00, 0xff),
+    (0x00, 0xff, 0x00), (0x00, 0xff, 0xff), (0xff, 0xff, 0x00), (0xff, 0xff, 0xff),
+)
+
+#-----------------------------------------------------------------------------
+
+# the machine description
+_spec = {
+    'roms': {'rom': _ROM_FILE},
+    'memory': (
+        ('rom', 0x0000, 0x4000, 'rom', 14, memory.RO),
+        # the ula shares this ram with the cpu: it holds the screen
+        ('contended', 0x4000, 0x4000, 'ram', 14, memory.RW),
+        ('ram', 0x8000, 0x8000, 'ram', 15, memory.RW),
+    ),
+    'ports': (
+        ('ula', 0x0001, 0x0000), # A0 low
+    ),
+    'interrupts': (
+        ('frame', _FRAME_CLKS),
+    ),
+}
+
+class memmap(memory.bus):
+    """memory devices and address map"""
+
+    def __init__(self, romfile = _ROM_FILE):
+        memory.bus.__init__(self)
+        board.build_memory(self, _spec, {'rom': romfile})
+
+    def reset(self):
+        """zero the ram"""
+        self.contended.clear()
+        self.ram.clear()
+
+    def screen(self):
+        """return the bitmap and attribute bytes"""
+        return self.contended.dump(0, _SCREEN_SIZE)
+
+#-----------------------------------------------------------------------------
+
+def line_address(y):
+    """return the bitmap offset of pixel line y - the thirds of the screen are interleaved"""
+    return ((y & 0xc0) << 5) | ((y & 0x07) << 8) | ((y & 0x38) << 2)
+
+def _tables():
+    """return the bitmap and attribute offsets of each byte of the screen, by line and column"""
+    y = numpy.arange(_PIXELS_V)
+    x = numpy.arange(_COLS)
+    bitmap = line_address(y)[:, None] + x[None, :]
+    attr = _BITMAP_SIZE + ((y >> 3) * _COLS)[:, None] + x[None, :]
+    return (bitmap, attr)
+
+if numpy is not None:
+    (_bitmap_index, _attr_index) = _tables()
+    _rgb = numpy.array(_palette, dtype = numpy.uint8)
+
+def render(screen, flash = False):
+    """
+    Render the bitmap and attributes to a 192 x 256 array of palette indices.
+    flash: the flash phase - flashing attributes swap ink and paper
+    """
+    data = numpy.frombuffer(screen, dtype = numpy.uint8, count = _SCREEN_SIZE)
+    pixels = numpy.unpackbits(data[_bitmap_index], axis = 1).astype(bool)
+    attr = numpy.repeat(data[_attr_index], 8, axis = 1)
+    if flash:
+        pixels ^= (attr & 0x80).astype(bool)
+    ink = attr & 7
+    paper = (attr >> 3) & 7
+    bright = (attr >> 3) & 8
+    return numpy.where(pixels, ink, paper) | bright
+
+def render_rgb(screen, flash = False):
+    """render the bitmap and attributes to a 192 x 256 x 3 array of rgb values"""
+    return _rgb[render(screen, flash)]
+
+#-----------------------------------------------------------------------------
+# snapshots
+
+def _word(data, i):
+    """return the little endian 16 bit value at data[i]"""
+    return data[i] | (data[i + 1] << 8)
+
+def _unpack_z80(data, n):
+    """
+    Expand a .z80 compressed block to n bytes: ED ED count val is a run
+    of count vals, all other bytes are literal.
+    """
+    out = bytearray()
+    i = 0
+    while len(out) < n:
+        j = data.find(b'\xed\xed', i)
+        if j < 0:
+            out += data[i:]
+            break
+        out += data[i:j]
+        out += bytes(data[j + 3:j + 4]) * data[j + 2]
+        i = j + 4
+    if len(out) < n:
+        raise ValueError('short .z80 memory block')
+    return bytes(out[:n])
+
+# .z80 version 2/3 16K pages of the 48K ram
+_z80_pages = {8: 0x4000, 4: 0x8000, 5: 0xc000}
+
+def load_sna(m, data):
+    """
+    Load a .sna snapshot: a 27 byte register header then the 48K ram.
+    The pc was pushed onto the stack when the snapshot was taken.
+    """
+    if len(data) != 27 + 0xc000:
+        raise ValueError('not a 48K .sna snapshot')
+    cpu = m.cpu
+    cpu.reset()
+    cpu.i = data[0]
+    cpu.alt_hl = _word(data, 1)
+    cpu.alt_de = _word(data, 3)
+    cpu.alt_bc = _word(data, 5)
+    cpu.alt_af = _word(data, 7)
+    cpu._set_hl(_word(data, 9))
+    cpu._set_de(_word(data, 11))
+    cpu._set_bc(_word(data, 13))
+    cpu.iy = _word(data, 15)
+    cpu.ix = _word(data, 17)
+    cpu.iff2 = (data[19] >> 2) & 1
+    cpu.iff1 = cpu.iff2
+    cpu.r = data[20] & 0x7f
+    cpu._set_af(_word(data, 21))
+    cpu.sp = _word(data, 23)
+    cpu.im = data[25] & 3
+    m.border = data[26] & 7
+    m.mem.write_block(0x4000, data[27:])
+    # the snapshot was taken in an interrupt: retn
+    cpu._set_pc(cpu._pop())
+
+def load_z80(m, data):
+    """
+    Load a .z80 snapshot: version 1 (one 48K block, maybe compressed) or
+    versions 2 and 3 (16K pages) of a 48K machine.
+    """
+    if len(data) < 30:
+        raise ValueError('short .z80 snapshot')
+    flags = data[12]
+    if flags == 0xff:
+        # version 1 compatibility
+        flags = 1
+    cpu = m.cpu
+    cpu.reset()
+    cpu.a = data[0]
+    cpu.f = data[1]
+    cpu._set_bc(_word(data, 2))
+    cpu._set_hl(_word(data, 4))
+    pc = _word(data, 6)
+    cpu.sp = _word(data, 8)
+    cpu.i = data[10]
+    cpu.r = (data[11] & 0x7f) | ((flags & 1) << 7)
+    m.border = (flags >> 1) & 7
+    cpu._set_de(_word(data, 13))
+    cpu.alt_bc = _word(data, 15)
+    cpu.alt_de = _word(data, 17)
+    cpu.alt_hl = _word(data, 19)
+    cpu.alt_af = (data[21] << 8) | data[22]
+    cpu.iy = _word(data, 23)
+    cpu.ix = _word(data, 25)
+    cpu.iff1 = int(data[27] != 0)
+    cpu.iff2 = int(data[28] != 0)
+    cpu.im = data[29] & 3
+    if pc != 0:
+        # version 1
+        body = data[30:]
+        if flags & 0x20:
+            ram = _unpack_z80(body, 0xc000)
+        elif len(body) >= 0xc000:
+            ram = body[:0xc000]
+        else:
+            raise ValueError('short .z80 snapshot')
+        m.mem.write_block(0x4000, ram)
+        cpu._set_pc(pc)
+        return
+    # versions 2 and 3: an extra header then the pages
+    n = _word(data, 30)
+    cpu._set_pc(_word(data, 32))
+    hardware = data[34]
+    if hardware not in ((0, 1), (0, 1, 3))[n != 23]:
+        raise ValueError('not a 48K .z80 snapshot')
+    i = 32 + n
+    while i + 3 <= len(data):
+        length = _word(data, i)
+        page = data[i + 2]
+        i += 3
+        if length == 0xffff:
+            block = data[i:i + 0x4000]
+            if len(block) < 0x4000:
+                raise ValueError('short .z80 memory block')
+            i += 0x4000
+        else:
+            block = _unpack_z80(data[i:i + length], 0x4000)
+            i += length
+        adr = _z80_pages.get(page, None)
+        if adr is not None:
+            m.mem.write_block(adr, block)
+
+_loaders = {
+    '.sna': load_sna,
+    '.z80': load_z80,
+}
+
+#-----------------------------------------------------------------------------
+
+class machine:
+    """
+    The headless machine: memory, io, keyboard matrix, cpu and scheduler.
+    """
+
+    def __init__(self, romfile = _ROM_FILE):
+        self.keyboard = board.keyboard()
+        self.mem = memmap(romfile)
+        self.io = board.io(_spec['ports'], {
+            'ula': (self.port_rd, self.port_wr),
+        })
+        self.cpu = z80.cpu(self.mem, self.io)
+        self.beeper = sound.beeper(self.cpu, _CPU_CLOCK)
+        self.border = 7
+        self.frames = 0
+        self.sched = scheduler.scheduler(self.cpu)
+        board.add_interrupts(self.sched, _spec, {
+            'frame': self.frame,
+        })
+
+    def port_rd(self, adr):
+        """in from the ula: the keyboard on D0-D4, the tape input (quiet) on D6"""
+        return self.keyboard.rd(adr)
+
+    def port_wr(self, adr, val):
+        """out to the ula: the border colour on D0-D2, the speaker on D4"""
+        self.border = val & 7
+        self.beeper.set((val >> 4) & 1)
+
+    def flash(self):
+        """return the flash phase of the current frame"""
+        return bool((self.frames // _FLASH_FRAMES) & 1)
+
+    def frame(self):
+        """frame event: emit the frame of sound, interrupt the cpu"""
+        self.frames += 1
+        self.beeper.frame()
+        # nothing drives the data bus during the acknowledge
+        return self.cpu.interrupt(0xff)
+
+    def load(self, filename):
+        """load a .sna or .z80 snapshot"""
+        loader = _loaders.get(os.path.splitext(filename)[1].lower(), None)
+        if loader is None:
+            raise ValueError('unknown snapshot type %s' % filename)
+        with open(filename, 'rb') as f:
+            data = f.read()
+        self.keyboard.reset()
+        # the beeper restarts sampling from the scheduler's new T-state
+        self.sched.reset()
+        self.beeper.reset()
+        loader(self, data)
+
+    def reset(self, hard = True):
+        """
+        Reset the machine so it can be reused.
+        hard: also zero the ram, as at power on
+        """
+        self.cpu.reset()
+        self.keyboard.reset()
+        self.sched.reset()
+        self.beeper.reset()
+        self.border = 7
+        self.frames = 0
+        if hard:
+            self.mem.reset()
+
+    def run(self, clks):
+        """run the machine for clks T-states"""
+        return self.sched.run(clks)
+
+#-----------------------------------------------------------------------------
+
+class video:
+    """draw the screen and border - redrawn only when they change"""
+
+    def __init__(self):
+        self.drawn = None
+
+    def refresh(self, screen):
+        """force a redraw of the whole display"""
+        self.drawn = None
+
+    def update(self, screen, m):
+        """draw the display of a machine - return True if it changed"""
+        data = bytes(m.mem.screen())
+        flash = m.flash()
+        state = (data, flash, m.border)
+        if state == self.drawn:
+            return False
+        self.drawn = state
+        screen.fill(_palette[m.border])
+        # the surface array is indexed [x][y]
+        surface = pygame.surfarray.make_surface(render_rgb(data, flash).swapaxes(0, 1))
+        surface = pygame.transform.scale(surface, (_scale * _PIXELS_H, _scale * _PIXELS_V))
+        screen.blit(surface, (_scale * _border_x, _scale * _border_y))
+        return True
+
+#-----------------------------------------------------------------------------
+
+#; The Spectrum keyboard layout - the same matrix as the ACE with
+#; caps shift and symbol shift at the ends of the bottom rows.
+#;
+#;       D0        D1    D2  D3  D4
+#; fefe  CAPS      Z     X   C   V
+#; fdfe  A         S     D   F   G
+#; fbfe  Q         W     E   R   T
+#; f7fe  1         2     3   4   5
+#; effe  0         9     8   7   6
+#; dffe  P         O     I   U   Y
+#; bffe  ENTER     L     K   J   H
+#; 7ffe  SPACE     SYMB  M   N   B
+
+def host_keys():
+    """return the host key to (port, bits) mapping"""
+    rows = (
+        (0xfefe, (K_LSHIFT, K_z, K_x, K_c, K_v)),
+        (0xfdfe, (K_a, K_s, K_d, K_f, K_g)),
+        (0xfbfe, (K_q, K_w, K_e, K_r, K_t)),
+        (0xf7fe, (K_1, K_2, K_3, K_4, K_5)),
+        (0xeffe, (K_0, K_9, K_8, K_7, K_6)),
+        (0xdffe, (K_p, K_o, K_i, K_u, K_y)),
+        (0xbffe, (K_RETURN, K_l, K_k, K_j, K_h)),
+        (0x7ffe, (K_SPACE, K_RSHIFT, K_m, K_n, K_b)),
+    )
+    keys = {}
+    for (port, row) in rows:
+        for (i, key) in enumerate(row):
+            keys[key] = (port, 1 << i)
+    # symbol shift on either control key as well
+    keys[K_LCTRL] = (0x7ffe, 1 << 1)
+    keys[K_RCTRL] = (0x7ffe, 1 << 1)
+    return keys
+
+#-----------------------------------------------------------------------------
+
+class spectrum:
+
+    def __init__(self, app):
+        self.app = app
+        self.video = video()
+        self.machine = machine()
+        self.keyboard = self.machine.keyboard
+        self.mem = self.machine.mem
+        self.cpu = self.machine.cpu
+        self.sched = self.machine.sched
+        self.keys = host_keys()
+        self.mon = monitor.monitor(self.cpu)
+        self.menu_root = (
+            ('..', 'return to main menu', util.cr, self.parent_menu, None),
+            ('da', 'disassemble memory', monitor._help_disassemble, self.mon.cli_disassemble, None),
+            ('exit', 'exit the application', util.cr, self.exit, None),
+            ('help', 'display general help', util.cr, app.general_help, None),
+            ('load', 'load a snapshot', _help_load, self.cli_load, None),
+            ('memory', 'memory functions', None, None, self.mon.menu_memory),
+            ('regs', 'display cpu registers', util.cr, self.mon.cli_registers, None),
+            ('reset', 'reset the machine', util.cr, self.cli_reset, None),
+            ('run', 'run the emulation', util.cr, self.cli_run, None),
+            ('step', 'single step the emulation', util.cr, self.cli_step, None),
+            ('stop', 'stop the emulation', util.cr, self.cli_stop, None),
+        )
+
+        # setup the video window and sound - a small mixer buffer keeps the latency down
+        pygame.mixer.pre_init(sound._RATE, -16, 1, 512)
+        pygame.init()
+        self.screen = pygame.display.set_mode((_screen_x, _screen_y))
+        pygame.display.set_caption('ZX Spectrum 48K')
+        self.video.refresh(self.screen)
+        if (sound.numpy is not None) and pygame.mixer.get_init():
+            self.machine.beeper.sink = sound.mixer_sink(pygame.mixer)
+
+        # video presentation and host input polling run while the target is selected
+        self.emulation = None
+        self.tasks = [
+            asyncio.create_task(scheduler.periodic(_FRAME_PERIOD, self.present)),
+            asyncio.create_task(scheduler.periodic(_FRAME_PERIOD, self.poll_input)),
+        ]
+
+        app.cli.set_root(self.menu_root)
+        self.app.cli.set_prompt('\nspectrum> ')
+
+    def cli_load(self, app, args):
+        """load a snapshot"""
+        if util.wrong_argc(app, args, (1,)):
+            return
+        if not util.file_arg(app, args[0]):
+            return
+        if self.running():
+            app.put('\n\nstop the emulation first\n')
+            return
+        try:
+            self.machine.load(args[0])
+        except ValueError as e:
+            app.put('\n\n%s\n' % e)
+            return
+        app.put('\n\nloaded %s - pc %04x\n' % (args[0], self.cpu._get_pc()))
+
+    def cli_reset(self, app, args):
+        """reset the machine"""
+        if self.running():
+            app.put('\n\nstop the emulation first\n')
+            return
+        self.machine.reset()
+        app.put('\n\nmachine reset\n')
+
+    def poll_input(self):
+        """host input task: process keyboard events - the matrix is sampled by the cpu"""
+        for event in pygame.event.get():
+            if event.type in (KEYDOWN, KEYUP):
+                x = self.keys.get(event.key, None)
+                if x != None:
+                    (port, bits) = x
+                    self.keyboard.event(port, bits, event.type == KEYDOWN)
+
+    def present(self):
+        """video presentation task"""
+        if self.video.update(self.screen, self.machine):
+            pygame.display.flip()
+
+    def running(self):
+        """return True if the emulation task is running"""
+        return (self.emulation is not None) and not self.emulation.done()
+
+    async def emulate(self):
+        """cpu task: run frame sized slices in real time"""
+        try:
+            await self.sched.run_async(_FRAME_CLKS, _FRAME_PERIOD)
+        except z80.Error as e:
+            self.app.put('\n\nexception: %s\n' % e)
+            self.app.cli.cl.render()
+
+    def cli_run(self, app, args):
+        """run the emulation"""
+        if self.running():
+            app.put('\n\nalready running\n')
+            return
+        self.emulation = asyncio.create_task(self.emulate())
+        app.put('\n\nrunning - use "stop" to halt\n')
+
+    def cli_stop(self, app, args):
+        """stop the emulation"""
+        if self.running():
+            self.emulation.cancel()
+        self.emulation = None
+        app.put('\n\nstopped at %s\n' % self.current_instruction())
+
+    def current_instruction(self):
+        """return a string for the current instruction"""
+        pc = self.cpu._get_pc()
+        (operation, operands, n) = self.cpu.da(pc)
+        return '%04x %-5s %s' % (pc, operation, operands)
+
+    def cli_step(self, app, args):
+        """single step the cpu"""
+        if self.running():
+            app.put('\n\nstop the emulation first\n')
+            return
+        done = 'done: %s' % self.current_instruction()
+        self.sched.step()
+        next = 'next: %s' % self.current_instruction()
+        app.put('\n\n%s\n' % '\n'.join((done, next)))
+
+    def exit(self, app, args):
+        """exit the application"""
+        app.exit(app, [])
+
+    def close(self):
+        """cancel the target tasks"""
+        if self.running():
+            self.emulation.cancel()
+        for task in self.tasks:
+            task.cancel()
+
+    def parent_menu(self, app, args):
+        """return to parent menu"""
+        self.close()
+        app.put('\n')
+        app.main_menu()
+
+#-----------------------------------------------------------------------------
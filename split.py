@@ -0,0 +1,189 @@
+#-----------------------------------------------------------------------------
+"""
+Split Mode
+
+Runs a machine's cpu in a worker process. Memory the host needs to see
+(Eg. video ram) is backed by shared memory and host input is passed to
+the worker over a lock-free ring, so the cpu never waits on the host.
+
+Shared memory layout:
+
+control words (u32): stop flag, frame count
+input ring: head (u32), tail (u32), data
+named buffers
+
+The worker takes over the host's machine state when it starts and hands
+its own back over a pipe when it stops.
+"""
+#-----------------------------------------------------------------------------
+
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+
+#-----------------------------------------------------------------------------
+
+CTL_STOP = 0
+CTL_FRAMES = 1
+_CTL_WORDS = 4
+
+_RING_SIZE = 256 # must be a power of 2
+_SEND_TIMEOUT = 1.0 # secs - the consumer drains the ring every frame
+
+#-----------------------------------------------------------------------------
+
+class Error(Exception):
+    pass
+
+#-----------------------------------------------------------------------------
+
+class ring:
+    """single producer, single consumer lock-free byte ring in a shared buffer"""
+
+    def __init__(self, buf):
+        self.idx = buf[:8].cast('I')
+        self.data = buf[8:]
+        self.size = len(self.data)
+
+    def used(self):
+        """return the number of bytes in the ring"""
+        return (self.idx[0] - self.idx[1]) & 0xffffffff
+
+    def put(self, data):
+        """producer: add bytes to the ring - return False if there is no room"""
+        head = self.idx[0]
+        if self.size - self.used() < len(data):
+            return False
+        for (i, val) in enumerate(data):
+            self.data[(head + i) & (self.size - 1)] = val
+        # publish the data after it has been written
+        self.idx[0] = (head + len(data)) & 0xffffffff
+        return True
+
+    def get(self):
+        """consumer: remove and return all bytes in the ring"""
+        tail = self.idx[1]
+        n = self.used()
+        data = bytes([self.data[(tail + i) & (self.size - 1)] for i in range(n)])
+        self.idx[1] = (tail + n) & 0xffffffff
+        return data
+
+    def release(self):
+        self.idx.release()
+        self.data.release()
+
+#-----------------------------------------------------------------------------
+
+class sender:
+    """
+    Producer side of a ring for callers that must not block (Eg. an event
+    loop task). Records that don't fit are queued in order and sent by a
+    later put() or flush(), so none are lost.
+    """
+
+    def __init__(self, ring, timeout = _SEND_TIMEOUT):
+        self.ring = ring
+        self.timeout = timeout
+        self.queue = []
+        # when the ring was first found full
+        self.full = None
+
+    def put(self, data):
+        """queue a record and send what fits"""
+        self.queue.append(bytes(data))
+        self.flush()
+
+    def flush(self):
+        """
+        Send the queued records that fit in the ring.
+        Raise Error each time the ring has been full for the timeout.
+        """
+        while self.queue and self.ring.put(self.queue[0]):
+            self.queue.pop(0)
+        if not self.queue:
+            self.full = None
+            return
+        now = time.monotonic()
+        if self.full is None:
+            self.full = now
+        elif now - self.full > self.timeout:
+            self.full = now
+            raise Error('ring full for %.1f secs: the consumer is not running' % self.timeout)
+
+#-----------------------------------------------------------------------------
+
+class shared:
+    """a shared memory block with control words, an input ring and named buffers"""
+
+    def __init__(self, layout, name = None):
+        """
+        layout: a tuple of (name, size) buffers
+        name: attach to an existing block, or create a new block if None
+        """
+        ring_bytes = 8 + _RING_SIZE
+        size = (_CTL_WORDS * 4) + ring_bytes + sum([n for (x, n) in layout])
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create = True, size = size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name = name)
+            self.owner = False
+        self.name = self.shm.name
+        buf = self.shm.buf
+        adr = _CTL_WORDS * 4
+        self.ctl = buf[:adr].cast('I')
+        self.ring = ring(buf[adr:adr + ring_bytes])
+        adr += ring_bytes
+        self.bufs = {}
+        for (x, n) in layout:
+            self.bufs[x] = buf[adr:adr + n]
+            adr += n
+
+    def close(self):
+        """release the buffers, unlink the block if we created it"""
+        self.ctl.release()
+        self.ring.release()
+        for buf in self.bufs.values():
+            buf.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+#-----------------------------------------------------------------------------
+
+def start(target, layout, *args):
+    """
+    Create the shared memory and start target(name, conn, *args) in a
+    worker process. conn is a pipe the worker sends its result on when
+    it stops (Eg. the machine state).
+    Return (sm, worker, conn).
+    """
+    sm = shared(layout)
+    (conn, worker_conn) = multiprocessing.Pipe()
+    worker = multiprocessing.Process(target = target, args = (sm.name, worker_conn) + args, daemon = True)
+    worker.start()
+    worker_conn.close()
+    return (sm, worker, conn)
+
+def stop(sm, worker, conn, timeout = 1.0):
+    """
+    Ask the worker to stop, wait for it, release the shared memory.
+    Return the result the worker sent, or None if it sent none.
+    """
+    sm.ctl[CTL_STOP] = 1
+    result = None
+    try:
+        if conn.poll(timeout):
+            result = conn.recv()
+    except EOFError:
+        # the worker exited without a result
+        pass
+    conn.close()
+    worker.join(timeout)
+    if worker.is_alive():
+        worker.terminate()
+        worker.join()
+    sm.close()
+    return result
+
+#-----------------------------------------------------------------------------
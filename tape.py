@@ -0,0 +1,263 @@
+#-----------------------------------------------------------------------------
+"""
+Tape Files
+
+A .tap file is a sequence of blocks, each a 16 bit little endian length
+followed by that many bytes: the block data and an xor checksum of the data.
+The flag byte sent on the tape is not stored - the blocks of each saved
+file alternate between a header (flag 0x00) and the data (flag 0xff).
+
+Blocks are copied to and from memory in one operation by the ROM traps of
+a target, so there is no emulated tape time.
+
+WAV recordings of real tapes are streamed a chunk at a time, so memory use
+does not depend on the length of the recording. The pulse edges either
+drive the EAR input bit as the cpu reaches them, or are decoded to blocks
+for the ROM traps (fast mode).
+"""
+#-----------------------------------------------------------------------------
+
+import os
+import wave
+import functools
+import scheduler
+
+try:
+    import numpy
+except ImportError:
+    # no wav tapes without numpy
+    numpy = None
+
+#-----------------------------------------------------------------------------
+
+HEADER = 0x00
+DATA = 0xff
+
+def checksum(data):
+    """return the xor of the data bytes"""
+    return functools.reduce(lambda x, y: x ^ y, data, 0)
+
+#-----------------------------------------------------------------------------
+
+class tap:
+    """a tape: blocks are read from the current position, saved at the end"""
+
+    def __init__(self, filename = None):
+        """filename: a .tap file, created on the first save if it doesn't exist"""
+        self.filename = filename
+        self.blocks = []
+        self.pos = 0
+        if (filename is not None) and os.path.isfile(filename):
+            with open(filename, 'rb') as f:
+                self.parse(f.read())
+
+    def parse(self, buf):
+        """add the blocks of a .tap file image"""
+        i = 0
+        while i + 2 <= len(buf):
+            n = buf[i] | (buf[i + 1] << 8)
+            block = bytes(buf[i + 2:i + 2 + n])
+            i += 2 + n
+            if n == 0:
+                continue
+            self.blocks.append((block[:-1], block[-1]))
+
+    def rewind(self):
+        self.pos = 0
+
+    def read(self):
+        """
+        Return the next block as (flag, data, csum) or None at the end of the tape.
+        csum: the checksum byte - it is good if it equals checksum(data)
+        """
+        if self.pos >= len(self.blocks):
+            return None
+        (data, csum) = self.blocks[self.pos]
+        flag = (HEADER, DATA)[self.pos & 1]
+        self.pos += 1
+        return (flag, data, csum)
+
+    def write(self, data):
+        """append a block to the tape - and to its file"""
+        data = bytes(data)
+        csum = checksum(data)
+        self.blocks.append((data, csum))
+        if self.filename is not None:
+            n = len(data) + 1
+            with open(self.filename, 'ab') as f:
+                f.write(bytes((n & 0xff, n >> 8)) + data + bytes((csum,)))
+
+    def __str__(self):
+        return '%s: block %d of %d' % (self.filename or 'no file', self.pos, len(self.blocks))
+
+#-----------------------------------------------------------------------------
+
+# wav decoding
+_WAV_CHUNK = 1 << 16 # frames read at a time
+_HYSTERESIS = 0.02 # of full scale
+
+def wav_edges(filename, chunk = _WAV_CHUNK):
+    """
+    Stream the edges of a WAV recording, a chunk at a time.
+    Yield arrays of edge times (seconds) - a Schmitt trigger on the first
+    channel rejects noise around the zero level.
+    """
+    with wave.open(filename, 'rb') as w:
+        rate = w.getframerate()
+        nch = w.getnchannels()
+        width = w.getsampwidth()
+        if width not in (1, 2):
+            raise ValueError('%s: %d bit samples are not supported' % (filename, width * 8))
+        h = _HYSTERESIS * (128.0, 32768.0)[width - 1]
+        level = 0
+        base = 0
+        while True:
+            buf = w.readframes(chunk)
+            if not buf:
+                break
+            x = numpy.frombuffer(buf, dtype = (numpy.uint8, '<i2')[width - 1])[::nch].astype(numpy.float64)
+            if width == 1:
+                x -= 128.0
+            # samples between the thresholds keep the previous level
+            state = numpy.where(x > h, 1, numpy.where(x < -h, 0, -1))
+            state = numpy.concatenate(((level,), state))
+            idx = numpy.where(state >= 0, numpy.arange(len(state)), 0)
+            numpy.maximum.accumulate(idx, out = idx)
+            levels = state[idx]
+            # sample k is the first at a new level
+            k = numpy.flatnonzero(levels[1:] != levels[:-1])
+            level = int(levels[-1])
+            yield (base + k) / float(rate)
+            base += len(x)
+
+#-----------------------------------------------------------------------------
+
+class ear(scheduler.device):
+    """
+    The tape input bit, driven by the edges of a WAV recording.
+    The recording starts playing at the current T-state. Edges are read
+    from the file as the cpu reaches them - the device is synced lazily.
+    """
+
+    def __init__(self, cpu, filename, clock):
+        scheduler.device.__init__(self, cpu)
+        self.filename = filename
+        self.clock = clock
+        self.chunks = wav_edges(filename)
+        self.start = cpu.clks
+        self.synced = cpu.clks
+        # T-states of the edges not yet reached
+        self.edges = numpy.zeros(0)
+        self.level = 0
+
+    def advance(self, t0, t1):
+        while True:
+            k = int(numpy.searchsorted(self.edges, t1))
+            self.level ^= k & 1
+            if k < len(self.edges):
+                self.edges = self.edges[k:]
+                return
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                # end of the recording
+                self.edges = numpy.zeros(0)
+                return
+            self.edges = self.start + (chunk * self.clock)
+
+    def rd(self):
+        """return the input bit at the current T-state"""
+        self.sync()
+        return self.level
+
+#-----------------------------------------------------------------------------
+
+# half cycle lengths (T-states at the 3.25 MHz ACE clock) written by the rom
+_LEADER = (1800, 2600) # 2011
+_SYNC = 700 # 601, then 791
+_BIT = 1200 # 801 for 0, 1591 for 1
+_LEADER_MIN = 16 # leader half cycles before a sync pulse
+_ACE_CLOCK = 3250000
+
+class wav_tap:
+    """
+    A tape of blocks decoded from a WAV recording, read by the ROM traps.
+    The half cycles are classified and packed into bytes with NumPy. Only
+    the block being decoded is held in memory.
+    """
+
+    def __init__(self, filename, chunk = _WAV_CHUNK):
+        self.filename = filename
+        self.chunk = chunk
+        self.rewind()
+
+    def rewind(self):
+        self.chunks = wav_edges(self.filename, self.chunk)
+        self.pos = 0
+        # half cycle lengths not yet decoded, and the last edge time
+        self.halves = numpy.zeros(0)
+        self.last = None
+        self.done = False
+
+    def more(self):
+        """read the next chunk of half cycles - return False at the end"""
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.done = True
+            return False
+        t = chunk * _ACE_CLOCK
+        if self.last is not None:
+            t = numpy.concatenate(((self.last,), t))
+        if len(t):
+            self.last = t[-1]
+            self.halves = numpy.concatenate((self.halves, numpy.diff(t)))
+        return True
+
+    def sync(self):
+        """return the index of the first sync pulse after a leader, or None"""
+        d = self.halves
+        leader = ((d > _LEADER[0]) & (d < _LEADER[1])).astype(numpy.int32)
+        run = numpy.concatenate(((0,), numpy.cumsum(leader)))
+        i = numpy.arange(_LEADER_MIN, len(d))
+        i = i[(d[i] < _SYNC) & ((run[i] - run[i - _LEADER_MIN]) == _LEADER_MIN)]
+        if len(i) == 0:
+            return None
+        return int(i[0])
+
+    def read(self):
+        """
+        Return the next block as (flag, data, csum) or None at the end of the tape.
+        csum: the checksum byte - it is good if it equals checksum(data)
+        """
+        block = b''
+        while len(block) < 2:
+            # find a sync pulse
+            i = self.sync()
+            while i is None:
+                # keep enough to see a leader spanning the chunks
+                self.halves = self.halves[-_LEADER_MIN:]
+                if not self.more():
+                    return None
+                i = self.sync()
+            # the data runs to the next long pulse or gap
+            start = i + 2
+            while True:
+                end = numpy.flatnonzero(self.halves[start:] > _LEADER[0])
+                if len(end):
+                    end = start + int(end[0])
+                    break
+                if not self.more():
+                    end = len(self.halves)
+                    break
+            d = self.halves[start:end]
+            self.halves = self.halves[end:]
+            # a bit is a full cycle of two halves, sent msb first
+            n = (len(d) // 16) * 16
+            bits = d[:n].reshape(-1, 2).sum(axis = 1) > (2 * _BIT)
+            block = numpy.packbits(bits).tobytes()
+        self.pos += 1
+        return (block[0], block[1:-1], block[-1])
+
+    def __str__(self):
+        return '%s: block %d (fast)' % (self.filename, self.pos)
+
+#-----------------------------------------------------------------------------
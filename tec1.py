@@ -4,147 +4,338 @@ Talking Electronics Computer Emulator
 """
 #-----------------------------------------------------------------------------
 
+import asyncio
+import board
 import memory
 import z80da
 import z80
+import logging
 import monitor
+import scheduler
 import util
-import pygame
-from pygame.locals import *
+
+try:
+    import pygame
+    from pygame.locals import *
+except ImportError:
+    # headless machines don't need pygame
+    pygame = None
 
 #-----------------------------------------------------------------------------
 
+_CPU_CLOCK = 2000000 # Hz - approximate
+_FRAME_RATE = 50 # Hz
+_FRAME_CLKS = _CPU_CLOCK // _FRAME_RATE
+_FRAME_PERIOD = 1.0 / _FRAME_RATE # secs
+
 _screen_x = 400
-_screen_y = 50
+_screen_y = 110
 
 _border = (0, 0, 0)
 
 #-----------------------------------------------------------------------------
 
-class memmap:
+# the machine description
+_spec = {
+    'roms': {'rom': './roms/tec1a.rom'},
+    'memory': (
+        ('rom', 0x0000, 0x0800, 'rom', 11, memory.RO),
+        ('ram', 0x0800, 0x0800, 'ram', 11, memory.RW),
+        # 0x1000 - 0xffff is unmapped
+    ),
+    'ports': (
+        # ports are decoded on A0-A2
+        ('keypad', 0x0007, 0x0000),
+        ('digits', 0x0007, 0x0001),
+        ('segments', 0x0007, 0x0002),
+    ),
+    'interrupts': (
+        ('frame', _FRAME_CLKS),
+    ),
+}
+
+class memmap(memory.bus):
     """memory devices and address map"""
 
     def __init__(self, romfile = './roms/tec1a.rom'):
-        self.rom = memory.rom(11)
-        self.rom.load_file(0, romfile)
-        self.ram = memory.ram(11)
-        self.empty = memory.null()
-
-    def select(self, adr):
-        """return the memory object selected by this address"""
-        # select with 2k granularity
-        memmap = (
-            self.rom,   # 0x0000 - 0x07ff
-            self.ram,   # 0x0800 - 0x0fff
-            self.empty, # 0x1000
-            self.empty, # 0x1800
-            self.empty, # 0x2000
-            self.empty, # 0x2800
-            self.empty, # 0x3000
-            self.empty, # 0x3800
-            self.empty, # 0x4000
-            self.empty, # 0x4800
-            self.empty, # 0x5000
-            self.empty, # 0x5800
-            self.empty, # 0x6000
-            self.empty, # 0x6800
-            self.empty, # 0x7000
-            self.empty, # 0x7800
-            self.empty, # 0x8000
-            self.empty, # 0x8800
-            self.empty, # 0x9000
-            self.empty, # 0x9800
-            self.empty, # 0xa000
-            self.empty, # 0xa800
-            self.empty, # 0xb000
-            self.empty, # 0xb800
-            self.empty, # 0xc000
-            self.empty, # 0xc800
-            self.empty, # 0xd000
-            self.empty, # 0xd800
-            self.empty, # 0xe000
-            self.empty, # 0xe800
-            self.empty, # 0xf000
-            self.empty, # 0xf800
-        )
-        return memmap[adr >> 11]
-
-    def __getitem__(self, adr):
-        adr &= 0xffff
-        return self.select(adr)[adr]
+        memory.bus.__init__(self)
+        board.build_memory(self, _spec, {'rom': romfile})
 
-    def __setitem__(self, adr, val):
-        adr &= 0xffff
-        self.select(adr)[adr] = val
+    def reset(self):
+        """zero the ram"""
+        self.ram.clear()
 
 #-----------------------------------------------------------------------------
 
+_DIGITS = 6
+_SEGMENTS = 8 # a, f, g, b, dp, c, e, d on bits 0..7
+# brightness for a duty cycle - a digit is lit for at most 1/6 of the time
+_GAIN = 8.0
+
 class display:
-    """6 x 7 segment led displays"""
+    """
+    6 x 7 segment led displays, multiplexed by the cpu.
+    Writes to the digit select and segment latches are stamped with the
+    T-state. The time each latch pair is lit adds up over a frame into a
+    brightness for every segment, as the persistence of the leds does.
+    """
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.reset()
+
+    def reset(self):
+        self.sel = 0
+        self.seg = 0
+        # T-state of the last latch write, and of the frame start
+        self.t = 0
+        self.t0 = 0
+        # (sel, seg) -> T-states lit this frame
+        self.lit = {}
+        self.brightness = [[0.0] * _SEGMENTS for i in range(_DIGITS)]
+
+    def latch(self):
+        """add the time since the last latch write to the lit segments"""
+        now = self.cpu.clks
+        if self.sel and self.seg:
+            k = (self.sel, self.seg)
+            self.lit[k] = self.lit.get(k, 0) + (now - self.t)
+        self.t = now
+
+    def select(self, adr, val):
+        """io write: select the digits"""
+        self.latch()
+        self.sel = val & 0x3f
+
+    def segments(self, adr, val):
+        """io write: set the segments"""
+        self.latch()
+        self.seg = val
+
+    def frame(self):
+        """end of frame: compute the segment brightness for the frame"""
+        self.latch()
+        clks = self.t - self.t0
+        if clks <= 0:
+            return
+        on = [[0] * _SEGMENTS for i in range(_DIGITS)]
+        for ((sel, seg), n) in self.lit.items():
+            for d in range(_DIGITS):
+                if sel & (1 << d):
+                    for s in range(_SEGMENTS):
+                        if seg & (1 << s):
+                            on[d][s] += n
+        self.brightness = [[min(1.0, (_GAIN * n) / clks) for n in digit] for digit in on]
+        self.lit = {}
+        self.t0 = self.t
 
-    def __init__(self):
-        pass
+#-----------------------------------------------------------------------------
 
-    def select(self, val):
-        print '%d' % val
+# keypad codes
+_KEY_PLUS = 0x10
+_KEY_MINUS = 0x11
+_KEY_GO = 0x12
+_KEY_AD = 0x13
 
-    def segments(self, val):
-        pass
+class keypad:
+    """hex keypad - a 74C923 encoder, a key press is a non maskable interrupt"""
 
-    def refresh(self, screen):
-        """refresh the whole display"""
-        bg = pygame.Surface(screen.get_size())
-        bg = bg.convert()
-        bg.fill(_border)
-        screen.blit(bg, (0, 0))
-        pygame.display.flip()
+    def __init__(self):
+        self.code = 0
+        self.pressed = False
 
-    def update(self, screen):
-        """update the video display"""
-        pygame.display.flip()
+    def press(self, code):
+        """a key has been pressed - the nmi happens at the next frame"""
+        self.code = code
+        self.pressed = True
+
+    def rd(self, adr):
+        """io read: the code of the last key - the undriven bits read high"""
+        return 0xe0 | self.code
 
 #-----------------------------------------------------------------------------
 
-class keyboard:
-    """keyboard emulation"""
+def _rd_undecoded(adr):
+    logging.debug('rd %04x' % adr)
+    return 0xff
 
-    def __init__(self):
-        pass
+def _wr_undecoded(adr, val):
+    logging.debug('wr %04x %02x' % (adr, val))
 
-    def get(self):
-        """process keyboard events"""
-        for event in pygame.event.get():
-            if event.type == KEYDOWN:
-                return True
-            elif event.type == KEYUP:
-                pass
-        return False
+#-----------------------------------------------------------------------------
 
-    def rd(self, adr):
-        """return the current port value"""
-        return 0
+# the monitor's idle loop: scan the display from (ix) until an nmi sets a key in i
+# 0131: ld a,0xff; ld i,a; call 0x0140; ld a,i; cp 0xff; ret nz; jp 0x0131
+_SCAN_LOOP = 0x0131
+_SCAN_LOOP_CLKS = 1544 # T-states per loop
+_SCAN_LOOP_R = 191 # instruction fetches per loop
+_SCAN_LIT_CLKS = 170 # T-states each digit is selected
+
+class machine:
+    """
+    The headless machine: memory, io, keypad, display latches, cpu and scheduler.
+    """
+
+    def __init__(self, romfile = './roms/tec1a.rom', hle = False):
+        """hle: high level emulation of the monitor's display scan loop"""
+        self.hle = hle
+        self.mem = memmap(romfile)
+        self.keypad = keypad()
+        self.cpu = z80.cpu(self.mem, None)
+        self.display = display(self.cpu)
+        self.io = board.io(_spec['ports'], {
+            'keypad': (self.keypad.rd, None),
+            'digits': (None, self.display.select),
+            'segments': (None, self.display.segments),
+        }, (_rd_undecoded, _wr_undecoded))
+        self.cpu.io = self.io
+        self.cpu.trap(_SCAN_LOOP, self.scan_loop)
+        self.sched = scheduler.scheduler(self.cpu)
+        board.add_interrupts(self.sched, _spec, {
+            'frame': self.frame,
+        })
+
+    def scan_loop(self):
+        """
+        High level emulation of the monitor's idle loop.
+        No key can be pressed before the end of the slice, so all the whole
+        loops up to then are done in one step: the digits in the display
+        buffer are lit for the time the scan would light them. Registers,
+        ram and the display latches are left as the emulated loops leave them.
+        """
+        if not self.hle:
+            return None
+        cpu = self.cpu
+        n = (self.sched.deadline - cpu.clks) // _SCAN_LOOP_CLKS
+        if n <= 0:
+            return None
+        # the display buffer
+        buf = self.mem.read_block(cpu.ix, _DIGITS)
+        d = self.display
+        d.latch()
+        for i in range(_DIGITS):
+            if buf[i]:
+                k = (1 << i, buf[i])
+                d.lit[k] = d.lit.get(k, 0) + (n * _SCAN_LIT_CLKS)
+        d.sel = 0
+        d.seg = buf[_DIGITS - 1]
+        # the stack writes of call 0x0140 and push ix
+        sp = cpu.sp
+        cpu._poke((sp - 2) & 0xffff, 0x0138)
+        cpu._poke((sp - 4) & 0xffff, cpu.ix)
+        # registers after cp 0xff
+        cpu.a = 0xff
+        cpu.f = 0x42
+        cpu.b = 0
+        cpu.c = 0x40
+        cpu.i = 0xff
+        cpu.r = (cpu.r + (n * _SCAN_LOOP_R) - 1) & 0x7f
+        cpu.pc = _SCAN_LOOP
+        return n * _SCAN_LOOP_CLKS
+
+    def frame(self):
+        """frame event: update the display, nmi the cpu if a key was pressed"""
+        self.display.frame()
+        if self.keypad.pressed:
+            self.keypad.pressed = False
+            return self.cpu.nmi()
+
+    def reset(self):
+        """reset the machine, zero the ram"""
+        self.cpu.reset()
+        self.sched.reset()
+        self.display.reset()
+        self.mem.reset()
+
+    def run(self, clks):
+        """run the machine for clks T-states"""
+        return self.sched.run(clks)
 
 #-----------------------------------------------------------------------------
 
-class io:
-    """io handler"""
+_help_hle = (
+    ('[on|off]', 'high level emulation of the monitor display scan'),
+    ( '', 'display the current setting if omitted'),
+)
 
-    def __init__(self, display, keyboard):
-        self.display = display
-        self.keyboard = keyboard
+#-----------------------------------------------------------------------------
 
-    def rd(self, adr):
-        print 'rd %04x' % adr
-        return 0xff
-
-    def wr(self, adr, val):
-        adr &= 0xff
-        if adr == 0x01:
-            self.display.select(val)
-        elif adr == 0x02:
-            self.display.segments(val)
-        else:
-            print 'wr %04x %02x' % (adr, val)
+_digit_x = 60 # pixels per digit
+_digit_w = 40
+_digit_h = 80
+_seg_w = 7
+_led_off = (40, 0, 0)
+_led_on = (255, 30, 30)
+_levels = 16 # brightness levels drawn
+
+def _segment_rects():
+    """return the (x, y, w, h) rectangles of segments a, f, g, b, c, e, d"""
+    (w, h, t) = (_digit_w, _digit_h, _seg_w)
+    h2 = h // 2
+    return (
+        (0, (t, 0, w - (2 * t), t)), # a
+        (1, (0, t, t, h2 - t)), # f
+        (2, (t, h2 - (t // 2), w - (2 * t), t)), # g
+        (3, (w - t, t, t, h2 - t)), # b
+        (5, (w - t, h2, t, h2 - t)), # c
+        (6, (0, h2, t, h2 - t)), # e
+        (7, (t, h - t, w - (2 * t), t)), # d
+    )
+
+class leds:
+    """draw the led displays"""
+
+    def __init__(self):
+        self.drawn = None
+        self.rects = _segment_rects()
+
+    def color(self, level):
+        return tuple([off + (((on - off) * level) // (_levels - 1)) for (off, on) in zip(_led_off, _led_on)])
+
+    def refresh(self, screen):
+        """refresh the whole display"""
+        bg = pygame.Surface(screen.get_size())
+        bg = bg.convert()
+        bg.fill(_border)
+        screen.blit(bg, (0, 0))
+        self.drawn = None
+        pygame.display.flip()
+
+    def update(self, screen, brightness):
+        """draw the digits that have changed - return True if any were"""
+        levels = [[int(b * (_levels - 1)) for b in digit] for digit in brightness]
+        changed = False
+        for d in range(_DIGITS):
+            if (self.drawn is not None) and (self.drawn[d] == levels[d]):
+                continue
+            changed = True
+            # digit 0 is the rightmost
+            x0 = 20 + ((_DIGITS - 1 - d) * _digit_x)
+            y0 = 15
+            pygame.draw.rect(screen, _border, (x0, y0, _digit_x, _digit_h + 4))
+            for (s, (x, y, w, h)) in self.rects:
+                pygame.draw.rect(screen, self.color(levels[d][s]), (x0 + x, y0 + y, w, h))
+            pygame.draw.circle(screen, self.color(levels[d][4]), (x0 + _digit_w + 6, y0 + _digit_h - 3), 4)
+        self.drawn = levels
+        return changed
+
+#-----------------------------------------------------------------------------
+
+def host_keys():
+    """return a host key to keypad code mapping"""
+    keys = {}
+    for i in range(10):
+        keys[K_0 + i] = i
+    for i in range(6):
+        keys[K_a + i] = 10 + i
+    keys[K_EQUALS] = _KEY_PLUS
+    keys[K_PLUS] = _KEY_PLUS
+    keys[K_KP_PLUS] = _KEY_PLUS
+    keys[K_MINUS] = _KEY_MINUS
+    keys[K_KP_MINUS] = _KEY_MINUS
+    keys[K_RETURN] = _KEY_GO
+    keys[K_TAB] = _KEY_AD
+    return keys
 
 #-----------------------------------------------------------------------------
 
@@ -152,56 +343,93 @@ class tec1:
 
     def __init__(self, app):
         self.app = app
-        self.display = display()
-        self.keyboard = keyboard()
-        self.mem = memmap()
-        self.io = io(self.display, self.keyboard)
-        self.cpu = z80.cpu(self.mem, self.io)
+        self.leds = leds()
+        self.machine = machine(hle = True)
+        self.keypad = self.machine.keypad
+        self.mem = self.machine.mem
+        self.cpu = self.machine.cpu
+        self.sched = self.machine.sched
+        self.keys = host_keys()
         self.mon = monitor.monitor(self.cpu)
         self.menu_root = (
             ('..', 'return to main menu', util.cr, self.parent_menu, None),
             ('da', 'disassemble memory', monitor._help_disassemble, self.mon.cli_disassemble, None),
             ('exit', 'exit the application', util.cr, self.exit, None),
             ('help', 'display general help', util.cr, app.general_help, None),
+            ('hle', 'high level emulation of the display scan', _help_hle, self.cli_hle, None),
             ('memory', 'memory functions', None, None, self.mon.menu_memory),
             ('regs', 'display cpu registers', util.cr, self.mon.cli_registers, None),
             ('run', 'run the emulation', util.cr, self.cli_run, None),
             ('step', 'single step the emulation', util.cr, self.cli_step, None),
+            ('stop', 'stop the emulation', util.cr, self.cli_stop, None),
         )
 
         # setup the video window
         pygame.init()
         self.screen = pygame.display.set_mode((_screen_x, _screen_y))
         pygame.display.set_caption('Talking Electronics Computer TEC 1')
-        self.display.refresh(self.screen)
+        self.leds.refresh(self.screen)
+
+        # display presentation and host input polling run while the target is selected
+        self.emulation = None
+        self.tasks = [
+            asyncio.create_task(scheduler.periodic(_FRAME_PERIOD, self.present)),
+            asyncio.create_task(scheduler.periodic(_FRAME_PERIOD, self.poll_input)),
+        ]
 
-        app.cli.set_poll(pygame.event.pump)
         app.cli.set_root(self.menu_root)
         self.app.cli.set_prompt('\ntec1> ')
 
+    def cli_hle(self, app, args):
+        """set high level emulation of the display scan"""
+        if util.wrong_argc(app, args, (0, 1)):
+            return
+        if len(args) == 1:
+            if args[0] not in ('on', 'off'):
+                app.put(util.inv_arg)
+                return
+            self.machine.hle = (args[0] == 'on')
+        app.put('\n\nhle: %s\n' % ('off', 'on')[self.machine.hle])
+
+    def poll_input(self):
+        """host input task: key presses go to the keypad"""
+        for event in pygame.event.get():
+            if event.type == KEYDOWN:
+                code = self.keys.get(event.key, None)
+                if code is not None:
+                    self.keypad.press(code)
+
+    def present(self):
+        """display presentation task"""
+        if self.leds.update(self.screen, self.machine.display.brightness):
+            pygame.display.flip()
+
+    def running(self):
+        """return True if the emulation task is running"""
+        return (self.emulation is not None) and not self.emulation.done()
+
+    async def emulate(self):
+        """cpu task: run frame sized slices in real time"""
+        try:
+            await self.sched.run_async(_FRAME_CLKS, _FRAME_PERIOD)
+        except z80.Error as e:
+            self.app.put('\n\nexception: %s\n' % e)
+            self.app.cli.cl.render()
+
     def cli_run(self, app, args):
         """run the emulation"""
-        app.put('\n\npress any key to halt\n')
-        irq = False
-        x = 0
-        while True:
-            if app.io.anykey():
-                return
-            try:
-                pc = self.cpu._get_pc()
-                if  irq:
-                    self.cpu.interrupt(x)
-                    irq = False
-                    x += 1
-                else:
-                    self.cpu.execute()
-            except z80.Error, e:
-                self.cpu._set_pc(pc)
-                app.put('exception: %s\n' % e)
-                return
-            print x
-            self.display.update(self.screen)
-            irq = self.keyboard.get()
+        if self.running():
+            app.put('\n\nalready running\n')
+            return
+        self.emulation = asyncio.create_task(self.emulate())
+        app.put('\n\nrunning - use "stop" to halt\n')
+
+    def cli_stop(self, app, args):
+        """stop the emulation"""
+        if self.running():
+            self.emulation.cancel()
+        self.emulation = None
+        app.put('\n\nstopped at %s\n' % self.current_instruction())
 
     def current_instruction(self):
         """return a string for the current instruction"""
@@ -211,8 +439,11 @@ class tec1:
 
     def cli_step(self, app, args):
         """single step the cpu"""
+        if self.running():
+            app.put('\n\nstop the emulation first\n')
+            return
         done = 'done: %s' % self.current_instruction()
-        self.cpu.execute()
+        self.sched.step()
         next = 'next: %s' % self.current_instruction()
         app.put('\n\n%s\n' % '\n'.join((done, next)))
 
@@ -220,8 +451,16 @@ class tec1:
         """exit the application"""
         app.exit(app, [])
 
+    def close(self):
+        """cancel the target tasks"""
+        if self.running():
+            self.emulation.cancel()
+        for task in self.tasks:
+            task.cancel()
+
     def parent_menu(self, app, args):
         """return to parent menu"""
+        self.close()
         app.put('\n')
         app.main_menu()
 
@@ -1,13 +1,30 @@
 #-----------------------------------------------------------------------------
 
+import os
+import sys
+import asyncio
+import tempfile
+import wave
+import threading
+import time
 import unittest
 
 #-----------------------------------------------------------------------------
 
 import memory
+import board
+import conio
+import cli
 import jace
+import tec1
+import spectrum
 import z80da
 import z80
+import scheduler
+import bench
+import split
+import sound
+import tape
 
 #-----------------------------------------------------------------------------
 
@@ -32,6 +49,20 @@ class memory_testing(unittest.TestCase):
         self.assertEqual(rom[8190], 0x1d)
         self.assertEqual(rom[8191], 0x00)
 
+    def test_bulk(self):
+        ram = memory.ram(13)
+        self.assertEqual(ram.load_file(0x100, './roms/ace.rom', 2, 4), 4)
+        self.assertEqual(bytes(ram.dump(0x100, 4)), bytes(memory.image('./roms/ace.rom')[2:6]))
+        self.assertEqual(ram[0x104], 0)
+        # loads are clipped to the device
+        self.assertEqual(ram.load_file(0x1ffe, './roms/ace.rom'), 2)
+        self.assertEqual(bytes(ram.dump(0x1ffe, 2)), b'\xf3\x21')
+        rom = memory.mapped_rom(13, './roms/ace.rom')
+        self.assertEqual(rom[0], 0xf3)
+        self.assertEqual(rom[8190], 0x1d)
+        self.assertEqual(bytes(rom.dump(0, 2)), b'\xf3\x21')
+        self.assertRaises(TypeError, rom.load, 0, b'\x00')
+
     def test_ram(self):
         bits = 10
         size = 1 << bits
@@ -45,6 +76,24 @@ class memory_testing(unittest.TestCase):
         ram[10] = val
         self.assertEqual(ram[10 + size], val)
 
+    def test_dirty(self):
+        ram = memory.ram(10)
+        self.assertEqual(ram.poll_dirty(), [])
+        ram[0x41] = 1
+        ram[0x7f] = 1
+        ram[0x400 + 0x3ff] = 1
+        self.assertEqual(ram.poll_dirty(), [1, 15])
+        self.assertEqual(ram.poll_dirty(), [])
+        ram.load(0x3f, b'\x01\x02')
+        self.assertEqual(ram.poll_dirty(), [0, 1])
+        ram.clear()
+        self.assertEqual(ram.poll_dirty(), list(range(16)))
+        # optional synchronous notification
+        writes = []
+        ram.wr_notify = writes.append
+        ram[0x123] = 5
+        self.assertEqual(writes, [0x123])
+
     def test_wom(self):
         bits = 10
         size = 1 << bits
@@ -66,6 +115,98 @@ class memory_testing(unittest.TestCase):
         null[20] = 0xff
         self.assertEqual(null[20], memory._empty)
 
+    def test_mapped_ram(self):
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, 'ram.bin')
+            ram = memory.mapped_ram(10, filename)
+            ram[0x10] = 0x42
+            ram.flush()
+            self.assertEqual(os.path.getsize(filename), 1 << 10)
+            # a new device on the same file sees the contents
+            other = memory.mapped_ram(10, filename)
+            self.assertEqual(other[0x10], 0x42)
+            other.close()
+            # snapshots reference the file
+            self.assertEqual(ram.snapshot(), filename)
+            other = memory.ram(10)
+            other.restore(ram.snapshot())
+            self.assertEqual(other[0x10], 0x42)
+            ram.restore(memory.ram(10).snapshot())
+            self.assertEqual(ram[0x10], 0)
+            ram.close()
+
+    def test_bus(self):
+        bus = memory.bus()
+        ram = memory.ram(10)
+        rom = memory.rom(11, bytes(range(256)) * 8)
+        wom = memory.wom(10)
+        bus.map(0x0000, 0x0800, rom, memory.RO)
+        bus.map(0x1000, 0x1000, ram)
+        bus.map(0x2000, 0x0400, wom, memory.WO)
+        bus.handle(0x3000, 0x0400, ram)
+        # rom, writes are discarded
+        self.assertEqual(bus[0x0123], 0x23)
+        bus[0x0123] = 0
+        self.assertEqual(bus[0x0123], 0x23)
+        # mirrored ram
+        bus[0x1001] = 0x55
+        self.assertEqual(bus[0x1401], 0x55)
+        self.assertEqual(bus[0x1c01], 0x55)
+        self.assertEqual(ram[1], 0x55)
+        # wom
+        bus[0x2002] = 0x66
+        self.assertEqual(bus[0x2002], memory._empty)
+        self.assertEqual(wom.rd(2), 0x66)
+        # handler pages go through the device
+        ram.poll_dirty()
+        bus[0x3003] = 0x77
+        self.assertEqual(bus[0x1003], 0x77)
+        self.assertEqual(ram.poll_dirty(), [0])
+        # unmapped, and addresses wrap at 64K
+        self.assertEqual(bus[0x8000], memory._empty)
+        bus[0x8000] = 1
+        self.assertEqual(bus[0x8000], memory._empty)
+        self.assertEqual(bus[0x10123], 0x23)
+        self.assertIs(bus.select(0x1800), ram)
+
+    def test_bus_dirty(self):
+        bus = memory.bus()
+        ram = memory.ram(12)
+        rom = memory.rom(10)
+        bus.map(0x1000, 0x1000, ram, memory.RW, 0x400)
+        bus.map(0x0000, 0x0400, rom, memory.RO)
+        ram.poll_dirty()
+        # cpu writes to rw pages go straight into the buffer
+        bus[0x1000] = 1
+        self.assertEqual(ram.poll_dirty(), [])
+        # block writes mark the device lines, across pages and mirrors
+        bus.write_block(0x13f0, bytes(0x20))
+        self.assertEqual(ram.poll_dirty(), [0x1f, 0x20])
+        bus.write_block(0x1c00, bytes(1))
+        self.assertEqual(ram.poll_dirty(), [0])
+        # discarded writes mark nothing
+        bus.write_block(0x0000, bytes(0x10))
+        self.assertEqual(rom.poll_dirty(), [])
+
+    def test_banked(self):
+        bus = memory.bus()
+        ram = memory.ram(17) # 128K, 8 banks of 16K
+        remaps = []
+        bus.remap_notify = lambda adr, size: remaps.append((adr, size))
+        banks = memory.banked(bus, 0xc000, 0x4000, ram)
+        self.assertEqual(remaps, [(0xc000, 0x4000)])
+        bus[0xc000] = 1
+        banks.wr(0x7ffd, 3)
+        self.assertEqual(banks.bank, 3)
+        self.assertEqual(bus[0xc000], 0)
+        bus[0xc000] = 4
+        self.assertEqual(ram[3 * 0x4000], 4)
+        banks.select(0)
+        self.assertEqual(bus[0xc000], 1)
+        # selecting the current bank does not remap
+        banks.select(8)
+        self.assertEqual(len(remaps), 3)
+
 #-----------------------------------------------------------------------------
 
 class jace_memmap_testing(unittest.TestCase):
@@ -104,6 +245,151 @@ class jace_memmap_testing(unittest.TestCase):
         mem[0xf800] = val
         self.assertEqual(mem[0xf800], memory._empty)
 
+    def test_expansion(self):
+        for size in jace._expansions:
+            mem = jace.memmap('./roms/ace.rom', expansion = size)
+            end = 0x4000 + (size << 10)
+            for adr in (0x4000, 0x7fff, 0x8000, 0xbfff, 0xc000, 0xffff):
+                mem[adr] = 0x5a
+                self.assertEqual(mem[adr], (memory._empty, 0x5a)[adr < end])
+        mem.expand(16)
+        self.assertEqual(mem[0x4000], 0)
+        self.assertEqual(mem[0xc000], memory._empty)
+        self.assertRaises(ValueError, mem.expand, 8)
+
+    def test_expansion_file(self):
+        # resizing a file backed expansion releases the old mapping
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, 'ram.bin')
+            mem = jace.memmap('./roms/ace.rom')
+            mem.expand(16, filename)
+            mem[0x4000] = 0xa5
+            old = mem.expansion
+            mem.expand(32, filename)
+            self.assertTrue(old.mem.closed)
+            self.assertEqual(mem[0x4000], 0xa5)
+            mem.expand(0)
+            self.assertIsNone(mem.expansion)
+
+    def test_shared_rom(self):
+        mem0 = jace.memmap('./roms/ace.rom')
+        mem1 = jace.memmap('./roms/ace.rom')
+        self.assertIs(mem0.rom.mem, mem1.rom.mem)
+        self.assertIsNot(mem0.ram.mem, mem1.ram.mem)
+
+    def test_reset(self):
+        m = jace.machine()
+        m.run(2 * jace._FRAME_CLKS)
+        self.assertNotEqual(m.cpu.pc, 0)
+        self.assertNotEqual(bytes(m.mem.ram.mem), bytes(1 << 10))
+        m.reset()
+        self.assertEqual(m.cpu.pc, 0)
+        self.assertEqual(m.sched.clks, 0)
+        self.assertEqual(bytes(m.mem.ram.mem), bytes(1 << 10))
+        self.assertEqual(bytes(m.mem.video.mem), bytes(1 << 10))
+
+#-----------------------------------------------------------------------------
+
+class keyboard_testing(unittest.TestCase):
+
+    def test_matrix(self):
+        kb = board.keyboard()
+        self.assertEqual(kb.rd(0x00fe), 0xff)
+        # a on the asdfg half-row, m on the space half-row
+        kb.event(0xfdfe, 1 << 0, True)
+        kb.event(0x7ffe, 1 << 1, True)
+        self.assertEqual(kb.rd(0xfdfe), 0xfe)
+        self.assertEqual(kb.rd(0x7ffe), 0xfd)
+        self.assertEqual(kb.rd(0xfefe), 0xff)
+        # several half-rows at once: any key
+        self.assertEqual(kb.rd(0x00fe), 0xfc)
+        self.assertEqual(kb.rd(0x7dfe), 0xfc)
+        self.assertEqual(kb.rd(0xfcfe), 0xfe)
+        kb.event(0xfdfe, 1 << 0, False)
+        self.assertEqual(kb.rd(0x00fe), 0xfd)
+        kb.reset()
+        self.assertEqual(kb.rd(0x00fe), 0xff)
+
+#-----------------------------------------------------------------------------
+
+class board_testing(unittest.TestCase):
+
+    def test_build(self):
+        spec = {
+            'roms': {'rom': './roms/ace.rom'},
+            'memory': (
+                ('rom', 0x0000, 0x2000, 'rom', 13, memory.RO),
+                ('ram', 0x8000, 0x1000, 'ram', 10, memory.RW),
+                ('ram', 0xc000, 0x0400, 'ram', 10, memory.DEV),
+            ),
+            'ports': (
+                ('a', 0x0001, 0x0000),
+                ('b', 0x00ff, 0x0011),
+                ('c', 0x8003, 0x8003),
+            ),
+        }
+        bus = memory.bus()
+        board.build_memory(bus, spec)
+        self.assertEqual(bus[0x0000], 0xf3)
+        bus[0x8c01] = 0x12
+        self.assertEqual(bus[0xc001], 0x12)
+        self.assertIs(bus.ram, bus.select(0xc000))
+        writes = []
+        io = board.io(spec['ports'], {
+            'a': (lambda adr: 0x0a, None),
+            'b': (lambda adr: 0x0b, lambda adr, val: writes.append((adr, val))),
+            'c': (lambda adr: 0x0c, None),
+        })
+        self.assertEqual(io.rd(0x12fe), 0x0a)
+        self.assertEqual(io.rd(0x0011), 0x0b)
+        self.assertEqual(io.rd(0x8013), 0x0c)
+        self.assertEqual(io.rd(0x0013), 0xff)
+        io.wr(0x0011, 0x55)
+        io.wr(0x0010, 0x66)
+        self.assertEqual(writes, [(0x0011, 0x55)])
+        # every port selected by a decode, and no others
+        self.assertEqual(io.rd_index.count(io.rd_index[0x8003]), 1 << 13)
+        self.assertEqual(len(io.rd_index), 1 << 16)
+        # a rom image of the wrong size fails at build time
+        spec['memory'] = (('rom', 0x0000, 0x4000, 'rom', 14, memory.RO),)
+        self.assertRaises(ValueError, board.build_memory, memory.bus(), spec)
+
+    def test_banks(self):
+        spec = {
+            'memory': (
+                ('ram', 0x0000, 0x4000, 'ram', 14, memory.RW),
+            ),
+            'banks': (
+                ('paged', 0xc000, 0x4000, 'ram', 17, memory.RW), # 8 banks of 16K
+            ),
+            'ports': (
+                ('paged', 0x8002, 0x0000),
+            ),
+        }
+        bus = memory.bus()
+        board.build_memory(bus, spec)
+        io = board.io(spec['ports'], board.bank_ports(bus, spec))
+        bus.paged.dev[3 * 0x4000] = 0x5a
+        # ld a,3; ld bc,0x7ffd; out (c),a; ld a,(0xc000)
+        bus.write_block(0, bytes((0x3e, 0x03, 0x01, 0xfd, 0x7f, 0xed, 0x79, 0x3a, 0x00, 0xc0)))
+        cpu = z80.cpu(bus, io)
+        self.assertEqual(bus[0xc000], 0)
+        for i in range(4):
+            cpu.execute()
+        self.assertEqual(bus.paged.bank, 3)
+        self.assertEqual(cpu.a, 0x5a)
+
+    def test_sizes(self):
+        # buffers must fit the device, mapped devices must fill a page
+        self.assertRaises(ValueError, memory.ram, 10, bytearray(100))
+        self.assertRaises(ValueError, memory.bus().map, 0, 0x400, memory.ram(4))
+
+    def test_static(self):
+        io = board.io((('id', 0x00ff, 0x005a),), {'id': (0x42, None)})
+        self.assertEqual(len(io.rd_index), 1 << 8)
+        self.assertEqual(io.rd(0x125a), 0x42)
+        self.assertEqual(io.rd(0x125b), 0xff)
+
 #-----------------------------------------------------------------------------
 
 class z80_regs_test(unittest.TestCase):
@@ -126,6 +412,721 @@ class z80_regs_test(unittest.TestCase):
 
 
 
+#-----------------------------------------------------------------------------
+
+class z80_tables_test(unittest.TestCase):
+
+    def test_class_tables(self):
+        cpu0 = z80.cpu(memory.ram(4), None)
+        cpu1 = z80.cpu(memory.ram(4), None)
+        # tables are shared by the class, not built per instance
+        for name in ('opcodes', 'opcodes_cb', 'opcodes_ddcb00', 'f_sz', 'f_szhv_dec'):
+            self.assertNotIn(name, vars(cpu0))
+            self.assertIs(getattr(cpu0, name), getattr(cpu1, name))
+        # ld a,0x42
+        cpu0.mem[0] = 0x3e
+        cpu0.mem[1] = 0x42
+        self.assertEqual(cpu0.execute(), 7)
+        self.assertEqual(cpu0.a, 0x42)
+        self.assertEqual(cpu1.a, 0xff)
+
+#-----------------------------------------------------------------------------
+
+class block_io_test(unittest.TestCase):
+
+    def run_block(self, opcode, bulk):
+        """run ld hl,0x80fe; ld bc,0x2010; <opcode> - return the results"""
+        mem = memory.bus()
+        mem.map(0x0000, 0x10000, memory.ram(16))
+        for (i, val) in enumerate((0x21, 0xfe, 0x80, 0x01, 0x10, 0x20, 0xed, opcode)):
+            mem[i] = val
+        for i in range(0x100):
+            mem[0x8000 + i] = (i * 7) & 0xff
+        state = {'n': 0x70, 'log': []}
+        def rd(adr):
+            state['n'] = (state['n'] + 3) & 0xff
+            state['log'].append((adr, state['n']))
+            return state['n']
+        def wr(adr, val):
+            state['log'].append((adr, val))
+        def rd_block(adr, n):
+            return bytes([rd((adr - (i << 8)) & 0xffff) for i in range(n)])
+        def wr_block(adr, data):
+            for (i, val) in enumerate(data):
+                wr((adr - (i << 8)) & 0xffff, val)
+        handlers = ((rd, wr), (rd, wr, rd_block, wr_block))[bulk]
+        cpu = z80.cpu(mem, board.io((('port', 0x00ff, 0x0010),), {'port': handlers}))
+        clks = 0
+        steps = 0
+        while cpu.pc < 8:
+            clks += cpu.execute()
+            steps += 1
+        return (str(cpu), mem.read_block(0x7f00, 0x200), state['log'], clks, steps)
+
+    def test_block_io(self):
+        for opcode in (0xa2, 0xaa, 0xb2, 0xba, 0xa3, 0xab, 0xb3, 0xbb):
+            single = self.run_block(opcode, False)
+            bulk = self.run_block(opcode, True)
+            self.assertEqual(single[:4], bulk[:4])
+            if opcode & 0x10:
+                # the repeated forms: 0x20 bytes in a single step
+                self.assertEqual(single[4], 2 + 0x20)
+                self.assertEqual(bulk[4], 2 + 1)
+                self.assertEqual(single[3], 10 + 10 + (21 * 0x1f) + 16)
+                self.assertEqual(len(single[2]), 0x20)
+        # ini: b = 0x1f, val = 0x73, k = 0x11 + 0x73: X from b, P from (k & 7) ^ b
+        cpu = self.run_block(0xa2, False)[0]
+        self.assertIn('f    : 0c', cpu)
+
+#-----------------------------------------------------------------------------
+
+class scheduler_testing(unittest.TestCase):
+
+    def test_events(self):
+        # memory full of nops - 4 clocks each
+        cpu = z80.cpu(memory.ram(8), None)
+        sched = scheduler.scheduler(cpu)
+        calls = []
+        sched.add(100, lambda: calls.append(sched.clks))
+        sched.run(1000)
+        self.assertEqual(sched.clks, 1000)
+        self.assertEqual(calls, list(range(100, 1001, 100)))
+
+    def test_stop(self):
+        cpu = z80.cpu(memory.ram(8), None)
+        sched = scheduler.scheduler(cpu)
+        sched.add(400, sched.stop)
+        sched.run()
+        self.assertEqual(sched.clks, 400)
+
+    def test_step(self):
+        cpu = z80.cpu(memory.ram(8), None)
+        sched = scheduler.scheduler(cpu)
+        calls = []
+        sched.add(8, lambda: calls.append(sched.clks))
+        sched.step()
+        self.assertEqual((cpu.pc, sched.clks, cpu.clks), (1, 4, 4))
+        sched.step()
+        self.assertEqual((cpu.pc, sched.clks, cpu.clks), (2, 8, 8))
+        self.assertEqual(calls, [8])
+
+    def test_lazy_device(self):
+        # a device whose state counts T-states, synced only when read
+        class counter(scheduler.device):
+            ticks = 0
+            def advance(self, t0, t1):
+                self.ticks += t1 - t0
+            def rd(self, adr):
+                self.sync()
+                return (self.ticks // 100) & 0xff
+        mem = memory.ram(12)
+        # ld hl,0x100; loop: in a,(0); ld (hl),a; inc hl; jr loop
+        mem.load(0, (0x21, 0x00, 0x01, 0xdb, 0x00, 0x77, 0x23, 0x18, 0xfa))
+        cpu = z80.cpu(mem, None)
+        dev = counter(cpu)
+        cpu.io = board.io((('counter', 0xff, 0x00),), {'counter': (dev.rd, None)})
+        sched = scheduler.scheduler(cpu)
+        sched.add_device(dev)
+        sched.add(1000, lambda: None)
+        sched.run(10 + (36 * 200))
+        # each in reads the count at the start of the instruction
+        for k in range(200):
+            self.assertEqual(mem[0x100 + k], ((10 + (36 * k)) // 100) & 0xff)
+        # the device is synced at the end of the slice
+        self.assertEqual(dev.ticks, sched.clks)
+        self.assertEqual(cpu.clks, sched.clks)
+
+#-----------------------------------------------------------------------------
+
+@unittest.skipIf(sound.numpy is None, 'needs numpy')
+class sound_testing(unittest.TestCase):
+
+    def test_synthesize(self):
+        # 10 T-states per sample, an edge half way through the second sample
+        (samples, t) = sound.synthesize(0, 35, 0, [(15, 1)], 10)
+        self.assertEqual(t, 30)
+        self.assertEqual(list(samples), [-sound._AMPLITUDE, 0, sound._AMPLITUDE])
+
+    def test_beeper(self):
+        # loop: out (0xfe),a; in a,(0xfe); djnz loop; jr loop
+        mem = memory.ram(10)
+        mem.load(0, (0x06, 0x00, 0xd3, 0xfe, 0xdb, 0xfe, 0x10, 0xfa, 0x18, 0xf6))
+        m = jace.machine()
+        cpu = z80.cpu(mem, m.io)
+        m.beeper = sound.beeper(cpu, jace._CPU_CLOCK)
+        blocks = []
+        m.beeper.sink = blocks.append
+        sched = scheduler.scheduler(cpu)
+        sched.add(jace._FRAME_CLKS, m.beeper.frame)
+        sched.run(3 * jace._FRAME_CLKS)
+        samples = sound.numpy.concatenate(blocks)
+        self.assertEqual(len(samples), 3 * 882)
+        # the speaker is out for 11 of every 35 T-states
+        self.assertAlmostEqual(float(samples.mean()) / sound._AMPLITUDE, (22.0 / 35.0) - 1.0, 2)
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, 'beeper.wav')
+            wav = sound.wav_sink(filename)
+            wav(samples)
+            wav.close()
+            self.assertEqual(os.path.getsize(filename), 44 + (2 * len(samples)))
+
+    def test_record(self):
+        # a headless machine records its sound to a WAV file
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, 'ace.wav')
+            m = jace.machine()
+            m.run(jace._FRAME_CLKS)
+            m.beeper.record(filename)
+            m.run(2 * jace._FRAME_CLKS)
+            m.beeper.record(None)
+            self.assertIsNone(m.beeper.sink)
+            w = wave.open(filename, 'rb')
+            self.assertEqual((w.getframerate(), w.getnframes()), (sound._RATE, 2 * 882))
+            w.close()
+
+#-----------------------------------------------------------------------------
+
+class tape_testing(unittest.TestCase):
+
+    def call(self, m, adr, hl, de, c, carry = 0):
+        """call a rom tape routine from 0x3000"""
+        cpu = m.cpu
+        cpu.sp = 0x3f00
+        cpu._push(0x3000)
+        cpu._set_hl(hl)
+        cpu._set_de(de)
+        cpu.c = c
+        cpu.f = carry
+        cpu.pc = adr
+        # the trap resumes the rom at the end of the routine
+        for i in range(1000):
+            cpu.execute()
+            if cpu.pc == 0x3000:
+                break
+        self.assertEqual(cpu.pc, 0x3000)
+        return cpu.f & 1
+
+    def test_traps(self):
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, 'x.tap')
+            m = jace.machine(expansion = 16)
+            m.tape = tape.tap(filename)
+            m.mem.write_block(0x3c00, bytes(range(25)))
+            m.mem.write_block(0x4000, b'forth' * 100)
+            self.call(m, jace._TAPE_SAVE, 0x3c00, 25, tape.HEADER)
+            self.call(m, jace._TAPE_SAVE, 0x4000, 500, tape.DATA)
+            with open(filename, 'rb') as f:
+                buf = f.read()
+            self.assertEqual(len(buf), 2 + 26 + 2 + 501)
+            self.assertEqual(buf[:3], bytes((26, 0, 0)))
+            # load into another machine
+            m = jace.machine(expansion = 16)
+            m.tape = tape.tap(filename)
+            self.assertEqual(self.call(m, jace._TAPE_LOAD, 0x3c00, 25, tape.HEADER, 1), 1)
+            self.assertEqual(m.mem.read_block(0x3c00, 25), bytes(range(25)))
+            self.assertEqual(self.call(m, jace._TAPE_LOAD, 0x4000, 500, tape.DATA, 1), 1)
+            self.assertEqual(m.mem.read_block(0x4000, 500), b'forth' * 100)
+            self.assertEqual((m.cpu.iff1, m.cpu._get_de()), (1, 0))
+            # verify, then a wrong block type
+            m.tape.rewind()
+            m.mem[0x3c00] = 0xaa
+            self.assertEqual(self.call(m, jace._TAPE_LOAD, 0x3c00, 25, tape.HEADER, 0), 0)
+            self.assertEqual(self.call(m, jace._TAPE_LOAD, 0x3c00, 25, tape.HEADER, 1), 0)
+            self.assertEqual(m.mem[0x3c00], 0xaa)
+            # end of tape: the rom routine runs
+            m.cpu.pc = jace._TAPE_LOAD
+            m.cpu.execute()
+            self.assertEqual(m.cpu.pc, jace._TAPE_LOAD + 1)
+
+def ace_tape_wav(filename, block, rate = 44100):
+    """write a WAV recording of a block as the ACE rom saves it"""
+    halves = [2011] * 1024 + [601, 791]
+    for byte in block:
+        for i in range(7, -1, -1):
+            halves.extend([(801, 1591)[(byte >> i) & 1]] * 2)
+    halves.append(917)
+    t = tape.numpy.cumsum([0] + halves) * (float(rate) / jace._CPU_CLOCK)
+    n = int(t[-1]) + (rate // 10)
+    level = tape.numpy.searchsorted(t, tape.numpy.arange(n), side = 'right') & 1
+    samples = ((level * 2) - 1) * 10000
+    # a dc offset and some noise
+    samples = samples + 300 + (tape.numpy.arange(n) % 7) * 40
+    w = wave.open(filename, 'wb')
+    w.setnchannels(1)
+    w.setsampwidth(2)
+    w.setframerate(rate)
+    w.writeframes(samples.astype('<i2').tobytes())
+    w.close()
+
+@unittest.skipIf(tape.numpy is None, 'needs numpy')
+class wav_tape_testing(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.dir.name, 'x.wav')
+        self.data = bytes(range(1, 40))
+        ace_tape_wav(self.filename, bytes((0xff,)) + self.data + bytes((tape.checksum(self.data),)))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_decode(self):
+        # small chunks: the leader and data span many of them
+        t = tape.wav_tap(self.filename, 1000)
+        self.assertEqual(t.read(), (0xff, self.data, tape.checksum(self.data)))
+        self.assertEqual(t.read(), None)
+        self.assertLess(len(t.halves), 1000)
+
+    def test_ear(self):
+        # the rom loader reads the recording from the tape input
+        m = jace.machine(expansion = 16)
+        m.play(self.filename)
+        cpu = m.cpu
+        # return to di; halt
+        m.mem[0x3000] = 0xf3
+        m.mem[0x3001] = 0x76
+        cpu.sp = 0x3f00
+        cpu._push(0x3000)
+        cpu._set_hl(0x4000)
+        cpu._set_de(len(self.data))
+        cpu.c = 0xff
+        cpu.f = 1
+        cpu.pc = jace._TAPE_LOAD
+        for i in range(100):
+            m.run(5 * jace._FRAME_CLKS)
+            if cpu.halt:
+                break
+        self.assertEqual(cpu.pc, 0x3001)
+        self.assertEqual(cpu.f & 1, 1)
+        self.assertEqual(m.mem.read_block(0x4000, len(self.data)), self.data)
+
+    def load(self, m, flag, carry):
+        """run the rom load/verify routine into 0x4000 and return the registers"""
+        cpu = m.cpu
+        m.mem[0x3000] = 0xf3
+        m.mem[0x3001] = 0x76
+        cpu.sp = 0x3f00
+        cpu._push(0x3000)
+        cpu._set_hl(0x4000)
+        cpu._set_de(len(self.data))
+        cpu.c = flag
+        cpu._set_af(0x1200 | carry)
+        cpu.alt_af = 0x3456
+        cpu.iy = 0x1111
+        cpu.pc = jace._TAPE_LOAD
+        for i in range(2000):
+            m.run(jace._FRAME_CLKS // 10)
+            if cpu.halt:
+                break
+        self.assertEqual(cpu.pc, 0x3001)
+        # r counts the instructions run, a' has the tape input (ear) bit
+        # of the port read on the way out - only one run plays a signal
+        cpu.r = 0
+        cpu.alt_af &= ~0x1000
+        return str(cpu)
+
+    def test_trap_registers(self):
+        # the trap leaves the registers as the rom loader does
+        for (flag, carry, ram) in ((0xff, 1, b''), (0x00, 1, b''), (0xff, 0, self.data), (0xff, 0, b'\x01\x02\x00')):
+            regs = []
+            for trapped in (False, True):
+                m = jace.machine(expansion = 16)
+                m.mem.write_block(0x4000, ram)
+                if trapped:
+                    m.tape = tape.wav_tap(self.filename)
+                else:
+                    m.play(self.filename)
+                regs.append(self.load(m, flag, carry))
+            self.assertEqual(regs[0], regs[1])
+
+# tec-1 7 segment patterns for 0..f
+_tec1_hex = (0xeb, 0x28, 0xcd, 0xad, 0x2e, 0xa7, 0xe7, 0x29, 0xef, 0x2f, 0x6f, 0xe6, 0xc3, 0xec, 0xc7, 0x47)
+
+class tec1_testing(unittest.TestCase):
+
+    def shown(self, m):
+        """return the hex digits lit on the display, left to right"""
+        s = ''
+        for d in range(5, -1, -1):
+            segs = sum([1 << i for (i, b) in enumerate(m.display.brightness[d]) if b > 0.5])
+            s += '%x' % _tec1_hex.index(segs & 0xef)
+        return s
+
+    def test_keypad(self):
+        m = tec1.machine()
+        m.run(20 * tec1._FRAME_CLKS)
+        self.assertEqual(self.shown(m), '080000')
+        # address 0x0900, data 0x5a
+        for k in (tec1._KEY_AD, 0, 9, 0, 0, tec1._KEY_AD, 5, 0xa):
+            m.keypad.press(k)
+            m.run(5 * tec1._FRAME_CLKS)
+        self.assertEqual(self.shown(m), '09005a')
+        self.assertEqual(m.mem[0x0900], 0x5a)
+        m.keypad.press(tec1._KEY_PLUS)
+        m.run(5 * tec1._FRAME_CLKS)
+        self.assertEqual(self.shown(m)[:4], '0901')
+
+    def test_hle(self):
+        # the same machine state with and without the display scan hle
+        states = []
+        for hle in (False, True):
+            m = tec1.machine(hle = hle)
+            m.run(20 * tec1._FRAME_CLKS)
+            for k in (tec1._KEY_AD, 0, 9, 0, 0, tec1._KEY_AD, 7):
+                m.keypad.press(k)
+                m.run(3 * tec1._FRAME_CLKS)
+            states.append((str(m.cpu), bytes(m.mem.ram.mem), m.sched.clks, m.display.brightness))
+        self.assertEqual(states[0], states[1])
+        self.assertEqual(self.shown(m), '090007')
+
+    def test_persistence(self):
+        cpu = z80.cpu(memory.ram(4), None)
+        d = tec1.display(cpu)
+        # digit 0 lit with segment 0 for half of the frame
+        d.select(1, 0x01)
+        d.segments(2, 0x01)
+        cpu.clks = 500
+        d.select(1, 0)
+        cpu.clks = 1000
+        d.frame()
+        self.assertEqual(d.brightness[0][0], 1.0)
+        self.assertEqual(d.brightness[0][1], 0.0)
+        # digit 1 lit for 100 of 1600 T-states: dimmer
+        cpu.clks = 2500
+        d.select(1, 0x02)
+        cpu.clks = 2600
+        d.frame()
+        self.assertEqual(d.brightness[0][0], 0.0)
+        self.assertEqual(d.brightness[1][0], (tec1._GAIN * 100) / 1600)
+
+#-----------------------------------------------------------------------------
+
+# spectrum test rom: count the frame interrupts at 0x9000 with the border red
+# 0000: ld sp,0x8000; ld a,2; out (0xfe),a; im 1; ei; halt; jr 0x0009
+# 0038: ld hl,(0x9000); inc hl; ld (0x9000),hl; ei; ret
+_spectrum_rom = {
+    0x0000: (0x31, 0x00, 0x80, 0x3e, 0x02, 0xd3, 0xfe, 0xed, 0x56, 0xfb, 0x76, 0x18, 0xfc),
+    0x0038: (0x2a, 0x00, 0x90, 0x23, 0x22, 0x00, 0x90, 0xfb, 0xc9),
+}
+
+def pack_z80(data):
+    """.z80 compression: runs of 5 or more bytes, or of 2 or more EDs"""
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        n = 1
+        while (i + n < len(data)) and (data[i + n] == data[i]) and (n < 255):
+            n += 1
+        if (n >= 5) or ((n >= 2) and (data[i] == 0xed)):
+            out += bytes((0xed, 0xed, n, data[i]))
+            i += n
+        else:
+            out.append(data[i])
+            i += 1
+            if (data[i - 1] == 0xed) and (i < len(data)):
+                # a byte after a single ED is never part of a run
+                out.append(data[i])
+                i += 1
+    return bytes(out)
+
+@unittest.skipIf(spectrum.numpy is None, 'needs numpy')
+class spectrum_testing(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        rom = bytearray(0x4000)
+        for (adr, code) in _spectrum_rom.items():
+            rom[adr:adr + len(code)] = bytes(code)
+        self.romfile = os.path.join(self.dir.name, 'test.rom')
+        with open(self.romfile, 'wb') as f:
+            f.write(rom)
+        # a ram image with a recognisable pattern and some runs
+        self.ram = bytes([(i * 7) & 0xff for i in range(0x4000)]) + bytes(0x4000) + bytes((0xed,) * 0x4000)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_line_address(self):
+        self.assertEqual(spectrum.line_address(0), 0x0000)
+        self.assertEqual(spectrum.line_address(1), 0x0100)
+        self.assertEqual(spectrum.line_address(8), 0x0020)
+        self.assertEqual(spectrum.line_address(64), 0x0800)
+        self.assertEqual(spectrum.line_address(191), 0x17e0)
+
+    def test_render(self):
+        screen = bytearray(spectrum._SCREEN_SIZE)
+        # line 9, column 3: the leftmost pixel set
+        screen[spectrum.line_address(9) + 3] = 0x80
+        # flash, bright, blue paper, red ink
+        screen[0x1800 + 32 + 3] = 0xca
+        x = spectrum.render(bytes(screen))
+        self.assertEqual(x.shape, (192, 256))
+        self.assertEqual((x[9, 24], x[9, 25], x[8, 24], x[0, 0]), (10, 9, 9, 0))
+        x = spectrum.render(bytes(screen), flash = True)
+        self.assertEqual((x[9, 24], x[9, 25], x[8, 24], x[0, 0]), (9, 10, 10, 0))
+        rgb = spectrum.render_rgb(bytes(screen))
+        self.assertEqual(rgb.shape, (192, 256, 3))
+        self.assertEqual(tuple(rgb[9, 24]), (0xff, 0x00, 0x00))
+
+    def test_frame(self):
+        m = spectrum.machine(self.romfile)
+        m.run(10 * spectrum._FRAME_CLKS)
+        self.assertEqual(m.border, 2)
+        # the last interrupt is acknowledged but its handler has not run
+        self.assertEqual(m.cpu._peek(0x9000), 9)
+        self.assertEqual(m.cpu.pc, 0x38)
+        self.assertEqual(m.frames, 10)
+        self.assertEqual(m.flash(), False)
+        m.run(6 * spectrum._FRAME_CLKS)
+        self.assertEqual(m.flash(), True)
+
+    def test_sna(self):
+        header = bytearray(27)
+        header[0] = 0x3f # i
+        header[9:11] = (0x34, 0x12) # hl
+        header[19] = 0x04 # iff2
+        header[21:23] = (0x44, 0x99) # af
+        header[23:25] = (0x00, 0x80) # sp
+        header[25] = 1 # im
+        header[26] = 5 # border
+        ram = bytearray(self.ram)
+        # pc on the stack
+        ram[0x4000:0x4002] = (0x78, 0x56)
+        filename = os.path.join(self.dir.name, 'test.sna')
+        with open(filename, 'wb') as f:
+            f.write(header + ram)
+        m = spectrum.machine(self.romfile)
+        m.load(filename)
+        cpu = m.cpu
+        self.assertEqual((cpu.i, cpu._get_hl(), cpu._get_af()), (0x3f, 0x1234, 0x9944))
+        self.assertEqual((cpu.iff1, cpu.iff2, cpu.im), (1, 1, 1))
+        self.assertEqual((cpu._get_pc(), cpu.sp, m.border), (0x5678, 0x8002, 5))
+        self.assertEqual(m.mem.read_block(0x4000, 0xc000), ram)
+        with open(filename, 'wb') as f:
+            f.write(header)
+        self.assertRaises(ValueError, m.load, filename)
+
+    def test_load_sound(self):
+        # loading a snapshot part way through a run restarts the sound
+        filename = os.path.join(self.dir.name, 'test.sna')
+        with open(filename, 'wb') as f:
+            f.write(bytes(27) + self.ram)
+        m = spectrum.machine(self.romfile)
+        blocks = []
+        m.beeper.sink = blocks.append
+        m.run(3 * spectrum._FRAME_CLKS)
+        m.load(filename)
+        m.run(spectrum._FRAME_CLKS)
+        self.assertEqual(len(blocks), 4)
+        self.assertAlmostEqual(len(blocks[-1]), spectrum._FRAME_CLKS / m.beeper.clks_per_sample, delta = 1)
+
+    def z80_header(self, pc):
+        header = bytearray(30)
+        header[0:2] = (0x12, 0x34) # a, f
+        header[6:8] = (pc & 0xff, pc >> 8)
+        header[8:10] = (0x00, 0xff) # sp
+        header[11] = 0x85 # r
+        header[12] = 0x25 | (3 << 1) # r bit 7, border, compressed
+        header[21:23] = (0x56, 0x78) # a', f'
+        header[27:30] = (1, 1, 2) # iff1, iff2, im
+        return header
+
+    def check_z80(self, m, pc):
+        cpu = m.cpu
+        self.assertEqual((cpu.a, cpu.f, cpu.alt_af, cpu.sp), (0x12, 0x34, 0x5678, 0xff00))
+        self.assertEqual((cpu.r, cpu.iff1, cpu.im, m.border), (0x85, 1, 2, 3))
+        self.assertEqual(cpu._get_pc(), pc)
+        self.assertEqual(m.mem.read_block(0x4000, 0xc000), self.ram)
+
+    def test_z80(self):
+        m = spectrum.machine(self.romfile)
+        # version 1: one compressed block and an end marker
+        self.assertEqual(spectrum._unpack_z80(pack_z80(self.ram), 0xc000), self.ram)
+        filename = os.path.join(self.dir.name, 'v1.z80')
+        with open(filename, 'wb') as f:
+            f.write(self.z80_header(0x1234) + pack_z80(self.ram) + bytes((0, 0xed, 0xed, 0)))
+        m.load(filename)
+        self.check_z80(m, 0x1234)
+        # version 3: pages 8, 4 and 5 - one of them uncompressed
+        header = self.z80_header(0) + bytearray(56)
+        header[30:32] = (54, 0)
+        header[32:34] = (0xcd, 0xab)
+        pages = b''
+        for (page, adr) in ((4, 0x8000), (5, 0xc000), (8, 0x4000)):
+            data = self.ram[adr - 0x4000:adr]
+            if page == 5:
+                pages += bytes((0xff, 0xff, page)) + data
+            else:
+                data = pack_z80(data)
+                pages += bytes((len(data) & 0xff, len(data) >> 8, page)) + data
+        filename = os.path.join(self.dir.name, 'v3.z80')
+        with open(filename, 'wb') as f:
+            f.write(header + pages)
+        m = spectrum.machine(self.romfile)
+        m.load(filename)
+        self.check_z80(m, 0xabcd)
+        # a 128K snapshot
+        header[34] = 4
+        with open(filename, 'wb') as f:
+            f.write(header + pages)
+        self.assertRaises(ValueError, m.load, filename)
+
+#-----------------------------------------------------------------------------
+
+class conio_testing(unittest.TestCase):
+
+    def test_decode(self):
+        self.assertEqual(conio.decode(b'a', True), (ord('a'), 1))
+        self.assertEqual(conio.decode(b'\r', True), (conio.CHAR_CR, 1))
+        self.assertEqual(conio.decode(b'\x7f', True), (conio.CHAR_BS, 1))
+        self.assertEqual(conio.decode(b'\x1b[Ax', True), (conio.CHAR_UP, 3))
+        self.assertEqual(conio.decode(b'\x1b[3~', True), (conio.CHAR_DEL, 4))
+        # partial escape sequences wait for more input
+        self.assertEqual(conio.decode(b'\x1b[', True), None)
+        self.assertEqual(conio.decode(b'\x1b', False), (conio.CHAR_ESC, 1))
+
+    @unittest.skipIf(sys.platform == 'win32', 'posix console')
+    def test_eof(self):
+        # the cli stops when the console input closes
+        (r, w) = os.pipe()
+        os.write(w, b'ab')
+        os.close(w)
+        app = fake_app('')
+        app.io = conio.posix_console(r)
+        app.put = app.io.put
+        try:
+            asyncio.run(asyncio.wait_for(app.cli.run(), 1.0))
+            self.assertFalse(app.cli.running)
+            self.assertTrue(app.io.eof)
+            self.assertRaises(EOFError, app.io.get)
+        finally:
+            app.io.close()
+            os.close(r)
+
+#-----------------------------------------------------------------------------
+
+class thread_testing(unittest.TestCase):
+
+    # ld hl,1000h; inc (hl); inc hl; djnz $-2; jr 0
+    program = (0x21, 0x00, 0x10, 0x34, 0x23, 0x10, 0xfc, 0x18, 0xf7)
+
+    def run_cpu(self, results, i):
+        mem = memory.ram(16)
+        mem.load(0, self.program)
+        cpu = z80.cpu(mem, None)
+        scheduler.scheduler(cpu).run(100000)
+        results[i] = (str(cpu), bytes(mem.mem))
+
+    def test_threads(self):
+        ref = [None]
+        self.run_cpu(ref, 0)
+        results = [None] * 4
+        threads = [threading.Thread(target = self.run_cpu, args = (results, i)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, ref * 4)
+
+#-----------------------------------------------------------------------------
+
+class fake_io:
+    """console input from a string, output discarded"""
+
+    def __init__(self, keys):
+        self.keys = [ord(c) for c in keys]
+
+    def get(self):
+        if self.keys:
+            return self.keys.pop(0)
+        return None
+
+    async def ready(self):
+        await asyncio.sleep(0)
+
+    def put(self, data):
+        pass
+
+class fake_app:
+
+    def __init__(self, keys):
+        self.io = fake_io(keys)
+        self.cli = cli.cli(self)
+
+class cli_testing(unittest.TestCase):
+
+    def test_get_cmd(self):
+        app = fake_app('regz\x7fs\n')
+        cmd = asyncio.run(app.cli.get_cmd())
+        self.assertEqual(cmd, 'regs')
+
+#-----------------------------------------------------------------------------
+
+class split_testing(unittest.TestCase):
+
+    def test_ring(self):
+        sm = split.shared((('video', 16),))
+        peer = split.shared((('video', 16),), sm.name)
+        try:
+            self.assertTrue(sm.ring.put((1, 2, 3)))
+            self.assertEqual(peer.ring.get(), bytes((1, 2, 3)))
+            self.assertEqual(peer.ring.get(), b'')
+            # wrap around the end of the ring
+            for i in range(100):
+                self.assertTrue(sm.ring.put(range(i % 7)))
+                self.assertEqual(peer.ring.get(), bytes(range(i % 7)))
+            # full ring
+            self.assertFalse(sm.ring.put(bytes(split._RING_SIZE + 1)))
+            self.assertTrue(sm.ring.put(bytes(split._RING_SIZE)))
+            # the sender queues what doesn't fit, in order, without blocking
+            sender = split.sender(sm.ring, 0.01)
+            sender.put((1, 2))
+            sender.put((3, 4))
+            self.assertEqual(len(sender.queue), 2)
+            time.sleep(0.02)
+            self.assertRaises(split.Error, sender.flush)
+            self.assertEqual(len(sender.queue), 2)
+            peer.ring.get()
+            sender.flush()
+            self.assertEqual(peer.ring.get(), bytes((1, 2, 3, 4)))
+            self.assertIsNone(sender.full)
+            # named buffers are shared
+            sm.bufs['video'][3] = 0xab
+            self.assertEqual(peer.bufs['video'][3], 0xab)
+        finally:
+            peer.close()
+            sm.close()
+
+    def test_handover(self):
+        # the worker takes over the machine and hands it back when stopped
+        m = jace.machine()
+        m.run(100 * jace._FRAME_CLKS)
+        m.mem.write_block(0x3c80, b'split')
+        m.keyboard.event(0xfdfe, 1, True)
+        m.tape.write(b'block')
+        (sm, worker, conn) = split.start(jace.split_worker, jace._split_layout, m.state())
+        for i in range(100):
+            if sm.ctl[split.CTL_FRAMES] >= 5:
+                break
+            time.sleep(0.02)
+        state = split.stop(sm, worker, conn)
+        self.assertIsNotNone(state)
+        m.restore(state)
+        self.assertEqual(m.mem.read_block(0x3c80, 5), b'split')
+        # the held key and the tape went across and back
+        self.assertEqual(m.keyboard.rd(0xfdfe), 0xfe)
+        self.assertEqual(m.tape.read(), (tape.HEADER, b'block', tape.checksum(b'block')))
+
+#-----------------------------------------------------------------------------
+
+class startup_testing(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        names = [x[0] for x in bench.importtime('import main')]
+        self.assertIn('main', names)
+        for name in bench._startup_lazy:
+            self.assertNotIn(name, names)
+
 #-----------------------------------------------------------------------------
 
 if __name__ == "__main__":
@@ -0,0 +1,8368 @@
+#-----------------------------------------------------------------------------
+"""
+Z80 CPU Emulation
+"""
+#-----------------------------------------------------------------------------
+
+import z80da
+
+#-----------------------------------------------------------------------------
+# flags
+
+_CF = 0x01 # carry
+_NF = 0x02 # subtract
+_PF = 0x04 # parity
+_VF = _PF  # overflow
+_XF = 0x08 # bit3 - undocumented
+_HF = 0x10 # half carry (bcd)
+_YF = 0x20 # bit5 - undocumented
+_ZF = 0x40 # zero
+_SF = 0x80 # sign
+
+def _signed(x):
+    if x & 0x80:
+        x = (x & 0x7f) - 128
+    return x
+
+#-----------------------------------------------------------------------------
+
+class Error(Exception):
+    pass
+
+#-----------------------------------------------------------------------------
+
+class cpu:
+
+    def _str_f(self):
+        """return the flags as a string"""
+        flags = []
+        flags.append(('.', 'S')[bool(self.f & _SF)])
+        flags.append(('.', 'Z')[bool(self.f & _ZF)])
+        flags.append(('.', 'H')[bool(self.f & _HF)])
+        flags.append(('.', 'P')[bool(self.f & _PF)])
+        flags.append(('.', 'V')[bool(self.f & _VF)])
+        flags.append(('.', 'N')[bool(self.f & _NF)])
+        flags.append(('.', 'C')[bool(self.f & _CF)])
+        return ''.join(flags)
+
+    def _add_flags(self, res, val):
+        """set the flags for an add operation: result = a + val"""
+        self.f = self.f_sz[res & 0xff]
+        self.f |= ((res >> 8) & _CF)
+        self.f |= ((self.a ^ res ^ val) & _HF)
+        self.f |= (((val ^ self.a ^ 0x80) & (val ^ res) & 0x80) >> 5)
+
+    def _add16_flags(self, res, d, s):
+        """set the flags for an 16 bit add operation: result = d + s"""
+        self.f = self.f & (_SF | _ZF | _VF)
+        self.f |= (((d ^ res ^ s) >> 8) & _HF)
+        self.f |= (((res >> 16) & _CF) | ((res >> 8) & (_YF | _XF)))
+
+    def _sub16_flags(self, res, d, s):
+        """set the flags for a 16 bit sub operation: result = d - s"""
+        self.f = (((d ^ res ^ s) >> 8) & _HF)
+        self.f |= _NF
+        self.f |= ((res >> 16) & _CF)
+        self.f |= ((res >> 8) & (_SF | _YF | _XF))
+        self.f |= (0, _ZF)[(res & 0xffff) == 0]
+        self.f |= (((s ^ d) & (d ^ res) & 0x8000) >> 13)
+
+    def _adc16_flags(self, res, d, s):
+        """set the flags for a 16 bit adc operation: result = d + s + cf"""
+        self.f = (((d ^ res ^ s) >> 8) & _HF)
+        self.f |= ((res >> 16) & _CF)
+        self.f |= ((res >> 8) & (_SF | _YF | _XF))
+        self.f |= (0, _ZF)[(res & 0xffff) == 0]
+        self.f |= (((s ^ d ^ 0x8000) & (d ^ res) & 0x8000) >> 13)
+
+    def _sub_flags(self, res, val):
+        """set the flags for a sub operation: result = a - val"""
+        self.f = self.f_sz[res & 0xff]
+        self.f |= ((res >> 8) & _CF)
+        self.f |= _NF
+        self.f |= ((self.a ^ res ^ val) & _HF)
+        self.f |= (((val ^ self.a) & (self.a ^ res) & 0x80) >> 5)
+
+    def _block_io_flags(self, val, k):
+        """set the flags for a block io instruction: val transferred, k = val + (c or l)"""
+        self.f = self.f_sz[self.b]
+        if val & 0x80:
+            self.f |= _NF
+        if k & 0x100:
+            self.f |= (_HF | _CF)
+        self.f |= (self.f_szp[(k & 0x07) ^ self.b] & _PF)
+
+    def _rd_block(self, adr, n, step):
+        """read n bytes from memory stepping from adr"""
+        if step < 0:
+            adr -= n - 1
+        read_block = getattr(self.mem, 'read_block', None)
+        if read_block is None:
+            data = bytes([self.mem[(adr + i) & 0xffff] for i in range(n)])
+        else:
+            data = read_block(adr, n)
+        return (data, data[::-1])[step < 0]
+
+    def _wr_block(self, adr, data, step):
+        """write bytes to memory stepping from adr"""
+        if step < 0:
+            adr -= len(data) - 1
+            data = data[::-1]
+        write_block = getattr(self.mem, 'write_block', None)
+        if write_block is None:
+            for (i, val) in enumerate(data):
+                self.mem[(adr + i) & 0xffff] = val
+        else:
+            write_block(adr, data)
+
+    def _bulk_in(self, step):
+        """
+        inir/indr: read the whole block with one io call if the port
+        handler takes buffers. Return the T-states taken, or 0 to run
+        the instruction a byte at a time.
+        The handler sees one time for the block: self.clks at its start.
+        """
+        bulk = getattr(self.io, 'rd_bulk', None)
+        if bulk is None:
+            return 0
+        n = self.b or 256
+        c = self.c
+        # the port address high byte counts down from b
+        ports = range((self.b << 8) | c, ((self.b - n) << 8) | c, -256)
+        rd_block = bulk(ports)
+        if rd_block is None:
+            return 0
+        data = rd_block(ports[0] & 0xffff, n)
+        hl = self._get_hl()
+        self._wr_block(hl, data, step)
+        self._set_hl(hl + (n * step))
+        self.b = 0
+        val = data[-1]
+        self._block_io_flags(val, ((c + step) & 0xff) + val)
+        self.r = (self.r + n - 1) & 0x7f
+        return (21 * (n - 1)) + 12
+
+    def _bulk_out(self, step):
+        """
+        otir/otdr: write the whole block with one io call if the port
+        handler takes buffers. Return the T-states taken, or 0 to run
+        the instruction a byte at a time.
+        The handler sees one time for the block: self.clks at its start.
+        """
+        bulk = getattr(self.io, 'wr_bulk', None)
+        if bulk is None:
+            return 0
+        n = self.b or 256
+        c = self.c
+        # b is decremented before each write
+        ports = range(((self.b - 1) << 8) | c, ((self.b - 1 - n) << 8) | c, -256)
+        wr_block = bulk(ports)
+        if wr_block is None:
+            return 0
+        hl = self._get_hl()
+        data = self._rd_block(hl, n, step)
+        wr_block(ports[0] & 0xffff, data)
+        self._set_hl(hl + (n * step))
+        self.b = 0
+        val = data[-1]
+        self._block_io_flags(val, self.l + val)
+        self.r = (self.r + n - 1) & 0x7f
+        return (21 * (n - 1)) + 12
+
+    def _enter_halt(self):
+        """enter halt mode"""
+        self.halt = 1
+        self._dec_pc(1)
+
+    def _leave_halt(self):
+        """leave halt mode"""
+        if self.halt:
+            self._inc_pc(1)
+            self.halt = 0
+
+    def _push(self, val):
+        """push a 16 bit quantity onto the stack"""
+        self.mem[self.sp - 1] = val >> 8
+        self.mem[self.sp - 2] = val & 0xff
+        self.sp = (self.sp - 2) & 0xffff
+
+    def _pop(self):
+        """pop a 16 bit quantity from the stack"""
+        val = (self.mem[self.sp + 1] << 8) | self.mem[self.sp]
+        self.sp = (self.sp + 2) & 0xffff
+        return val
+
+    def _peek(self, adr):
+        """read and return the 16 bit value at mem[adr]"""
+        return (self.mem[adr + 1] << 8) + self.mem[adr]
+
+    def _poke(self, adr, val):
+        """write the 16 bit value to mem[adr]"""
+        self.mem[adr + 1] = val >> 8
+        self.mem[adr] = val & 0xff
+
+    def _set_af(self, val):
+        """set the a and f registers with a 16 bit value"""
+        self.a = (val >> 8) & 0xff
+        self.f = val & 0xff
+
+    def _get_af(self):
+        """return the 16 bit value of the a and f registers"""
+        return (self.a << 8) | self.f
+
+    def _set_bc(self, val):
+        """set the b and c registers with a 16 bit value"""
+        self.b = (val >> 8) & 0xff
+        self.c = val & 0xff
+
+    def _get_bc(self):
+        """return the 16 bit value of the b and c registers"""
+        return (self.b << 8) | self.c
+
+    def _set_de(self, val):
+        """set the d and e registers with a 16 bit value"""
+        self.d = (val >> 8) & 0xff
+        self.e = val & 0xff
+
+    def _get_de(self):
+        """return the 16 bit value of the d and e registers"""
+        return (self.d << 8) | self.e
+
+    def _set_hl(self, val):
+        """set the h and l registers with a 16 bit value"""
+        self.h = (val >> 8) & 0xff
+        self.l = val & 0xff
+
+    def _get_hl(self):
+        """return the 16 bit value of the h and l registers"""
+        return (self.h << 8) | self.l
+
+    def _get_pc(self):
+        """return the 16 bit pc register"""
+        return self.pc
+
+    def _set_pc(self, val):
+        """set the 16 bit pc register"""
+        self.pc = val & 0xffff
+
+    def _dec_pc(self, n):
+        """decrement pc"""
+        self.pc = (self.pc - n) & 0xffff
+
+    def _inc_pc(self, n):
+        """increment pc"""
+        self.pc = (self.pc + n) & 0xffff
+
+    def _get_nn(self):
+        """return the 16 bit immediate at mem[pc], pc += 2"""
+        nn = self._peek(self.pc)
+        self._inc_pc(2)
+        return nn
+
+    def _get_n(self):
+        """return the 8 bit immediate at mem[pc], pc += 1"""
+        n = self.mem[self.pc]
+        self._inc_pc(1)
+        return n
+
+    def da(self, adr):
+        """
+        Disassemble the instruction at mem[adr].
+        Return the operation, operands and number of bytes.
+        """
+        return z80da.disassemble(self.mem, adr)
+
+    def execute(self):
+        """
+        Execute a single instruction at the current mem[pc] location.
+        Return the number of clock cycles taken.
+        """
+        self.r = (self.r + 1) & 0x7f
+        code = self._get_n()
+        return self.opcodes[code](self)
+
+    def trap(self, adr, handler):
+        """
+        Trap the instruction at adr (Eg. a ROM entry point).
+        The dispatch table entry for the instruction is replaced for this cpu
+        only, so other instructions run at full speed. handler() is called
+        when the instruction at adr executes - it returns the T-states taken,
+        or None to execute the instruction as normal.
+        """
+        code = self.mem[adr]
+        table = 'opcodes'
+        n = 1
+        if code in (0xcb, 0xdd, 0xed, 0xfd):
+            table = {0xcb: 'opcodes_cb', 0xdd: 'opcodes_dd', 0xed: 'opcodes_ed', 0xfd: 'opcodes_fd'}[code]
+            code = self.mem[adr + 1]
+            n = 2
+        ops = list(getattr(self, table))
+        op = ops[code]
+        def trapped(cpu):
+            if ((cpu.pc - n) & 0xffff) == adr:
+                clks = handler()
+                if clks is not None:
+                    # prefixed tables return the T-states after the prefix
+                    return clks - (4 * (n - 1))
+            return op(cpu)
+        ops[code] = trapped
+        setattr(self, table, ops)
+
+    def interrupt(self, x = 0):
+        """
+        Perform interrupt actions
+        """
+        if self.iff1 == 0:
+            return 0
+        self._leave_halt()
+        self.iff1 = 0
+        self.iff2 = 0
+        self._push(self.pc)
+        if self.im == 0:
+            self.pc = x & 0x38
+            return 13
+        elif self.im == 1:
+            self.pc = 0x38
+            return 11
+        else:
+            self._set_pc(self._peek((self.i << 8) + (x & 0xff)))
+            return 17
+
+    def nmi(self):
+        """
+        Perform non maskable interrupt actions
+        """
+        self._leave_halt()
+        self.iff2 = self.iff1
+        self.iff1 = 0
+        self._push(self.pc)
+        self.pc = 0x66
+        return 11
+
+    def reset(self):
+        """
+        reset the cpu state
+        """
+        self.a = 0xff
+        self.f = 0xff
+        self.b = 0xff
+        self.c = 0xff
+        self.d = 0xff
+        self.e = 0xff
+        self.h = 0xff
+        self.l = 0xff
+        self.alt_af = 0xffff
+        self.alt_bc = 0xffff
+        self.alt_de = 0xffff
+        self.alt_hl = 0xffff
+        self.sp = 0xffff
+        self.ix = 0xffff
+        self.iy = 0xffff
+        self.i = 0
+        self.r = 0
+        self.im = 0
+        self.iff1 = 0
+        self.iff2 = 0
+        self.halt = 0
+        self.pc = 0
+
+    def _repeated_prefix(self):
+        """A prefix code hase been repeated. NOP and re-run the current prefix"""
+        self._dec_pc(1)
+        return 0
+
+    def _execute_dddd(self):
+        self._repeated_prefix()
+
+    def _execute_ddfd(self):
+        self._repeated_prefix()
+
+    def _execute_fddd(self):
+        self._repeated_prefix()
+
+    def _execute_fdfd(self):
+        self._repeated_prefix()
+
+    def _execute_cb(self):
+        code = self._get_n()
+        return 4 + self.opcodes_cb[code](self)
+
+    def _execute_dd(self):
+        code = self._get_n()
+        return 4 + self.opcodes_dd[code](self)
+
+    def _execute_ed(self):
+        code = self._get_n()
+        return 4 + self.opcodes_ed[code](self)
+
+    def _execute_fd(self):
+        code = self._get_n()
+        return 4 + self.opcodes_fd[code](self)
+
+    def _execute_ddcb(self):
+        d = _signed(self._get_n())
+        code = self._get_n()
+        return 8 + self.opcodes_ddcb00[code](self, d)
+
+    def _execute_fdcb(self):
+        d = _signed(self._get_n())
+        code = self._get_n()
+        return 8 + self.opcodes_fdcb00[code](self, d)
+
+    def __str__(self):
+        """return a string with processor state"""
+        regs = []
+        regs.append('a    : %02x' % self.a)
+        regs.append('f    : %02x %s' % (self.f, self._str_f()))
+        regs.append('b c  : %02x %02x' % (self.b, self.c))
+        regs.append('d e  : %02x %02x' % (self.d, self.e))
+        regs.append('h l  : %02x %02x' % (self.h, self.l))
+        regs.append('a\'f\' : %02x %02x' % (self.alt_af >> 8, self.alt_af & 0xff))
+        regs.append('b\'c\' : %02x %02x' % (self.alt_bc >> 8, self.alt_bc & 0xff))
+        regs.append('d\'e\' : %02x %02x' % (self.alt_de >> 8, self.alt_de & 0xff))
+        regs.append('h\'l\' : %02x %02x' % (self.alt_hl >> 8, self.alt_hl & 0xff))
+        regs.append('i    : %02x' % self.i)
+        regs.append('im   : %d' % self.im)
+        regs.append('iff1 : %d' % self.iff1)
+        regs.append('iff2 : %d' % self.iff2)
+        regs.append('r    : %02x' % self.r)
+        regs.append('ix   : %04x' % self.ix)
+        regs.append('iy   : %04x' % self.iy)
+        regs.append('sp   : %04x' % self.sp)
+        regs.append('pc   : %04x' % self.pc)
+        return '\n'.join(regs)
+
+    def __init__(self, mem, io):
+        self.mem = mem
+        self.io = io
+        # T-state count at the start of the current instruction - set by
+        # the scheduler, stale if execute() is called outside it
+        self.clks = 0
+        self.reset()
+    f_sz = (
+        0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 
+        0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 
+        0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 
+        0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 
+        0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 
+        0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 
+        0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 
+        0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 
+        0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 
+        0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 
+        0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 
+        0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 
+        0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 
+    )
+    f_szp = (
+        0x44, 0x00, 0x00, 0x04, 0x00, 0x04, 0x04, 0x00, 0x08, 0x0c, 0x0c, 0x08, 0x0c, 0x08, 0x08, 0x0c, 
+        0x00, 0x04, 0x04, 0x00, 0x04, 0x00, 0x00, 0x04, 0x0c, 0x08, 0x08, 0x0c, 0x08, 0x0c, 0x0c, 0x08, 
+        0x20, 0x24, 0x24, 0x20, 0x24, 0x20, 0x20, 0x24, 0x2c, 0x28, 0x28, 0x2c, 0x28, 0x2c, 0x2c, 0x28, 
+        0x24, 0x20, 0x20, 0x24, 0x20, 0x24, 0x24, 0x20, 0x28, 0x2c, 0x2c, 0x28, 0x2c, 0x28, 0x28, 0x2c, 
+        0x00, 0x04, 0x04, 0x00, 0x04, 0x00, 0x00, 0x04, 0x0c, 0x08, 0x08, 0x0c, 0x08, 0x0c, 0x0c, 0x08, 
+        0x04, 0x00, 0x00, 0x04, 0x00, 0x04, 0x04, 0x00, 0x08, 0x0c, 0x0c, 0x08, 0x0c, 0x08, 0x08, 0x0c, 
+        0x24, 0x20, 0x20, 0x24, 0x20, 0x24, 0x24, 0x20, 0x28, 0x2c, 0x2c, 0x28, 0x2c, 0x28, 0x28, 0x2c, 
+        0x20, 0x24, 0x24, 0x20, 0x24, 0x20, 0x20, 0x24, 0x2c, 0x28, 0x28, 0x2c, 0x28, 0x2c, 0x2c, 0x28, 
+        0x80, 0x84, 0x84, 0x80, 0x84, 0x80, 0x80, 0x84, 0x8c, 0x88, 0x88, 0x8c, 0x88, 0x8c, 0x8c, 0x88, 
+        0x84, 0x80, 0x80, 0x84, 0x80, 0x84, 0x84, 0x80, 0x88, 0x8c, 0x8c, 0x88, 0x8c, 0x88, 0x88, 0x8c, 
+        0xa4, 0xa0, 0xa0, 0xa4, 0xa0, 0xa4, 0xa4, 0xa0, 0xa8, 0xac, 0xac, 0xa8, 0xac, 0xa8, 0xa8, 0xac, 
+        0xa0, 0xa4, 0xa4, 0xa0, 0xa4, 0xa0, 0xa0, 0xa4, 0xac, 0xa8, 0xa8, 0xac, 0xa8, 0xac, 0xac, 0xa8, 
+        0x84, 0x80, 0x80, 0x84, 0x80, 0x84, 0x84, 0x80, 0x88, 0x8c, 0x8c, 0x88, 0x8c, 0x88, 0x88, 0x8c, 
+        0x80, 0x84, 0x84, 0x80, 0x84, 0x80, 0x80, 0x84, 0x8c, 0x88, 0x88, 0x8c, 0x88, 0x8c, 0x8c, 0x88, 
+        0xa0, 0xa4, 0xa4, 0xa0, 0xa4, 0xa0, 0xa0, 0xa4, 0xac, 0xa8, 0xa8, 0xac, 0xa8, 0xac, 0xac, 0xa8, 
+        0xa4, 0xa0, 0xa0, 0xa4, 0xa0, 0xa4, 0xa4, 0xa0, 0xa8, 0xac, 0xac, 0xa8, 0xac, 0xa8, 0xa8, 0xac, 
+    )
+    f_szhv_inc = (
+        0x50, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 
+        0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 
+        0x30, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 
+        0x30, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 
+        0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 
+        0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 
+        0x30, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 
+        0x30, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 
+        0x94, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 
+        0x90, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 
+        0xb0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 
+        0xb0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 
+        0x90, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 
+        0x90, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 
+        0xb0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 
+        0xb0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa0, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 0xa8, 
+    )
+    f_szhv_dec = (
+        0x42, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x1a, 
+        0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x1a, 
+        0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x3a, 
+        0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x3a, 
+        0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x1a, 
+        0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x0a, 0x1a, 
+        0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x3a, 
+        0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x2a, 0x3e, 
+        0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x9a, 
+        0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x9a, 
+        0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xba, 
+        0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xba, 
+        0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x9a, 
+        0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x8a, 0x9a, 
+        0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xba, 
+        0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xa2, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xaa, 0xba, 
+    )
+    def _ins_00(self): # nop 
+        return 4
+    def _ins_01(self): # ld bc,0000
+        self._set_bc(self._get_nn())
+        return 10
+    def _ins_02(self): # ld (bc),a
+        self.mem[self._get_bc()] = self.a
+        return 7
+    def _ins_03(self): # inc bc
+        self._set_bc(self._get_bc() + 1)
+        return 6
+    def _ins_04(self): # inc b
+        n = (self.b + 1) & 0xff
+        self.b = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 4
+    def _ins_05(self): # dec b
+        n = (self.b - 1) & 0xff
+        self.b = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 4
+    def _ins_06(self): # ld b,00
+        self.b = self._get_n()
+        return 7
+    def _ins_07(self): # rlca 
+        self.a = ((self.a << 1) | (self.a >> 7)) & 0xff
+        self.f = (self.f & (_SF | _ZF | _PF)) | (self.a & (_YF | _XF | _CF))
+        return 4
+    def _ins_08(self): # ex af,af'
+        tmp = self._get_af()
+        self._set_af(self.alt_af)
+        self.alt_af = tmp
+        return 4
+    def _ins_09(self): # add hl,bc
+        s = self._get_bc()
+        d = self._get_hl()
+        res = d + s
+        self._add16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_0a(self): # ld a,(bc)
+        self.a = self.mem[self._get_bc()]
+        return 7
+    def _ins_0b(self): # dec bc
+        self._set_bc(self._get_bc() - 1)
+        return 6
+    def _ins_0c(self): # inc c
+        n = (self.c + 1) & 0xff
+        self.c = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 4
+    def _ins_0d(self): # dec c
+        n = (self.c - 1) & 0xff
+        self.c = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 4
+    def _ins_0e(self): # ld c,00
+        self.c = self._get_n()
+        return 7
+    def _ins_0f(self): # rrca 
+        self.f = (self.f & (_SF | _ZF | _PF)) | (self.a & _CF)
+        self.a = ((self.a >> 1) | (self.a << 7)) & 0xff
+        self.f |= (self.a & (_YF | _XF))
+        return 4
+    def _ins_10(self): # djnz 0002
+        e = self._get_n()
+        self.b = (self.b - 1) & 0xff
+        if self.b:
+            self._inc_pc(_signed(e))
+            return 13
+        return 8
+    def _ins_11(self): # ld de,0000
+        self._set_de(self._get_nn())
+        return 10
+    def _ins_12(self): # ld (de),a
+        self.mem[self._get_de()] = self.a
+        return 7
+    def _ins_13(self): # inc de
+        self._set_de(self._get_de() + 1)
+        return 6
+    def _ins_14(self): # inc d
+        n = (self.d + 1) & 0xff
+        self.d = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 4
+    def _ins_15(self): # dec d
+        n = (self.d - 1) & 0xff
+        self.d = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 4
+    def _ins_16(self): # ld d,00
+        self.d = self._get_n()
+        return 7
+    def _ins_17(self): # rla 
+        res = (self.a << 1) | (self.f & _CF)
+        c = (0, _CF)[(self.a & 0x80) != 0]
+        self.f = (self.f & (_SF | _ZF | _PF)) | c | (res & (_YF | _XF))
+        self.a = res & 0xff
+        return 4
+    def _ins_18(self): # jr 0002
+        self._inc_pc(_signed(self._get_n()))
+        return 12
+    def _ins_19(self): # add hl,de
+        s = self._get_de()
+        d = self._get_hl()
+        res = d + s
+        self._add16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_1a(self): # ld a,(de)
+        self.a = self.mem[self._get_de()]
+        return 7
+    def _ins_1b(self): # dec de
+        self._set_de(self._get_de() - 1)
+        return 6
+    def _ins_1c(self): # inc e
+        n = (self.e + 1) & 0xff
+        self.e = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 4
+    def _ins_1d(self): # dec e
+        n = (self.e - 1) & 0xff
+        self.e = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 4
+    def _ins_1e(self): # ld e,00
+        self.e = self._get_n()
+        return 7
+    def _ins_1f(self): # rra 
+        res = (self.a >> 1) | (self.f << 7)
+        c = (0, _CF)[(self.a & 0x01) != 0]
+        self.f = (self.f & (_SF | _ZF | _PF)) | c | (res & (_YF | _XF))
+        self.a = res & 0xff
+        return 4
+    def _ins_20(self): # jr nz,0002
+        e = self._get_n()
+        if (self.f & _ZF) == 0:
+            self._inc_pc(_signed(e))
+            return 12
+        return 7
+    def _ins_21(self): # ld hl,0000
+        self._set_hl(self._get_nn())
+        return 10
+    def _ins_22(self): # ld (0000),hl
+        nn = self._get_nn()
+        self.mem[nn] = self.l
+        self.mem[nn + 1] = self.h
+        return 16
+    def _ins_23(self): # inc hl
+        self._set_hl(self._get_hl() + 1)
+        return 6
+    def _ins_24(self): # inc h
+        n = (self.h + 1) & 0xff
+        self.h = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 4
+    def _ins_25(self): # dec h
+        n = (self.h - 1) & 0xff
+        self.h = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 4
+    def _ins_26(self): # ld h,00
+        self.h = self._get_n()
+        return 7
+    def _ins_27(self): # daa 
+        cf = bool(self.f & _CF)
+        nf = bool(self.f & _NF)
+        hf = bool(self.f & _HF)
+        lo = self.a & 0x0f
+        hi = self.a >> 4
+        if cf:
+            diff = (0x66, 0x60)[(lo <= 9) and (not hf)]
+        else:
+            if lo >= 10:
+                diff = (0x66, 0x06)[hi <= 8]
+            else:
+                if hi >= 10:
+                    diff = (0x60, 0x66)[hf]
+                else:
+                    diff = (0x00, 0x06)[hf]
+        if nf:
+            self.a = (self.a - diff) & 0xff
+        else:
+            self.a = (self.a + diff) & 0xff
+        self.f = self.f_szp[self.a] | (self.f & _NF)
+        if cf:
+            self.f |= _CF
+        if (lo <= 9) and (hi >= 10):
+            self.f |= _CF
+        if (lo > 9) and (hi >= 9):
+            self.f |= _CF
+        if nf and hf and (lo <= 5):
+            self.f |= _HF
+        if (not nf) and (lo >= 10):
+            self.f |= _HF
+        return 4
+    def _ins_28(self): # jr z,0002
+        e = self._get_n()
+        if self.f & _ZF:
+            self._inc_pc(_signed(e))
+            return 12
+        return 7
+    def _ins_29(self): # add hl,hl
+        s = self._get_hl()
+        d = self._get_hl()
+        res = d + s
+        self._add16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_2a(self): # ld hl,(0000)
+        nn = self._get_nn()
+        self.h = self.mem[nn + 1]
+        self.l = self.mem[nn]
+        return 16
+    def _ins_2b(self): # dec hl
+        self._set_hl(self._get_hl() - 1)
+        return 6
+    def _ins_2c(self): # inc l
+        n = (self.l + 1) & 0xff
+        self.l = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 4
+    def _ins_2d(self): # dec l
+        n = (self.l - 1) & 0xff
+        self.l = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 4
+    def _ins_2e(self): # ld l,00
+        self.l = self._get_n()
+        return 7
+    def _ins_2f(self): # cpl 
+        self.a ^= 0xff
+        self.f = (self.f & (_SF | _ZF | _PF | _CF)) | _HF | _NF | (self.a & (_YF | _XF))
+        return 4
+    def _ins_30(self): # jr nc,0002
+        e = self._get_n()
+        if (self.f & _CF) == 0:
+            self._inc_pc(_signed(e))
+            return 12
+        return 7
+    def _ins_31(self): # ld sp,0000
+        self.sp = self._get_nn()
+        return 10
+    def _ins_32(self): # ld (0000),a
+        self.mem[self._get_nn()] = self.a
+        return 13
+    def _ins_33(self): # inc sp
+        self.sp = (self.sp + 1) & 0xffff
+        return 6
+    def _ins_34(self): # inc (hl)
+        hl = self._get_hl()
+        n = (self.mem[hl] + 1) & 0xff
+        self.mem[hl] = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 11
+    def _ins_35(self): # dec (hl)
+        hl = self._get_hl()
+        n = (self.mem[hl] - 1) & 0xff
+        self.mem[hl] = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 11
+    def _ins_36(self): # ld (hl),00
+        self.mem[self._get_hl()] = self._get_n()
+        return 10
+    def _ins_37(self): # scf 
+        self.f = (self.f & (_SF | _ZF | _PF)) | _CF | (self.a & (_YF | _XF))
+        return 4
+    def _ins_38(self): # jr c,0002
+        e = self._get_n()
+        if self.f & _CF:
+            self._inc_pc(_signed(e))
+            return 12
+        return 7
+    def _ins_39(self): # add hl,sp
+        s = self.sp
+        d = self._get_hl()
+        res = d + s
+        self._add16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_3a(self): # ld a,(0000)
+        self.a = self.mem[self._get_nn()]
+        return 13
+    def _ins_3b(self): # dec sp
+        self.sp = (self.sp - 1) & 0xffff
+        return 6
+    def _ins_3c(self): # inc a
+        n = (self.a + 1) & 0xff
+        self.a = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 4
+    def _ins_3d(self): # dec a
+        n = (self.a - 1) & 0xff
+        self.a = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 4
+    def _ins_3e(self): # ld a,00
+        self.a = self._get_n()
+        return 7
+    def _ins_3f(self): # ccf 
+        self.f = ((self.f & (_SF | _ZF | _PF | _CF)) | ((self.f & _CF) << 4) | (self.a & (_YF | _XF))) ^ _CF
+        return 4
+    def _ins_40(self): # ld b,b
+        self.b = self.b
+        return 4
+    def _ins_41(self): # ld b,c
+        self.b = self.c
+        return 4
+    def _ins_42(self): # ld b,d
+        self.b = self.d
+        return 4
+    def _ins_43(self): # ld b,e
+        self.b = self.e
+        return 4
+    def _ins_44(self): # ld b,h
+        self.b = self.h
+        return 4
+    def _ins_45(self): # ld b,l
+        self.b = self.l
+        return 4
+    def _ins_46(self): # ld b,(hl)
+        self.b = self.mem[self._get_hl()]
+        return 7
+    def _ins_47(self): # ld b,a
+        self.b = self.a
+        return 4
+    def _ins_48(self): # ld c,b
+        self.c = self.b
+        return 4
+    def _ins_49(self): # ld c,c
+        self.c = self.c
+        return 4
+    def _ins_4a(self): # ld c,d
+        self.c = self.d
+        return 4
+    def _ins_4b(self): # ld c,e
+        self.c = self.e
+        return 4
+    def _ins_4c(self): # ld c,h
+        self.c = self.h
+        return 4
+    def _ins_4d(self): # ld c,l
+        self.c = self.l
+        return 4
+    def _ins_4e(self): # ld c,(hl)
+        self.c = self.mem[self._get_hl()]
+        return 7
+    def _ins_4f(self): # ld c,a
+        self.c = self.a
+        return 4
+    def _ins_50(self): # ld d,b
+        self.d = self.b
+        return 4
+    def _ins_51(self): # ld d,c
+        self.d = self.c
+        return 4
+    def _ins_52(self): # ld d,d
+        self.d = self.d
+        return 4
+    def _ins_53(self): # ld d,e
+        self.d = self.e
+        return 4
+    def _ins_54(self): # ld d,h
+        self.d = self.h
+        return 4
+    def _ins_55(self): # ld d,l
+        self.d = self.l
+        return 4
+    def _ins_56(self): # ld d,(hl)
+        self.d = self.mem[self._get_hl()]
+        return 7
+    def _ins_57(self): # ld d,a
+        self.d = self.a
+        return 4
+    def _ins_58(self): # ld e,b
+        self.e = self.b
+        return 4
+    def _ins_59(self): # ld e,c
+        self.e = self.c
+        return 4
+    def _ins_5a(self): # ld e,d
+        self.e = self.d
+        return 4
+    def _ins_5b(self): # ld e,e
+        self.e = self.e
+        return 4
+    def _ins_5c(self): # ld e,h
+        self.e = self.h
+        return 4
+    def _ins_5d(self): # ld e,l
+        self.e = self.l
+        return 4
+    def _ins_5e(self): # ld e,(hl)
+        self.e = self.mem[self._get_hl()]
+        return 7
+    def _ins_5f(self): # ld e,a
+        self.e = self.a
+        return 4
+    def _ins_60(self): # ld h,b
+        self.h = self.b
+        return 4
+    def _ins_61(self): # ld h,c
+        self.h = self.c
+        return 4
+    def _ins_62(self): # ld h,d
+        self.h = self.d
+        return 4
+    def _ins_63(self): # ld h,e
+        self.h = self.e
+        return 4
+    def _ins_64(self): # ld h,h
+        self.h = self.h
+        return 4
+    def _ins_65(self): # ld h,l
+        self.h = self.l
+        return 4
+    def _ins_66(self): # ld h,(hl)
+        self.h = self.mem[self._get_hl()]
+        return 7
+    def _ins_67(self): # ld h,a
+        self.h = self.a
+        return 4
+    def _ins_68(self): # ld l,b
+        self.l = self.b
+        return 4
+    def _ins_69(self): # ld l,c
+        self.l = self.c
+        return 4
+    def _ins_6a(self): # ld l,d
+        self.l = self.d
+        return 4
+    def _ins_6b(self): # ld l,e
+        self.l = self.e
+        return 4
+    def _ins_6c(self): # ld l,h
+        self.l = self.h
+        return 4
+    def _ins_6d(self): # ld l,l
+        self.l = self.l
+        return 4
+    def _ins_6e(self): # ld l,(hl)
+        self.l = self.mem[self._get_hl()]
+        return 7
+    def _ins_6f(self): # ld l,a
+        self.l = self.a
+        return 4
+    def _ins_70(self): # ld (hl),b
+        self.mem[self._get_hl()] = self.b
+        return 7
+    def _ins_71(self): # ld (hl),c
+        self.mem[self._get_hl()] = self.c
+        return 7
+    def _ins_72(self): # ld (hl),d
+        self.mem[self._get_hl()] = self.d
+        return 7
+    def _ins_73(self): # ld (hl),e
+        self.mem[self._get_hl()] = self.e
+        return 7
+    def _ins_74(self): # ld (hl),h
+        self.mem[self._get_hl()] = self.h
+        return 7
+    def _ins_75(self): # ld (hl),l
+        self.mem[self._get_hl()] = self.l
+        return 7
+    def _ins_76(self): # halt 
+        self._enter_halt()
+        return 4
+    def _ins_77(self): # ld (hl),a
+        self.mem[self._get_hl()] = self.a
+        return 7
+    def _ins_78(self): # ld a,b
+        self.a = self.b
+        return 4
+    def _ins_79(self): # ld a,c
+        self.a = self.c
+        return 4
+    def _ins_7a(self): # ld a,d
+        self.a = self.d
+        return 4
+    def _ins_7b(self): # ld a,e
+        self.a = self.e
+        return 4
+    def _ins_7c(self): # ld a,h
+        self.a = self.h
+        return 4
+    def _ins_7d(self): # ld a,l
+        self.a = self.l
+        return 4
+    def _ins_7e(self): # ld a,(hl)
+        self.a = self.mem[self._get_hl()]
+        return 7
+    def _ins_7f(self): # ld a,a
+        self.a = self.a
+        return 4
+    def _ins_80(self): # add a,b
+        val = self.b
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_81(self): # add a,c
+        val = self.c
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_82(self): # add a,d
+        val = self.d
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_83(self): # add a,e
+        val = self.e
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_84(self): # add a,h
+        val = self.h
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_85(self): # add a,l
+        val = self.l
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_86(self): # add a,(hl)
+        val = self.mem[self._get_hl()]
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 7
+    def _ins_87(self): # add a,a
+        val = self.a
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_88(self): # adc a,b
+        val = self.b
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_89(self): # adc a,c
+        val = self.c
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_8a(self): # adc a,d
+        val = self.d
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_8b(self): # adc a,e
+        val = self.e
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_8c(self): # adc a,h
+        val = self.h
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_8d(self): # adc a,l
+        val = self.l
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_8e(self): # adc a,(hl)
+        val = self.mem[self._get_hl()]
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 7
+    def _ins_8f(self): # adc a,a
+        val = self.a
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_90(self): # sub b
+        val = self.b
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_91(self): # sub c
+        val = self.c
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_92(self): # sub d
+        val = self.d
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_93(self): # sub e
+        val = self.e
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_94(self): # sub h
+        val = self.h
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_95(self): # sub l
+        val = self.l
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_96(self): # sub (hl)
+        val = self.mem[self._get_hl()]
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 7
+    def _ins_97(self): # sub a
+        val = self.a
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_98(self): # sbc a,b
+        val = self.b
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_99(self): # sbc a,c
+        val = self.c
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_9a(self): # sbc a,d
+        val = self.d
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_9b(self): # sbc a,e
+        val = self.e
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_9c(self): # sbc a,h
+        val = self.h
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_9d(self): # sbc a,l
+        val = self.l
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_9e(self): # sbc a,(hl)
+        val = self.mem[self._get_hl()]
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 7
+    def _ins_9f(self): # sbc a,a
+        val = self.a
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 4
+    def _ins_a0(self): # and b
+        val = self.b
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 4
+    def _ins_a1(self): # and c
+        val = self.c
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 4
+    def _ins_a2(self): # and d
+        val = self.d
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 4
+    def _ins_a3(self): # and e
+        val = self.e
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 4
+    def _ins_a4(self): # and h
+        val = self.h
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 4
+    def _ins_a5(self): # and l
+        val = self.l
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 4
+    def _ins_a6(self): # and (hl)
+        val = self.mem[self._get_hl()]
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 7
+    def _ins_a7(self): # and a
+        val = self.a
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 4
+    def _ins_a8(self): # xor b
+        val = self.b
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_a9(self): # xor c
+        val = self.c
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_aa(self): # xor d
+        val = self.d
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_ab(self): # xor e
+        val = self.e
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_ac(self): # xor h
+        val = self.h
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_ad(self): # xor l
+        val = self.l
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_ae(self): # xor (hl)
+        val = self.mem[self._get_hl()]
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 7
+    def _ins_af(self): # xor a
+        val = self.a
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_b0(self): # or b
+        val = self.b
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_b1(self): # or c
+        val = self.c
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_b2(self): # or d
+        val = self.d
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_b3(self): # or e
+        val = self.e
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_b4(self): # or h
+        val = self.h
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_b5(self): # or l
+        val = self.l
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_b6(self): # or (hl)
+        val = self.mem[self._get_hl()]
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 7
+    def _ins_b7(self): # or a
+        val = self.a
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 4
+    def _ins_b8(self): # cp b
+        val = self.b
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 4
+    def _ins_b9(self): # cp c
+        val = self.c
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 4
+    def _ins_ba(self): # cp d
+        val = self.d
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 4
+    def _ins_bb(self): # cp e
+        val = self.e
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 4
+    def _ins_bc(self): # cp h
+        val = self.h
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 4
+    def _ins_bd(self): # cp l
+        val = self.l
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 4
+    def _ins_be(self): # cp (hl)
+        val = self.mem[self._get_hl()]
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 7
+    def _ins_bf(self): # cp a
+        val = self.a
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 4
+    def _ins_c0(self): # ret nz
+        if (self.f & _ZF) == 0:
+            self.pc = self._pop()
+            return 11
+        return 5
+    def _ins_c1(self): # pop bc
+        self.b = self.mem[self.sp + 1]
+        self.c = self.mem[self.sp]
+        self.sp = (self.sp + 2) & 0xffff
+        return 10
+    def _ins_c2(self): # jp nz,0000
+        nn = self._get_nn()
+        if (self.f & _ZF) == 0:
+            self.pc = nn
+        return 10
+    def _ins_c3(self): # jp 0000
+        self.pc = self._get_nn()
+        return 10
+    def _ins_c4(self): # call nz,0000
+        nn = self._get_nn()
+        if (self.f & _ZF) == 0:
+            self._push(self.pc)
+            self.pc = nn
+            return 17
+        return 10
+    def _ins_c5(self): # push bc
+        self.mem[self.sp - 1] = self.b
+        self.mem[self.sp - 2] = self.c
+        self.sp = (self.sp - 2) & 0xffff
+        return 11
+    def _ins_c6(self): # add a,00
+        val = self._get_n()
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 7
+    def _ins_c7(self): # rst 00
+        self._push(self.pc)
+        self.pc = 0x00
+        return 11
+    def _ins_c8(self): # ret z
+        if self.f & _ZF:
+            self.pc = self._pop()
+            return 11
+        return 5
+    def _ins_c9(self): # ret 
+        self.pc = self._pop()
+        return 10
+    def _ins_ca(self): # jp z,0000
+        nn = self._get_nn()
+        if self.f & _ZF:
+            self.pc = nn
+        return 10
+    def _ins_cc(self): # call z,0000
+        nn = self._get_nn()
+        if self.f & _ZF:
+            self._push(self.pc)
+            self.pc = nn
+            return 17
+        return 10
+    def _ins_cd(self): # call 0000
+        nn = self._get_nn()
+        self._push(self.pc)
+        self.pc = nn
+        return 17
+    def _ins_ce(self): # adc a,00
+        val = self._get_n()
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 7
+    def _ins_cf(self): # rst 08
+        self._push(self.pc)
+        self.pc = 0x08
+        return 11
+    def _ins_d0(self): # ret nc
+        if (self.f & _CF) == 0:
+            self.pc = self._pop()
+            return 11
+        return 5
+    def _ins_d1(self): # pop de
+        self.d = self.mem[self.sp + 1]
+        self.e = self.mem[self.sp]
+        self.sp = (self.sp + 2) & 0xffff
+        return 10
+    def _ins_d2(self): # jp nc,0000
+        nn = self._get_nn()
+        if (self.f & _CF) == 0:
+            self.pc = nn
+        return 10
+    def _ins_d3(self): # out (00),a
+        self.io.wr((self.a << 8) | self._get_n(), self.a)
+        return 11
+    def _ins_d4(self): # call nc,0000
+        nn = self._get_nn()
+        if (self.f & _CF) == 0:
+            self._push(self.pc)
+            self.pc = nn
+            return 17
+        return 10
+    def _ins_d5(self): # push de
+        self.mem[self.sp - 1] = self.d
+        self.mem[self.sp - 2] = self.e
+        self.sp = (self.sp - 2) & 0xffff
+        return 11
+    def _ins_d6(self): # sub 00
+        val = self._get_n()
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 7
+    def _ins_d7(self): # rst 10
+        self._push(self.pc)
+        self.pc = 0x10
+        return 11
+    def _ins_d8(self): # ret c
+        if self.f & _CF:
+            self.pc = self._pop()
+            return 11
+        return 5
+    def _ins_d9(self): # exx 
+        tmp = self._get_bc()
+        self._set_bc(self.alt_bc)
+        self.alt_bc = tmp
+        tmp = self._get_de()
+        self._set_de(self.alt_de)
+        self.alt_de = tmp
+        tmp = self._get_hl()
+        self._set_hl(self.alt_hl)
+        self.alt_hl = tmp
+        return 4
+    def _ins_da(self): # jp c,0000
+        nn = self._get_nn()
+        if self.f & _CF:
+            self.pc = nn
+        return 10
+    def _ins_db(self): # in a,(00)
+        self.a = self.io.rd((self.a << 8) | self._get_n())
+        return 11
+    def _ins_dc(self): # call c,0000
+        nn = self._get_nn()
+        if self.f & _CF:
+            self._push(self.pc)
+            self.pc = nn
+            return 17
+        return 10
+    def _ins_de(self): # sbc a,00
+        val = self._get_n()
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 7
+    def _ins_df(self): # rst 18
+        self._push(self.pc)
+        self.pc = 0x18
+        return 11
+    def _ins_e0(self): # ret po
+        if (self.f & _PF) == 0:
+            self.pc = self._pop()
+            return 11
+        return 5
+    def _ins_e1(self): # pop hl
+        self.h = self.mem[self.sp + 1]
+        self.l = self.mem[self.sp]
+        self.sp = (self.sp + 2) & 0xffff
+        return 10
+    def _ins_e2(self): # jp po,0000
+        nn = self._get_nn()
+        if (self.f & _PF) == 0:
+            self.pc = nn
+        return 10
+    def _ins_e3(self): # ex (sp),hl
+        tmp = self._peek(self.sp)
+        self._poke(self.sp, self._get_hl())
+        self._set_hl(tmp)
+        return 19
+    def _ins_e4(self): # call po,0000
+        nn = self._get_nn()
+        if (self.f & _PF) == 0:
+            self._push(self.pc)
+            self.pc = nn
+            return 17
+        return 10
+    def _ins_e5(self): # push hl
+        self.mem[self.sp - 1] = self.h
+        self.mem[self.sp - 2] = self.l
+        self.sp = (self.sp - 2) & 0xffff
+        return 11
+    def _ins_e6(self): # and 00
+        val = self._get_n()
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 7
+    def _ins_e7(self): # rst 20
+        self._push(self.pc)
+        self.pc = 0x20
+        return 11
+    def _ins_e8(self): # ret pe
+        if self.f & _PF:
+            self.pc = self._pop()
+            return 11
+        return 5
+    def _ins_e9(self): # jp hl
+        self.pc = self._get_hl()
+        return 4
+    def _ins_ea(self): # jp pe,0000
+        nn = self._get_nn()
+        if self.f & _PF:
+            self.pc = nn
+        return 10
+    def _ins_eb(self): # ex de,hl
+        self.d, self.h = self.h, self.d
+        self.e, self.l = self.l, self.e
+        return 6
+    def _ins_ec(self): # call pe,0000
+        nn = self._get_nn()
+        if self.f & _PF:
+            self._push(self.pc)
+            self.pc = nn
+            return 17
+        return 10
+    def _ins_ee(self): # xor 00
+        val = self._get_n()
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 7
+    def _ins_ef(self): # rst 28
+        self._push(self.pc)
+        self.pc = 0x28
+        return 11
+    def _ins_f0(self): # ret p
+        if (self.f & _SF) == 0:
+            self.pc = self._pop()
+            return 11
+        return 5
+    def _ins_f1(self): # pop af
+        self.a = self.mem[self.sp + 1]
+        self.f = self.mem[self.sp]
+        self.sp = (self.sp + 2) & 0xffff
+        return 10
+    def _ins_f2(self): # jp p,0000
+        nn = self._get_nn()
+        if (self.f & _SF) == 0:
+            self.pc = nn
+        return 10
+    def _ins_f3(self): # di 
+        self.iff1 = 0
+        self.iff2 = 0
+        return 4
+    def _ins_f4(self): # call p,0000
+        nn = self._get_nn()
+        if (self.f & _SF) == 0:
+            self._push(self.pc)
+            self.pc = nn
+            return 17
+        return 10
+    def _ins_f5(self): # push af
+        self.mem[self.sp - 1] = self.a
+        self.mem[self.sp - 2] = self.f
+        self.sp = (self.sp - 2) & 0xffff
+        return 11
+    def _ins_f6(self): # or 00
+        val = self._get_n()
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 7
+    def _ins_f7(self): # rst 30
+        self._push(self.pc)
+        self.pc = 0x30
+        return 11
+    def _ins_f8(self): # ret m
+        if self.f & _SF:
+            self.pc = self._pop()
+            return 11
+        return 5
+    def _ins_f9(self): # ld sp,hl
+        self.sp = self._get_hl()
+        return 6
+    def _ins_fa(self): # jp m,0000
+        nn = self._get_nn()
+        if self.f & _SF:
+            self.pc = nn
+        return 10
+    def _ins_fb(self): # ei 
+        self.iff1 = 1
+        self.iff2 = 1
+        return 4
+    def _ins_fc(self): # call m,0000
+        nn = self._get_nn()
+        if self.f & _SF:
+            self._push(self.pc)
+            self.pc = nn
+            return 17
+        return 10
+    def _ins_fe(self): # cp 00
+        val = self._get_n()
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 7
+    def _ins_ff(self): # rst 38
+        self._push(self.pc)
+        self.pc = 0x38
+        return 11
+    def _ins_cb00(self): # rlc b
+        res = self.b
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        return 4
+    def _ins_cb01(self): # rlc c
+        res = self.c
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        return 4
+    def _ins_cb02(self): # rlc d
+        res = self.d
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        return 4
+    def _ins_cb03(self): # rlc e
+        res = self.e
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        return 4
+    def _ins_cb04(self): # rlc h
+        res = self.h
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        return 4
+    def _ins_cb05(self): # rlc l
+        res = self.l
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        return 4
+    def _ins_cb06(self): # rlc (hl)
+        res = self.mem[self._get_hl()]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self._get_hl()] = res
+        return 11
+    def _ins_cb07(self): # rlc a
+        res = self.a
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        return 4
+    def _ins_cb08(self): # rrc b
+        res = self.b
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        return 4
+    def _ins_cb09(self): # rrc c
+        res = self.c
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        return 4
+    def _ins_cb0a(self): # rrc d
+        res = self.d
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        return 4
+    def _ins_cb0b(self): # rrc e
+        res = self.e
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        return 4
+    def _ins_cb0c(self): # rrc h
+        res = self.h
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        return 4
+    def _ins_cb0d(self): # rrc l
+        res = self.l
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        return 4
+    def _ins_cb0e(self): # rrc (hl)
+        res = self.mem[self._get_hl()]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self._get_hl()] = res
+        return 11
+    def _ins_cb0f(self): # rrc a
+        res = self.a
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        return 4
+    def _ins_cb10(self): # rl b
+        res = self.b
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        return 4
+    def _ins_cb11(self): # rl c
+        res = self.c
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        return 4
+    def _ins_cb12(self): # rl d
+        res = self.d
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        return 4
+    def _ins_cb13(self): # rl e
+        res = self.e
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        return 4
+    def _ins_cb14(self): # rl h
+        res = self.h
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        return 4
+    def _ins_cb15(self): # rl l
+        res = self.l
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        return 4
+    def _ins_cb16(self): # rl (hl)
+        res = self.mem[self._get_hl()]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self._get_hl()] = res
+        return 11
+    def _ins_cb17(self): # rl a
+        res = self.a
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        return 4
+    def _ins_cb18(self): # rr b
+        res = self.b
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        return 4
+    def _ins_cb19(self): # rr c
+        res = self.c
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        return 4
+    def _ins_cb1a(self): # rr d
+        res = self.d
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        return 4
+    def _ins_cb1b(self): # rr e
+        res = self.e
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        return 4
+    def _ins_cb1c(self): # rr h
+        res = self.h
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        return 4
+    def _ins_cb1d(self): # rr l
+        res = self.l
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        return 4
+    def _ins_cb1e(self): # rr (hl)
+        res = self.mem[self._get_hl()]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self._get_hl()] = res
+        return 11
+    def _ins_cb1f(self): # rr a
+        res = self.a
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        return 4
+    def _ins_cb20(self): # sla b
+        res = self.b
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        return 4
+    def _ins_cb21(self): # sla c
+        res = self.c
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        return 4
+    def _ins_cb22(self): # sla d
+        res = self.d
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        return 4
+    def _ins_cb23(self): # sla e
+        res = self.e
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        return 4
+    def _ins_cb24(self): # sla h
+        res = self.h
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        return 4
+    def _ins_cb25(self): # sla l
+        res = self.l
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        return 4
+    def _ins_cb26(self): # sla (hl)
+        res = self.mem[self._get_hl()]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self._get_hl()] = res
+        return 11
+    def _ins_cb27(self): # sla a
+        res = self.a
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        return 4
+    def _ins_cb28(self): # sra b
+        res = self.b
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        return 4
+    def _ins_cb29(self): # sra c
+        res = self.c
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        return 4
+    def _ins_cb2a(self): # sra d
+        res = self.d
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        return 4
+    def _ins_cb2b(self): # sra e
+        res = self.e
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        return 4
+    def _ins_cb2c(self): # sra h
+        res = self.h
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        return 4
+    def _ins_cb2d(self): # sra l
+        res = self.l
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        return 4
+    def _ins_cb2e(self): # sra (hl)
+        res = self.mem[self._get_hl()]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self._get_hl()] = res
+        return 11
+    def _ins_cb2f(self): # sra a
+        res = self.a
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        return 4
+    def _ins_cb30(self): # sll b
+        res = self.b
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        return 4
+    def _ins_cb31(self): # sll c
+        res = self.c
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        return 4
+    def _ins_cb32(self): # sll d
+        res = self.d
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        return 4
+    def _ins_cb33(self): # sll e
+        res = self.e
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        return 4
+    def _ins_cb34(self): # sll h
+        res = self.h
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        return 4
+    def _ins_cb35(self): # sll l
+        res = self.l
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        return 4
+    def _ins_cb36(self): # sll (hl)
+        res = self.mem[self._get_hl()]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self._get_hl()] = res
+        return 11
+    def _ins_cb37(self): # sll a
+        res = self.a
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        return 4
+    def _ins_cb38(self): # srl b
+        res = self.b
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        return 4
+    def _ins_cb39(self): # srl c
+        res = self.c
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        return 4
+    def _ins_cb3a(self): # srl d
+        res = self.d
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        return 4
+    def _ins_cb3b(self): # srl e
+        res = self.e
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        return 4
+    def _ins_cb3c(self): # srl h
+        res = self.h
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        return 4
+    def _ins_cb3d(self): # srl l
+        res = self.l
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        return 4
+    def _ins_cb3e(self): # srl (hl)
+        res = self.mem[self._get_hl()]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self._get_hl()] = res
+        return 11
+    def _ins_cb3f(self): # srl a
+        res = self.a
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        return 4
+    def _ins_cb40(self): # bit 0,b
+        bit = self.b & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb41(self): # bit 0,c
+        bit = self.c & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb42(self): # bit 0,d
+        bit = self.d & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb43(self): # bit 0,e
+        bit = self.e & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb44(self): # bit 0,h
+        bit = self.h & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb45(self): # bit 0,l
+        bit = self.l & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb46(self): # bit 0,(hl)
+        bit = self.mem[self._get_hl()] & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_cb47(self): # bit 0,a
+        bit = self.a & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb48(self): # bit 1,b
+        bit = self.b & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb49(self): # bit 1,c
+        bit = self.c & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb4a(self): # bit 1,d
+        bit = self.d & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb4b(self): # bit 1,e
+        bit = self.e & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb4c(self): # bit 1,h
+        bit = self.h & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb4d(self): # bit 1,l
+        bit = self.l & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb4e(self): # bit 1,(hl)
+        bit = self.mem[self._get_hl()] & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_cb4f(self): # bit 1,a
+        bit = self.a & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb50(self): # bit 2,b
+        bit = self.b & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb51(self): # bit 2,c
+        bit = self.c & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb52(self): # bit 2,d
+        bit = self.d & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb53(self): # bit 2,e
+        bit = self.e & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb54(self): # bit 2,h
+        bit = self.h & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb55(self): # bit 2,l
+        bit = self.l & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb56(self): # bit 2,(hl)
+        bit = self.mem[self._get_hl()] & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_cb57(self): # bit 2,a
+        bit = self.a & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb58(self): # bit 3,b
+        bit = self.b & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb59(self): # bit 3,c
+        bit = self.c & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb5a(self): # bit 3,d
+        bit = self.d & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb5b(self): # bit 3,e
+        bit = self.e & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb5c(self): # bit 3,h
+        bit = self.h & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb5d(self): # bit 3,l
+        bit = self.l & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb5e(self): # bit 3,(hl)
+        bit = self.mem[self._get_hl()] & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_cb5f(self): # bit 3,a
+        bit = self.a & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb60(self): # bit 4,b
+        bit = self.b & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb61(self): # bit 4,c
+        bit = self.c & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb62(self): # bit 4,d
+        bit = self.d & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb63(self): # bit 4,e
+        bit = self.e & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb64(self): # bit 4,h
+        bit = self.h & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb65(self): # bit 4,l
+        bit = self.l & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb66(self): # bit 4,(hl)
+        bit = self.mem[self._get_hl()] & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_cb67(self): # bit 4,a
+        bit = self.a & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb68(self): # bit 5,b
+        bit = self.b & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb69(self): # bit 5,c
+        bit = self.c & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb6a(self): # bit 5,d
+        bit = self.d & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb6b(self): # bit 5,e
+        bit = self.e & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb6c(self): # bit 5,h
+        bit = self.h & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb6d(self): # bit 5,l
+        bit = self.l & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb6e(self): # bit 5,(hl)
+        bit = self.mem[self._get_hl()] & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_cb6f(self): # bit 5,a
+        bit = self.a & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb70(self): # bit 6,b
+        bit = self.b & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb71(self): # bit 6,c
+        bit = self.c & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb72(self): # bit 6,d
+        bit = self.d & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb73(self): # bit 6,e
+        bit = self.e & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb74(self): # bit 6,h
+        bit = self.h & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb75(self): # bit 6,l
+        bit = self.l & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb76(self): # bit 6,(hl)
+        bit = self.mem[self._get_hl()] & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_cb77(self): # bit 6,a
+        bit = self.a & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb78(self): # bit 7,b
+        bit = self.b & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb79(self): # bit 7,c
+        bit = self.c & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb7a(self): # bit 7,d
+        bit = self.d & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb7b(self): # bit 7,e
+        bit = self.e & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb7c(self): # bit 7,h
+        bit = self.h & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb7d(self): # bit 7,l
+        bit = self.l & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb7e(self): # bit 7,(hl)
+        bit = self.mem[self._get_hl()] & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_cb7f(self): # bit 7,a
+        bit = self.a & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 4
+    def _ins_cb80(self): # res 0,b
+        val = self.b & ~(1 << 0)
+        self.b = val
+        return 4
+    def _ins_cb81(self): # res 0,c
+        val = self.c & ~(1 << 0)
+        self.c = val
+        return 4
+    def _ins_cb82(self): # res 0,d
+        val = self.d & ~(1 << 0)
+        self.d = val
+        return 4
+    def _ins_cb83(self): # res 0,e
+        val = self.e & ~(1 << 0)
+        self.e = val
+        return 4
+    def _ins_cb84(self): # res 0,h
+        val = self.h & ~(1 << 0)
+        self.h = val
+        return 4
+    def _ins_cb85(self): # res 0,l
+        val = self.l & ~(1 << 0)
+        self.l = val
+        return 4
+    def _ins_cb86(self): # res 0,(hl)
+        n = self._get_hl()
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        return 11
+    def _ins_cb87(self): # res 0,a
+        val = self.a & ~(1 << 0)
+        self.a = val
+        return 4
+    def _ins_cb88(self): # res 1,b
+        val = self.b & ~(1 << 1)
+        self.b = val
+        return 4
+    def _ins_cb89(self): # res 1,c
+        val = self.c & ~(1 << 1)
+        self.c = val
+        return 4
+    def _ins_cb8a(self): # res 1,d
+        val = self.d & ~(1 << 1)
+        self.d = val
+        return 4
+    def _ins_cb8b(self): # res 1,e
+        val = self.e & ~(1 << 1)
+        self.e = val
+        return 4
+    def _ins_cb8c(self): # res 1,h
+        val = self.h & ~(1 << 1)
+        self.h = val
+        return 4
+    def _ins_cb8d(self): # res 1,l
+        val = self.l & ~(1 << 1)
+        self.l = val
+        return 4
+    def _ins_cb8e(self): # res 1,(hl)
+        n = self._get_hl()
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        return 11
+    def _ins_cb8f(self): # res 1,a
+        val = self.a & ~(1 << 1)
+        self.a = val
+        return 4
+    def _ins_cb90(self): # res 2,b
+        val = self.b & ~(1 << 2)
+        self.b = val
+        return 4
+    def _ins_cb91(self): # res 2,c
+        val = self.c & ~(1 << 2)
+        self.c = val
+        return 4
+    def _ins_cb92(self): # res 2,d
+        val = self.d & ~(1 << 2)
+        self.d = val
+        return 4
+    def _ins_cb93(self): # res 2,e
+        val = self.e & ~(1 << 2)
+        self.e = val
+        return 4
+    def _ins_cb94(self): # res 2,h
+        val = self.h & ~(1 << 2)
+        self.h = val
+        return 4
+    def _ins_cb95(self): # res 2,l
+        val = self.l & ~(1 << 2)
+        self.l = val
+        return 4
+    def _ins_cb96(self): # res 2,(hl)
+        n = self._get_hl()
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        return 11
+    def _ins_cb97(self): # res 2,a
+        val = self.a & ~(1 << 2)
+        self.a = val
+        return 4
+    def _ins_cb98(self): # res 3,b
+        val = self.b & ~(1 << 3)
+        self.b = val
+        return 4
+    def _ins_cb99(self): # res 3,c
+        val = self.c & ~(1 << 3)
+        self.c = val
+        return 4
+    def _ins_cb9a(self): # res 3,d
+        val = self.d & ~(1 << 3)
+        self.d = val
+        return 4
+    def _ins_cb9b(self): # res 3,e
+        val = self.e & ~(1 << 3)
+        self.e = val
+        return 4
+    def _ins_cb9c(self): # res 3,h
+        val = self.h & ~(1 << 3)
+        self.h = val
+        return 4
+    def _ins_cb9d(self): # res 3,l
+        val = self.l & ~(1 << 3)
+        self.l = val
+        return 4
+    def _ins_cb9e(self): # res 3,(hl)
+        n = self._get_hl()
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        return 11
+    def _ins_cb9f(self): # res 3,a
+        val = self.a & ~(1 << 3)
+        self.a = val
+        return 4
+    def _ins_cba0(self): # res 4,b
+        val = self.b & ~(1 << 4)
+        self.b = val
+        return 4
+    def _ins_cba1(self): # res 4,c
+        val = self.c & ~(1 << 4)
+        self.c = val
+        return 4
+    def _ins_cba2(self): # res 4,d
+        val = self.d & ~(1 << 4)
+        self.d = val
+        return 4
+    def _ins_cba3(self): # res 4,e
+        val = self.e & ~(1 << 4)
+        self.e = val
+        return 4
+    def _ins_cba4(self): # res 4,h
+        val = self.h & ~(1 << 4)
+        self.h = val
+        return 4
+    def _ins_cba5(self): # res 4,l
+        val = self.l & ~(1 << 4)
+        self.l = val
+        return 4
+    def _ins_cba6(self): # res 4,(hl)
+        n = self._get_hl()
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        return 11
+    def _ins_cba7(self): # res 4,a
+        val = self.a & ~(1 << 4)
+        self.a = val
+        return 4
+    def _ins_cba8(self): # res 5,b
+        val = self.b & ~(1 << 5)
+        self.b = val
+        return 4
+    def _ins_cba9(self): # res 5,c
+        val = self.c & ~(1 << 5)
+        self.c = val
+        return 4
+    def _ins_cbaa(self): # res 5,d
+        val = self.d & ~(1 << 5)
+        self.d = val
+        return 4
+    def _ins_cbab(self): # res 5,e
+        val = self.e & ~(1 << 5)
+        self.e = val
+        return 4
+    def _ins_cbac(self): # res 5,h
+        val = self.h & ~(1 << 5)
+        self.h = val
+        return 4
+    def _ins_cbad(self): # res 5,l
+        val = self.l & ~(1 << 5)
+        self.l = val
+        return 4
+    def _ins_cbae(self): # res 5,(hl)
+        n = self._get_hl()
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        return 11
+    def _ins_cbaf(self): # res 5,a
+        val = self.a & ~(1 << 5)
+        self.a = val
+        return 4
+    def _ins_cbb0(self): # res 6,b
+        val = self.b & ~(1 << 6)
+        self.b = val
+        return 4
+    def _ins_cbb1(self): # res 6,c
+        val = self.c & ~(1 << 6)
+        self.c = val
+        return 4
+    def _ins_cbb2(self): # res 6,d
+        val = self.d & ~(1 << 6)
+        self.d = val
+        return 4
+    def _ins_cbb3(self): # res 6,e
+        val = self.e & ~(1 << 6)
+        self.e = val
+        return 4
+    def _ins_cbb4(self): # res 6,h
+        val = self.h & ~(1 << 6)
+        self.h = val
+        return 4
+    def _ins_cbb5(self): # res 6,l
+        val = self.l & ~(1 << 6)
+        self.l = val
+        return 4
+    def _ins_cbb6(self): # res 6,(hl)
+        n = self._get_hl()
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        return 11
+    def _ins_cbb7(self): # res 6,a
+        val = self.a & ~(1 << 6)
+        self.a = val
+        return 4
+    def _ins_cbb8(self): # res 7,b
+        val = self.b & ~(1 << 7)
+        self.b = val
+        return 4
+    def _ins_cbb9(self): # res 7,c
+        val = self.c & ~(1 << 7)
+        self.c = val
+        return 4
+    def _ins_cbba(self): # res 7,d
+        val = self.d & ~(1 << 7)
+        self.d = val
+        return 4
+    def _ins_cbbb(self): # res 7,e
+        val = self.e & ~(1 << 7)
+        self.e = val
+        return 4
+    def _ins_cbbc(self): # res 7,h
+        val = self.h & ~(1 << 7)
+        self.h = val
+        return 4
+    def _ins_cbbd(self): # res 7,l
+        val = self.l & ~(1 << 7)
+        self.l = val
+        return 4
+    def _ins_cbbe(self): # res 7,(hl)
+        n = self._get_hl()
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        return 11
+    def _ins_cbbf(self): # res 7,a
+        val = self.a & ~(1 << 7)
+        self.a = val
+        return 4
+    def _ins_cbc0(self): # set 0,b
+        val = self.b | (1 << 0)
+        self.b = val
+        return 4
+    def _ins_cbc1(self): # set 0,c
+        val = self.c | (1 << 0)
+        self.c = val
+        return 4
+    def _ins_cbc2(self): # set 0,d
+        val = self.d | (1 << 0)
+        self.d = val
+        return 4
+    def _ins_cbc3(self): # set 0,e
+        val = self.e | (1 << 0)
+        self.e = val
+        return 4
+    def _ins_cbc4(self): # set 0,h
+        val = self.h | (1 << 0)
+        self.h = val
+        return 4
+    def _ins_cbc5(self): # set 0,l
+        val = self.l | (1 << 0)
+        self.l = val
+        return 4
+    def _ins_cbc6(self): # set 0,(hl)
+        n = self._get_hl()
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        return 11
+    def _ins_cbc7(self): # set 0,a
+        val = self.a | (1 << 0)
+        self.a = val
+        return 4
+    def _ins_cbc8(self): # set 1,b
+        val = self.b | (1 << 1)
+        self.b = val
+        return 4
+    def _ins_cbc9(self): # set 1,c
+        val = self.c | (1 << 1)
+        self.c = val
+        return 4
+    def _ins_cbca(self): # set 1,d
+        val = self.d | (1 << 1)
+        self.d = val
+        return 4
+    def _ins_cbcb(self): # set 1,e
+        val = self.e | (1 << 1)
+        self.e = val
+        return 4
+    def _ins_cbcc(self): # set 1,h
+        val = self.h | (1 << 1)
+        self.h = val
+        return 4
+    def _ins_cbcd(self): # set 1,l
+        val = self.l | (1 << 1)
+        self.l = val
+        return 4
+    def _ins_cbce(self): # set 1,(hl)
+        n = self._get_hl()
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        return 11
+    def _ins_cbcf(self): # set 1,a
+        val = self.a | (1 << 1)
+        self.a = val
+        return 4
+    def _ins_cbd0(self): # set 2,b
+        val = self.b | (1 << 2)
+        self.b = val
+        return 4
+    def _ins_cbd1(self): # set 2,c
+        val = self.c | (1 << 2)
+        self.c = val
+        return 4
+    def _ins_cbd2(self): # set 2,d
+        val = self.d | (1 << 2)
+        self.d = val
+        return 4
+    def _ins_cbd3(self): # set 2,e
+        val = self.e | (1 << 2)
+        self.e = val
+        return 4
+    def _ins_cbd4(self): # set 2,h
+        val = self.h | (1 << 2)
+        self.h = val
+        return 4
+    def _ins_cbd5(self): # set 2,l
+        val = self.l | (1 << 2)
+        self.l = val
+        return 4
+    def _ins_cbd6(self): # set 2,(hl)
+        n = self._get_hl()
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        return 11
+    def _ins_cbd7(self): # set 2,a
+        val = self.a | (1 << 2)
+        self.a = val
+        return 4
+    def _ins_cbd8(self): # set 3,b
+        val = self.b | (1 << 3)
+        self.b = val
+        return 4
+    def _ins_cbd9(self): # set 3,c
+        val = self.c | (1 << 3)
+        self.c = val
+        return 4
+    def _ins_cbda(self): # set 3,d
+        val = self.d | (1 << 3)
+        self.d = val
+        return 4
+    def _ins_cbdb(self): # set 3,e
+        val = self.e | (1 << 3)
+        self.e = val
+        return 4
+    def _ins_cbdc(self): # set 3,h
+        val = self.h | (1 << 3)
+        self.h = val
+        return 4
+    def _ins_cbdd(self): # set 3,l
+        val = self.l | (1 << 3)
+        self.l = val
+        return 4
+    def _ins_cbde(self): # set 3,(hl)
+        n = self._get_hl()
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        return 11
+    def _ins_cbdf(self): # set 3,a
+        val = self.a | (1 << 3)
+        self.a = val
+        return 4
+    def _ins_cbe0(self): # set 4,b
+        val = self.b | (1 << 4)
+        self.b = val
+        return 4
+    def _ins_cbe1(self): # set 4,c
+        val = self.c | (1 << 4)
+        self.c = val
+        return 4
+    def _ins_cbe2(self): # set 4,d
+        val = self.d | (1 << 4)
+        self.d = val
+        return 4
+    def _ins_cbe3(self): # set 4,e
+        val = self.e | (1 << 4)
+        self.e = val
+        return 4
+    def _ins_cbe4(self): # set 4,h
+        val = self.h | (1 << 4)
+        self.h = val
+        return 4
+    def _ins_cbe5(self): # set 4,l
+        val = self.l | (1 << 4)
+        self.l = val
+        return 4
+    def _ins_cbe6(self): # set 4,(hl)
+        n = self._get_hl()
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        return 11
+    def _ins_cbe7(self): # set 4,a
+        val = self.a | (1 << 4)
+        self.a = val
+        return 4
+    def _ins_cbe8(self): # set 5,b
+        val = self.b | (1 << 5)
+        self.b = val
+        return 4
+    def _ins_cbe9(self): # set 5,c
+        val = self.c | (1 << 5)
+        self.c = val
+        return 4
+    def _ins_cbea(self): # set 5,d
+        val = self.d | (1 << 5)
+        self.d = val
+        return 4
+    def _ins_cbeb(self): # set 5,e
+        val = self.e | (1 << 5)
+        self.e = val
+        return 4
+    def _ins_cbec(self): # set 5,h
+        val = self.h | (1 << 5)
+        self.h = val
+        return 4
+    def _ins_cbed(self): # set 5,l
+        val = self.l | (1 << 5)
+        self.l = val
+        return 4
+    def _ins_cbee(self): # set 5,(hl)
+        n = self._get_hl()
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        return 11
+    def _ins_cbef(self): # set 5,a
+        val = self.a | (1 << 5)
+        self.a = val
+        return 4
+    def _ins_cbf0(self): # set 6,b
+        val = self.b | (1 << 6)
+        self.b = val
+        return 4
+    def _ins_cbf1(self): # set 6,c
+        val = self.c | (1 << 6)
+        self.c = val
+        return 4
+    def _ins_cbf2(self): # set 6,d
+        val = self.d | (1 << 6)
+        self.d = val
+        return 4
+    def _ins_cbf3(self): # set 6,e
+        val = self.e | (1 << 6)
+        self.e = val
+        return 4
+    def _ins_cbf4(self): # set 6,h
+        val = self.h | (1 << 6)
+        self.h = val
+        return 4
+    def _ins_cbf5(self): # set 6,l
+        val = self.l | (1 << 6)
+        self.l = val
+        return 4
+    def _ins_cbf6(self): # set 6,(hl)
+        n = self._get_hl()
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        return 11
+    def _ins_cbf7(self): # set 6,a
+        val = self.a | (1 << 6)
+        self.a = val
+        return 4
+    def _ins_cbf8(self): # set 7,b
+        val = self.b | (1 << 7)
+        self.b = val
+        return 4
+    def _ins_cbf9(self): # set 7,c
+        val = self.c | (1 << 7)
+        self.c = val
+        return 4
+    def _ins_cbfa(self): # set 7,d
+        val = self.d | (1 << 7)
+        self.d = val
+        return 4
+    def _ins_cbfb(self): # set 7,e
+        val = self.e | (1 << 7)
+        self.e = val
+        return 4
+    def _ins_cbfc(self): # set 7,h
+        val = self.h | (1 << 7)
+        self.h = val
+        return 4
+    def _ins_cbfd(self): # set 7,l
+        val = self.l | (1 << 7)
+        self.l = val
+        return 4
+    def _ins_cbfe(self): # set 7,(hl)
+        n = self._get_hl()
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        return 11
+    def _ins_cbff(self): # set 7,a
+        val = self.a | (1 << 7)
+        self.a = val
+        return 4
+    def _ins_dd09(self): # add ix,bc
+        s = self._get_bc()
+        d = self.ix
+        res = d + s
+        self._add16_flags(res, d, s)
+        self.ix = res
+        return 11
+    def _ins_dd10(self): # djnz 0003
+        e = self._get_n()
+        self.b = (self.b - 1) & 0xff
+        if self.b:
+            self._inc_pc(_signed(e))
+            return 13
+        return 8
+    def _ins_dd18(self): # jr 0003
+        raise Error('unimplemented instruction')
+    def _ins_dd19(self): # add ix,de
+        s = self._get_de()
+        d = self.ix
+        res = d + s
+        self._add16_flags(res, d, s)
+        self.ix = res
+        return 11
+    def _ins_dd20(self): # jr nz,0003
+        e = self._get_n()
+        if (self.f & _ZF) == 0:
+            self._inc_pc(_signed(e))
+            return 12
+        return 7
+    def _ins_dd21(self): # ld ix,0000
+        self.ix = self._get_nn()
+        return 10
+    def _ins_dd22(self): # ld (0000),ix
+        nn = self._get_nn()
+        self.mem[nn] = self.ix & 0xff
+        self.mem[nn + 1] = self.ix >> 8
+        return 16
+    def _ins_dd23(self): # inc ix
+        self.ix = (self.ix + 1) & 0xffff
+        return 6
+    def _ins_dd24(self): # inc ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd25(self): # dec ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd26(self): # ld ixh,00
+        raise Error('unimplemented instruction')
+    def _ins_dd28(self): # jr z,0003
+        e = self._get_n()
+        if self.f & _ZF:
+            self._inc_pc(_signed(e))
+            return 12
+        return 7
+    def _ins_dd29(self): # add ix,ix
+        s = self.ix
+        d = self.ix
+        res = d + s
+        self._add16_flags(res, d, s)
+        self.ix = res
+        return 11
+    def _ins_dd2a(self): # ld ix,(0000)
+        nn = self._get_nn()
+        self.ix = self.mem[nn + 1] << 8
+        self.ix |= self.mem[nn]
+        return 16
+    def _ins_dd2b(self): # dec ix
+        self.ix = (self.ix - 1) & 0xffff
+        return 6
+    def _ins_dd2c(self): # inc ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd2d(self): # dec ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd2e(self): # ld ixl,00
+        raise Error('unimplemented instruction')
+    def _ins_dd30(self): # jr nc,0003
+        e = self._get_n()
+        if (self.f & _CF) == 0:
+            self._inc_pc(_signed(e))
+            return 12
+        return 7
+    def _ins_dd34(self): # inc (ix+00)
+        adr = self.ix + _signed(self._get_n())
+        n = (self.mem[adr] + 1) & 0xff
+        self.mem[adr] = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 19
+    def _ins_dd35(self): # dec (ix+00)
+        adr = self.ix + _signed(self._get_n())
+        n = (self.mem[adr] - 1) & 0xff
+        self.mem[adr] = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 19
+    def _ins_dd36(self): # ld (ix+00),00
+        d = _signed(self._get_n())
+        self.mem[self.ix + d] = self._get_n()
+        return 15
+    def _ins_dd38(self): # jr c,0003
+        e = self._get_n()
+        if self.f & _CF:
+            self._inc_pc(_signed(e))
+            return 12
+        return 7
+    def _ins_dd39(self): # add ix,sp
+        s = self.sp
+        d = self.ix
+        res = d + s
+        self._add16_flags(res, d, s)
+        self.ix = res
+        return 11
+    def _ins_dd44(self): # ld b,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd45(self): # ld b,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd46(self): # ld b,(ix+00)
+        d = _signed(self._get_n())
+        self.b = self.mem[self.ix + d]
+        return 15
+    def _ins_dd4c(self): # ld c,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd4d(self): # ld c,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd4e(self): # ld c,(ix+00)
+        d = _signed(self._get_n())
+        self.c = self.mem[self.ix + d]
+        return 15
+    def _ins_dd54(self): # ld d,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd55(self): # ld d,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd56(self): # ld d,(ix+00)
+        d = _signed(self._get_n())
+        self.d = self.mem[self.ix + d]
+        return 15
+    def _ins_dd5c(self): # ld e,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd5d(self): # ld e,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd5e(self): # ld e,(ix+00)
+        d = _signed(self._get_n())
+        self.e = self.mem[self.ix + d]
+        return 15
+    def _ins_dd60(self): # ld ixh,b
+        raise Error('unimplemented instruction')
+    def _ins_dd61(self): # ld ixh,c
+        raise Error('unimplemented instruction')
+    def _ins_dd62(self): # ld ixh,d
+        raise Error('unimplemented instruction')
+    def _ins_dd63(self): # ld ixh,e
+        raise Error('unimplemented instruction')
+    def _ins_dd64(self): # ld ixh,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd65(self): # ld ixh,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd66(self): # ld h,(ix+00)
+        d = _signed(self._get_n())
+        self.h = self.mem[self.ix + d]
+        return 15
+    def _ins_dd67(self): # ld ixh,a
+        raise Error('unimplemented instruction')
+    def _ins_dd68(self): # ld ixl,b
+        raise Error('unimplemented instruction')
+    def _ins_dd69(self): # ld ixl,c
+        raise Error('unimplemented instruction')
+    def _ins_dd6a(self): # ld ixl,d
+        raise Error('unimplemented instruction')
+    def _ins_dd6b(self): # ld ixl,e
+        raise Error('unimplemented instruction')
+    def _ins_dd6c(self): # ld ixl,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd6d(self): # ld ixl,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd6e(self): # ld l,(ix+00)
+        d = _signed(self._get_n())
+        self.l = self.mem[self.ix + d]
+        return 15
+    def _ins_dd6f(self): # ld ixl,a
+        raise Error('unimplemented instruction')
+    def _ins_dd70(self): # ld (ix+00),b
+        d = _signed(self._get_n())
+        self.mem[self.ix + d] = self.b
+        return 15
+    def _ins_dd71(self): # ld (ix+00),c
+        d = _signed(self._get_n())
+        self.mem[self.ix + d] = self.c
+        return 15
+    def _ins_dd72(self): # ld (ix+00),d
+        d = _signed(self._get_n())
+        self.mem[self.ix + d] = self.d
+        return 15
+    def _ins_dd73(self): # ld (ix+00),e
+        d = _signed(self._get_n())
+        self.mem[self.ix + d] = self.e
+        return 15
+    def _ins_dd74(self): # ld (ix+00),h
+        d = _signed(self._get_n())
+        self.mem[self.ix + d] = self.h
+        return 15
+    def _ins_dd75(self): # ld (ix+00),l
+        d = _signed(self._get_n())
+        self.mem[self.ix + d] = self.l
+        return 15
+    def _ins_dd77(self): # ld (ix+00),a
+        d = _signed(self._get_n())
+        self.mem[self.ix + d] = self.a
+        return 15
+    def _ins_dd7c(self): # ld a,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd7d(self): # ld a,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd7e(self): # ld a,(ix+00)
+        d = _signed(self._get_n())
+        self.a = self.mem[self.ix + d]
+        return 15
+    def _ins_dd84(self): # add a,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd85(self): # add a,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd86(self): # add a,(ix+00)
+        val = self.mem[self.ix + _signed(self._get_n())]
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 15
+    def _ins_dd8c(self): # adc a,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd8d(self): # adc a,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd8e(self): # adc a,(ix+00)
+        val = self.mem[self.ix + _signed(self._get_n())]
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 15
+    def _ins_dd94(self): # sub ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd95(self): # sub ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd96(self): # sub (ix+00)
+        val = self.mem[self.ix + _signed(self._get_n())]
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 15
+    def _ins_dd9c(self): # sbc a,ixh
+        raise Error('unimplemented instruction')
+    def _ins_dd9d(self): # sbc a,ixl
+        raise Error('unimplemented instruction')
+    def _ins_dd9e(self): # sbc a,(ix+00)
+        val = self.mem[self.ix + _signed(self._get_n())]
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 15
+    def _ins_dda4(self): # and ixh
+        raise Error('unimplemented instruction')
+    def _ins_dda5(self): # and ixl
+        raise Error('unimplemented instruction')
+    def _ins_dda6(self): # and (ix+00)
+        val = self.mem[self.ix + _signed(self._get_n())]
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 15
+    def _ins_ddac(self): # xor ixh
+        raise Error('unimplemented instruction')
+    def _ins_ddad(self): # xor ixl
+        raise Error('unimplemented instruction')
+    def _ins_ddae(self): # xor (ix+00)
+        val = self.mem[self.ix + _signed(self._get_n())]
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 15
+    def _ins_ddb4(self): # or ixh
+        raise Error('unimplemented instruction')
+    def _ins_ddb5(self): # or ixl
+        raise Error('unimplemented instruction')
+    def _ins_ddb6(self): # or (ix+00)
+        val = self.mem[self.ix + _signed(self._get_n())]
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 15
+    def _ins_ddbc(self): # cp ixh
+        raise Error('unimplemented instruction')
+    def _ins_ddbd(self): # cp ixl
+        raise Error('unimplemented instruction')
+    def _ins_ddbe(self): # cp (ix+00)
+        val = self.mem[self.ix + _signed(self._get_n())]
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 15
+    def _ins_dde1(self): # pop ix
+        self.ix = self._pop()
+        return 10
+    def _ins_dde3(self): # ex (sp),ix
+        tmp = self._peek(self.sp)
+        self._poke(self.sp, self.ix)
+        self.ix = tmp
+        return 19
+    def _ins_dde5(self): # push ix
+        self._push(self.ix)
+        return 11
+    def _ins_dde9(self): # jp ix
+        self.pc = self.ix
+        return 4
+    def _ins_ddf9(self): # ld sp,ix
+        raise Error('unimplemented instruction')
+    def _ins_ddcb0000(self, d): # rlc (ix+00),b
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0001(self, d): # rlc (ix+00),c
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0002(self, d): # rlc (ix+00),d
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0003(self, d): # rlc (ix+00),e
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0004(self, d): # rlc (ix+00),h
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0005(self, d): # rlc (ix+00),l
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0006(self, d): # rlc (ix+00)
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0007(self, d): # rlc (ix+00),a
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0008(self, d): # rrc (ix+00),b
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0009(self, d): # rrc (ix+00),c
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb000a(self, d): # rrc (ix+00),d
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb000b(self, d): # rrc (ix+00),e
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb000c(self, d): # rrc (ix+00),h
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb000d(self, d): # rrc (ix+00),l
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb000e(self, d): # rrc (ix+00)
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb000f(self, d): # rrc (ix+00),a
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0010(self, d): # rl (ix+00),b
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0011(self, d): # rl (ix+00),c
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0012(self, d): # rl (ix+00),d
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0013(self, d): # rl (ix+00),e
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0014(self, d): # rl (ix+00),h
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0015(self, d): # rl (ix+00),l
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0016(self, d): # rl (ix+00)
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0017(self, d): # rl (ix+00),a
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0018(self, d): # rr (ix+00),b
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0019(self, d): # rr (ix+00),c
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb001a(self, d): # rr (ix+00),d
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb001b(self, d): # rr (ix+00),e
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb001c(self, d): # rr (ix+00),h
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb001d(self, d): # rr (ix+00),l
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb001e(self, d): # rr (ix+00)
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb001f(self, d): # rr (ix+00),a
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0020(self, d): # sla (ix+00),b
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0021(self, d): # sla (ix+00),c
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0022(self, d): # sla (ix+00),d
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0023(self, d): # sla (ix+00),e
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0024(self, d): # sla (ix+00),h
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0025(self, d): # sla (ix+00),l
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0026(self, d): # sla (ix+00)
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0027(self, d): # sla (ix+00),a
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0028(self, d): # sra (ix+00),b
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0029(self, d): # sra (ix+00),c
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb002a(self, d): # sra (ix+00),d
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb002b(self, d): # sra (ix+00),e
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb002c(self, d): # sra (ix+00),h
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb002d(self, d): # sra (ix+00),l
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb002e(self, d): # sra (ix+00)
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb002f(self, d): # sra (ix+00),a
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0030(self, d): # sll (ix+00),b
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0031(self, d): # sll (ix+00),c
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0032(self, d): # sll (ix+00),d
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0033(self, d): # sll (ix+00),e
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0034(self, d): # sll (ix+00),h
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0035(self, d): # sll (ix+00),l
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0036(self, d): # sll (ix+00)
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0037(self, d): # sll (ix+00),a
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0038(self, d): # srl (ix+00),b
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0039(self, d): # srl (ix+00),c
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb003a(self, d): # srl (ix+00),d
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb003b(self, d): # srl (ix+00),e
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb003c(self, d): # srl (ix+00),h
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb003d(self, d): # srl (ix+00),l
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb003e(self, d): # srl (ix+00)
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb003f(self, d): # srl (ix+00),a
+        res = self.mem[self.ix + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.ix + d] = res
+        return 11
+    def _ins_ddcb0040(self, d): # bit 0,(ix+00)
+        bit = self.mem[self.ix + d] & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_ddcb0048(self, d): # bit 1,(ix+00)
+        bit = self.mem[self.ix + d] & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_ddcb0050(self, d): # bit 2,(ix+00)
+        bit = self.mem[self.ix + d] & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_ddcb0058(self, d): # bit 3,(ix+00)
+        bit = self.mem[self.ix + d] & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_ddcb0060(self, d): # bit 4,(ix+00)
+        bit = self.mem[self.ix + d] & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_ddcb0068(self, d): # bit 5,(ix+00)
+        bit = self.mem[self.ix + d] & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_ddcb0070(self, d): # bit 6,(ix+00)
+        bit = self.mem[self.ix + d] & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_ddcb0078(self, d): # bit 7,(ix+00)
+        bit = self.mem[self.ix + d] & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_ddcb0080(self, d): # res 0,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb0081(self, d): # res 0,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb0082(self, d): # res 0,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb0083(self, d): # res 0,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb0084(self, d): # res 0,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb0085(self, d): # res 0,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb0086(self, d): # res 0,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb0087(self, d): # res 0,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb0088(self, d): # res 1,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb0089(self, d): # res 1,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb008a(self, d): # res 1,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb008b(self, d): # res 1,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb008c(self, d): # res 1,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb008d(self, d): # res 1,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb008e(self, d): # res 1,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb008f(self, d): # res 1,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb0090(self, d): # res 2,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb0091(self, d): # res 2,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb0092(self, d): # res 2,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb0093(self, d): # res 2,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb0094(self, d): # res 2,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb0095(self, d): # res 2,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb0096(self, d): # res 2,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb0097(self, d): # res 2,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb0098(self, d): # res 3,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb0099(self, d): # res 3,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb009a(self, d): # res 3,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb009b(self, d): # res 3,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb009c(self, d): # res 3,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb009d(self, d): # res 3,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb009e(self, d): # res 3,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb009f(self, d): # res 3,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00a0(self, d): # res 4,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00a1(self, d): # res 4,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00a2(self, d): # res 4,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00a3(self, d): # res 4,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00a4(self, d): # res 4,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00a5(self, d): # res 4,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00a6(self, d): # res 4,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00a7(self, d): # res 4,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00a8(self, d): # res 5,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00a9(self, d): # res 5,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00aa(self, d): # res 5,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00ab(self, d): # res 5,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00ac(self, d): # res 5,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00ad(self, d): # res 5,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00ae(self, d): # res 5,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00af(self, d): # res 5,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00b0(self, d): # res 6,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00b1(self, d): # res 6,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00b2(self, d): # res 6,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00b3(self, d): # res 6,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00b4(self, d): # res 6,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00b5(self, d): # res 6,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00b6(self, d): # res 6,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00b7(self, d): # res 6,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00b8(self, d): # res 7,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00b9(self, d): # res 7,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00ba(self, d): # res 7,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00bb(self, d): # res 7,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00bc(self, d): # res 7,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00bd(self, d): # res 7,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00be(self, d): # res 7,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00bf(self, d): # res 7,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00c0(self, d): # set 0,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00c1(self, d): # set 0,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00c2(self, d): # set 0,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00c3(self, d): # set 0,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00c4(self, d): # set 0,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00c5(self, d): # set 0,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00c6(self, d): # set 0,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00c7(self, d): # set 0,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00c8(self, d): # set 1,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00c9(self, d): # set 1,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00ca(self, d): # set 1,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00cb(self, d): # set 1,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00cc(self, d): # set 1,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00cd(self, d): # set 1,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00ce(self, d): # set 1,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00cf(self, d): # set 1,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00d0(self, d): # set 2,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00d1(self, d): # set 2,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00d2(self, d): # set 2,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00d3(self, d): # set 2,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00d4(self, d): # set 2,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00d5(self, d): # set 2,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00d6(self, d): # set 2,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00d7(self, d): # set 2,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00d8(self, d): # set 3,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00d9(self, d): # set 3,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00da(self, d): # set 3,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00db(self, d): # set 3,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00dc(self, d): # set 3,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00dd(self, d): # set 3,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00de(self, d): # set 3,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00df(self, d): # set 3,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00e0(self, d): # set 4,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00e1(self, d): # set 4,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00e2(self, d): # set 4,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00e3(self, d): # set 4,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00e4(self, d): # set 4,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00e5(self, d): # set 4,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00e6(self, d): # set 4,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00e7(self, d): # set 4,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00e8(self, d): # set 5,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00e9(self, d): # set 5,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00ea(self, d): # set 5,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00eb(self, d): # set 5,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00ec(self, d): # set 5,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00ed(self, d): # set 5,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00ee(self, d): # set 5,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00ef(self, d): # set 5,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00f0(self, d): # set 6,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00f1(self, d): # set 6,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00f2(self, d): # set 6,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00f3(self, d): # set 6,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00f4(self, d): # set 6,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00f5(self, d): # set 6,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00f6(self, d): # set 6,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00f7(self, d): # set 6,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ddcb00f8(self, d): # set 7,(ix+00),b
+        n = self.ix + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_ddcb00f9(self, d): # set 7,(ix+00),c
+        n = self.ix + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_ddcb00fa(self, d): # set 7,(ix+00),d
+        n = self.ix + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_ddcb00fb(self, d): # set 7,(ix+00),e
+        n = self.ix + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_ddcb00fc(self, d): # set 7,(ix+00),h
+        n = self.ix + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_ddcb00fd(self, d): # set 7,(ix+00),l
+        n = self.ix + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_ddcb00fe(self, d): # set 7,(ix+00)
+        n = self.ix + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        return 11
+    def _ins_ddcb00ff(self, d): # set 7,(ix+00),a
+        n = self.ix + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_ed40(self): # in b,(c)
+        val = self.io.rd(self._get_bc())
+        self.b = val
+        self.f = (self.f & _CF) | self.f_szp[val]
+        return 8
+    def _ins_ed41(self): # out (c),b
+        self.io.wr(self._get_bc(), self.b)
+        return 8
+    def _ins_ed42(self): # sbc hl,bc
+        s = self._get_bc()
+        d = self._get_hl()
+        res = d - s - (self.f & _CF)
+        self._sub16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_ed43(self): # ld (0000),bc
+        nn = self._get_nn()
+        self.mem[nn] = self.c
+        self.mem[nn + 1] = self.b
+        return 16
+    def _ins_ed44(self): # neg 
+        result = -self.a
+        self._sub_flags(result, self.a)
+        self.a = result & 0xff
+        return 4
+    def _ins_ed45(self): # retn 
+        self.pc = self._pop()
+        self.iff1 = self.iff2
+        return 10
+    def _ins_ed46(self): # im 0
+        self.im = 0
+        return 4
+    def _ins_ed47(self): # ld i,a
+        self.i = self.a
+        return 9
+    def _ins_ed48(self): # in c,(c)
+        val = self.io.rd(self._get_bc())
+        self.c = val
+        self.f = (self.f & _CF) | self.f_szp[val]
+        return 8
+    def _ins_ed49(self): # out (c),c
+        self.io.wr(self._get_bc(), self.c)
+        return 8
+    def _ins_ed4a(self): # adc hl,bc
+        s = self._get_bc()
+        d = self._get_hl()
+        res = d + s + (self.f & _CF)
+        self._adc16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_ed4b(self): # ld bc,(0000)
+        nn = self._get_nn()
+        self.b = self.mem[nn + 1]
+        self.c = self.mem[nn]
+        return 16
+    def _ins_ed4d(self): # reti 
+        self.pc = self._pop()
+        self.iff1 = self.iff2
+        return 10
+    def _ins_ed4f(self): # ld r,a
+        self.r = self.a
+        return 9
+    def _ins_ed50(self): # in d,(c)
+        val = self.io.rd(self._get_bc())
+        self.d = val
+        self.f = (self.f & _CF) | self.f_szp[val]
+        return 8
+    def _ins_ed51(self): # out (c),d
+        self.io.wr(self._get_bc(), self.d)
+        return 8
+    def _ins_ed52(self): # sbc hl,de
+        s = self._get_de()
+        d = self._get_hl()
+        res = d - s - (self.f & _CF)
+        self._sub16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_ed53(self): # ld (0000),de
+        nn = self._get_nn()
+        self.mem[nn] = self.e
+        self.mem[nn + 1] = self.d
+        return 16
+    def _ins_ed56(self): # im 1
+        self.im = 1
+        return 4
+    def _ins_ed57(self): # ld a,i
+        self.a = self.i
+        self.f = (self.f & _CF) | (self.f_sz[self.a]) | (self.iff2 << 2)
+        return 9
+    def _ins_ed58(self): # in e,(c)
+        val = self.io.rd(self._get_bc())
+        self.e = val
+        self.f = (self.f & _CF) | self.f_szp[val]
+        return 8
+    def _ins_ed59(self): # out (c),e
+        self.io.wr(self._get_bc(), self.e)
+        return 8
+    def _ins_ed5a(self): # adc hl,de
+        s = self._get_de()
+        d = self._get_hl()
+        res = d + s + (self.f & _CF)
+        self._adc16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_ed5b(self): # ld de,(0000)
+        nn = self._get_nn()
+        self.d = self.mem[nn + 1]
+        self.e = self.mem[nn]
+        return 16
+    def _ins_ed5e(self): # im 2
+        self.im = 2
+        return 4
+    def _ins_ed5f(self): # ld a,r
+        self.a = self.r
+        self.f = (self.f & _CF) | (self.f_sz[self.a]) | (self.iff2 << 2)
+        return 9
+    def _ins_ed60(self): # in h,(c)
+        val = self.io.rd(self._get_bc())
+        self.h = val
+        self.f = (self.f & _CF) | self.f_szp[val]
+        return 8
+    def _ins_ed61(self): # out (c),h
+        self.io.wr(self._get_bc(), self.h)
+        return 8
+    def _ins_ed62(self): # sbc hl,hl
+        s = self._get_hl()
+        d = self._get_hl()
+        res = d - s - (self.f & _CF)
+        self._sub16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_ed67(self): # rrd 
+        adr = self._get_hl()
+        n = self.mem[adr]
+        self.mem[adr] = ((n >> 4) | (self.a << 4)) & 0xff
+        self.a = (self.a & 0xf0) | (n & 0x0f)
+        self.f = (self.f & _CF) | self.f_szp[self.a]
+        return 14
+    def _ins_ed68(self): # in l,(c)
+        val = self.io.rd(self._get_bc())
+        self.l = val
+        self.f = (self.f & _CF) | self.f_szp[val]
+        return 8
+    def _ins_ed69(self): # out (c),l
+        self.io.wr(self._get_bc(), self.l)
+        return 8
+    def _ins_ed6a(self): # adc hl,hl
+        s = self._get_hl()
+        d = self._get_hl()
+        res = d + s + (self.f & _CF)
+        self._adc16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_ed6f(self): # rld 
+        adr = self._get_hl()
+        n = self.mem[adr]
+        self.mem[adr] = ((n << 4) | (self.a & 0x0f)) & 0xff
+        self.a = (self.a & 0xf0) | (n >> 4)
+        self.f = (self.f & _CF) | self.f_szp[self.a]
+        return 14
+    def _ins_ed70(self): # in (c)
+        val = self.io.rd(self._get_bc())
+        self.f = (self.f & _CF) | self.f_szp[val]
+        return 8
+    def _ins_ed71(self): # out (c)
+        self.io.wr(self._get_bc(), 0)
+        return 8
+    def _ins_ed72(self): # sbc hl,sp
+        s = self.sp
+        d = self._get_hl()
+        res = d - s - (self.f & _CF)
+        self._sub16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_ed73(self): # ld (0000),sp
+        nn = self._get_nn()
+        self.mem[nn] = self.sp & 0xff
+        self.mem[nn + 1] = self.sp >> 8
+        return 16
+    def _ins_ed78(self): # in a,(c)
+        val = self.io.rd(self._get_bc())
+        self.a = val
+        self.f = (self.f & _CF) | self.f_szp[val]
+        return 8
+    def _ins_ed79(self): # out (c),a
+        self.io.wr(self._get_bc(), self.a)
+        return 8
+    def _ins_ed7a(self): # adc hl,sp
+        s = self.sp
+        d = self._get_hl()
+        res = d + s + (self.f & _CF)
+        self._adc16_flags(res, d, s)
+        self._set_hl(res)
+        return 11
+    def _ins_ed7b(self): # ld sp,(0000)
+        nn = self._get_nn()
+        self.sp = self.mem[nn + 1] << 8
+        self.sp |= self.mem[nn]
+        return 16
+    def _ins_eda0(self): # ldi 
+        d = self._get_de()
+        s = self._get_hl()
+        n = self._get_bc() - 1
+        val = self.mem[s]
+        self.mem[d] = val
+        self.f &= (_SF | _ZF | _CF)
+        if (self.a + val) & 0x02:
+            self.f |= _YF
+        if (self.a + val) & 0x08:
+            self.f |= _XF
+        self._set_de(d + 1)
+        self._set_hl(s + 1)
+        self._set_bc(n)
+        if n:
+            self.f |= _VF
+        return 12
+    def _ins_eda1(self): # cpi 
+        s = self._get_hl()
+        n = self._get_bc() - 1
+        val = self.mem[s]
+        res = self.a - val
+        self.f = (self.f & _CF) | _NF
+        self.f |= (self.f_sz[res] & ~(_YF | _XF))
+        self.f |= ((self.a ^ val ^ res) & _HF)
+        if self.f & _HF:
+            res -= 1
+        if res & 0x02:
+            self.f |= _YF
+        if res & 0x08:
+            self.f |= _XF
+        self._set_hl(s + 1)
+        self._set_bc(n)
+        if n:
+            self.f |= _VF
+        return 12
+    def _ins_eda2(self): # ini 
+        val = self.io.rd(self._get_bc())
+        self.b = (self.b - 1) & 0xff
+        hl = self._get_hl()
+        self.mem[hl] = val
+        self._set_hl(hl + 1)
+        self._block_io_flags(val, ((self.c + 1) & 0xff) + val)
+        return 12
+    def _ins_eda3(self): # outi 
+        hl = self._get_hl()
+        val = self.mem[hl]
+        self.b = (self.b - 1) & 0xff
+        self.io.wr(self._get_bc(), val)
+        self._set_hl(hl + 1)
+        self._block_io_flags(val, self.l + val)
+        return 12
+    def _ins_eda8(self): # ldd 
+        d = self._get_de()
+        s = self._get_hl()
+        n = self._get_bc() - 1
+        val = self.mem[s]
+        self.mem[d] = val
+        self.f &= (_SF | _ZF | _CF)
+        if (self.a + val) & 0x02:
+            self.f |= _YF
+        if (self.a + val) & 0x08:
+            self.f |= _XF
+        self._set_de(d - 1)
+        self._set_hl(s - 1)
+        self._set_bc(n)
+        if n:
+            self.f |= _VF
+        return 12
+    def _ins_eda9(self): # cpd 
+        s = self._get_hl()
+        n = self._get_bc() - 1
+        val = self.mem[s]
+        res = self.a - val
+        self.f = (self.f & _CF) | _NF
+        self.f |= (self.f_sz[res] & ~(_YF | _XF))
+        self.f |= ((self.a ^ val ^ res) & _HF)
+        if self.f & _HF:
+            res -= 1
+        if res & 0x02:
+            self.f |= _YF
+        if res & 0x08:
+            self.f |= _XF
+        self._set_hl(s - 1)
+        self._set_bc(n)
+        if n:
+            self.f |= _VF
+        return 12
+    def _ins_edaa(self): # ind 
+        val = self.io.rd(self._get_bc())
+        self.b = (self.b - 1) & 0xff
+        hl = self._get_hl()
+        self.mem[hl] = val
+        self._set_hl(hl - 1)
+        self._block_io_flags(val, ((self.c - 1) & 0xff) + val)
+        return 12
+    def _ins_edab(self): # outd 
+        hl = self._get_hl()
+        val = self.mem[hl]
+        self.b = (self.b - 1) & 0xff
+        self.io.wr(self._get_bc(), val)
+        self._set_hl(hl - 1)
+        self._block_io_flags(val, self.l + val)
+        return 12
+    def _ins_edb0(self): # ldir 
+        d = self._get_de()
+        s = self._get_hl()
+        n = self._get_bc() - 1
+        val = self.mem[s]
+        self.mem[d] = val
+        self.f &= (_SF | _ZF | _CF)
+        if (self.a + val) & 0x02:
+            self.f |= _YF
+        if (self.a + val) & 0x08:
+            self.f |= _XF
+        self._set_de(d + 1)
+        self._set_hl(s + 1)
+        self._set_bc(n)
+        if n:
+            self.f |= _VF
+            self._dec_pc(2)
+            return 17
+        return 12
+    def _ins_edb1(self): # cpir 
+        s = self._get_hl()
+        n = self._get_bc() - 1
+        val = self.mem[s]
+        res = self.a - val
+        self.f = (self.f & _CF) | _NF
+        self.f |= (self.f_sz[res] & ~(_YF | _XF))
+        self.f |= ((self.a ^ val ^ res) & _HF)
+        if self.f & _HF:
+            res -= 1
+        if res & 0x02:
+            self.f |= _YF
+        if res & 0x08:
+            self.f |= _XF
+        self._set_hl(s + 1)
+        self._set_bc(n)
+        if n and (self.f & _ZF == 0):
+            self._dec_pc(2)
+            return 17
+        return 12
+    def _ins_edb2(self): # inir 
+        n = self._bulk_in(+1)
+        if n:
+            return n
+        val = self.io.rd(self._get_bc())
+        self.b = (self.b - 1) & 0xff
+        hl = self._get_hl()
+        self.mem[hl] = val
+        self._set_hl(hl + 1)
+        self._block_io_flags(val, ((self.c + 1) & 0xff) + val)
+        if self.b:
+            self._dec_pc(2)
+            return 17
+        return 12
+    def _ins_edb3(self): # otir 
+        n = self._bulk_out(+1)
+        if n:
+            return n
+        hl = self._get_hl()
+        val = self.mem[hl]
+        self.b = (self.b - 1) & 0xff
+        self.io.wr(self._get_bc(), val)
+        self._set_hl(hl + 1)
+        self._block_io_flags(val, self.l + val)
+        if self.b:
+            self._dec_pc(2)
+            return 17
+        return 12
+    def _ins_edb8(self): # lddr 
+        d = self._get_de()
+        s = self._get_hl()
+        n = self._get_bc() - 1
+        val = self.mem[s]
+        self.mem[d] = val
+        self.f &= (_SF | _ZF | _CF)
+        if (self.a + val) & 0x02:
+            self.f |= _YF
+        if (self.a + val) & 0x08:
+            self.f |= _XF
+        self._set_de(d - 1)
+        self._set_hl(s - 1)
+        self._set_bc(n)
+        if n:
+            self.f |= _VF
+            self._dec_pc(2)
+            return 17
+        return 12
+    def _ins_edb9(self): # cpdr 
+        s = self._get_hl()
+        n = self._get_bc() - 1
+        val = self.mem[s]
+        res = self.a - val
+        self.f = (self.f & _CF) | _NF
+        self.f |= (self.f_sz[res] & ~(_YF | _XF))
+        self.f |= ((self.a ^ val ^ res) & _HF)
+        if self.f & _HF:
+            res -= 1
+        if res & 0x02:
+            self.f |= _YF
+        if res & 0x08:
+            self.f |= _XF
+        self._set_hl(s - 1)
+        self._set_bc(n)
+        if n and (self.f & _ZF == 0):
+            self._dec_pc(2)
+            return 17
+        return 12
+    def _ins_edba(self): # indr 
+        n = self._bulk_in(-1)
+        if n:
+            return n
+        val = self.io.rd(self._get_bc())
+        self.b = (self.b - 1) & 0xff
+        hl = self._get_hl()
+        self.mem[hl] = val
+        self._set_hl(hl - 1)
+        self._block_io_flags(val, ((self.c - 1) & 0xff) + val)
+        if self.b:
+            self._dec_pc(2)
+            return 17
+        return 12
+    def _ins_edbb(self): # otdr 
+        n = self._bulk_out(-1)
+        if n:
+            return n
+        hl = self._get_hl()
+        val = self.mem[hl]
+        self.b = (self.b - 1) & 0xff
+        self.io.wr(self._get_bc(), val)
+        self._set_hl(hl - 1)
+        self._block_io_flags(val, self.l + val)
+        if self.b:
+            self._dec_pc(2)
+            return 17
+        return 12
+    def _ins_fd09(self): # add iy,bc
+        s = self._get_bc()
+        d = self.iy
+        res = d + s
+        self._add16_flags(res, d, s)
+        self.iy = res
+        return 11
+    def _ins_fd19(self): # add iy,de
+        s = self._get_de()
+        d = self.iy
+        res = d + s
+        self._add16_flags(res, d, s)
+        self.iy = res
+        return 11
+    def _ins_fd21(self): # ld iy,0000
+        self.iy = self._get_nn()
+        return 10
+    def _ins_fd22(self): # ld (0000),iy
+        nn = self._get_nn()
+        self.mem[nn] = self.iy & 0xff
+        self.mem[nn + 1] = self.iy >> 8
+        return 16
+    def _ins_fd23(self): # inc iy
+        self.iy = (self.iy + 1) & 0xffff
+        return 6
+    def _ins_fd24(self): # inc iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd25(self): # dec iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd26(self): # ld iyh,00
+        raise Error('unimplemented instruction')
+    def _ins_fd29(self): # add iy,iy
+        s = self.iy
+        d = self.iy
+        res = d + s
+        self._add16_flags(res, d, s)
+        self.iy = res
+        return 11
+    def _ins_fd2a(self): # ld iy,(0000)
+        nn = self._get_nn()
+        self.iy = self.mem[nn + 1] << 8
+        self.iy |= self.mem[nn]
+        return 16
+    def _ins_fd2b(self): # dec iy
+        self.iy = (self.iy - 1) & 0xffff
+        return 6
+    def _ins_fd2c(self): # inc iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd2d(self): # dec iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd2e(self): # ld iyl,00
+        raise Error('unimplemented instruction')
+    def _ins_fd34(self): # inc (iy+00)
+        adr = self.iy + _signed(self._get_n())
+        n = (self.mem[adr] + 1) & 0xff
+        self.mem[adr] = n
+        self.f = (self.f & _CF) | self.f_szhv_inc[n]
+        return 19
+    def _ins_fd35(self): # dec (iy+00)
+        adr = self.iy + _signed(self._get_n())
+        n = (self.mem[adr] - 1) & 0xff
+        self.mem[adr] = n
+        self.f = (self.f & _CF) | self.f_szhv_dec[n]
+        return 19
+    def _ins_fd36(self): # ld (iy+00),00
+        d = _signed(self._get_n())
+        self.mem[self.iy + d] = self._get_n()
+        return 15
+    def _ins_fd39(self): # add iy,sp
+        s = self.sp
+        d = self.iy
+        res = d + s
+        self._add16_flags(res, d, s)
+        self.iy = res
+        return 11
+    def _ins_fd44(self): # ld b,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd45(self): # ld b,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd46(self): # ld b,(iy+00)
+        d = _signed(self._get_n())
+        self.b = self.mem[self.iy + d]
+        return 15
+    def _ins_fd4c(self): # ld c,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd4d(self): # ld c,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd4e(self): # ld c,(iy+00)
+        d = _signed(self._get_n())
+        self.c = self.mem[self.iy + d]
+        return 15
+    def _ins_fd54(self): # ld d,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd55(self): # ld d,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd56(self): # ld d,(iy+00)
+        d = _signed(self._get_n())
+        self.d = self.mem[self.iy + d]
+        return 15
+    def _ins_fd5c(self): # ld e,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd5d(self): # ld e,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd5e(self): # ld e,(iy+00)
+        d = _signed(self._get_n())
+        self.e = self.mem[self.iy + d]
+        return 15
+    def _ins_fd60(self): # ld iyh,b
+        raise Error('unimplemented instruction')
+    def _ins_fd61(self): # ld iyh,c
+        raise Error('unimplemented instruction')
+    def _ins_fd62(self): # ld iyh,d
+        raise Error('unimplemented instruction')
+    def _ins_fd63(self): # ld iyh,e
+        raise Error('unimplemented instruction')
+    def _ins_fd64(self): # ld iyh,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd65(self): # ld iyh,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd66(self): # ld h,(iy+00)
+        d = _signed(self._get_n())
+        self.h = self.mem[self.iy + d]
+        return 15
+    def _ins_fd67(self): # ld iyh,a
+        raise Error('unimplemented instruction')
+    def _ins_fd68(self): # ld iyl,b
+        raise Error('unimplemented instruction')
+    def _ins_fd69(self): # ld iyl,c
+        raise Error('unimplemented instruction')
+    def _ins_fd6a(self): # ld iyl,d
+        raise Error('unimplemented instruction')
+    def _ins_fd6b(self): # ld iyl,e
+        raise Error('unimplemented instruction')
+    def _ins_fd6c(self): # ld iyl,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd6d(self): # ld iyl,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd6e(self): # ld l,(iy+00)
+        d = _signed(self._get_n())
+        self.l = self.mem[self.iy + d]
+        return 15
+    def _ins_fd6f(self): # ld iyl,a
+        raise Error('unimplemented instruction')
+    def _ins_fd70(self): # ld (iy+00),b
+        d = _signed(self._get_n())
+        self.mem[self.iy + d] = self.b
+        return 15
+    def _ins_fd71(self): # ld (iy+00),c
+        d = _signed(self._get_n())
+        self.mem[self.iy + d] = self.c
+        return 15
+    def _ins_fd72(self): # ld (iy+00),d
+        d = _signed(self._get_n())
+        self.mem[self.iy + d] = self.d
+        return 15
+    def _ins_fd73(self): # ld (iy+00),e
+        d = _signed(self._get_n())
+        self.mem[self.iy + d] = self.e
+        return 15
+    def _ins_fd74(self): # ld (iy+00),h
+        d = _signed(self._get_n())
+        self.mem[self.iy + d] = self.h
+        return 15
+    def _ins_fd75(self): # ld (iy+00),l
+        d = _signed(self._get_n())
+        self.mem[self.iy + d] = self.l
+        return 15
+    def _ins_fd77(self): # ld (iy+00),a
+        d = _signed(self._get_n())
+        self.mem[self.iy + d] = self.a
+        return 15
+    def _ins_fd7c(self): # ld a,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd7d(self): # ld a,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd7e(self): # ld a,(iy+00)
+        d = _signed(self._get_n())
+        self.a = self.mem[self.iy + d]
+        return 15
+    def _ins_fd84(self): # add a,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd85(self): # add a,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd86(self): # add a,(iy+00)
+        val = self.mem[self.iy + _signed(self._get_n())]
+        result = self.a + val
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 15
+    def _ins_fd8c(self): # adc a,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd8d(self): # adc a,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd8e(self): # adc a,(iy+00)
+        val = self.mem[self.iy + _signed(self._get_n())]
+        result = self.a + val + (self.f & _CF)
+        self._add_flags(result, val)
+        self.a = result & 0xff
+        return 15
+    def _ins_fd94(self): # sub iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd95(self): # sub iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd96(self): # sub (iy+00)
+        val = self.mem[self.iy + _signed(self._get_n())]
+        result = self.a - val
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 15
+    def _ins_fd9c(self): # sbc a,iyh
+        raise Error('unimplemented instruction')
+    def _ins_fd9d(self): # sbc a,iyl
+        raise Error('unimplemented instruction')
+    def _ins_fd9e(self): # sbc a,(iy+00)
+        val = self.mem[self.iy + _signed(self._get_n())]
+        result = self.a - val - (self.f & _CF)
+        self._sub_flags(result, val)
+        self.a = result & 0xff
+        return 15
+    def _ins_fda4(self): # and iyh
+        raise Error('unimplemented instruction')
+    def _ins_fda5(self): # and iyl
+        raise Error('unimplemented instruction')
+    def _ins_fda6(self): # and (iy+00)
+        val = self.mem[self.iy + _signed(self._get_n())]
+        self.a &= val
+        self.f = self.f_szp[self.a] | _HF
+        return 15
+    def _ins_fdac(self): # xor iyh
+        raise Error('unimplemented instruction')
+    def _ins_fdad(self): # xor iyl
+        raise Error('unimplemented instruction')
+    def _ins_fdae(self): # xor (iy+00)
+        val = self.mem[self.iy + _signed(self._get_n())]
+        self.a ^= val
+        self.f = self.f_szp[self.a]
+        return 15
+    def _ins_fdb4(self): # or iyh
+        raise Error('unimplemented instruction')
+    def _ins_fdb5(self): # or iyl
+        raise Error('unimplemented instruction')
+    def _ins_fdb6(self): # or (iy+00)
+        val = self.mem[self.iy + _signed(self._get_n())]
+        self.a |= val
+        self.f = self.f_szp[self.a]
+        return 15
+    def _ins_fdbc(self): # cp iyh
+        raise Error('unimplemented instruction')
+    def _ins_fdbd(self): # cp iyl
+        raise Error('unimplemented instruction')
+    def _ins_fdbe(self): # cp (iy+00)
+        val = self.mem[self.iy + _signed(self._get_n())]
+        result = self.a - val
+        self._sub_flags(result, val)
+        return 15
+    def _ins_fde1(self): # pop iy
+        self.iy = self._pop()
+        return 10
+    def _ins_fde3(self): # ex (sp),iy
+        tmp = self._peek(self.sp)
+        self._poke(self.sp, self.iy)
+        self.iy = tmp
+        return 19
+    def _ins_fde5(self): # push iy
+        self._push(self.iy)
+        return 11
+    def _ins_fde9(self): # jp iy
+        self.pc = self.iy
+        return 4
+    def _ins_fdf9(self): # ld sp,iy
+        raise Error('unimplemented instruction')
+    def _ins_fdcb0000(self, d): # rlc (iy+00),b
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0001(self, d): # rlc (iy+00),c
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0002(self, d): # rlc (iy+00),d
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0003(self, d): # rlc (iy+00),e
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0004(self, d): # rlc (iy+00),h
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0005(self, d): # rlc (iy+00),l
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0006(self, d): # rlc (iy+00)
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0007(self, d): # rlc (iy+00),a
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (res >> 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0008(self, d): # rrc (iy+00),b
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0009(self, d): # rrc (iy+00),c
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb000a(self, d): # rrc (iy+00),d
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb000b(self, d): # rrc (iy+00),e
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb000c(self, d): # rrc (iy+00),h
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb000d(self, d): # rrc (iy+00),l
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb000e(self, d): # rrc (iy+00)
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb000f(self, d): # rrc (iy+00),a
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0010(self, d): # rl (iy+00),b
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0011(self, d): # rl (iy+00),c
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0012(self, d): # rl (iy+00),d
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0013(self, d): # rl (iy+00),e
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0014(self, d): # rl (iy+00),h
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0015(self, d): # rl (iy+00),l
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0016(self, d): # rl (iy+00)
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0017(self, d): # rl (iy+00),a
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | (self.f & _CF)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0018(self, d): # rr (iy+00),b
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0019(self, d): # rr (iy+00),c
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb001a(self, d): # rr (iy+00),d
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb001b(self, d): # rr (iy+00),e
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb001c(self, d): # rr (iy+00),h
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb001d(self, d): # rr (iy+00),l
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb001e(self, d): # rr (iy+00)
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb001f(self, d): # rr (iy+00),a
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (self.f << 7)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0020(self, d): # sla (iy+00),b
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0021(self, d): # sla (iy+00),c
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0022(self, d): # sla (iy+00),d
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0023(self, d): # sla (iy+00),e
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0024(self, d): # sla (iy+00),h
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0025(self, d): # sla (iy+00),l
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0026(self, d): # sla (iy+00)
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0027(self, d): # sla (iy+00),a
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = (res << 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0028(self, d): # sra (iy+00),b
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0029(self, d): # sra (iy+00),c
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb002a(self, d): # sra (iy+00),d
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb002b(self, d): # sra (iy+00),e
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb002c(self, d): # sra (iy+00),h
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb002d(self, d): # sra (iy+00),l
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb002e(self, d): # sra (iy+00)
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb002f(self, d): # sra (iy+00),a
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = ((res >> 1) | (res & 0x80)) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0030(self, d): # sll (iy+00),b
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0031(self, d): # sll (iy+00),c
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0032(self, d): # sll (iy+00),d
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0033(self, d): # sll (iy+00),e
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0034(self, d): # sll (iy+00),h
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0035(self, d): # sll (iy+00),l
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0036(self, d): # sll (iy+00)
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0037(self, d): # sll (iy+00),a
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x80) != 0]
+        res = ((res << 1) | 0x01) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0038(self, d): # srl (iy+00),b
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.b = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0039(self, d): # srl (iy+00),c
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.c = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb003a(self, d): # srl (iy+00),d
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.d = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb003b(self, d): # srl (iy+00),e
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.e = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb003c(self, d): # srl (iy+00),h
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.h = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb003d(self, d): # srl (iy+00),l
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.l = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb003e(self, d): # srl (iy+00)
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb003f(self, d): # srl (iy+00),a
+        res = self.mem[self.iy + d]
+        cf = (0, _CF)[(res & 0x01) != 0]
+        res = (res >> 1) & 0xff
+        self.f = self.f_szp[res] | cf
+        self.a = res
+        self.mem[self.iy + d] = res
+        return 11
+    def _ins_fdcb0040(self, d): # bit 0,(iy+00)
+        bit = self.mem[self.iy + d] & (1 << 0)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_fdcb0048(self, d): # bit 1,(iy+00)
+        bit = self.mem[self.iy + d] & (1 << 1)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_fdcb0050(self, d): # bit 2,(iy+00)
+        bit = self.mem[self.iy + d] & (1 << 2)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_fdcb0058(self, d): # bit 3,(iy+00)
+        bit = self.mem[self.iy + d] & (1 << 3)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_fdcb0060(self, d): # bit 4,(iy+00)
+        bit = self.mem[self.iy + d] & (1 << 4)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_fdcb0068(self, d): # bit 5,(iy+00)
+        bit = self.mem[self.iy + d] & (1 << 5)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_fdcb0070(self, d): # bit 6,(iy+00)
+        bit = self.mem[self.iy + d] & (1 << 6)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_fdcb0078(self, d): # bit 7,(iy+00)
+        bit = self.mem[self.iy + d] & (1 << 7)
+        zf = (0, _ZF)[bit == 0]
+        self.f = (self.f & _CF) | _HF | zf
+        return 8
+    def _ins_fdcb0080(self, d): # res 0,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb0081(self, d): # res 0,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb0082(self, d): # res 0,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb0083(self, d): # res 0,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb0084(self, d): # res 0,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb0085(self, d): # res 0,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb0086(self, d): # res 0,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb0087(self, d): # res 0,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 0)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb0088(self, d): # res 1,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb0089(self, d): # res 1,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb008a(self, d): # res 1,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb008b(self, d): # res 1,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb008c(self, d): # res 1,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb008d(self, d): # res 1,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb008e(self, d): # res 1,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb008f(self, d): # res 1,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 1)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb0090(self, d): # res 2,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb0091(self, d): # res 2,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb0092(self, d): # res 2,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb0093(self, d): # res 2,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb0094(self, d): # res 2,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb0095(self, d): # res 2,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb0096(self, d): # res 2,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb0097(self, d): # res 2,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 2)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb0098(self, d): # res 3,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb0099(self, d): # res 3,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb009a(self, d): # res 3,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb009b(self, d): # res 3,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb009c(self, d): # res 3,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb009d(self, d): # res 3,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb009e(self, d): # res 3,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb009f(self, d): # res 3,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 3)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00a0(self, d): # res 4,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00a1(self, d): # res 4,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00a2(self, d): # res 4,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00a3(self, d): # res 4,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00a4(self, d): # res 4,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00a5(self, d): # res 4,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00a6(self, d): # res 4,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00a7(self, d): # res 4,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 4)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00a8(self, d): # res 5,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00a9(self, d): # res 5,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00aa(self, d): # res 5,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00ab(self, d): # res 5,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00ac(self, d): # res 5,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00ad(self, d): # res 5,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00ae(self, d): # res 5,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00af(self, d): # res 5,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 5)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00b0(self, d): # res 6,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00b1(self, d): # res 6,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00b2(self, d): # res 6,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00b3(self, d): # res 6,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00b4(self, d): # res 6,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00b5(self, d): # res 6,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00b6(self, d): # res 6,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00b7(self, d): # res 6,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 6)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00b8(self, d): # res 7,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00b9(self, d): # res 7,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00ba(self, d): # res 7,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00bb(self, d): # res 7,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00bc(self, d): # res 7,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00bd(self, d): # res 7,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00be(self, d): # res 7,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00bf(self, d): # res 7,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] & ~(1 << 7)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00c0(self, d): # set 0,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00c1(self, d): # set 0,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00c2(self, d): # set 0,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00c3(self, d): # set 0,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00c4(self, d): # set 0,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00c5(self, d): # set 0,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00c6(self, d): # set 0,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00c7(self, d): # set 0,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] | (1 << 0)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00c8(self, d): # set 1,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00c9(self, d): # set 1,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00ca(self, d): # set 1,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00cb(self, d): # set 1,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00cc(self, d): # set 1,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00cd(self, d): # set 1,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00ce(self, d): # set 1,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00cf(self, d): # set 1,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] | (1 << 1)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00d0(self, d): # set 2,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00d1(self, d): # set 2,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00d2(self, d): # set 2,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00d3(self, d): # set 2,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00d4(self, d): # set 2,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00d5(self, d): # set 2,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00d6(self, d): # set 2,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00d7(self, d): # set 2,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] | (1 << 2)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00d8(self, d): # set 3,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00d9(self, d): # set 3,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00da(self, d): # set 3,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00db(self, d): # set 3,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00dc(self, d): # set 3,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00dd(self, d): # set 3,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00de(self, d): # set 3,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00df(self, d): # set 3,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] | (1 << 3)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00e0(self, d): # set 4,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00e1(self, d): # set 4,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00e2(self, d): # set 4,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00e3(self, d): # set 4,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00e4(self, d): # set 4,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00e5(self, d): # set 4,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00e6(self, d): # set 4,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00e7(self, d): # set 4,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] | (1 << 4)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00e8(self, d): # set 5,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00e9(self, d): # set 5,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00ea(self, d): # set 5,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00eb(self, d): # set 5,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00ec(self, d): # set 5,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00ed(self, d): # set 5,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00ee(self, d): # set 5,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00ef(self, d): # set 5,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] | (1 << 5)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00f0(self, d): # set 6,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00f1(self, d): # set 6,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00f2(self, d): # set 6,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00f3(self, d): # set 6,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00f4(self, d): # set 6,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00f5(self, d): # set 6,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00f6(self, d): # set 6,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00f7(self, d): # set 6,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] | (1 << 6)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    def _ins_fdcb00f8(self, d): # set 7,(iy+00),b
+        n = self.iy + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.b = val
+        return 11
+    def _ins_fdcb00f9(self, d): # set 7,(iy+00),c
+        n = self.iy + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.c = val
+        return 11
+    def _ins_fdcb00fa(self, d): # set 7,(iy+00),d
+        n = self.iy + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.d = val
+        return 11
+    def _ins_fdcb00fb(self, d): # set 7,(iy+00),e
+        n = self.iy + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.e = val
+        return 11
+    def _ins_fdcb00fc(self, d): # set 7,(iy+00),h
+        n = self.iy + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.h = val
+        return 11
+    def _ins_fdcb00fd(self, d): # set 7,(iy+00),l
+        n = self.iy + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.l = val
+        return 11
+    def _ins_fdcb00fe(self, d): # set 7,(iy+00)
+        n = self.iy + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        return 11
+    def _ins_fdcb00ff(self, d): # set 7,(iy+00),a
+        n = self.iy + d
+        val = self.mem[n] | (1 << 7)
+        self.mem[n] = val
+        self.a = val
+        return 11
+    opcodes = (
+        _ins_00,                    # 0x00 nop 
+        _ins_01,                    # 0x01 ld bc,0000
+        _ins_02,                    # 0x02 ld (bc),a
+        _ins_03,                    # 0x03 inc bc
+        _ins_04,                    # 0x04 inc b
+        _ins_05,                    # 0x05 dec b
+        _ins_06,                    # 0x06 ld b,00
+        _ins_07,                    # 0x07 rlca 
+        _ins_08,                    # 0x08 ex af,af'
+        _ins_09,                    # 0x09 add hl,bc
+        _ins_0a,                    # 0x0a ld a,(bc)
+        _ins_0b,                    # 0x0b dec bc
+        _ins_0c,                    # 0x0c inc c
+        _ins_0d,                    # 0x0d dec c
+        _ins_0e,                    # 0x0e ld c,00
+        _ins_0f,                    # 0x0f rrca 
+        _ins_10,                    # 0x10 djnz 0002
+        _ins_11,                    # 0x11 ld de,0000
+        _ins_12,                    # 0x12 ld (de),a
+        _ins_13,                    # 0x13 inc de
+        _ins_14,                    # 0x14 inc d
+        _ins_15,                    # 0x15 dec d
+        _ins_16,                    # 0x16 ld d,00
+        _ins_17,                    # 0x17 rla 
+        _ins_18,                    # 0x18 jr 0002
+        _ins_19,                    # 0x19 add hl,de
+        _ins_1a,                    # 0x1a ld a,(de)
+        _ins_1b,                    # 0x1b dec de
+        _ins_1c,                    # 0x1c inc e
+        _ins_1d,                    # 0x1d dec e
+        _ins_1e,                    # 0x1e ld e,00
+        _ins_1f,                    # 0x1f rra 
+        _ins_20,                    # 0x20 jr nz,0002
+        _ins_21,                    # 0x21 ld hl,0000
+        _ins_22,                    # 0x22 ld (0000),hl
+        _ins_23,                    # 0x23 inc hl
+        _ins_24,                    # 0x24 inc h
+        _ins_25,                    # 0x25 dec h
+        _ins_26,                    # 0x26 ld h,00
+        _ins_27,                    # 0x27 daa 
+        _ins_28,                    # 0x28 jr z,0002
+        _ins_29,                    # 0x29 add hl,hl
+        _ins_2a,                    # 0x2a ld hl,(0000)
+        _ins_2b,                    # 0x2b dec hl
+        _ins_2c,                    # 0x2c inc l
+        _ins_2d,                    # 0x2d dec l
+        _ins_2e,                    # 0x2e ld l,00
+        _ins_2f,                    # 0x2f cpl 
+        _ins_30,                    # 0x30 jr nc,0002
+        _ins_31,                    # 0x31 ld sp,0000
+        _ins_32,                    # 0x32 ld (0000),a
+        _ins_33,                    # 0x33 inc sp
+        _ins_34,                    # 0x34 inc (hl)
+        _ins_35,                    # 0x35 dec (hl)
+        _ins_36,                    # 0x36 ld (hl),00
+        _ins_37,                    # 0x37 scf 
+        _ins_38,                    # 0x38 jr c,0002
+        _ins_39,                    # 0x39 add hl,sp
+        _ins_3a,                    # 0x3a ld a,(0000)
+        _ins_3b,                    # 0x3b dec sp
+        _ins_3c,                    # 0x3c inc a
+        _ins_3d,                    # 0x3d dec a
+        _ins_3e,                    # 0x3e ld a,00
+        _ins_3f,                    # 0x3f ccf 
+        _ins_40,                    # 0x40 ld b,b
+        _ins_41,                    # 0x41 ld b,c
+        _ins_42,                    # 0x42 ld b,d
+        _ins_43,                    # 0x43 ld b,e
+        _ins_44,                    # 0x44 ld b,h
+        _ins_45,                    # 0x45 ld b,l
+        _ins_46,                    # 0x46 ld b,(hl)
+        _ins_47,                    # 0x47 ld b,a
+        _ins_48,                    # 0x48 ld c,b
+        _ins_49,                    # 0x49 ld c,c
+        _ins_4a,                    # 0x4a ld c,d
+        _ins_4b,                    # 0x4b ld c,e
+        _ins_4c,                    # 0x4c ld c,h
+        _ins_4d,                    # 0x4d ld c,l
+        _ins_4e,                    # 0x4e ld c,(hl)
+        _ins_4f,                    # 0x4f ld c,a
+        _ins_50,                    # 0x50 ld d,b
+        _ins_51,                    # 0x51 ld d,c
+        _ins_52,                    # 0x52 ld d,d
+        _ins_53,                    # 0x53 ld d,e
+        _ins_54,                    # 0x54 ld d,h
+        _ins_55,                    # 0x55 ld d,l
+        _ins_56,                    # 0x56 ld d,(hl)
+        _ins_57,                    # 0x57 ld d,a
+        _ins_58,                    # 0x58 ld e,b
+        _ins_59,                    # 0x59 ld e,c
+        _ins_5a,                    # 0x5a ld e,d
+        _ins_5b,                    # 0x5b ld e,e
+        _ins_5c,                    # 0x5c ld e,h
+        _ins_5d,                    # 0x5d ld e,l
+        _ins_5e,                    # 0x5e ld e,(hl)
+        _ins_5f,                    # 0x5f ld e,a
+        _ins_60,                    # 0x60 ld h,b
+        _ins_61,                    # 0x61 ld h,c
+        _ins_62,                    # 0x62 ld h,d
+        _ins_63,                    # 0x63 ld h,e
+        _ins_64,                    # 0x64 ld h,h
+        _ins_65,                    # 0x65 ld h,l
+        _ins_66,                    # 0x66 ld h,(hl)
+        _ins_67,                    # 0x67 ld h,a
+        _ins_68,                    # 0x68 ld l,b
+        _ins_69,                    # 0x69 ld l,c
+        _ins_6a,                    # 0x6a ld l,d
+        _ins_6b,                    # 0x6b ld l,e
+        _ins_6c,                    # 0x6c ld l,h
+        _ins_6d,                    # 0x6d ld l,l
+        _ins_6e,                    # 0x6e ld l,(hl)
+        _ins_6f,                    # 0x6f ld l,a
+        _ins_70,                    # 0x70 ld (hl),b
+        _ins_71,                    # 0x71 ld (hl),c
+        _ins_72,                    # 0x72 ld (hl),d
+        _ins_73,                    # 0x73 ld (hl),e
+        _ins_74,                    # 0x74 ld (hl),h
+        _ins_75,                    # 0x75 ld (hl),l
+        _ins_76,                    # 0x76 halt 
+        _ins_77,                    # 0x77 ld (hl),a
+        _ins_78,                    # 0x78 ld a,b
+        _ins_79,                    # 0x79 ld a,c
+        _ins_7a,                    # 0x7a ld a,d
+        _ins_7b,                    # 0x7b ld a,e
+        _ins_7c,                    # 0x7c ld a,h
+        _ins_7d,                    # 0x7d ld a,l
+        _ins_7e,                    # 0x7e ld a,(hl)
+        _ins_7f,                    # 0x7f ld a,a
+        _ins_80,                    # 0x80 add a,b
+        _ins_81,                    # 0x81 add a,c
+        _ins_82,                    # 0x82 add a,d
+        _ins_83,                    # 0x83 add a,e
+        _ins_84,                    # 0x84 add a,h
+        _ins_85,                    # 0x85 add a,l
+        _ins_86,                    # 0x86 add a,(hl)
+        _ins_87,                    # 0x87 add a,a
+        _ins_88,                    # 0x88 adc a,b
+        _ins_89,                    # 0x89 adc a,c
+        _ins_8a,                    # 0x8a adc a,d
+        _ins_8b,                    # 0x8b adc a,e
+        _ins_8c,                    # 0x8c adc a,h
+        _ins_8d,                    # 0x8d adc a,l
+        _ins_8e,                    # 0x8e adc a,(hl)
+        _ins_8f,                    # 0x8f adc a,a
+        _ins_90,                    # 0x90 sub b
+        _ins_91,                    # 0x91 sub c
+        _ins_92,                    # 0x92 sub d
+        _ins_93,                    # 0x93 sub e
+        _ins_94,                    # 0x94 sub h
+        _ins_95,                    # 0x95 sub l
+        _ins_96,                    # 0x96 sub (hl)
+        _ins_97,                    # 0x97 sub a
+        _ins_98,                    # 0x98 sbc a,b
+        _ins_99,                    # 0x99 sbc a,c
+        _ins_9a,                    # 0x9a sbc a,d
+        _ins_9b,                    # 0x9b sbc a,e
+        _ins_9c,                    # 0x9c sbc a,h
+        _ins_9d,                    # 0x9d sbc a,l
+        _ins_9e,                    # 0x9e sbc a,(hl)
+        _ins_9f,                    # 0x9f sbc a,a
+        _ins_a0,                    # 0xa0 and b
+        _ins_a1,                    # 0xa1 and c
+        _ins_a2,                    # 0xa2 and d
+        _ins_a3,                    # 0xa3 and e
+        _ins_a4,                    # 0xa4 and h
+        _ins_a5,                    # 0xa5 and l
+        _ins_a6,                    # 0xa6 and (hl)
+        _ins_a7,                    # 0xa7 and a
+        _ins_a8,                    # 0xa8 xor b
+        _ins_a9,                    # 0xa9 xor c
+        _ins_aa,                    # 0xaa xor d
+        _ins_ab,                    # 0xab xor e
+        _ins_ac,                    # 0xac xor h
+        _ins_ad,                    # 0xad xor l
+        _ins_ae,                    # 0xae xor (hl)
+        _ins_af,                    # 0xaf xor a
+        _ins_b0,                    # 0xb0 or b
+        _ins_b1,                    # 0xb1 or c
+        _ins_b2,                    # 0xb2 or d
+        _ins_b3,                    # 0xb3 or e
+        _ins_b4,                    # 0xb4 or h
+        _ins_b5,                    # 0xb5 or l
+        _ins_b6,                    # 0xb6 or (hl)
+        _ins_b7,                    # 0xb7 or a
+        _ins_b8,                    # 0xb8 cp b
+        _ins_b9,                    # 0xb9 cp c
+        _ins_ba,                    # 0xba cp d
+        _ins_bb,                    # 0xbb cp e
+        _ins_bc,                    # 0xbc cp h
+        _ins_bd,                    # 0xbd cp l
+        _ins_be,                    # 0xbe cp (hl)
+        _ins_bf,                    # 0xbf cp a
+        _ins_c0,                    # 0xc0 ret nz
+        _ins_c1,                    # 0xc1 pop bc
+        _ins_c2,                    # 0xc2 jp nz,0000
+        _ins_c3,                    # 0xc3 jp 0000
+        _ins_c4,                    # 0xc4 call nz,0000
+        _ins_c5,                    # 0xc5 push bc
+        _ins_c6,                    # 0xc6 add a,00
+        _ins_c7,                    # 0xc7 rst 00
+        _ins_c8,                    # 0xc8 ret z
+        _ins_c9,                    # 0xc9 ret 
+        _ins_ca,                    # 0xca jp z,0000
+        _execute_cb,                # 0xcb execute cb prefix
+        _ins_cc,                    # 0xcc call z,0000
+        _ins_cd,                    # 0xcd call 0000
+        _ins_ce,                    # 0xce adc a,00
+        _ins_cf,                    # 0xcf rst 08
+        _ins_d0,                    # 0xd0 ret nc
+        _ins_d1,                    # 0xd1 pop de
+        _ins_d2,                    # 0xd2 jp nc,0000
+        _ins_d3,                    # 0xd3 out (00),a
+        _ins_d4,                    # 0xd4 call nc,0000
+        _ins_d5,                    # 0xd5 push de
+        _ins_d6,                    # 0xd6 sub 00
+        _ins_d7,                    # 0xd7 rst 10
+        _ins_d8,                    # 0xd8 ret c
+        _ins_d9,                    # 0xd9 exx 
+        _ins_da,                    # 0xda jp c,0000
+        _ins_db,                    # 0xdb in a,(00)
+        _ins_dc,                    # 0xdc call c,0000
+        _execute_dd,                # 0xdd execute dd prefix
+        _ins_de,                    # 0xde sbc a,00
+        _ins_df,                    # 0xdf rst 18
+        _ins_e0,                    # 0xe0 ret po
+        _ins_e1,                    # 0xe1 pop hl
+        _ins_e2,                    # 0xe2 jp po,0000
+        _ins_e3,                    # 0xe3 ex (sp),hl
+        _ins_e4,                    # 0xe4 call po,0000
+        _ins_e5,                    # 0xe5 push hl
+        _ins_e6,                    # 0xe6 and 00
+        _ins_e7,                    # 0xe7 rst 20
+        _ins_e8,                    # 0xe8 ret pe
+        _ins_e9,                    # 0xe9 jp hl
+        _ins_ea,                    # 0xea jp pe,0000
+        _ins_eb,                    # 0xeb ex de,hl
+        _ins_ec,                    # 0xec call pe,0000
+        _execute_ed,                # 0xed execute ed prefix
+        _ins_ee,                    # 0xee xor 00
+        _ins_ef,                    # 0xef rst 28
+        _ins_f0,                    # 0xf0 ret p
+        _ins_f1,                    # 0xf1 pop af
+        _ins_f2,                    # 0xf2 jp p,0000
+        _ins_f3,                    # 0xf3 di 
+        _ins_f4,                    # 0xf4 call p,0000
+        _ins_f5,                    # 0xf5 push af
+        _ins_f6,                    # 0xf6 or 00
+        _ins_f7,                    # 0xf7 rst 30
+        _ins_f8,                    # 0xf8 ret m
+        _ins_f9,                    # 0xf9 ld sp,hl
+        _ins_fa,                    # 0xfa jp m,0000
+        _ins_fb,                    # 0xfb ei 
+        _ins_fc,                    # 0xfc call m,0000
+        _execute_fd,                # 0xfd execute fd prefix
+        _ins_fe,                    # 0xfe cp 00
+        _ins_ff,                    # 0xff rst 38
+    )
+    opcodes_cb = (
+        _ins_cb00,                  # 0x00 rlc b
+        _ins_cb01,                  # 0x01 rlc c
+        _ins_cb02,                  # 0x02 rlc d
+        _ins_cb03,                  # 0x03 rlc e
+        _ins_cb04,                  # 0x04 rlc h
+        _ins_cb05,                  # 0x05 rlc l
+        _ins_cb06,                  # 0x06 rlc (hl)
+        _ins_cb07,                  # 0x07 rlc a
+        _ins_cb08,                  # 0x08 rrc b
+        _ins_cb09,                  # 0x09 rrc c
+        _ins_cb0a,                  # 0x0a rrc d
+        _ins_cb0b,                  # 0x0b rrc e
+        _ins_cb0c,                  # 0x0c rrc h
+        _ins_cb0d,                  # 0x0d rrc l
+        _ins_cb0e,                  # 0x0e rrc (hl)
+        _ins_cb0f,                  # 0x0f rrc a
+        _ins_cb10,                  # 0x10 rl b
+        _ins_cb11,                  # 0x11 rl c
+        _ins_cb12,                  # 0x12 rl d
+        _ins_cb13,                  # 0x13 rl e
+        _ins_cb14,                  # 0x14 rl h
+        _ins_cb15,                  # 0x15 rl l
+        _ins_cb16,                  # 0x16 rl (hl)
+        _ins_cb17,                  # 0x17 rl a
+        _ins_cb18,                  # 0x18 rr b
+        _ins_cb19,                  # 0x19 rr c
+        _ins_cb1a,                  # 0x1a rr d
+        _ins_cb1b,                  # 0x1b rr e
+        _ins_cb1c,                  # 0x1c rr h
+        _ins_cb1d,                  # 0x1d rr l
+        _ins_cb1e,                  # 0x1e rr (hl)
+        _ins_cb1f,                  # 0x1f rr a
+        _ins_cb20,                  # 0x20 sla b
+        _ins_cb21,                  # 0x21 sla c
+        _ins_cb22,                  # 0x22 sla d
+        _ins_cb23,                  # 0x23 sla e
+        _ins_cb24,                  # 0x24 sla h
+        _ins_cb25,                  # 0x25 sla l
+        _ins_cb26,                  # 0x26 sla (hl)
+        _ins_cb27,                  # 0x27 sla a
+        _ins_cb28,                  # 0x28 sra b
+        _ins_cb29,                  # 0x29 sra c
+        _ins_cb2a,                  # 0x2a sra d
+        _ins_cb2b,                  # 0x2b sra e
+        _ins_cb2c,                  # 0x2c sra h
+        _ins_cb2d,                  # 0x2d sra l
+        _ins_cb2e,                  # 0x2e sra (hl)
+        _ins_cb2f,                  # 0x2f sra a
+        _ins_cb30,                  # 0x30 sll b
+        _ins_cb31,                  # 0x31 sll c
+        _ins_cb32,                  # 0x32 sll d
+        _ins_cb33,                  # 0x33 sll e
+        _ins_cb34,                  # 0x34 sll h
+        _ins_cb35,                  # 0x35 sll l
+        _ins_cb36,                  # 0x36 sll (hl)
+        _ins_cb37,                  # 0x37 sll a
+        _ins_cb38,                  # 0x38 srl b
+        _ins_cb39,                  # 0x39 srl c
+        _ins_cb3a,                  # 0x3a srl d
+        _ins_cb3b,                  # 0x3b srl e
+        _ins_cb3c,                  # 0x3c srl h
+        _ins_cb3d,                  # 0x3d srl l
+        _ins_cb3e,                  # 0x3e srl (hl)
+        _ins_cb3f,                  # 0x3f srl a
+        _ins_cb40,                  # 0x40 bit 0,b
+        _ins_cb41,                  # 0x41 bit 0,c
+        _ins_cb42,                  # 0x42 bit 0,d
+        _ins_cb43,                  # 0x43 bit 0,e
+        _ins_cb44,                  # 0x44 bit 0,h
+        _ins_cb45,                  # 0x45 bit 0,l
+        _ins_cb46,                  # 0x46 bit 0,(hl)
+        _ins_cb47,                  # 0x47 bit 0,a
+        _ins_cb48,                  # 0x48 bit 1,b
+        _ins_cb49,                  # 0x49 bit 1,c
+        _ins_cb4a,                  # 0x4a bit 1,d
+        _ins_cb4b,                  # 0x4b bit 1,e
+        _ins_cb4c,                  # 0x4c bit 1,h
+        _ins_cb4d,                  # 0x4d bit 1,l
+        _ins_cb4e,                  # 0x4e bit 1,(hl)
+        _ins_cb4f,                  # 0x4f bit 1,a
+        _ins_cb50,                  # 0x50 bit 2,b
+        _ins_cb51,                  # 0x51 bit 2,c
+        _ins_cb52,                  # 0x52 bit 2,d
+        _ins_cb53,                  # 0x53 bit 2,e
+        _ins_cb54,                  # 0x54 bit 2,h
+        _ins_cb55,                  # 0x55 bit 2,l
+        _ins_cb56,                  # 0x56 bit 2,(hl)
+        _ins_cb57,                  # 0x57 bit 2,a
+        _ins_cb58,                  # 0x58 bit 3,b
+        _ins_cb59,                  # 0x59 bit 3,c
+        _ins_cb5a,                  # 0x5a bit 3,d
+        _ins_cb5b,                  # 0x5b bit 3,e
+        _ins_cb5c,                  # 0x5c bit 3,h
+        _ins_cb5d,                  # 0x5d bit 3,l
+        _ins_cb5e,                  # 0x5e bit 3,(hl)
+        _ins_cb5f,                  # 0x5f bit 3,a
+        _ins_cb60,                  # 0x60 bit 4,b
+        _ins_cb61,                  # 0x61 bit 4,c
+        _ins_cb62,                  # 0x62 bit 4,d
+        _ins_cb63,                  # 0x63 bit 4,e
+        _ins_cb64,                  # 0x64 bit 4,h
+        _ins_cb65,                  # 0x65 bit 4,l
+        _ins_cb66,                  # 0x66 bit 4,(hl)
+        _ins_cb67,                  # 0x67 bit 4,a
+        _ins_cb68,                  # 0x68 bit 5,b
+        _ins_cb69,                  # 0x69 bit 5,c
+        _ins_cb6a,                  # 0x6a bit 5,d
+        _ins_cb6b,                  # 0x6b bit 5,e
+        _ins_cb6c,                  # 0x6c bit 5,h
+        _ins_cb6d,                  # 0x6d bit 5,l
+        _ins_cb6e,                  # 0x6e bit 5,(hl)
+        _ins_cb6f,                  # 0x6f bit 5,a
+        _ins_cb70,                  # 0x70 bit 6,b
+        _ins_cb71,                  # 0x71 bit 6,c
+        _ins_cb72,                  # 0x72 bit 6,d
+        _ins_cb73,                  # 0x73 bit 6,e
+        _ins_cb74,                  # 0x74 bit 6,h
+        _ins_cb75,                  # 0x75 bit 6,l
+        _ins_cb76,                  # 0x76 bit 6,(hl)
+        _ins_cb77,                  # 0x77 bit 6,a
+        _ins_cb78,                  # 0x78 bit 7,b
+        _ins_cb79,                  # 0x79 bit 7,c
+        _ins_cb7a,                  # 0x7a bit 7,d
+        _ins_cb7b,                  # 0x7b bit 7,e
+        _ins_cb7c,                  # 0x7c bit 7,h
+        _ins_cb7d,                  # 0x7d bit 7,l
+        _ins_cb7e,                  # 0x7e bit 7,(hl)
+        _ins_cb7f,                  # 0x7f bit 7,a
+        _ins_cb80,                  # 0x80 res 0,b
+        _ins_cb81,                  # 0x81 res 0,c
+        _ins_cb82,                  # 0x82 res 0,d
+        _ins_cb83,                  # 0x83 res 0,e
+        _ins_cb84,                  # 0x84 res 0,h
+        _ins_cb85,                  # 0x85 res 0,l
+        _ins_cb86,                  # 0x86 res 0,(hl)
+        _ins_cb87,                  # 0x87 res 0,a
+        _ins_cb88,                  # 0x88 res 1,b
+        _ins_cb89,                  # 0x89 res 1,c
+        _ins_cb8a,                  # 0x8a res 1,d
+        _ins_cb8b,                  # 0x8b res 1,e
+        _ins_cb8c,                  # 0x8c res 1,h
+        _ins_cb8d,                  # 0x8d res 1,l
+        _ins_cb8e,                  # 0x8e res 1,(hl)
+        _ins_cb8f,                  # 0x8f res 1,a
+        _ins_cb90,                  # 0x90 res 2,b
+        _ins_cb91,                  # 0x91 res 2,c
+        _ins_cb92,                  # 0x92 res 2,d
+        _ins_cb93,                  # 0x93 res 2,e
+        _ins_cb94,                  # 0x94 res 2,h
+        _ins_cb95,                  # 0x95 res 2,l
+        _ins_cb96,                  # 0x96 res 2,(hl)
+        _ins_cb97,                  # 0x97 res 2,a
+        _ins_cb98,                  # 0x98 res 3,b
+        _ins_cb99,                  # 0x99 res 3,c
+        _ins_cb9a,                  # 0x9a res 3,d
+        _ins_cb9b,                  # 0x9b res 3,e
+        _ins_cb9c,                  # 0x9c res 3,h
+        _ins_cb9d,                  # 0x9d res 3,l
+        _ins_cb9e,                  # 0x9e res 3,(hl)
+        _ins_cb9f,                  # 0x9f res 3,a
+        _ins_cba0,                  # 0xa0 res 4,b
+        _ins_cba1,                  # 0xa1 res 4,c
+        _ins_cba2,                  # 0xa2 res 4,d
+        _ins_cba3,                  # 0xa3 res 4,e
+        _ins_cba4,                  # 0xa4 res 4,h
+        _ins_cba5,                  # 0xa5 res 4,l
+        _ins_cba6,                  # 0xa6 res 4,(hl)
+        _ins_cba7,                  # 0xa7 res 4,a
+        _ins_cba8,                  # 0xa8 res 5,b
+        _ins_cba9,                  # 0xa9 res 5,c
+        _ins_cbaa,                  # 0xaa res 5,d
+        _ins_cbab,                  # 0xab res 5,e
+        _ins_cbac,                  # 0xac res 5,h
+        _ins_cbad,                  # 0xad res 5,l
+        _ins_cbae,                  # 0xae res 5,(hl)
+        _ins_cbaf,                  # 0xaf res 5,a
+        _ins_cbb0,                  # 0xb0 res 6,b
+        _ins_cbb1,                  # 0xb1 res 6,c
+        _ins_cbb2,                  # 0xb2 res 6,d
+        _ins_cbb3,                  # 0xb3 res 6,e
+        _ins_cbb4,                  # 0xb4 res 6,h
+        _ins_cbb5,                  # 0xb5 res 6,l
+        _ins_cbb6,                  # 0xb6 res 6,(hl)
+        _ins_cbb7,                  # 0xb7 res 6,a
+        _ins_cbb8,                  # 0xb8 res 7,b
+        _ins_cbb9,                  # 0xb9 res 7,c
+        _ins_cbba,                  # 0xba res 7,d
+        _ins_cbbb,                  # 0xbb res 7,e
+        _ins_cbbc,                  # 0xbc res 7,h
+        _ins_cbbd,                  # 0xbd res 7,l
+        _ins_cbbe,                  # 0xbe res 7,(hl)
+        _ins_cbbf,                  # 0xbf res 7,a
+        _ins_cbc0,                  # 0xc0 set 0,b
+        _ins_cbc1,                  # 0xc1 set 0,c
+        _ins_cbc2,                  # 0xc2 set 0,d
+        _ins_cbc3,                  # 0xc3 set 0,e
+        _ins_cbc4,                  # 0xc4 set 0,h
+        _ins_cbc5,                  # 0xc5 set 0,l
+        _ins_cbc6,                  # 0xc6 set 0,(hl)
+        _ins_cbc7,                  # 0xc7 set 0,a
+        _ins_cbc8,                  # 0xc8 set 1,b
+        _ins_cbc9,                  # 0xc9 set 1,c
+        _ins_cbca,                  # 0xca set 1,d
+        _ins_cbcb,                  # 0xcb set 1,e
+        _ins_cbcc,                  # 0xcc set 1,h
+        _ins_cbcd,                  # 0xcd set 1,l
+        _ins_cbce,                  # 0xce set 1,(hl)
+        _ins_cbcf,                  # 0xcf set 1,a
+        _ins_cbd0,                  # 0xd0 set 2,b
+        _ins_cbd1,                  # 0xd1 set 2,c
+        _ins_cbd2,                  # 0xd2 set 2,d
+        _ins_cbd3,                  # 0xd3 set 2,e
+        _ins_cbd4,                  # 0xd4 set 2,h
+        _ins_cbd5,                  # 0xd5 set 2,l
+        _ins_cbd6,                  # 0xd6 set 2,(hl)
+        _ins_cbd7,                  # 0xd7 set 2,a
+        _ins_cbd8,                  # 0xd8 set 3,b
+        _ins_cbd9,                  # 0xd9 set 3,c
+        _ins_cbda,                  # 0xda set 3,d
+        _ins_cbdb,                  # 0xdb set 3,e
+        _ins_cbdc,                  # 0xdc set 3,h
+        _ins_cbdd,                  # 0xdd set 3,l
+        _ins_cbde,                  # 0xde set 3,(hl)
+        _ins_cbdf,                  # 0xdf set 3,a
+        _ins_cbe0,                  # 0xe0 set 4,b
+        _ins_cbe1,                  # 0xe1 set 4,c
+        _ins_cbe2,                  # 0xe2 set 4,d
+        _ins_cbe3,                  # 0xe3 set 4,e
+        _ins_cbe4,                  # 0xe4 set 4,h
+        _ins_cbe5,                  # 0xe5 set 4,l
+        _ins_cbe6,                  # 0xe6 set 4,(hl)
+        _ins_cbe7,                  # 0xe7 set 4,a
+        _ins_cbe8,                  # 0xe8 set 5,b
+        _ins_cbe9,                  # 0xe9 set 5,c
+        _ins_cbea,                  # 0xea set 5,d
+        _ins_cbeb,                  # 0xeb set 5,e
+        _ins_cbec,                  # 0xec set 5,h
+        _ins_cbed,                  # 0xed set 5,l
+        _ins_cbee,                  # 0xee set 5,(hl)
+        _ins_cbef,                  # 0xef set 5,a
+        _ins_cbf0,                  # 0xf0 set 6,b
+        _ins_cbf1,                  # 0xf1 set 6,c
+        _ins_cbf2,                  # 0xf2 set 6,d
+        _ins_cbf3,                  # 0xf3 set 6,e
+        _ins_cbf4,                  # 0xf4 set 6,h
+        _ins_cbf5,                  # 0xf5 set 6,l
+        _ins_cbf6,                  # 0xf6 set 6,(hl)
+        _ins_cbf7,                  # 0xf7 set 6,a
+        _ins_cbf8,                  # 0xf8 set 7,b
+        _ins_cbf9,                  # 0xf9 set 7,c
+        _ins_cbfa,                  # 0xfa set 7,d
+        _ins_cbfb,                  # 0xfb set 7,e
+        _ins_cbfc,                  # 0xfc set 7,h
+        _ins_cbfd,                  # 0xfd set 7,l
+        _ins_cbfe,                  # 0xfe set 7,(hl)
+        _ins_cbff,                  # 0xff set 7,a
+    )
+    opcodes_dd = (
+        _ins_00,                    # 0x00 nop 
+        _ins_01,                    # 0x01 ld bc,0000
+        _ins_02,                    # 0x02 ld (bc),a
+        _ins_03,                    # 0x03 inc bc
+        _ins_04,                    # 0x04 inc b
+        _ins_05,                    # 0x05 dec b
+        _ins_06,                    # 0x06 ld b,00
+        _ins_07,                    # 0x07 rlca 
+        _ins_08,                    # 0x08 ex af,af'
+        _ins_dd09,                  # 0x09 add ix,bc
+        _ins_0a,                    # 0x0a ld a,(bc)
+        _ins_0b,                    # 0x0b dec bc
+        _ins_0c,                    # 0x0c inc c
+        _ins_0d,                    # 0x0d dec c
+        _ins_0e,                    # 0x0e ld c,00
+        _ins_0f,                    # 0x0f rrca 
+        _ins_dd10,                  # 0x10 djnz 0003
+        _ins_11,                    # 0x11 ld de,0000
+        _ins_12,                    # 0x12 ld (de),a
+        _ins_13,                    # 0x13 inc de
+        _ins_14,                    # 0x14 inc d
+        _ins_15,                    # 0x15 dec d
+        _ins_16,                    # 0x16 ld d,00
+        _ins_17,                    # 0x17 rla 
+        _ins_dd18,                  # 0x18 jr 0003
+        _ins_dd19,                  # 0x19 add ix,de
+        _ins_1a,                    # 0x1a ld a,(de)
+        _ins_1b,                    # 0x1b dec de
+        _ins_1c,                    # 0x1c inc e
+        _ins_1d,                    # 0x1d dec e
+        _ins_1e,                    # 0x1e ld e,00
+        _ins_1f,                    # 0x1f rra 
+        _ins_dd20,                  # 0x20 jr nz,0003
+        _ins_dd21,                  # 0x21 ld ix,0000
+        _ins_dd22,                  # 0x22 ld (0000),ix
+        _ins_dd23,                  # 0x23 inc ix
+        _ins_dd24,                  # 0x24 inc ixh
+        _ins_dd25,                  # 0x25 dec ixh
+        _ins_dd26,                  # 0x26 ld ixh,00
+        _ins_27,                    # 0x27 daa 
+        _ins_dd28,                  # 0x28 jr z,0003
+        _ins_dd29,                  # 0x29 add ix,ix
+        _ins_dd2a,                  # 0x2a ld ix,(0000)
+        _ins_dd2b,                  # 0x2b dec ix
+        _ins_dd2c,                  # 0x2c inc ixl
+        _ins_dd2d,                  # 0x2d dec ixl
+        _ins_dd2e,                  # 0x2e ld ixl,00
+        _ins_2f,                    # 0x2f cpl 
+        _ins_dd30,                  # 0x30 jr nc,0003
+        _ins_31,                    # 0x31 ld sp,0000
+        _ins_32,                    # 0x32 ld (0000),a
+        _ins_33,                    # 0x33 inc sp
+        _ins_dd34,                  # 0x34 inc (ix+00)
+        _ins_dd35,                  # 0x35 dec (ix+00)
+        _ins_dd36,                  # 0x36 ld (ix+00),00
+        _ins_37,                    # 0x37 scf 
+        _ins_dd38,                  # 0x38 jr c,0003
+        _ins_dd39,                  # 0x39 add ix,sp
+        _ins_3a,                    # 0x3a ld a,(0000)
+        _ins_3b,                    # 0x3b dec sp
+        _ins_3c,                    # 0x3c inc a
+        _ins_3d,                    # 0x3d dec a
+        _ins_3e,                    # 0x3e ld a,00
+        _ins_3f,                    # 0x3f ccf 
+        _ins_40,                    # 0x40 ld b,b
+        _ins_41,                    # 0x41 ld b,c
+        _ins_42,                    # 0x42 ld b,d
+        _ins_43,                    # 0x43 ld b,e
+        _ins_dd44,                  # 0x44 ld b,ixh
+        _ins_dd45,                  # 0x45 ld b,ixl
+        _ins_dd46,                  # 0x46 ld b,(ix+00)
+        _ins_47,                    # 0x47 ld b,a
+        _ins_48,                    # 0x48 ld c,b
+        _ins_49,                    # 0x49 ld c,c
+        _ins_4a,                    # 0x4a ld c,d
+        _ins_4b,                    # 0x4b ld c,e
+        _ins_dd4c,                  # 0x4c ld c,ixh
+        _ins_dd4d,                  # 0x4d ld c,ixl
+        _ins_dd4e,                  # 0x4e ld c,(ix+00)
+        _ins_4f,                    # 0x4f ld c,a
+        _ins_50,                    # 0x50 ld d,b
+        _ins_51,                    # 0x51 ld d,c
+        _ins_52,                    # 0x52 ld d,d
+        _ins_53,                    # 0x53 ld d,e
+        _ins_dd54,                  # 0x54 ld d,ixh
+        _ins_dd55,                  # 0x55 ld d,ixl
+        _ins_dd56,                  # 0x56 ld d,(ix+00)
+        _ins_57,                    # 0x57 ld d,a
+        _ins_58,                    # 0x58 ld e,b
+        _ins_59,                    # 0x59 ld e,c
+        _ins_5a,                    # 0x5a ld e,d
+        _ins_5b,                    # 0x5b ld e,e
+        _ins_dd5c,                  # 0x5c ld e,ixh
+        _ins_dd5d,                  # 0x5d ld e,ixl
+        _ins_dd5e,                  # 0x5e ld e,(ix+00)
+        _ins_5f,                    # 0x5f ld e,a
+        _ins_dd60,                  # 0x60 ld ixh,b
+        _ins_dd61,                  # 0x61 ld ixh,c
+        _ins_dd62,                  # 0x62 ld ixh,d
+        _ins_dd63,                  # 0x63 ld ixh,e
+        _ins_dd64,                  # 0x64 ld ixh,ixh
+        _ins_dd65,                  # 0x65 ld ixh,ixl
+        _ins_dd66,                  # 0x66 ld h,(ix+00)
+        _ins_dd67,                  # 0x67 ld ixh,a
+        _ins_dd68,                  # 0x68 ld ixl,b
+        _ins_dd69,                  # 0x69 ld ixl,c
+        _ins_dd6a,                  # 0x6a ld ixl,d
+        _ins_dd6b,                  # 0x6b ld ixl,e
+        _ins_dd6c,                  # 0x6c ld ixl,ixh
+        _ins_dd6d,                  # 0x6d ld ixl,ixl
+        _ins_dd6e,                  # 0x6e ld l,(ix+00)
+        _ins_dd6f,                  # 0x6f ld ixl,a
+        _ins_dd70,                  # 0x70 ld (ix+00),b
+        _ins_dd71,                  # 0x71 ld (ix+00),c
+        _ins_dd72,                  # 0x72 ld (ix+00),d
+        _ins_dd73,                  # 0x73 ld (ix+00),e
+        _ins_dd74,                  # 0x74 ld (ix+00),h
+        _ins_dd75,                  # 0x75 ld (ix+00),l
+        _ins_76,                    # 0x76 halt 
+        _ins_dd77,                  # 0x77 ld (ix+00),a
+        _ins_78,                    # 0x78 ld a,b
+        _ins_79,                    # 0x79 ld a,c
+        _ins_7a,                    # 0x7a ld a,d
+        _ins_7b,                    # 0x7b ld a,e
+        _ins_dd7c,                  # 0x7c ld a,ixh
+        _ins_dd7d,                  # 0x7d ld a,ixl
+        _ins_dd7e,                  # 0x7e ld a,(ix+00)
+        _ins_7f,                    # 0x7f ld a,a
+        _ins_80,                    # 0x80 add a,b
+        _ins_81,                    # 0x81 add a,c
+        _ins_82,                    # 0x82 add a,d
+        _ins_83,                    # 0x83 add a,e
+        _ins_dd84,                  # 0x84 add a,ixh
+        _ins_dd85,                  # 0x85 add a,ixl
+        _ins_dd86,                  # 0x86 add a,(ix+00)
+        _ins_87,                    # 0x87 add a,a
+        _ins_88,                    # 0x88 adc a,b
+        _ins_89,                    # 0x89 adc a,c
+        _ins_8a,                    # 0x8a adc a,d
+        _ins_8b,                    # 0x8b adc a,e
+        _ins_dd8c,                  # 0x8c adc a,ixh
+        _ins_dd8d,                  # 0x8d adc a,ixl
+        _ins_dd8e,                  # 0x8e adc a,(ix+00)
+        _ins_8f,                    # 0x8f adc a,a
+        _ins_90,                    # 0x90 sub b
+        _ins_91,                    # 0x91 sub c
+        _ins_92,                    # 0x92 sub d
+        _ins_93,                    # 0x93 sub e
+        _ins_dd94,                  # 0x94 sub ixh
+        _ins_dd95,                  # 0x95 sub ixl
+        _ins_dd96,                  # 0x96 sub (ix+00)
+        _ins_97,                    # 0x97 sub a
+        _ins_98,                    # 0x98 sbc a,b
+        _ins_99,                    # 0x99 sbc a,c
+        _ins_9a,                    # 0x9a sbc a,d
+        _ins_9b,                    # 0x9b sbc a,e
+        _ins_dd9c,                  # 0x9c sbc a,ixh
+        _ins_dd9d,                  # 0x9d sbc a,ixl
+        _ins_dd9e,                  # 0x9e sbc a,(ix+00)
+        _ins_9f,                    # 0x9f sbc a,a
+        _ins_a0,                    # 0xa0 and b
+        _ins_a1,                    # 0xa1 and c
+        _ins_a2,                    # 0xa2 and d
+        _ins_a3,                    # 0xa3 and e
+        _ins_dda4,                  # 0xa4 and ixh
+        _ins_dda5,                  # 0xa5 and ixl
+        _ins_dda6,                  # 0xa6 and (ix+00)
+        _ins_a7,                    # 0xa7 and a
+        _ins_a8,                    # 0xa8 xor b
+        _ins_a9,                    # 0xa9 xor c
+        _ins_aa,                    # 0xaa xor d
+        _ins_ab,                    # 0xab xor e
+        _ins_ddac,                  # 0xac xor ixh
+        _ins_ddad,                  # 0xad xor ixl
+        _ins_ddae,                  # 0xae xor (ix+00)
+        _ins_af,                    # 0xaf xor a
+        _ins_b0,                    # 0xb0 or b
+        _ins_b1,                    # 0xb1 or c
+        _ins_b2,                    # 0xb2 or d
+        _ins_b3,                    # 0xb3 or e
+        _ins_ddb4,                  # 0xb4 or ixh
+        _ins_ddb5,                  # 0xb5 or ixl
+        _ins_ddb6,                  # 0xb6 or (ix+00)
+        _ins_b7,                    # 0xb7 or a
+        _ins_b8,                    # 0xb8 cp b
+        _ins_b9,                    # 0xb9 cp c
+        _ins_ba,                    # 0xba cp d
+        _ins_bb,                    # 0xbb cp e
+        _ins_ddbc,                  # 0xbc cp ixh
+        _ins_ddbd,                  # 0xbd cp ixl
+        _ins_ddbe,                  # 0xbe cp (ix+00)
+        _ins_bf,                    # 0xbf cp a
+        _ins_c0,                    # 0xc0 ret nz
+        _ins_c1,                    # 0xc1 pop bc
+        _ins_c2,                    # 0xc2 jp nz,0000
+        _ins_c3,                    # 0xc3 jp 0000
+        _ins_c4,                    # 0xc4 call nz,0000
+        _ins_c5,                    # 0xc5 push bc
+        _ins_c6,                    # 0xc6 add a,00
+        _ins_c7,                    # 0xc7 rst 00
+        _ins_c8,                    # 0xc8 ret z
+        _ins_c9,                    # 0xc9 ret 
+        _ins_ca,                    # 0xca jp z,0000
+        _execute_ddcb,              # 0xcb execute ddcb prefix
+        _ins_cc,                    # 0xcc call z,0000
+        _ins_cd,                    # 0xcd call 0000
+        _ins_ce,                    # 0xce adc a,00
+        _ins_cf,                    # 0xcf rst 08
+        _ins_d0,                    # 0xd0 ret nc
+        _ins_d1,                    # 0xd1 pop de
+        _ins_d2,                    # 0xd2 jp nc,0000
+        _ins_d3,                    # 0xd3 out (00),a
+        _ins_d4,                    # 0xd4 call nc,0000
+        _ins_d5,                    # 0xd5 push de
+        _ins_d6,                    # 0xd6 sub 00
+        _ins_d7,                    # 0xd7 rst 10
+        _ins_d8,                    # 0xd8 ret c
+        _ins_d9,                    # 0xd9 exx 
+        _ins_da,                    # 0xda jp c,0000
+        _ins_db,                    # 0xdb in a,(00)
+        _ins_dc,                    # 0xdc call c,0000
+        _execute_dddd,              # 0xdd execute dddd prefix
+        _ins_de,                    # 0xde sbc a,00
+        _ins_df,                    # 0xdf rst 18
+        _ins_e0,                    # 0xe0 ret po
+        _ins_dde1,                  # 0xe1 pop ix
+        _ins_e2,                    # 0xe2 jp po,0000
+        _ins_dde3,                  # 0xe3 ex (sp),ix
+        _ins_e4,                    # 0xe4 call po,0000
+        _ins_dde5,                  # 0xe5 push ix
+        _ins_e6,                    # 0xe6 and 00
+        _ins_e7,                    # 0xe7 rst 20
+        _ins_e8,                    # 0xe8 ret pe
+        _ins_dde9,                  # 0xe9 jp ix
+        _ins_ea,                    # 0xea jp pe,0000
+        _ins_eb,                    # 0xeb ex de,hl
+        _ins_ec,                    # 0xec call pe,0000
+        _ins_00,                    # 0xed nop 
+        _ins_ee,                    # 0xee xor 00
+        _ins_ef,                    # 0xef rst 28
+        _ins_f0,                    # 0xf0 ret p
+        _ins_f1,                    # 0xf1 pop af
+        _ins_f2,                    # 0xf2 jp p,0000
+        _ins_f3,                    # 0xf3 di 
+        _ins_f4,                    # 0xf4 call p,0000
+        _ins_f5,                    # 0xf5 push af
+        _ins_f6,                    # 0xf6 or 00
+        _ins_f7,                    # 0xf7 rst 30
+        _ins_f8,                    # 0xf8 ret m
+        _ins_ddf9,                  # 0xf9 ld sp,ix
+        _ins_fa,                    # 0xfa jp m,0000
+        _ins_fb,                    # 0xfb ei 
+        _ins_fc,                    # 0xfc call m,0000
+        _execute_ddfd,              # 0xfd execute ddfd prefix
+        _ins_fe,                    # 0xfe cp 00
+        _ins_ff,                    # 0xff rst 38
+    )
+    opcodes_ddcb00 = (
+        _ins_ddcb0000,              # 0x00 rlc (ix+00),b
+        _ins_ddcb0001,              # 0x01 rlc (ix+00),c
+        _ins_ddcb0002,              # 0x02 rlc (ix+00),d
+        _ins_ddcb0003,              # 0x03 rlc (ix+00),e
+        _ins_ddcb0004,              # 0x04 rlc (ix+00),h
+        _ins_ddcb0005,              # 0x05 rlc (ix+00),l
+        _ins_ddcb0006,              # 0x06 rlc (ix+00)
+        _ins_ddcb0007,              # 0x07 rlc (ix+00),a
+        _ins_ddcb0008,              # 0x08 rrc (ix+00),b
+        _ins_ddcb0009,              # 0x09 rrc (ix+00),c
+        _ins_ddcb000a,              # 0x0a rrc (ix+00),d
+        _ins_ddcb000b,              # 0x0b rrc (ix+00),e
+        _ins_ddcb000c,              # 0x0c rrc (ix+00),h
+        _ins_ddcb000d,              # 0x0d rrc (ix+00),l
+        _ins_ddcb000e,              # 0x0e rrc (ix+00)
+        _ins_ddcb000f,              # 0x0f rrc (ix+00),a
+        _ins_ddcb0010,              # 0x10 rl (ix+00),b
+        _ins_ddcb0011,              # 0x11 rl (ix+00),c
+        _ins_ddcb0012,              # 0x12 rl (ix+00),d
+        _ins_ddcb0013,              # 0x13 rl (ix+00),e
+        _ins_ddcb0014,              # 0x14 rl (ix+00),h
+        _ins_ddcb0015,              # 0x15 rl (ix+00),l
+        _ins_ddcb0016,              # 0x16 rl (ix+00)
+        _ins_ddcb0017,              # 0x17 rl (ix+00),a
+        _ins_ddcb0018,              # 0x18 rr (ix+00),b
+        _ins_ddcb0019,              # 0x19 rr (ix+00),c
+        _ins_ddcb001a,              # 0x1a rr (ix+00),d
+        _ins_ddcb001b,              # 0x1b rr (ix+00),e
+        _ins_ddcb001c,              # 0x1c rr (ix+00),h
+        _ins_ddcb001d,              # 0x1d rr (ix+00),l
+        _ins_ddcb001e,              # 0x1e rr (ix+00)
+        _ins_ddcb001f,              # 0x1f rr (ix+00),a
+        _ins_ddcb0020,              # 0x20 sla (ix+00),b
+        _ins_ddcb0021,              # 0x21 sla (ix+00),c
+        _ins_ddcb0022,              # 0x22 sla (ix+00),d
+        _ins_ddcb0023,              # 0x23 sla (ix+00),e
+        _ins_ddcb0024,              # 0x24 sla (ix+00),h
+        _ins_ddcb0025,              # 0x25 sla (ix+00),l
+        _ins_ddcb0026,              # 0x26 sla (ix+00)
+        _ins_ddcb0027,              # 0x27 sla (ix+00),a
+        _ins_ddcb0028,              # 0x28 sra (ix+00),b
+        _ins_ddcb0029,              # 0x29 sra (ix+00),c
+        _ins_ddcb002a,              # 0x2a sra (ix+00),d
+        _ins_ddcb002b,              # 0x2b sra (ix+00),e
+        _ins_ddcb002c,              # 0x2c sra (ix+00),h
+        _ins_ddcb002d,              # 0x2d sra (ix+00),l
+        _ins_ddcb002e,              # 0x2e sra (ix+00)
+        _ins_ddcb002f,              # 0x2f sra (ix+00),a
+        _ins_ddcb0030,              # 0x30 sll (ix+00),b
+        _ins_ddcb0031,              # 0x31 sll (ix+00),c
+        _ins_ddcb0032,              # 0x32 sll (ix+00),d
+        _ins_ddcb0033,              # 0x33 sll (ix+00),e
+        _ins_ddcb0034,              # 0x34 sll (ix+00),h
+        _ins_ddcb0035,              # 0x35 sll (ix+00),l
+        _ins_ddcb0036,              # 0x36 sll (ix+00)
+        _ins_ddcb0037,              # 0x37 sll (ix+00),a
+        _ins_ddcb0038,              # 0x38 srl (ix+00),b
+        _ins_ddcb0039,              # 0x39 srl (ix+00),c
+        _ins_ddcb003a,              # 0x3a srl (ix+00),d
+        _ins_ddcb003b,              # 0x3b srl (ix+00),e
+        _ins_ddcb003c,              # 0x3c srl (ix+00),h
+        _ins_ddcb003d,              # 0x3d srl (ix+00),l
+        _ins_ddcb003e,              # 0x3e srl (ix+00)
+        _ins_ddcb003f,              # 0x3f srl (ix+00),a
+        _ins_ddcb0040,              # 0x40 bit 0,(ix+00)
+        _ins_ddcb0040,              # 0x41 bit 0,(ix+00)
+        _ins_ddcb0040,              # 0x42 bit 0,(ix+00)
+        _ins_ddcb0040,              # 0x43 bit 0,(ix+00)
+        _ins_ddcb0040,              # 0x44 bit 0,(ix+00)
+        _ins_ddcb0040,              # 0x45 bit 0,(ix+00)
+        _ins_ddcb0040,              # 0x46 bit 0,(ix+00)
+        _ins_ddcb0040,              # 0x47 bit 0,(ix+00)
+        _ins_ddcb0048,              # 0x48 bit 1,(ix+00)
+        _ins_ddcb0048,              # 0x49 bit 1,(ix+00)
+        _ins_ddcb0048,              # 0x4a bit 1,(ix+00)
+        _ins_ddcb0048,              # 0x4b bit 1,(ix+00)
+        _ins_ddcb0048,              # 0x4c bit 1,(ix+00)
+        _ins_ddcb0048,              # 0x4d bit 1,(ix+00)
+        _ins_ddcb0048,              # 0x4e bit 1,(ix+00)
+        _ins_ddcb0048,              # 0x4f bit 1,(ix+00)
+        _ins_ddcb0050,              # 0x50 bit 2,(ix+00)
+        _ins_ddcb0050,              # 0x51 bit 2,(ix+00)
+        _ins_ddcb0050,              # 0x52 bit 2,(ix+00)
+        _ins_ddcb0050,              # 0x53 bit 2,(ix+00)
+        _ins_ddcb0050,              # 0x54 bit 2,(ix+00)
+        _ins_ddcb0050,              # 0x55 bit 2,(ix+00)
+        _ins_ddcb0050,              # 0x56 bit 2,(ix+00)
+        _ins_ddcb0050,              # 0x57 bit 2,(ix+00)
+        _ins_ddcb0058,              # 0x58 bit 3,(ix+00)
+        _ins_ddcb0058,              # 0x59 bit 3,(ix+00)
+        _ins_ddcb0058,              # 0x5a bit 3,(ix+00)
+        _ins_ddcb0058,              # 0x5b bit 3,(ix+00)
+        _ins_ddcb0058,              # 0x5c bit 3,(ix+00)
+        _ins_ddcb0058,              # 0x5d bit 3,(ix+00)
+        _ins_ddcb0058,              # 0x5e bit 3,(ix+00)
+        _ins_ddcb0058,              # 0x5f bit 3,(ix+00)
+        _ins_ddcb0060,              # 0x60 bit 4,(ix+00)
+        _ins_ddcb0060,              # 0x61 bit 4,(ix+00)
+        _ins_ddcb0060,              # 0x62 bit 4,(ix+00)
+        _ins_ddcb0060,              # 0x63 bit 4,(ix+00)
+        _ins_ddcb0060,              # 0x64 bit 4,(ix+00)
+        _ins_ddcb0060,              # 0x65 bit 4,(ix+00)
+        _ins_ddcb0060,              # 0x66 bit 4,(ix+00)
+        _ins_ddcb0060,              # 0x67 bit 4,(ix+00)
+        _ins_ddcb0068,              # 0x68 bit 5,(ix+00)
+        _ins_ddcb0068,              # 0x69 bit 5,(ix+00)
+        _ins_ddcb0068,              # 0x6a bit 5,(ix+00)
+        _ins_ddcb0068,              # 0x6b bit 5,(ix+00)
+        _ins_ddcb0068,              # 0x6c bit 5,(ix+00)
+        _ins_ddcb0068,              # 0x6d bit 5,(ix+00)
+        _ins_ddcb0068,              # 0x6e bit 5,(ix+00)
+        _ins_ddcb0068,              # 0x6f bit 5,(ix+00)
+        _ins_ddcb0070,              # 0x70 bit 6,(ix+00)
+        _ins_ddcb0070,              # 0x71 bit 6,(ix+00)
+        _ins_ddcb0070,              # 0x72 bit 6,(ix+00)
+        _ins_ddcb0070,              # 0x73 bit 6,(ix+00)
+        _ins_ddcb0070,              # 0x74 bit 6,(ix+00)
+        _ins_ddcb0070,              # 0x75 bit 6,(ix+00)
+        _ins_ddcb0070,              # 0x76 bit 6,(ix+00)
+        _ins_ddcb0070,              # 0x77 bit 6,(ix+00)
+        _ins_ddcb0078,              # 0x78 bit 7,(ix+00)
+        _ins_ddcb0078,              # 0x79 bit 7,(ix+00)
+        _ins_ddcb0078,              # 0x7a bit 7,(ix+00)
+        _ins_ddcb0078,              # 0x7b bit 7,(ix+00)
+        _ins_ddcb0078,              # 0x7c bit 7,(ix+00)
+        _ins_ddcb0078,              # 0x7d bit 7,(ix+00)
+        _ins_ddcb0078,              # 0x7e bit 7,(ix+00)
+        _ins_ddcb0078,              # 0x7f bit 7,(ix+00)
+        _ins_ddcb0080,              # 0x80 res 0,(ix+00),b
+        _ins_ddcb0081,              # 0x81 res 0,(ix+00),c
+        _ins_ddcb0082,              # 0x82 res 0,(ix+00),d
+        _ins_ddcb0083,              # 0x83 res 0,(ix+00),e
+        _ins_ddcb0084,              # 0x84 res 0,(ix+00),h
+        _ins_ddcb0085,              # 0x85 res 0,(ix+00),l
+        _ins_ddcb0086,              # 0x86 res 0,(ix+00)
+        _ins_ddcb0087,              # 0x87 res 0,(ix+00),a
+        _ins_ddcb0088,              # 0x88 res 1,(ix+00),b
+        _ins_ddcb0089,              # 0x89 res 1,(ix+00),c
+        _ins_ddcb008a,              # 0x8a res 1,(ix+00),d
+        _ins_ddcb008b,              # 0x8b res 1,(ix+00),e
+        _ins_ddcb008c,              # 0x8c res 1,(ix+00),h
+        _ins_ddcb008d,              # 0x8d res 1,(ix+00),l
+        _ins_ddcb008e,              # 0x8e res 1,(ix+00)
+        _ins_ddcb008f,              # 0x8f res 1,(ix+00),a
+        _ins_ddcb0090,              # 0x90 res 2,(ix+00),b
+        _ins_ddcb0091,              # 0x91 res 2,(ix+00),c
+        _ins_ddcb0092,              # 0x92 res 2,(ix+00),d
+        _ins_ddcb0093,              # 0x93 res 2,(ix+00),e
+        _ins_ddcb0094,              # 0x94 res 2,(ix+00),h
+        _ins_ddcb0095,              # 0x95 res 2,(ix+00),l
+        _ins_ddcb0096,              # 0x96 res 2,(ix+00)
+        _ins_ddcb0097,              # 0x97 res 2,(ix+00),a
+        _ins_ddcb0098,              # 0x98 res 3,(ix+00),b
+        _ins_ddcb0099,              # 0x99 res 3,(ix+00),c
+        _ins_ddcb009a,              # 0x9a res 3,(ix+00),d
+        _ins_ddcb009b,              # 0x9b res 3,(ix+00),e
+        _ins_ddcb009c,              # 0x9c res 3,(ix+00),h
+        _ins_ddcb009d,              # 0x9d res 3,(ix+00),l
+        _ins_ddcb009e,              # 0x9e res 3,(ix+00)
+        _ins_ddcb009f,              # 0x9f res 3,(ix+00),a
+        _ins_ddcb00a0,              # 0xa0 res 4,(ix+00),b
+        _ins_ddcb00a1,              # 0xa1 res 4,(ix+00),c
+        _ins_ddcb00a2,              # 0xa2 res 4,(ix+00),d
+        _ins_ddcb00a3,              # 0xa3 res 4,(ix+00),e
+        _ins_ddcb00a4,              # 0xa4 res 4,(ix+00),h
+        _ins_ddcb00a5,              # 0xa5 res 4,(ix+00),l
+        _ins_ddcb00a6,              # 0xa6 res 4,(ix+00)
+        _ins_ddcb00a7,              # 0xa7 res 4,(ix+00),a
+        _ins_ddcb00a8,              # 0xa8 res 5,(ix+00),b
+        _ins_ddcb00a9,              # 0xa9 res 5,(ix+00),c
+        _ins_ddcb00aa,              # 0xaa res 5,(ix+00),d
+        _ins_ddcb00ab,              # 0xab res 5,(ix+00),e
+        _ins_ddcb00ac,              # 0xac res 5,(ix+00),h
+        _ins_ddcb00ad,              # 0xad res 5,(ix+00),l
+        _ins_ddcb00ae,              # 0xae res 5,(ix+00)
+        _ins_ddcb00af,              # 0xaf res 5,(ix+00),a
+        _ins_ddcb00b0,              # 0xb0 res 6,(ix+00),b
+        _ins_ddcb00b1,              # 0xb1 res 6,(ix+00),c
+        _ins_ddcb00b2,              # 0xb2 res 6,(ix+00),d
+        _ins_ddcb00b3,              # 0xb3 res 6,(ix+00),e
+        _ins_ddcb00b4,              # 0xb4 res 6,(ix+00),h
+        _ins_ddcb00b5,              # 0xb5 res 6,(ix+00),l
+        _ins_ddcb00b6,              # 0xb6 res 6,(ix+00)
+        _ins_ddcb00b7,              # 0xb7 res 6,(ix+00),a
+        _ins_ddcb00b8,              # 0xb8 res 7,(ix+00),b
+        _ins_ddcb00b9,              # 0xb9 res 7,(ix+00),c
+        _ins_ddcb00ba,              # 0xba res 7,(ix+00),d
+        _ins_ddcb00bb,              # 0xbb res 7,(ix+00),e
+        _ins_ddcb00bc,              # 0xbc res 7,(ix+00),h
+        _ins_ddcb00bd,              # 0xbd res 7,(ix+00),l
+        _ins_ddcb00be,              # 0xbe res 7,(ix+00)
+        _ins_ddcb00bf,              # 0xbf res 7,(ix+00),a
+        _ins_ddcb00c0,              # 0xc0 set 0,(ix+00),b
+        _ins_ddcb00c1,              # 0xc1 set 0,(ix+00),c
+        _ins_ddcb00c2,              # 0xc2 set 0,(ix+00),d
+        _ins_ddcb00c3,              # 0xc3 set 0,(ix+00),e
+        _ins_ddcb00c4,              # 0xc4 set 0,(ix+00),h
+        _ins_ddcb00c5,              # 0xc5 set 0,(ix+00),l
+        _ins_ddcb00c6,              # 0xc6 set 0,(ix+00)
+        _ins_ddcb00c7,              # 0xc7 set 0,(ix+00),a
+        _ins_ddcb00c8,              # 0xc8 set 1,(ix+00),b
+        _ins_ddcb00c9,              # 0xc9 set 1,(ix+00),c
+        _ins_ddcb00ca,              # 0xca set 1,(ix+00),d
+        _ins_ddcb00cb,              # 0xcb set 1,(ix+00),e
+        _ins_ddcb00cc,              # 0xcc set 1,(ix+00),h
+        _ins_ddcb00cd,              # 0xcd set 1,(ix+00),l
+        _ins_ddcb00ce,              # 0xce set 1,(ix+00)
+        _ins_ddcb00cf,              # 0xcf set 1,(ix+00),a
+        _ins_ddcb00d0,              # 0xd0 set 2,(ix+00),b
+        _ins_ddcb00d1,              # 0xd1 set 2,(ix+00),c
+        _ins_ddcb00d2,              # 0xd2 set 2,(ix+00),d
+        _ins_ddcb00d3,              # 0xd3 set 2,(ix+00),e
+        _ins_ddcb00d4,              # 0xd4 set 2,(ix+00),h
+        _ins_ddcb00d5,              # 0xd5 set 2,(ix+00),l
+        _ins_ddcb00d6,              # 0xd6 set 2,(ix+00)
+        _ins_ddcb00d7,              # 0xd7 set 2,(ix+00),a
+        _ins_ddcb00d8,              # 0xd8 set 3,(ix+00),b
+        _ins_ddcb00d9,              # 0xd9 set 3,(ix+00),c
+        _ins_ddcb00da,              # 0xda set 3,(ix+00),d
+        _ins_ddcb00db,              # 0xdb set 3,(ix+00),e
+        _ins_ddcb00dc,              # 0xdc set 3,(ix+00),h
+        _ins_ddcb00dd,              # 0xdd set 3,(ix+00),l
+        _ins_ddcb00de,              # 0xde set 3,(ix+00)
+        _ins_ddcb00df,              # 0xdf set 3,(ix+00),a
+        _ins_ddcb00e0,              # 0xe0 set 4,(ix+00),b
+        _ins_ddcb00e1,              # 0xe1 set 4,(ix+00),c
+        _ins_ddcb00e2,              # 0xe2 set 4,(ix+00),d
+        _ins_ddcb00e3,              # 0xe3 set 4,(ix+00),e
+        _ins_ddcb00e4,              # 0xe4 set 4,(ix+00),h
+        _ins_ddcb00e5,              # 0xe5 set 4,(ix+00),l
+        _ins_ddcb00e6,              # 0xe6 set 4,(ix+00)
+        _ins_ddcb00e7,              # 0xe7 set 4,(ix+00),a
+        _ins_ddcb00e8,              # 0xe8 set 5,(ix+00),b
+        _ins_ddcb00e9,              # 0xe9 set 5,(ix+00),c
+        _ins_ddcb00ea,              # 0xea set 5,(ix+00),d
+        _ins_ddcb00eb,              # 0xeb set 5,(ix+00),e
+        _ins_ddcb00ec,              # 0xec set 5,(ix+00),h
+        _ins_ddcb00ed,              # 0xed set 5,(ix+00),l
+        _ins_ddcb00ee,              # 0xee set 5,(ix+00)
+        _ins_ddcb00ef,              # 0xef set 5,(ix+00),a
+        _ins_ddcb00f0,              # 0xf0 set 6,(ix+00),b
+        _ins_ddcb00f1,              # 0xf1 set 6,(ix+00),c
+        _ins_ddcb00f2,              # 0xf2 set 6,(ix+00),d
+        _ins_ddcb00f3,              # 0xf3 set 6,(ix+00),e
+        _ins_ddcb00f4,              # 0xf4 set 6,(ix+00),h
+        _ins_ddcb00f5,              # 0xf5 set 6,(ix+00),l
+        _ins_ddcb00f6,              # 0xf6 set 6,(ix+00)
+        _ins_ddcb00f7,              # 0xf7 set 6,(ix+00),a
+        _ins_ddcb00f8,              # 0xf8 set 7,(ix+00),b
+        _ins_ddcb00f9,              # 0xf9 set 7,(ix+00),c
+        _ins_ddcb00fa,              # 0xfa set 7,(ix+00),d
+        _ins_ddcb00fb,              # 0xfb set 7,(ix+00),e
+        _ins_ddcb00fc,              # 0xfc set 7,(ix+00),h
+        _ins_ddcb00fd,              # 0xfd set 7,(ix+00),l
+        _ins_ddcb00fe,              # 0xfe set 7,(ix+00)
+        _ins_ddcb00ff,              # 0xff set 7,(ix+00),a
+    )
+    opcodes_ed = (
+        _ins_00,                    # 0x00 nop 
+        _ins_00,                    # 0x01 nop 
+        _ins_00,                    # 0x02 nop 
+        _ins_00,                    # 0x03 nop 
+        _ins_00,                    # 0x04 nop 
+        _ins_00,                    # 0x05 nop 
+        _ins_00,                    # 0x06 nop 
+        _ins_00,                    # 0x07 nop 
+        _ins_00,                    # 0x08 nop 
+        _ins_00,                    # 0x09 nop 
+        _ins_00,                    # 0x0a nop 
+        _ins_00,                    # 0x0b nop 
+        _ins_00,                    # 0x0c nop 
+        _ins_00,                    # 0x0d nop 
+        _ins_00,                    # 0x0e nop 
+        _ins_00,                    # 0x0f nop 
+        _ins_00,                    # 0x10 nop 
+        _ins_00,                    # 0x11 nop 
+        _ins_00,                    # 0x12 nop 
+        _ins_00,                    # 0x13 nop 
+        _ins_00,                    # 0x14 nop 
+        _ins_00,                    # 0x15 nop 
+        _ins_00,                    # 0x16 nop 
+        _ins_00,                    # 0x17 nop 
+        _ins_00,                    # 0x18 nop 
+        _ins_00,                    # 0x19 nop 
+        _ins_00,                    # 0x1a nop 
+        _ins_00,                    # 0x1b nop 
+        _ins_00,                    # 0x1c nop 
+        _ins_00,                    # 0x1d nop 
+        _ins_00,                    # 0x1e nop 
+        _ins_00,                    # 0x1f nop 
+        _ins_00,                    # 0x20 nop 
+        _ins_00,                    # 0x21 nop 
+        _ins_00,                    # 0x22 nop 
+        _ins_00,                    # 0x23 nop 
+        _ins_00,                    # 0x24 nop 
+        _ins_00,                    # 0x25 nop 
+        _ins_00,                    # 0x26 nop 
+        _ins_00,                    # 0x27 nop 
+        _ins_00,                    # 0x28 nop 
+        _ins_00,                    # 0x29 nop 
+        _ins_00,                    # 0x2a nop 
+        _ins_00,                    # 0x2b nop 
+        _ins_00,                    # 0x2c nop 
+        _ins_00,                    # 0x2d nop 
+        _ins_00,                    # 0x2e nop 
+        _ins_00,                    # 0x2f nop 
+        _ins_00,                    # 0x30 nop 
+        _ins_00,                    # 0x31 nop 
+        _ins_00,                    # 0x32 nop 
+        _ins_00,                    # 0x33 nop 
+        _ins_00,                    # 0x34 nop 
+        _ins_00,                    # 0x35 nop 
+        _ins_00,                    # 0x36 nop 
+        _ins_00,                    # 0x37 nop 
+        _ins_00,                    # 0x38 nop 
+        _ins_00,                    # 0x39 nop 
+        _ins_00,                    # 0x3a nop 
+        _ins_00,                    # 0x3b nop 
+        _ins_00,                    # 0x3c nop 
+        _ins_00,                    # 0x3d nop 
+        _ins_00,                    # 0x3e nop 
+        _ins_00,                    # 0x3f nop 
+        _ins_ed40,                  # 0x40 in b,(c)
+        _ins_ed41,                  # 0x41 out (c),b
+        _ins_ed42,                  # 0x42 sbc hl,bc
+        _ins_ed43,                  # 0x43 ld (0000),bc
+        _ins_ed44,                  # 0x44 neg 
+        _ins_ed45,                  # 0x45 retn 
+        _ins_ed46,                  # 0x46 im 0
+        _ins_ed47,                  # 0x47 ld i,a
+        _ins_ed48,                  # 0x48 in c,(c)
+        _ins_ed49,                  # 0x49 out (c),c
+        _ins_ed4a,                  # 0x4a adc hl,bc
+        _ins_ed4b,                  # 0x4b ld bc,(0000)
+        _ins_ed44,                  # 0x4c neg 
+        _ins_ed4d,                  # 0x4d reti 
+        _ins_ed46,                  # 0x4e im 0
+        _ins_ed4f,                  # 0x4f ld r,a
+        _ins_ed50,                  # 0x50 in d,(c)
+        _ins_ed51,                  # 0x51 out (c),d
+        _ins_ed52,                  # 0x52 sbc hl,de
+        _ins_ed53,                  # 0x53 ld (0000),de
+        _ins_ed44,                  # 0x54 neg 
+        _ins_ed45,                  # 0x55 retn 
+        _ins_ed56,                  # 0x56 im 1
+        _ins_ed57,                  # 0x57 ld a,i
+        _ins_ed58,                  # 0x58 in e,(c)
+        _ins_ed59,                  # 0x59 out (c),e
+        _ins_ed5a,                  # 0x5a adc hl,de
+        _ins_ed5b,                  # 0x5b ld de,(0000)
+        _ins_ed44,                  # 0x5c neg 
+        _ins_ed45,                  # 0x5d retn 
+        _ins_ed5e,                  # 0x5e im 2
+        _ins_ed5f,                  # 0x5f ld a,r
+        _ins_ed60,                  # 0x60 in h,(c)
+        _ins_ed61,                  # 0x61 out (c),h
+        _ins_ed62,                  # 0x62 sbc hl,hl
+        _ins_22,                    # 0x63 ld (0000),hl
+        _ins_ed44,                  # 0x64 neg 
+        _ins_ed45,                  # 0x65 retn 
+        _ins_ed46,                  # 0x66 im 0
+        _ins_ed67,                  # 0x67 rrd 
+        _ins_ed68,                  # 0x68 in l,(c)
+        _ins_ed69,                  # 0x69 out (c),l
+        _ins_ed6a,                  # 0x6a adc hl,hl
+        _ins_2a,                    # 0x6b ld hl,(0000)
+        _ins_ed44,                  # 0x6c neg 
+        _ins_ed45,                  # 0x6d retn 
+        _ins_ed46,                  # 0x6e im 0
+        _ins_ed6f,                  # 0x6f rld 
+        _ins_ed70,                  # 0x70 in (c)
+        _ins_ed71,                  # 0x71 out (c)
+        _ins_ed72,                  # 0x72 sbc hl,sp
+        _ins_ed73,                  # 0x73 ld (0000),sp
+        _ins_ed44,                  # 0x74 neg 
+        _ins_ed45,                  # 0x75 retn 
+        _ins_ed56,                  # 0x76 im 1
+        _ins_00,                    # 0x77 nop 
+        _ins_ed78,                  # 0x78 in a,(c)
+        _ins_ed79,                  # 0x79 out (c),a
+        _ins_ed7a,                  # 0x7a adc hl,sp
+        _ins_ed7b,                  # 0x7b ld sp,(0000)
+        _ins_ed44,                  # 0x7c neg 
+        _ins_ed45,                  # 0x7d retn 
+        _ins_ed5e,                  # 0x7e im 2
+        _ins_00,                    # 0x7f nop 
+        _ins_00,                    # 0x80 nop 
+        _ins_00,                    # 0x81 nop 
+        _ins_00,                    # 0x82 nop 
+        _ins_00,                    # 0x83 nop 
+        _ins_00,                    # 0x84 nop 
+        _ins_00,                    # 0x85 nop 
+        _ins_00,                    # 0x86 nop 
+        _ins_00,                    # 0x87 nop 
+        _ins_00,                    # 0x88 nop 
+        _ins_00,                    # 0x89 nop 
+        _ins_00,                    # 0x8a nop 
+        _ins_00,                    # 0x8b nop 
+        _ins_00,                    # 0x8c nop 
+        _ins_00,                    # 0x8d nop 
+        _ins_00,                    # 0x8e nop 
+        _ins_00,                    # 0x8f nop 
+        _ins_00,                    # 0x90 nop 
+        _ins_00,                    # 0x91 nop 
+        _ins_00,                    # 0x92 nop 
+        _ins_00,                    # 0x93 nop 
+        _ins_00,                    # 0x94 nop 
+        _ins_00,                    # 0x95 nop 
+        _ins_00,                    # 0x96 nop 
+        _ins_00,                    # 0x97 nop 
+        _ins_00,                    # 0x98 nop 
+        _ins_00,                    # 0x99 nop 
+        _ins_00,                    # 0x9a nop 
+        _ins_00,                    # 0x9b nop 
+        _ins_00,                    # 0x9c nop 
+        _ins_00,                    # 0x9d nop 
+        _ins_00,                    # 0x9e nop 
+        _ins_00,                    # 0x9f nop 
+        _ins_eda0,                  # 0xa0 ldi 
+        _ins_eda1,                  # 0xa1 cpi 
+        _ins_eda2,                  # 0xa2 ini 
+        _ins_eda3,                  # 0xa3 outi 
+        _ins_00,                    # 0xa4 nop 
+        _ins_00,                    # 0xa5 nop 
+        _ins_00,                    # 0xa6 nop 
+        _ins_00,                    # 0xa7 nop 
+        _ins_eda8,                  # 0xa8 ldd 
+        _ins_eda9,                  # 0xa9 cpd 
+        _ins_edaa,                  # 0xaa ind 
+        _ins_edab,                  # 0xab outd 
+        _ins_00,                    # 0xac nop 
+        _ins_00,                    # 0xad nop 
+        _ins_00,                    # 0xae nop 
+        _ins_00,                    # 0xaf nop 
+        _ins_edb0,                  # 0xb0 ldir 
+        _ins_edb1,                  # 0xb1 cpir 
+        _ins_edb2,                  # 0xb2 inir 
+        _ins_edb3,                  # 0xb3 otir 
+        _ins_00,                    # 0xb4 nop 
+        _ins_00,                    # 0xb5 nop 
+        _ins_00,                    # 0xb6 nop 
+        _ins_00,                    # 0xb7 nop 
+        _ins_edb8,                  # 0xb8 lddr 
+        _ins_edb9,                  # 0xb9 cpdr 
+        _ins_edba,                  # 0xba indr 
+        _ins_edbb,                  # 0xbb otdr 
+        _ins_00,                    # 0xbc nop 
+        _ins_00,                    # 0xbd nop 
+        _ins_00,                    # 0xbe nop 
+        _ins_00,                    # 0xbf nop 
+        _ins_00,                    # 0xc0 nop 
+        _ins_00,                    # 0xc1 nop 
+        _ins_00,                    # 0xc2 nop 
+        _ins_00,                    # 0xc3 nop 
+        _ins_00,                    # 0xc4 nop 
+        _ins_00,                    # 0xc5 nop 
+        _ins_00,                    # 0xc6 nop 
+        _ins_00,                    # 0xc7 nop 
+        _ins_00,                    # 0xc8 nop 
+        _ins_00,                    # 0xc9 nop 
+        _ins_00,                    # 0xca nop 
+        _ins_00,                    # 0xcb nop 
+        _ins_00,                    # 0xcc nop 
+        _ins_00,                    # 0xcd nop 
+        _ins_00,                    # 0xce nop 
+        _ins_00,                    # 0xcf nop 
+        _ins_00,                    # 0xd0 nop 
+        _ins_00,                    # 0xd1 nop 
+        _ins_00,                    # 0xd2 nop 
+        _ins_00,                    # 0xd3 nop 
+        _ins_00,                    # 0xd4 nop 
+        _ins_00,                    # 0xd5 nop 
+        _ins_00,                    # 0xd6 nop 
+        _ins_00,                    # 0xd7 nop 
+        _ins_00,                    # 0xd8 nop 
+        _ins_00,                    # 0xd9 nop 
+        _ins_00,                    # 0xda nop 
+        _ins_00,                    # 0xdb nop 
+        _ins_00,                    # 0xdc nop 
+        _ins_00,                    # 0xdd nop 
+        _ins_00,                    # 0xde nop 
+        _ins_00,                    # 0xdf nop 
+        _ins_00,                    # 0xe0 nop 
+        _ins_00,                    # 0xe1 nop 
+        _ins_00,                    # 0xe2 nop 
+        _ins_00,                    # 0xe3 nop 
+        _ins_00,                    # 0xe4 nop 
+        _ins_00,                    # 0xe5 nop 
+        _ins_00,                    # 0xe6 nop 
+        _ins_00,                    # 0xe7 nop 
+        _ins_00,                    # 0xe8 nop 
+        _ins_00,                    # 0xe9 nop 
+        _ins_00,                    # 0xea nop 
+        _ins_00,                    # 0xeb nop 
+        _ins_00,                    # 0xec nop 
+        _ins_00,                    # 0xed nop 
+        _ins_00,                    # 0xee nop 
+        _ins_00,                    # 0xef nop 
+        _ins_00,                    # 0xf0 nop 
+        _ins_00,                    # 0xf1 nop 
+        _ins_00,                    # 0xf2 nop 
+        _ins_00,                    # 0xf3 nop 
+        _ins_00,                    # 0xf4 nop 
+        _ins_00,                    # 0xf5 nop 
+        _ins_00,                    # 0xf6 nop 
+        _ins_00,                    # 0xf7 nop 
+        _ins_00,                    # 0xf8 nop 
+        _ins_00,                    # 0xf9 nop 
+        _ins_00,                    # 0xfa nop 
+        _ins_00,                    # 0xfb nop 
+        _ins_00,                    # 0xfc nop 
+        _ins_00,                    # 0xfd nop 
+        _ins_00,                    # 0xfe nop 
+        _ins_00,                    # 0xff nop 
+    )
+    opcodes_fd = (
+        _ins_00,                    # 0x00 nop 
+        _ins_01,                    # 0x01 ld bc,0000
+        _ins_02,                    # 0x02 ld (bc),a
+        _ins_03,                    # 0x03 inc bc
+        _ins_04,                    # 0x04 inc b
+        _ins_05,                    # 0x05 dec b
+        _ins_06,                    # 0x06 ld b,00
+        _ins_07,                    # 0x07 rlca 
+        _ins_08,                    # 0x08 ex af,af'
+        _ins_fd09,                  # 0x09 add iy,bc
+        _ins_0a,                    # 0x0a ld a,(bc)
+        _ins_0b,                    # 0x0b dec bc
+        _ins_0c,                    # 0x0c inc c
+        _ins_0d,                    # 0x0d dec c
+        _ins_0e,                    # 0x0e ld c,00
+        _ins_0f,                    # 0x0f rrca 
+        _ins_dd10,                  # 0x10 djnz 0003
+        _ins_11,                    # 0x11 ld de,0000
+        _ins_12,                    # 0x12 ld (de),a
+        _ins_13,                    # 0x13 inc de
+        _ins_14,                    # 0x14 inc d
+        _ins_15,                    # 0x15 dec d
+        _ins_16,                    # 0x16 ld d,00
+        _ins_17,                    # 0x17 rla 
+        _ins_dd18,                  # 0x18 jr 0003
+        _ins_fd19,                  # 0x19 add iy,de
+        _ins_1a,                    # 0x1a ld a,(de)
+        _ins_1b,                    # 0x1b dec de
+        _ins_1c,                    # 0x1c inc e
+        _ins_1d,                    # 0x1d dec e
+        _ins_1e,                    # 0x1e ld e,00
+        _ins_1f,                    # 0x1f rra 
+        _ins_dd20,                  # 0x20 jr nz,0003
+        _ins_fd21,                  # 0x21 ld iy,0000
+        _ins_fd22,                  # 0x22 ld (0000),iy
+        _ins_fd23,                  # 0x23 inc iy
+        _ins_fd24,                  # 0x24 inc iyh
+        _ins_fd25,                  # 0x25 dec iyh
+        _ins_fd26,                  # 0x26 ld iyh,00
+        _ins_27,                    # 0x27 daa 
+        _ins_dd28,                  # 0x28 jr z,0003
+        _ins_fd29,                  # 0x29 add iy,iy
+        _ins_fd2a,                  # 0x2a ld iy,(0000)
+        _ins_fd2b,                  # 0x2b dec iy
+        _ins_fd2c,                  # 0x2c inc iyl
+        _ins_fd2d,                  # 0x2d dec iyl
+        _ins_fd2e,                  # 0x2e ld iyl,00
+        _ins_2f,                    # 0x2f cpl 
+        _ins_dd30,                  # 0x30 jr nc,0003
+        _ins_31,                    # 0x31 ld sp,0000
+        _ins_32,                    # 0x32 ld (0000),a
+        _ins_33,                    # 0x33 inc sp
+        _ins_fd34,                  # 0x34 inc (iy+00)
+        _ins_fd35,                  # 0x35 dec (iy+00)
+        _ins_fd36,                  # 0x36 ld (iy+00),00
+        _ins_37,                    # 0x37 scf 
+        _ins_dd38,                  # 0x38 jr c,0003
+        _ins_fd39,                  # 0x39 add iy,sp
+        _ins_3a,                    # 0x3a ld a,(0000)
+        _ins_3b,                    # 0x3b dec sp
+        _ins_3c,                    # 0x3c inc a
+        _ins_3d,                    # 0x3d dec a
+        _ins_3e,                    # 0x3e ld a,00
+        _ins_3f,                    # 0x3f ccf 
+        _ins_40,                    # 0x40 ld b,b
+        _ins_41,                    # 0x41 ld b,c
+        _ins_42,                    # 0x42 ld b,d
+        _ins_43,                    # 0x43 ld b,e
+        _ins_fd44,                  # 0x44 ld b,iyh
+        _ins_fd45,                  # 0x45 ld b,iyl
+        _ins_fd46,                  # 0x46 ld b,(iy+00)
+        _ins_47,                    # 0x47 ld b,a
+        _ins_48,                    # 0x48 ld c,b
+        _ins_49,                    # 0x49 ld c,c
+        _ins_4a,                    # 0x4a ld c,d
+        _ins_4b,                    # 0x4b ld c,e
+        _ins_fd4c,                  # 0x4c ld c,iyh
+        _ins_fd4d,                  # 0x4d ld c,iyl
+        _ins_fd4e,                  # 0x4e ld c,(iy+00)
+        _ins_4f,                    # 0x4f ld c,a
+        _ins_50,                    # 0x50 ld d,b
+        _ins_51,                    # 0x51 ld d,c
+        _ins_52,                    # 0x52 ld d,d
+        _ins_53,                    # 0x53 ld d,e
+        _ins_fd54,                  # 0x54 ld d,iyh
+        _ins_fd55,                  # 0x55 ld d,iyl
+        _ins_fd56,                  # 0x56 ld d,(iy+00)
+        _ins_57,                    # 0x57 ld d,a
+        _ins_58,                    # 0x58 ld e,b
+        _ins_59,                    # 0x59 ld e,c
+        _ins_5a,                    # 0x5a ld e,d
+        _ins_5b,                    # 0x5b ld e,e
+        _ins_fd5c,                  # 0x5c ld e,iyh
+        _ins_fd5d,                  # 0x5d ld e,iyl
+        _ins_fd5e,                  # 0x5e ld e,(iy+00)
+        _ins_5f,                    # 0x5f ld e,a
+        _ins_fd60,                  # 0x60 ld iyh,b
+        _ins_fd61,                  # 0x61 ld iyh,c
+        _ins_fd62,                  # 0x62 ld iyh,d
+        _ins_fd63,                  # 0x63 ld iyh,e
+        _ins_fd64,                  # 0x64 ld iyh,iyh
+        _ins_fd65,                  # 0x65 ld iyh,iyl
+        _ins_fd66,                  # 0x66 ld h,(iy+00)
+        _ins_fd67,                  # 0x67 ld iyh,a
+        _ins_fd68,                  # 0x68 ld iyl,b
+        _ins_fd69,                  # 0x69 ld iyl,c
+        _ins_fd6a,                  # 0x6a ld iyl,d
+        _ins_fd6b,                  # 0x6b ld iyl,e
+        _ins_fd6c,                  # 0x6c ld iyl,iyh
+        _ins_fd6d,                  # 0x6d ld iyl,iyl
+        _ins_fd6e,                  # 0x6e ld l,(iy+00)
+        _ins_fd6f,                  # 0x6f ld iyl,a
+        _ins_fd70,                  # 0x70 ld (iy+00),b
+        _ins_fd71,                  # 0x71 ld (iy+00),c
+        _ins_fd72,                  # 0x72 ld (iy+00),d
+        _ins_fd73,                  # 0x73 ld (iy+00),e
+        _ins_fd74,                  # 0x74 ld (iy+00),h
+        _ins_fd75,                  # 0x75 ld (iy+00),l
+        _ins_76,                    # 0x76 halt 
+        _ins_fd77,                  # 0x77 ld (iy+00),a
+        _ins_78,                    # 0x78 ld a,b
+        _ins_79,                    # 0x79 ld a,c
+        _ins_7a,                    # 0x7a ld a,d
+        _ins_7b,                    # 0x7b ld a,e
+        _ins_fd7c,                  # 0x7c ld a,iyh
+        _ins_fd7d,                  # 0x7d ld a,iyl
+        _ins_fd7e,                  # 0x7e ld a,(iy+00)
+        _ins_7f,                    # 0x7f ld a,a
+        _ins_80,                    # 0x80 add a,b
+        _ins_81,                    # 0x81 add a,c
+        _ins_82,                    # 0x82 add a,d
+        _ins_83,                    # 0x83 add a,e
+        _ins_fd84,                  # 0x84 add a,iyh
+        _ins_fd85,                  # 0x85 add a,iyl
+        _ins_fd86,                  # 0x86 add a,(iy+00)
+        _ins_87,                    # 0x87 add a,a
+        _ins_88,                    # 0x88 adc a,b
+        _ins_89,                    # 0x89 adc a,c
+        _ins_8a,                    # 0x8a adc a,d
+        _ins_8b,                    # 0x8b adc a,e
+        _ins_fd8c,                  # 0x8c adc a,iyh
+        _ins_fd8d,                  # 0x8d adc a,iyl
+        _ins_fd8e,                  # 0x8e adc a,(iy+00)
+        _ins_8f,                    # 0x8f adc a,a
+        _ins_90,                    # 0x90 sub b
+        _ins_91,                    # 0x91 sub c
+        _ins_92,                    # 0x92 sub d
+        _ins_93,                    # 0x93 sub e
+        _ins_fd94,                  # 0x94 sub iyh
+        _ins_fd95,                  # 0x95 sub iyl
+        _ins_fd96,                  # 0x96 sub (iy+00)
+        _ins_97,                    # 0x97 sub a
+        _ins_98,                    # 0x98 sbc a,b
+        _ins_99,                    # 0x99 sbc a,c
+        _ins_9a,                    # 0x9a sbc a,d
+        _ins_9b,                    # 0x9b sbc a,e
+        _ins_fd9c,                  # 0x9c sbc a,iyh
+        _ins_fd9d,                  # 0x9d sbc a,iyl
+        _ins_fd9e,                  # 0x9e sbc a,(iy+00)
+        _ins_9f,                    # 0x9f sbc a,a
+        _ins_a0,                    # 0xa0 and b
+        _ins_a1,                    # 0xa1 and c
+        _ins_a2,                    # 0xa2 and d
+        _ins_a3,                    # 0xa3 and e
+        _ins_fda4,                  # 0xa4 and iyh
+        _ins_fda5,                  # 0xa5 and iyl
+        _ins_fda6,                  # 0xa6 and (iy+00)
+        _ins_a7,                    # 0xa7 and a
+        _ins_a8,                    # 0xa8 xor b
+        _ins_a9,                    # 0xa9 xor c
+        _ins_aa,                    # 0xaa xor d
+        _ins_ab,                    # 0xab xor e
+        _ins_fdac,                  # 0xac xor iyh
+        _ins_fdad,                  # 0xad xor iyl
+        _ins_fdae,                  # 0xae xor (iy+00)
+        _ins_af,                    # 0xaf xor a
+        _ins_b0,                    # 0xb0 or b
+        _ins_b1,                    # 0xb1 or c
+        _ins_b2,                    # 0xb2 or d
+        _ins_b3,                    # 0xb3 or e
+        _ins_fdb4,                  # 0xb4 or iyh
+        _ins_fdb5,                  # 0xb5 or iyl
+        _ins_fdb6,                  # 0xb6 or (iy+00)
+        _ins_b7,                    # 0xb7 or a
+        _ins_b8,                    # 0xb8 cp b
+        _ins_b9,                    # 0xb9 cp c
+        _ins_ba,                    # 0xba cp d
+        _ins_bb,                    # 0xbb cp e
+        _ins_fdbc,                  # 0xbc cp iyh
+        _ins_fdbd,                  # 0xbd cp iyl
+        _ins_fdbe,                  # 0xbe cp (iy+00)
+        _ins_bf,                    # 0xbf cp a
+        _ins_c0,                    # 0xc0 ret nz
+        _ins_c1,                    # 0xc1 pop bc
+        _ins_c2,                    # 0xc2 jp nz,0000
+        _ins_c3,                    # 0xc3 jp 0000
+        _ins_c4,                    # 0xc4 call nz,0000
+        _ins_c5,                    # 0xc5 push bc
+        _ins_c6,                    # 0xc6 add a,00
+        _ins_c7,                    # 0xc7 rst 00
+        _ins_c8,                    # 0xc8 ret z
+        _ins_c9,                    # 0xc9 ret 
+        _ins_ca,                    # 0xca jp z,0000
+        _execute_fdcb,              # 0xcb execute fdcb prefix
+        _ins_cc,                    # 0xcc call z,0000
+        _ins_cd,                    # 0xcd call 0000
+        _ins_ce,                    # 0xce adc a,00
+        _ins_cf,                    # 0xcf rst 08
+        _ins_d0,                    # 0xd0 ret nc
+        _ins_d1,                    # 0xd1 pop de
+        _ins_d2,                    # 0xd2 jp nc,0000
+        _ins_d3,                    # 0xd3 out (00),a
+        _ins_d4,                    # 0xd4 call nc,0000
+        _ins_d5,                    # 0xd5 push de
+        _ins_d6,                    # 0xd6 sub 00
+        _ins_d7,                    # 0xd7 rst 10
+        _ins_d8,                    # 0xd8 ret c
+        _ins_d9,                    # 0xd9 exx 
+        _ins_da,                    # 0xda jp c,0000
+        _ins_db,                    # 0xdb in a,(00)
+        _ins_dc,                    # 0xdc call c,0000
+        _execute_fddd,              # 0xdd execute fddd prefix
+        _ins_de,                    # 0xde sbc a,00
+        _ins_df,                    # 0xdf rst 18
+        _ins_e0,                    # 0xe0 ret po
+        _ins_fde1,                  # 0xe1 pop iy
+        _ins_e2,                    # 0xe2 jp po,0000
+        _ins_fde3,                  # 0xe3 ex (sp),iy
+        _ins_e4,                    # 0xe4 call po,0000
+        _ins_fde5,                  # 0xe5 push iy
+        _ins_e6,                    # 0xe6 and 00
+        _ins_e7,                    # 0xe7 rst 20
+        _ins_e8,                    # 0xe8 ret pe
+        _ins_fde9,                  # 0xe9 jp iy
+        _ins_ea,                    # 0xea jp pe,0000
+        _ins_eb,                    # 0xeb ex de,hl
+        _ins_ec,                    # 0xec call pe,0000
+        _ins_00,                    # 0xed nop 
+        _ins_ee,                    # 0xee xor 00
+        _ins_ef,                    # 0xef rst 28
+        _ins_f0,                    # 0xf0 ret p
+        _ins_f1,                    # 0xf1 pop af
+        _ins_f2,                    # 0xf2 jp p,0000
+        _ins_f3,                    # 0xf3 di 
+        _ins_f4,                    # 0xf4 call p,0000
+        _ins_f5,                    # 0xf5 push af
+        _ins_f6,                    # 0xf6 or 00
+        _ins_f7,                    # 0xf7 rst 30
+        _ins_f8,                    # 0xf8 ret m
+        _ins_fdf9,                  # 0xf9 ld sp,iy
+        _ins_fa,                    # 0xfa jp m,0000
+        _ins_fb,                    # 0xfb ei 
+        _ins_fc,                    # 0xfc call m,0000
+        _execute_fdfd,              # 0xfd execute fdfd prefix
+        _ins_fe,                    # 0xfe cp 00
+        _ins_ff,                    # 0xff rst 38
+    )
+    opcodes_fdcb00 = (
+        _ins_fdcb0000,              # 0x00 rlc (iy+00),b
+        _ins_fdcb0001,              # 0x01 rlc (iy+00),c
+        _ins_fdcb0002,              # 0x02 rlc (iy+00),d
+        _ins_fdcb0003,              # 0x03 rlc (iy+00),e
+        _ins_fdcb0004,              # 0x04 rlc (iy+00),h
+        _ins_fdcb0005,              # 0x05 rlc (iy+00),l
+        _ins_fdcb0006,              # 0x06 rlc (iy+00)
+        _ins_fdcb0007,              # 0x07 rlc (iy+00),a
+        _ins_fdcb0008,              # 0x08 rrc (iy+00),b
+        _ins_fdcb0009,              # 0x09 rrc (iy+00),c
+        _ins_fdcb000a,              # 0x0a rrc (iy+00),d
+        _ins_fdcb000b,              # 0x0b rrc (iy+00),e
+        _ins_fdcb000c,              # 0x0c rrc (iy+00),h
+        _ins_fdcb000d,              # 0x0d rrc (iy+00),l
+        _ins_fdcb000e,              # 0x0e rrc (iy+00)
+        _ins_fdcb000f,              # 0x0f rrc (iy+00),a
+        _ins_fdcb0010,              # 0x10 rl (iy+00),b
+        _ins_fdcb0011,              # 0x11 rl (iy+00),c
+        _ins_fdcb0012,              # 0x12 rl (iy+00),d
+        _ins_fdcb0013,              # 0x13 rl (iy+00),e
+        _ins_fdcb0014,              # 0x14 rl (iy+00),h
+        _ins_fdcb0015,              # 0x15 rl (iy+00),l
+        _ins_fdcb0016,              # 0x16 rl (iy+00)
+        _ins_fdcb0017,              # 0x17 rl (iy+00),a
+        _ins_fdcb0018,              # 0x18 rr (iy+00),b
+        _ins_fdcb0019,              # 0x19 rr (iy+00),c
+        _ins_fdcb001a,              # 0x1a rr (iy+00),d
+        _ins_fdcb001b,              # 0x1b rr (iy+00),e
+        _ins_fdcb001c,              # 0x1c rr (iy+00),h
+        _ins_fdcb001d,              # 0x1d rr (iy+00),l
+        _ins_fdcb001e,              # 0x1e rr (iy+00)
+        _ins_fdcb001f,              # 0x1f rr (iy+00),a
+        _ins_fdcb0020,              # 0x20 sla (iy+00),b
+        _ins_fdcb0021,              # 0x21 sla (iy+00),c
+        _ins_fdcb0022,              # 0x22 sla (iy+00),d
+        _ins_fdcb0023,              # 0x23 sla (iy+00),e
+        _ins_fdcb0024,              # 0x24 sla (iy+00),h
+        _ins_fdcb0025,              # 0x25 sla (iy+00),l
+        _ins_fdcb0026,              # 0x26 sla (iy+00)
+        _ins_fdcb0027,              # 0x27 sla (iy+00),a
+        _ins_fdcb0028,              # 0x28 sra (iy+00),b
+        _ins_fdcb0029,              # 0x29 sra (iy+00),c
+        _ins_fdcb002a,              # 0x2a sra (iy+00),d
+        _ins_fdcb002b,              # 0x2b sra (iy+00),e
+        _ins_fdcb002c,              # 0x2c sra (iy+00),h
+        _ins_fdcb002d,              # 0x2d sra (iy+00),l
+        _ins_fdcb002e,              # 0x2e sra (iy+00)
+        _ins_fdcb002f,              # 0x2f sra (iy+00),a
+        _ins_fdcb0030,              # 0x30 sll (iy+00),b
+        _ins_fdcb0031,              # 0x31 sll (iy+00),c
+        _ins_fdcb0032,              # 0x32 sll (iy+00),d
+        _ins_fdcb0033,              # 0x33 sll (iy+00),e
+        _ins_fdcb0034,              # 0x34 sll (iy+00),h
+        _ins_fdcb0035,              # 0x35 sll (iy+00),l
+        _ins_fdcb0036,              # 0x36 sll (iy+00)
+        _ins_fdcb0037,              # 0x37 sll (iy+00),a
+        _ins_fdcb0038,              # 0x38 srl (iy+00),b
+        _ins_fdcb0039,              # 0x39 srl (iy+00),c
+        _ins_fdcb003a,              # 0x3a srl (iy+00),d
+        _ins_fdcb003b,              # 0x3b srl (iy+00),e
+        _ins_fdcb003c,              # 0x3c srl (iy+00),h
+        _ins_fdcb003d,              # 0x3d srl (iy+00),l
+        _ins_fdcb003e,              # 0x3e srl (iy+00)
+        _ins_fdcb003f,              # 0x3f srl (iy+00),a
+        _ins_fdcb0040,              # 0x40 bit 0,(iy+00)
+        _ins_fdcb0040,              # 0x41 bit 0,(iy+00)
+        _ins_fdcb0040,              # 0x42 bit 0,(iy+00)
+        _ins_fdcb0040,              # 0x43 bit 0,(iy+00)
+        _ins_fdcb0040,              # 0x44 bit 0,(iy+00)
+        _ins_fdcb0040,              # 0x45 bit 0,(iy+00)
+        _ins_fdcb0040,              # 0x46 bit 0,(iy+00)
+        _ins_fdcb0040,              # 0x47 bit 0,(iy+00)
+        _ins_fdcb0048,              # 0x48 bit 1,(iy+00)
+        _ins_fdcb0048,              # 0x49 bit 1,(iy+00)
+        _ins_fdcb0048,              # 0x4a bit 1,(iy+00)
+        _ins_fdcb0048,              # 0x4b bit 1,(iy+00)
+        _ins_fdcb0048,              # 0x4c bit 1,(iy+00)
+        _ins_fdcb0048,              # 0x4d bit 1,(iy+00)
+        _ins_fdcb0048,              # 0x4e bit 1,(iy+00)
+        _ins_fdcb0048,              # 0x4f bit 1,(iy+00)
+        _ins_fdcb0050,              # 0x50 bit 2,(iy+00)
+        _ins_fdcb0050,              # 0x51 bit 2,(iy+00)
+        _ins_fdcb0050,              # 0x52 bit 2,(iy+00)
+        _ins_fdcb0050,              # 0x53 bit 2,(iy+00)
+        _ins_fdcb0050,              # 0x54 bit 2,(iy+00)
+        _ins_fdcb0050,              # 0x55 bit 2,(iy+00)
+        _ins_fdcb0050,              # 0x56 bit 2,(iy+00)
+        _ins_fdcb0050,              # 0x57 bit 2,(iy+00)
+        _ins_fdcb0058,              # 0x58 bit 3,(iy+00)
+        _ins_fdcb0058,              # 0x59 bit 3,(iy+00)
+        _ins_fdcb0058,              # 0x5a bit 3,(iy+00)
+        _ins_fdcb0058,              # 0x5b bit 3,(iy+00)
+        _ins_fdcb0058,              # 0x5c bit 3,(iy+00)
+        _ins_fdcb0058,              # 0x5d bit 3,(iy+00)
+        _ins_fdcb0058,              # 0x5e bit 3,(iy+00)
+        _ins_fdcb0058,              # 0x5f bit 3,(iy+00)
+        _ins_fdcb0060,              # 0x60 bit 4,(iy+00)
+        _ins_fdcb0060,              # 0x61 bit 4,(iy+00)
+        _ins_fdcb0060,              # 0x62 bit 4,(iy+00)
+        _ins_fdcb0060,              # 0x63 bit 4,(iy+00)
+        _ins_fdcb0060,              # 0x64 bit 4,(iy+00)
+        _ins_fdcb0060,              # 0x65 bit 4,(iy+00)
+        _ins_fdcb0060,              # 0x66 bit 4,(iy+00)
+        _ins_fdcb0060,              # 0x67 bit 4,(iy+00)
+        _ins_fdcb0068,              # 0x68 bit 5,(iy+00)
+        _ins_fdcb0068,              # 0x69 bit 5,(iy+00)
+        _ins_fdcb0068,              # 0x6a bit 5,(iy+00)
+        _ins_fdcb0068,              # 0x6b bit 5,(iy+00)
+        _ins_fdcb0068,              # 0x6c bit 5,(iy+00)
+        _ins_fdcb0068,              # 0x6d bit 5,(iy+00)
+        _ins_fdcb0068,              # 0x6e bit 5,(iy+00)
+        _ins_fdcb0068,              # 0x6f bit 5,(iy+00)
+        _ins_fdcb0070,              # 0x70 bit 6,(iy+00)
+        _ins_fdcb0070,              # 0x71 bit 6,(iy+00)
+        _ins_fdcb0070,              # 0x72 bit 6,(iy+00)
+        _ins_fdcb0070,              # 0x73 bit 6,(iy+00)
+        _ins_fdcb0070,              # 0x74 bit 6,(iy+00)
+        _ins_fdcb0070,              # 0x75 bit 6,(iy+00)
+        _ins_fdcb0070,              # 0x76 bit 6,(iy+00)
+        _ins_fdcb0070,              # 0x77 bit 6,(iy+00)
+        _ins_fdcb0078,              # 0x78 bit 7,(iy+00)
+        _ins_fdcb0078,              # 0x79 bit 7,(iy+00)
+        _ins_fdcb0078,              # 0x7a bit 7,(iy+00)
+        _ins_fdcb0078,              # 0x7b bit 7,(iy+00)
+        _ins_fdcb0078,              # 0x7c bit 7,(iy+00)
+        _ins_fdcb0078,              # 0x7d bit 7,(iy+00)
+        _ins_fdcb0078,              # 0x7e bit 7,(iy+00)
+        _ins_fdcb0078,              # 0x7f bit 7,(iy+00)
+        _ins_fdcb0080,              # 0x80 res 0,(iy+00),b
+        _ins_fdcb0081,              # 0x81 res 0,(iy+00),c
+        _ins_fdcb0082,              # 0x82 res 0,(iy+00),d
+        _ins_fdcb0083,              # 0x83 res 0,(iy+00),e
+        _ins_fdcb0084,              # 0x84 res 0,(iy+00),h
+        _ins_fdcb0085,              # 0x85 res 0,(iy+00),l
+        _ins_fdcb0086,              # 0x86 res 0,(iy+00)
+        _ins_fdcb0087,              # 0x87 res 0,(iy+00),a
+        _ins_fdcb0088,              # 0x88 res 1,(iy+00),b
+        _ins_fdcb0089,              # 0x89 res 1,(iy+00),c
+        _ins_fdcb008a,              # 0x8a res 1,(iy+00),d
+        _ins_fdcb008b,              # 0x8b res 1,(iy+00),e
+        _ins_fdcb008c,              # 0x8c res 1,(iy+00),h
+        _ins_fdcb008d,              # 0x8d res 1,(iy+00),l
+        _ins_fdcb008e,              # 0x8e res 1,(iy+00)
+        _ins_fdcb008f,              # 0x8f res 1,(iy+00),a
+        _ins_fdcb0090,              # 0x90 res 2,(iy+00),b
+        _ins_fdcb0091,              # 0x91 res 2,(iy+00),c
+        _ins_fdcb0092,              # 0x92 res 2,(iy+00),d
+        _ins_fdcb0093,              # 0x93 res 2,(iy+00),e
+        _ins_fdcb0094,              # 0x94 res 2,(iy+00),h
+        _ins_fdcb0095,              # 0x95 res 2,(iy+00),l
+        _ins_fdcb0096,              # 0x96 res 2,(iy+00)
+        _ins_fdcb0097,              # 0x97 res 2,(iy+00),a
+        _ins_fdcb0098,              # 0x98 res 3,(iy+00),b
+        _ins_fdcb0099,              # 0x99 res 3,(iy+00),c
+        _ins_fdcb009a,              # 0x9a res 3,(iy+00),d
+        _ins_fdcb009b,              # 0x9b res 3,(iy+00),e
+        _ins_fdcb009c,              # 0x9c res 3,(iy+00),h
+        _ins_fdcb009d,              # 0x9d res 3,(iy+00),l
+        _ins_fdcb009e,              # 0x9e res 3,(iy+00)
+        _ins_fdcb009f,              # 0x9f res 3,(iy+00),a
+        _ins_fdcb00a0,              # 0xa0 res 4,(iy+00),b
+        _ins_fdcb00a1,              # 0xa1 res 4,(iy+00),c
+        _ins_fdcb00a2,              # 0xa2 res 4,(iy+00),d
+        _ins_fdcb00a3,              # 0xa3 res 4,(iy+00),e
+        _ins_fdcb00a4,              # 0xa4 res 4,(iy+00),h
+        _ins_fdcb00a5,              # 0xa5 res 4,(iy+00),l
+        _ins_fdcb00a6,              # 0xa6 res 4,(iy+00)
+        _ins_fdcb00a7,              # 0xa7 res 4,(iy+00),a
+        _ins_fdcb00a8,              # 0xa8 res 5,(iy+00),b
+        _ins_fdcb00a9,              # 0xa9 res 5,(iy+00),c
+        _ins_fdcb00aa,              # 0xaa res 5,(iy+00),d
+        _ins_fdcb00ab,              # 0xab res 5,(iy+00),e
+        _ins_fdcb00ac,              # 0xac res 5,(iy+00),h
+        _ins_fdcb00ad,              # 0xad res 5,(iy+00),l
+        _ins_fdcb00ae,              # 0xae res 5,(iy+00)
+        _ins_fdcb00af,              # 0xaf res 5,(iy+00),a
+        _ins_fdcb00b0,              # 0xb0 res 6,(iy+00),b
+        _ins_fdcb00b1,              # 0xb1 res 6,(iy+00),c
+        _ins_fdcb00b2,              # 0xb2 res 6,(iy+00),d
+        _ins_fdcb00b3,              # 0xb3 res 6,(iy+00),e
+        _ins_fdcb00b4,              # 0xb4 res 6,(iy+00),h
+        _ins_fdcb00b5,              # 0xb5 res 6,(iy+00),l
+        _ins_fdcb00b6,              # 0xb6 res 6,(iy+00)
+        _ins_fdcb00b7,              # 0xb7 res 6,(iy+00),a
+        _ins_fdcb00b8,              # 0xb8 res 7,(iy+00),b
+        _ins_fdcb00b9,              # 0xb9 res 7,(iy+00),c
+        _ins_fdcb00ba,              # 0xba res 7,(iy+00),d
+        _ins_fdcb00bb,              # 0xbb res 7,(iy+00),e
+        _ins_fdcb00bc,              # 0xbc res 7,(iy+00),h
+        _ins_fdcb00bd,              # 0xbd res 7,(iy+00),l
+        _ins_fdcb00be,              # 0xbe res 7,(iy+00)
+        _ins_fdcb00bf,              # 0xbf res 7,(iy+00),a
+        _ins_fdcb00c0,              # 0xc0 set 0,(iy+00),b
+        _ins_fdcb00c1,              # 0xc1 set 0,(iy+00),c
+        _ins_fdcb00c2,              # 0xc2 set 0,(iy+00),d
+        _ins_fdcb00c3,              # 0xc3 set 0,(iy+00),e
+        _ins_fdcb00c4,              # 0xc4 set 0,(iy+00),h
+        _ins_fdcb00c5,              # 0xc5 set 0,(iy+00),l
+        _ins_fdcb00c6,              # 0xc6 set 0,(iy+00)
+        _ins_fdcb00c7,              # 0xc7 set 0,(iy+00),a
+        _ins_fdcb00c8,              # 0xc8 set 1,(iy+00),b
+        _ins_fdcb00c9,              # 0xc9 set 1,(iy+00),c
+        _ins_fdcb00ca,              # 0xca set 1,(iy+00),d
+        _ins_fdcb00cb,              # 0xcb set 1,(iy+00),e
+        _ins_fdcb00cc,              # 0xcc set 1,(iy+00),h
+        _ins_fdcb00cd,              # 0xcd set 1,(iy+00),l
+        _ins_fdcb00ce,              # 0xce set 1,(iy+00)
+        _ins_fdcb00cf,              # 0xcf set 1,(iy+00),a
+        _ins_fdcb00d0,              # 0xd0 set 2,(iy+00),b
+        _ins_fdcb00d1,              # 0xd1 set 2,(iy+00),c
+        _ins_fdcb00d2,              # 0xd2 set 2,(iy+00),d
+        _ins_fdcb00d3,              # 0xd3 set 2,(iy+00),e
+        _ins_fdcb00d4,              # 0xd4 set 2,(iy+00),h
+        _ins_fdcb00d5,              # 0xd5 set 2,(iy+00),l
+        _ins_fdcb00d6,              # 0xd6 set 2,(iy+00)
+        _ins_fdcb00d7,              # 0xd7 set 2,(iy+00),a
+        _ins_fdcb00d8,              # 0xd8 set 3,(iy+00),b
+        _ins_fdcb00d9,              # 0xd9 set 3,(iy+00),c
+        _ins_fdcb00da,              # 0xda set 3,(iy+00),d
+        _ins_fdcb00db,              # 0xdb set 3,(iy+00),e
+        _ins_fdcb00dc,              # 0xdc set 3,(iy+00),h
+        _ins_fdcb00dd,              # 0xdd set 3,(iy+00),l
+        _ins_fdcb00de,              # 0xde set 3,(iy+00)
+        _ins_fdcb00df,              # 0xdf set 3,(iy+00),a
+        _ins_fdcb00e0,              # 0xe0 set 4,(iy+00),b
+        _ins_fdcb00e1,              # 0xe1 set 4,(iy+00),c
+        _ins_fdcb00e2,              # 0xe2 set 4,(iy+00),d
+        _ins_fdcb00e3,              # 0xe3 set 4,(iy+00),e
+        _ins_fdcb00e4,              # 0xe4 set 4,(iy+00),h
+        _ins_fdcb00e5,              # 0xe5 set 4,(iy+00),l
+        _ins_fdcb00e6,              # 0xe6 set 4,(iy+00)
+        _ins_fdcb00e7,              # 0xe7 set 4,(iy+00),a
+        _ins_fdcb00e8,              # 0xe8 set 5,(iy+00),b
+        _ins_fdcb00e9,              # 0xe9 set 5,(iy+00),c
+        _ins_fdcb00ea,              # 0xea set 5,(iy+00),d
+        _ins_fdcb00eb,              # 0xeb set 5,(iy+00),e
+        _ins_fdcb00ec,              # 0xec set 5,(iy+00),h
+        _ins_fdcb00ed,              # 0xed set 5,(iy+00),l
+        _ins_fdcb00ee,              # 0xee set 5,(iy+00)
+        _ins_fdcb00ef,              # 0xef set 5,(iy+00),a
+        _ins_fdcb00f0,              # 0xf0 set 6,(iy+00),b
+        _ins_fdcb00f1,              # 0xf1 set 6,(iy+00),c
+        _ins_fdcb00f2,              # 0xf2 set 6,(iy+00),d
+        _ins_fdcb00f3,              # 0xf3 set 6,(iy+00),e
+        _ins_fdcb00f4,              # 0xf4 set 6,(iy+00),h
+        _ins_fdcb00f5,              # 0xf5 set 6,(iy+00),l
+        _ins_fdcb00f6,              # 0xf6 set 6,(iy+00)
+        _ins_fdcb00f7,              # 0xf7 set 6,(iy+00),a
+        _ins_fdcb00f8,              # 0xf8 set 7,(iy+00),b
+        _ins_fdcb00f9,              # 0xf9 set 7,(iy+00),c
+        _ins_fdcb00fa,              # 0xfa set 7,(iy+00),d
+        _ins_fdcb00fb,              # 0xfb set 7,(iy+00),e
+        _ins_fdcb00fc,              # 0xfc set 7,(iy+00),h
+        _ins_fdcb00fd,              # 0xfd set 7,(iy+00),l
+        _ins_fdcb00fe,              # 0xfe set 7,(iy+00)
+        _ins_fdcb00ff,              # 0xff set 7,(iy+00),a
+    )
@@ -4,6 +4,7 @@ Z80 Opcode Emulation Generator
 """
 #-----------------------------------------------------------------------------
 
+import io
 import sys
 import getopt
 import z80da
@@ -11,6 +12,10 @@ import memory
 
 #-----------------------------------------------------------------------------
 # format is (opcode prefix), (links to other prefixes), 'function preamble'
+#
+# The opcode and flag tables are class attributes, built once when the
+# module is imported. Opcode tables hold plain functions: dispatch with
+# self.opcodes[code](self)
 
 _prefixes = (
     ((), (0xcb, 0xdd, 0xed, 0xfd), '(self):'),
@@ -29,8 +34,8 @@ _indent = 4
 class output:
     """class for handling file output with auto indenting"""
 
-    def __init__(self, ofname):
-        self.ofile = file('%s' % ofname, 'w')
+    def __init__(self, ofile):
+        self.ofile = ofile
         self.lhs = 0
         self.col = 0
 
@@ -272,24 +277,51 @@ def emit_bli(out, op):
     if op in ('cpi', 'cpir', 'cpd', 'cpdr'):
         return emit_cpxx(out, op)
 
-    if op == 'ini':
-        out.put('assert False, \'unimplemented instruction\'\n')
-    elif op == 'ind':
-        out.put('assert False, \'unimplemented instruction\'\n')
-    elif op == 'inir':
-        out.put('assert False, \'unimplemented instruction\'\n')
-    elif op == 'indr':
-        out.put('assert False, \'unimplemented instruction\'\n')
-    elif op == 'outi':
-        out.put('assert False, \'unimplemented instruction\'\n')
-    elif op == 'outd':
-        out.put('assert False, \'unimplemented instruction\'\n')
-    elif op == 'otir':
-        out.put('assert False, \'unimplemented instruction\'\n')
-    elif op == 'otdr':
-        out.put('assert False, \'unimplemented instruction\'\n')
-    else:
-        assert False
+    if op in ('ini', 'inir', 'ind', 'indr'):
+        return emit_inxx(out, op)
+    if op in ('outi', 'otir', 'outd', 'otdr'):
+        return emit_outxx(out, op)
+    assert False
+
+def emit_inxx(out, op):
+    """ini, inir, ind, indr"""
+    dirn = ('-', '+')[op in ('ini', 'inir')]
+    if op in ('inir', 'indr'):
+        # transfer the whole block if the port handler takes buffers
+        out.put('n = self._bulk_in(%s1)\n' % dirn)
+        out.put('if n:\n')
+        out.put('    return n\n')
+    out.put('val = self.io.rd(self._get_bc())\n')
+    out.put('self.b = (self.b - 1) & 0xff\n')
+    out.put('hl = self._get_hl()\n')
+    out.put('self.mem[hl] = val\n')
+    out.put('self._set_hl(hl %s 1)\n' % dirn)
+    out.put('self._block_io_flags(val, ((self.c %s 1) & 0xff) + val)\n' % dirn)
+    if op in ('inir', 'indr'):
+        out.put('if self.b:\n')
+        out.put('    self._dec_pc(2)\n')
+        out.put('    return 17\n')
+    out.put('return 12\n')
+
+def emit_outxx(out, op):
+    """outi, otir, outd, otdr"""
+    dirn = ('-', '+')[op in ('outi', 'otir')]
+    if op in ('otir', 'otdr'):
+        # transfer the whole block if the port handler takes buffers
+        out.put('n = self._bulk_out(%s1)\n' % dirn)
+        out.put('if n:\n')
+        out.put('    return n\n')
+    out.put('hl = self._get_hl()\n')
+    out.put('val = self.mem[hl]\n')
+    out.put('self.b = (self.b - 1) & 0xff\n')
+    out.put('self.io.wr(self._get_bc(), val)\n')
+    out.put('self._set_hl(hl %s 1)\n' % dirn)
+    out.put('self._block_io_flags(val, self.l + val)\n')
+    if op in ('otir', 'otdr'):
+        out.put('if self.b:\n')
+        out.put('    self._dec_pc(2)\n')
+        out.put('    return 17\n')
+    out.put('return 12\n')
 
 def emit_ex_mem_sp_r(out, r):
     """ex (sp),r"""
@@ -864,6 +896,12 @@ def emit_ret(out):
     out.put('self.pc = self._pop()\n')
     out.put('return 10\n')
 
+def emit_retn(out):
+    """retn/reti - restore iff1 from iff2"""
+    out.put('self.pc = self._pop()\n')
+    out.put('self.iff1 = self.iff2\n')
+    out.put('return 10\n')
+
 #-----------------------------------------------------------------------------
 # Input and Output Group
 
@@ -878,12 +916,12 @@ def emit_in_r_c(out, r):
 def emit_in_a_n(out):
     """in a,(n)"""
     out.put('self.a = self.io.rd((self.a << 8) | self._get_n())\n')
-    out.put('return 7\n')
+    out.put('return 11\n')
 
 def emit_out_n_a(out):
     """out (n),a"""
     out.put('self.io.wr((self.a << 8) | self._get_n(), self.a)\n')
-    out.put('return 7\n')
+    out.put('return 11\n')
 
 def emit_out_c_r(out, r):
     if r == '':
@@ -896,7 +934,7 @@ def emit_out_c_r(out, r):
 
 def emit_unimplemented(out):
     """unimplemented instruction - crash"""
-    out.put('raise Error, \'unimplemented instruction\'\n')
+    out.put('raise Error(\'unimplemented instruction\')\n')
 
 #-----------------------------------------------------------------------------
 
@@ -1269,12 +1307,8 @@ def emit_ed_prefix(out, code):
         elif z == 4:
             return emit_neg(out)
         elif z == 5:
-            if y == 1:
-                #return ('reti', '', 2)
-                return emit_unimplemented(out)
-            else:
-                #return ('retn', '', 2)
-                return emit_unimplemented(out)
+            # reti and retn
+            return emit_retn(out)
         elif z == 6:
             return emit_im(out, _im[y])
         else:
@@ -1337,9 +1371,9 @@ def emit_triple_quote(out, comment):
 
 def emit_opcode_table(out, idic, prefix, links, preamble):
     """emit a function table for each opcode with this prefix"""
-    out.indent(2)
+    out.indent(1)
     label = '_%s' % ''.join(['%02x' % byte for byte in prefix])
-    out.put('self.opcodes%s = (\n' % (label, '')[len(label) == 1])
+    out.put('opcodes%s = (\n' % (label, '')[len(label) == 1])
     out.indent(1)
 
     for opcode in range(0x100):
@@ -1354,20 +1388,20 @@ def emit_opcode_table(out, idic, prefix, links, preamble):
         label = ''.join(['%02x' % byte for byte in code])
 
         if opcode in links:
-            out.put('self._execute_%s,' % label)
+            out.put('_execute_%s,' % label)
             out.pad(36)
             out.put('# 0x%02x execute %s prefix\n' % (opcode, label))
         else:
             # add the inst/label to the dictionary if it is unique
-            if idic.has_key(inst) == False:
+            if inst not in idic:
                 idic[inst] = (label, code, preamble)
-            out.put('self._ins_%s,' % idic[inst][0])
+            out.put('_ins_%s,' % idic[inst][0])
             out.pad(36)
             out.put('# 0x%02x %s\n' % (opcode, inst))
 
     out.outdent(1)
     out.put(')\n')
-    out.outdent(2)
+    out.outdent(1)
 
 #-----------------------------------------------------------------------------
 
@@ -1403,7 +1437,7 @@ def pop(x):
     return p
 
 def emit_table(out, name, data):
-    out.put('self.%s = (\n' % name)
+    out.put('%s = (\n' % name)
     out.indent(1)
     for x in range(16):
        for y in range(16):
@@ -1448,34 +1482,37 @@ def emit_flag_tables(out):
         if (i & 0x0f) == 0x0f:
             SZHV_dec[i] |= _HF
 
-    out.indent(2)
+    out.indent(1)
     emit_table(out, 'f_sz', SZ)
     emit_table(out, 'f_szp', SZP)
     emit_table(out, 'f_szhv_inc', SZHV_inc)
     emit_table(out, 'f_szhv_dec', SZHV_dec)
-    out.outdent(2)
+    out.outdent(1)
 
 #-----------------------------------------------------------------------------
 
 def generate(ofname):
     """generate the opcode emulation file"""
-    out = output(ofname)
-    # generate flag tables
-    emit_flag_tables(out)
+    # generate the opcode tables - this collects the instruction functions
+    tables = output(io.StringIO())
     idic = {}
-    # generate the opcode tables
     for (prefix, links, preamble) in _prefixes:
-        emit_opcode_table(out, idic, prefix, links, preamble)
+        emit_opcode_table(tables, idic, prefix, links, preamble)
+    out = output(open(ofname, 'w'))
+    # generate flag tables
+    emit_flag_tables(out)
     # generate the instruction functions
-    for (k, v) in idic.iteritems():
+    for (k, v) in idic.items():
         emit_instruction_function(out, k, v)
+    # the opcode tables follow the functions they refer to
+    out.put(tables.ofile.getvalue())
     out.close()
 
 #-----------------------------------------------------------------------------
 
 def usage():
-    print 'usage:'
-    print '%s -o [OUTPUT]' % sys.argv[0]
+    print('usage:')
+    print('%s -o [OUTPUT]' % sys.argv[0])
     sys.exit(2)
 
 #-----------------------------------------------------------------------------
@@ -83,6 +83,92 @@ class cpu:
         self.f |= ((self.a ^ res ^ val) & _HF)
         self.f |= (((val ^ self.a) & (self.a ^ res) & 0x80) >> 5)
 
+    def _block_io_flags(self, val, k):
+        """set the flags for a block io instruction: val transferred, k = val + (c or l)"""
+        self.f = self.f_sz[self.b]
+        if val & 0x80:
+            self.f |= _NF
+        if k & 0x100:
+            self.f |= (_HF | _CF)
+        self.f |= (self.f_szp[(k & 0x07) ^ self.b] & _PF)
+
+    def _rd_block(self, adr, n, step):
+        """read n bytes from memory stepping from adr"""
+        if step < 0:
+            adr -= n - 1
+        read_block = getattr(self.mem, 'read_block', None)
+        if read_block is None:
+            data = bytes([self.mem[(adr + i) & 0xffff] for i in range(n)])
+        else:
+            data = read_block(adr, n)
+        return (data, data[::-1])[step < 0]
+
+    def _wr_block(self, adr, data, step):
+        """write bytes to memory stepping from adr"""
+        if step < 0:
+            adr -= len(data) - 1
+            data = data[::-1]
+        write_block = getattr(self.mem, 'write_block', None)
+        if write_block is None:
+            for (i, val) in enumerate(data):
+                self.mem[(adr + i) & 0xffff] = val
+        else:
+            write_block(adr, data)
+
+    def _bulk_in(self, step):
+        """
+        inir/indr: read the whole block with one io call if the port
+        handler takes buffers. Return the T-states taken, or 0 to run
+        the instruction a byte at a time.
+        The handler sees one time for the block: self.clks at its start.
+        """
+        bulk = getattr(self.io, 'rd_bulk', None)
+        if bulk is None:
+            return 0
+        n = self.b or 256
+        c = self.c
+        # the port address high byte counts down from b
+        ports = range((self.b << 8) | c, ((self.b - n) << 8) | c, -256)
+        rd_block = bulk(ports)
+        if rd_block is None:
+            return 0
+        data = rd_block(ports[0] & 0xffff, n)
+        hl = self._get_hl()
+        self._wr_block(hl, data, step)
+        self._set_hl(hl + (n * step))
+        self.b = 0
+        val = data[-1]
+        self._block_io_flags(val, ((c + step) & 0xff) + val)
+        self.r = (self.r + n - 1) & 0x7f
+        return (21 * (n - 1)) + 12
+
+    def _bulk_out(self, step):
+        """
+        otir/otdr: write the whole block with one io call if the port
+        handler takes buffers. Return the T-states taken, or 0 to run
+        the instruction a byte at a time.
+        The handler sees one time for the block: self.clks at its start.
+        """
+        bulk = getattr(self.io, 'wr_bulk', None)
+        if bulk is None:
+            return 0
+        n = self.b or 256
+        c = self.c
+        # b is decremented before each write
+        ports = range(((self.b - 1) << 8) | c, ((self.b - 1 - n) << 8) | c, -256)
+        wr_block = bulk(ports)
+        if wr_block is None:
+            return 0
+        hl = self._get_hl()
+        data = self._rd_block(hl, n, step)
+        wr_block(ports[0] & 0xffff, data)
+        self._set_hl(hl + (n * step))
+        self.b = 0
+        val = data[-1]
+        self._block_io_flags(val, self.l + val)
+        self.r = (self.r + n - 1) & 0x7f
+        return (21 * (n - 1)) + 12
+
     def _enter_halt(self):
         """enter halt mode"""
         self.halt = 1
@@ -193,7 +279,34 @@ class cpu:
         """
         self.r = (self.r + 1) & 0x7f
         code = self._get_n()
-        return self.opcodes[code]()
+        return self.opcodes[code](self)
+
+    def trap(self, adr, handler):
+        """
+        Trap the instruction at adr (Eg. a ROM entry point).
+        The dispatch table entry for the instruction is replaced for this cpu
+        only, so other instructions run at full speed. handler() is called
+        when the instruction at adr executes - it returns the T-states taken,
+        or None to execute the instruction as normal.
+        """
+        code = self.mem[adr]
+        table = 'opcodes'
+        n = 1
+        if code in (0xcb, 0xdd, 0xed, 0xfd):
+            table = {0xcb: 'opcodes_cb', 0xdd: 'opcodes_dd', 0xed: 'opcodes_ed', 0xfd: 'opcodes_fd'}[code]
+            code = self.mem[adr + 1]
+            n = 2
+        ops = list(getattr(self, table))
+        op = ops[code]
+        def trapped(cpu):
+            if ((cpu.pc - n) & 0xffff) == adr:
+                clks = handler()
+                if clks is not None:
+                    # prefixed tables return the T-states after the prefix
+                    return clks - (4 * (n - 1))
+            return op(cpu)
+        ops[code] = trapped
+        setattr(self, table, ops)
 
     def interrupt(self, x = 0):
         """
@@ -215,6 +328,17 @@ class cpu:
             self._set_pc(self._peek((self.i << 8) + (x & 0xff)))
             return 17
 
+    def nmi(self):
+        """
+        Perform non maskable interrupt actions
+        """
+        self._leave_halt()
+        self.iff2 = self.iff1
+        self.iff1 = 0
+        self._push(self.pc)
+        self.pc = 0x66
+        return 11
+
     def reset(self):
         """
         reset the cpu state
@@ -261,29 +385,29 @@ class cpu:
 
     def _execute_cb(self):
         code = self._get_n()
-        return 4 + self.opcodes_cb[code]()
+        return 4 + self.opcodes_cb[code](self)
 
     def _execute_dd(self):
         code = self._get_n()
-        return 4 + self.opcodes_dd[code]()
+        return 4 + self.opcodes_dd[code](self)
 
     def _execute_ed(self):
         code = self._get_n()
-        return 4 + self.opcodes_ed[code]()
+        return 4 + self.opcodes_ed[code](self)
 
     def _execute_fd(self):
         code = self._get_n()
-        return 4 + self.opcodes_fd[code]()
+        return 4 + self.opcodes_fd[code](self)
 
     def _execute_ddcb(self):
         d = _signed(self._get_n())
         code = self._get_n()
-        return 8 + self.opcodes_ddcb00[code](d)
+        return 8 + self.opcodes_ddcb00[code](self, d)
 
     def _execute_fdcb(self):
         d = _signed(self._get_n())
         code = self._get_n()
-        return 8 + self.opcodes_fdcb00[code](d)
+        return 8 + self.opcodes_fdcb00[code](self, d)
 
     def __str__(self):
         """return a string with processor state"""
@@ -311,4 +435,7 @@ class cpu:
     def __init__(self, mem, io):
         self.mem = mem
         self.io = io
+        # T-state count at the start of the current instruction - set by
+        # the scheduler, stale if execute() is called outside it
+        self.clks = 0
         self.reset()